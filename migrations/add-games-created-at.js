@@ -0,0 +1,115 @@
+// migrations/add-games-created-at.js
+// Migration to add created_at column to games table
+// tools/materialize_leaderboards.py uses it to leave games rows from
+// transactions that may still be committing for its next run
+
+import { Pool } from "pg";
+
+const pool = new Pool({
+  connectionString: process.env.DATABASE_URL,
+  ssl: process.env.DATABASE_URL?.includes('localhost') ? false : { rejectUnauthorized: false }
+});
+
+export async function up() {
+  console.log("[Migration] Adding created_at column to games table...");
+  
+  try {
+    const client = await pool.connect();
+    try {
+      await client.query('BEGIN');
+      
+      // Existing rows stay NULL; the leaderboard job treats them as old
+      await client.query(`
+        ALTER TABLE games 
+        ADD COLUMN IF NOT EXISTS created_at TIMESTAMP;
+      `);
+      
+      // New rows get their insert time
+      await client.query(`
+        ALTER TABLE games 
+        ALTER COLUMN created_at SET DEFAULT NOW();
+      `);
+      
+      await client.query('COMMIT');
+      
+      console.log('[Migration] ✓ Successfully added created_at column');
+      
+      return {
+        success: true,
+        message: 'created_at column added successfully'
+      };
+      
+    } catch (err) {
+      await client.query('ROLLBACK');
+      throw err;
+    } finally {
+      client.release();
+    }
+    
+  } catch (err) {
+    console.error('[Migration] Error:', err.message);
+    throw err;
+  } finally {
+    await pool.end();
+  }
+}
+
+export async function down() {
+  console.log('[Migration] Removing created_at column from games table...');
+  
+  const client = await pool.connect();
+  try {
+    await client.query('BEGIN');
+    
+    await client.query(`
+      ALTER TABLE games 
+      DROP COLUMN IF EXISTS created_at;
+    `);
+    
+    await client.query('COMMIT');
+    
+    console.log('[Migration] ✓ Successfully removed created_at column');
+    
+    return {
+      success: true,
+      message: 'created_at column removed successfully'
+    };
+    
+  } catch (err) {
+    await client.query('ROLLBACK');
+    throw err;
+  } finally {
+    client.release();
+    await pool.end();
+  }
+}
+
+// If run directly
+if (import.meta.url === `file://${process.argv[1]}`) {
+  const command = process.argv[2] || 'up';
+  
+  if (command === 'up') {
+    up()
+      .then(() => {
+        console.log('\n[Migration] Migration completed successfully');
+        process.exit(0);
+      })
+      .catch((err) => {
+        console.error('\n[Migration] Migration failed:', err);
+        process.exit(1);
+      });
+  } else if (command === 'down') {
+    down()
+      .then(() => {
+        console.log('\n[Migration] Rollback completed successfully');
+        process.exit(0);
+      })
+      .catch((err) => {
+        console.error('\n[Migration] Rollback failed:', err);
+        process.exit(1);
+      });
+  } else {
+    console.error('Unknown command. Use "up" or "down"');
+    process.exit(1);
+  }
+}
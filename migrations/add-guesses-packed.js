@@ -0,0 +1,155 @@
+// migrations/add-guesses-packed.js
+// Migration to add guesses_packed columns to golf_holes and player_games
+// tools/guess_codec.py migrate fills them with the packed word-id form of
+// guesses; a trigger clears a packed copy whenever guesses changes
+
+import { Pool } from "pg";
+
+const pool = new Pool({
+  connectionString: process.env.DATABASE_URL,
+  ssl: process.env.DATABASE_URL?.includes('localhost') ? false : { rejectUnauthorized: false }
+});
+
+export async function up() {
+  console.log("[Migration] Adding guesses_packed columns to golf_holes and player_games...");
+  
+  try {
+    const client = await pool.connect();
+    try {
+      await client.query('BEGIN');
+      
+      // NULL means "not packed yet"; guess_codec.py migrate backfills them
+      await client.query(`
+        ALTER TABLE golf_holes 
+        ADD COLUMN IF NOT EXISTS guesses_packed BYTEA;
+      `);
+      
+      await client.query(`
+        ALTER TABLE player_games 
+        ADD COLUMN IF NOT EXISTS guesses_packed BYTEA;
+      `);
+      
+      // The handlers only write guesses, so drop the packed copy when it goes stale
+      await client.query(`
+        CREATE OR REPLACE FUNCTION clear_stale_guesses_packed() RETURNS trigger AS $$
+        BEGIN
+          IF NEW.guesses IS DISTINCT FROM OLD.guesses THEN
+            NEW.guesses_packed := NULL;
+          END IF;
+          RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+      `);
+      
+      await client.query(`
+        CREATE OR REPLACE TRIGGER golf_holes_guesses_packed 
+        BEFORE UPDATE OF guesses ON golf_holes 
+        FOR EACH ROW EXECUTE FUNCTION clear_stale_guesses_packed();
+      `);
+      
+      await client.query(`
+        CREATE OR REPLACE TRIGGER player_games_guesses_packed 
+        BEFORE UPDATE OF guesses ON player_games 
+        FOR EACH ROW EXECUTE FUNCTION clear_stale_guesses_packed();
+      `);
+      
+      await client.query('COMMIT');
+      
+      console.log('[Migration] ✓ Successfully added guesses_packed columns');
+      
+      return {
+        success: true,
+        message: 'guesses_packed columns added successfully'
+      };
+      
+    } catch (err) {
+      await client.query('ROLLBACK');
+      throw err;
+    } finally {
+      client.release();
+    }
+    
+  } catch (err) {
+    console.error('[Migration] Error:', err.message);
+    throw err;
+  } finally {
+    await pool.end();
+  }
+}
+
+export async function down() {
+  console.log('[Migration] Removing guesses_packed columns from golf_holes and player_games...');
+  
+  const client = await pool.connect();
+  try {
+    await client.query('BEGIN');
+    
+    await client.query(`
+      DROP TRIGGER IF EXISTS golf_holes_guesses_packed ON golf_holes;
+    `);
+    
+    await client.query(`
+      DROP TRIGGER IF EXISTS player_games_guesses_packed ON player_games;
+    `);
+    
+    await client.query(`
+      DROP FUNCTION IF EXISTS clear_stale_guesses_packed();
+    `);
+    
+    await client.query(`
+      ALTER TABLE golf_holes 
+      DROP COLUMN IF EXISTS guesses_packed;
+    `);
+    
+    await client.query(`
+      ALTER TABLE player_games 
+      DROP COLUMN IF EXISTS guesses_packed;
+    `);
+    
+    await client.query('COMMIT');
+    
+    console.log('[Migration] ✓ Successfully removed guesses_packed columns');
+    
+    return {
+      success: true,
+      message: 'guesses_packed columns removed successfully'
+    };
+    
+  } catch (err) {
+    await client.query('ROLLBACK');
+    throw err;
+  } finally {
+    client.release();
+    await pool.end();
+  }
+}
+
+// If run directly
+if (import.meta.url === `file://${process.argv[1]}`) {
+  const command = process.argv[2] || 'up';
+  
+  if (command === 'up') {
+    up()
+      .then(() => {
+        console.log('\n[Migration] Migration completed successfully');
+        process.exit(0);
+      })
+      .catch((err) => {
+        console.error('\n[Migration] Migration failed:', err);
+        process.exit(1);
+      });
+  } else if (command === 'down') {
+    down()
+      .then(() => {
+        console.log('\n[Migration] Rollback completed successfully');
+        process.exit(0);
+      })
+      .catch((err) => {
+        console.error('\n[Migration] Rollback failed:', err);
+        process.exit(1);
+      });
+  } else {
+    console.error('Unknown command. Use "up" or "down"');
+    process.exit(1);
+  }
+}
@@ -1,5 +1,8 @@
 // Script to remove problematic words from wordlist
 // Run with: node scripts/remove-words.js
+// Also remove the words listed in a file (one per line, e.g. the --remove-list
+// written by tools/word_vote_queue.py):
+//   node scripts/remove-words.js --from remove.txt
 
 import fs from 'fs';
 import path from 'path';
@@ -61,6 +64,21 @@ const wordsToRemove = new Set([
   'STELE', 'VITRO', 'SIGIL', 'PAEAN', 'AUGHT',
 ]);
 
+const fromIndex = process.argv.indexOf('--from');
+if (fromIndex !== -1) {
+  const listPath = process.argv[fromIndex + 1];
+  if (!listPath) {
+    console.error('--from needs a file of words');
+    process.exit(1);
+  }
+  const listed = fs.readFileSync(listPath, 'utf8')
+    .split('\n')
+    .map(line => line.split('\t')[0].trim().toUpperCase())
+    .filter(word => word && word !== 'WORD');
+  listed.forEach(word => wordsToRemove.add(word));
+  console.log(`Loaded ${listed.length} words from ${listPath}`);
+}
+
 const wordlistPath = path.join(process.cwd(), 'data', 'wordlist-table-cleaned.txt');
 const content = fs.readFileSync(wordlistPath, 'utf8');
 const lines = content.trim().split('\n');
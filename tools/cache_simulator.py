@@ -0,0 +1,719 @@
+#!/usr/bin/env python3
+"""Trace-driven simulation of edge caching for the API routes.
+
+Replays a request trace against one or more cache policies in a single pass.
+For every route and policy it reports the hit ratio, the database queries
+the hits avoid, and how many hits served a wrong answer.
+
+Trace: TSV with the header TS ROUTE METHOD ORG PLAYER DATE PARAM (or JSON
+lines with those keys, lowercase). TS is epoch seconds or an ISO 8601
+timestamp (UTC unless it carries an offset). ORG is the tenant
+slug, empty for grordle.com. DATE is the explicit date parameter, empty when
+the handler falls back to today. PARAM is any other parameter the response
+depends on: the word for validate-word, the period for the leaderboards, the
+hole for golf-get-hole. Files are read line by line, so trace size is not
+bounded by memory; `.gz` is decompressed on the fly and `-` reads stdin.
+Simulator state is bounded too: each sweep drops expired entries, and days
+more than RETAIN_DAYS behind the trace along with everything cached from them.
+`generate` writes a synthetic trace from the route mix the client produces
+(see src/ and load_test.py). Sessions land on a diurnal curve in each
+tenant's local day.
+
+ROUTES describes each handler: the typical-path query count, the fields the
+response varies by, the data it reads and writes, and whether it defaults
+to today's date. A write bumps a version on each piece of data it touches.
+A hit is a staleness violation when:
+
+  write     data the entry was built from changed since it was stored
+  day       the route defaults to today and the tenant's local date rolled
+            over since the entry was stored
+  variant   the cache key omits a field the response varies by (e.g. the
+            player), so the entry was stored for another request
+
+Policies are comma-separated options, one --policy each:
+
+  ttl=SECONDS         entries expire after SECONDS
+  lru=ENTRIES         at most ENTRIES entries, least recently used evicted
+  midnight            entries expire at the tenant's next local midnight
+  purge               writes invalidate the entries built from their data
+  key=org+date+player+param
+                      fields in the cache key (default org+date+param: the
+                      host and the query string, as a CDN sees them)
+  routes=a+b          only cache these routes (default: every read route)
+
+Usage:
+  python tools/cache_simulator.py generate trace.tsv.gz --tenants 50 --players 400 --days 14
+  python tools/cache_simulator.py simulate trace.tsv.gz --policy ttl=60 --policy midnight,purge --output cache-report.tsv
+  python tools/cache_simulator.py simulate trace.tsv.gz --policy midnight,purge,key=org+date+player+param
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import io
+import itertools
+import json
+import math
+import random
+import sys
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, Iterator
+from zoneinfo import ZoneInfo
+
+
+DEFAULT_TZ = "Australia/Sydney"  # getAustralianDate() in the handlers
+TRACE_HEADER = "\t".join(["TS", "ROUTE", "METHOD", "ORG", "PLAYER", "DATE", "PARAM"])
+KEY_FIELDS = ("org", "date", "player", "param")
+DEFAULT_KEY = ("org", "date", "param")
+DEFAULT_POLICIES = ("ttl=60", "ttl=3600", "lru=20000,ttl=3600", "midnight", "midnight,purge")
+SWEEP_EVERY = 1_000_000  # requests between sweeps of expired entries
+# Days this far behind the trace clock (UTC) are forgotten at each sweep: their
+# write versions and the cache entries that read them. Keeps memory flat over
+# long traces; an edge cache would have evicted such entries long before.
+RETAIN_DAYS = 7
+
+Request = tuple  # (ts, route, method, org, player, date, param)
+
+
+@dataclass(frozen=True)
+class RouteSpec:
+    queries: int  # SQL round trips on the handler's usual path
+    varies: tuple[str, ...] = ()  # request fields the response depends on
+    reads: tuple[str, ...] = ()  # data templates over org/day/yday/player/param
+    writes: tuple[str, ...] = ()
+    today: bool = False  # falls back to the tenant's current date
+    cacheable: bool = False
+
+
+# (route, method) -> spec; data templates name what a write invalidates.
+ROUTES: dict[tuple[str, str], RouteSpec] = {
+    ("get-target-word", "GET"): RouteSpec(1, ("date",), ("wordlist",), cacheable=True),
+    ("motd", "GET"): RouteSpec(1, ("date", "param"), ("motd:{day}",), cacheable=True),
+    ("tenant-settings", "GET"): RouteSpec(1, ("org",), ("org:{org}",), cacheable=True),
+    ("yesterday-winners", "GET"): RouteSpec(2, ("org",), ("daily:{org}:{yday}", "golf:{org}:{yday}"), today=True, cacheable=True),
+    ("game-state", "GET"): RouteSpec(6, ("org", "date"), ("daily:{org}:{day}", "wordlist"), today=True, cacheable=True),
+    ("status", "GET"): RouteSpec(5, ("org", "date"), ("daily:{org}:{day}",), today=True, cacheable=True),
+    ("completed-games", "GET"): RouteSpec(3, ("org", "date"), ("daily:{org}:{day}",), cacheable=True),
+    ("completed-golf-rounds", "GET"): RouteSpec(2, ("org", "date"), ("golf:{org}:{day}",), today=True, cacheable=True),
+    ("leaderboard", "GET"): RouteSpec(2, ("org", "param"), ("daily:{org}:{day}",), today=True, cacheable=True),
+    ("golf-leaderboard", "GET"): RouteSpec(1, ("org", "param"), ("golf:{org}:{day}",), today=True, cacheable=True),
+    ("wordlist", "GET"): RouteSpec(1, ("param",), ("wordlist",), cacheable=True),
+    ("validate-word", "POST"): RouteSpec(1, ("param",), ("validation",), cacheable=True),
+    ("golf-get-hole", "POST"): RouteSpec(1, ("org", "player", "param"), ("golfer:{org}:{day}:{player}",), today=True, cacheable=True),
+    ("golf-game-state", "POST"): RouteSpec(4, ("org", "player"), ("golfer:{org}:{day}:{player}", "golf:{org}:{day}"), today=True, cacheable=True),
+    ("start", "POST"): RouteSpec(7, writes=("daily:{org}:{day}",)),
+    ("save-game", "POST"): RouteSpec(4, writes=("daily:{org}:{day}",)),
+    ("submit", "POST"): RouteSpec(5, writes=("daily:{org}:{day}",)),
+    ("edit-daily-score", "POST"): RouteSpec(6, writes=("daily:{org}:{day}",)),
+    ("reset-player-status", "POST"): RouteSpec(8, writes=("daily:{org}:{day}",)),
+    ("golf-start", "POST"): RouteSpec(6, writes=("golf:{org}:{day}", "golfer:{org}:{day}:{player}"), today=True),
+    ("golf-submit", "POST"): RouteSpec(5, writes=("golf:{org}:{day}", "golfer:{org}:{day}:{player}"), today=True),
+    ("golf-save-guesses", "POST"): RouteSpec(1, writes=("golfer:{org}:{day}:{player}",), today=True),
+    ("golf-next-hole", "POST"): RouteSpec(2, writes=("golfer:{org}:{day}:{player}",), today=True),
+    ("edit-golf-score", "POST"): RouteSpec(5, writes=("golf:{org}:{day}", "golfer:{org}:{day}:{player}")),
+    ("motd", "POST"): RouteSpec(1, writes=("motd:{day}",)),
+    ("tenant-settings", "PUT"): RouteSpec(1, writes=("org:{org}",)),
+    ("tenant-settings", "POST"): RouteSpec(1, writes=("org:{org}",)),
+    ("manage-organizations", "PUT"): RouteSpec(1, writes=("org:{param}",)),
+    ("wordlist", "POST"): RouteSpec(2, writes=("wordlist",)),
+    ("schedule-wordlist-migration", "POST"): RouteSpec(6, writes=("wordlist", "validation")),
+    ("auth", "POST"): RouteSpec(2),
+}
+
+# --- time -----------------------------------------------------------------------
+
+
+class TenantClock:
+    """Local date of a tenant for epoch seconds, cached per local day."""
+
+    def __init__(self, zone: str):
+        self.zone = ZoneInfo(zone)
+        self.lo = math.inf
+        self.hi = -math.inf
+        self.today = ""
+
+    def day(self, ts: float) -> str:
+        if not self.lo <= ts < self.hi:
+            local = datetime.fromtimestamp(ts, self.zone)
+            start = datetime(local.year, local.month, local.day, tzinfo=self.zone)
+            end = start + timedelta(days=1)
+            end = datetime(end.year, end.month, end.day, tzinfo=self.zone)  # DST-safe midnight
+            self.lo, self.hi, self.today = start.timestamp(), end.timestamp(), start.date().isoformat()
+        return self.today
+
+    def next_midnight(self, ts: float) -> float:
+        self.day(ts)
+        return self.hi
+
+
+class Clocks(dict):
+    def __init__(self, zones: dict[str, str], default: str):
+        super().__init__()
+        self.zones = zones
+        self.default = default
+
+    def __missing__(self, org: str) -> TenantClock:
+        clock = self[org] = TenantClock(self.zones.get(org, self.default))
+        return clock
+
+
+@lru_cache(maxsize=4096)
+def previous_day(day: str) -> str:
+    return (date.fromisoformat(day) - timedelta(days=1)).isoformat()
+
+
+def parse_zones(values: list[str]) -> dict[str, str]:
+    zones = {}
+    for value in values:
+        slug, sep, zone = value.partition("=")
+        if not sep:
+            raise SystemExit(f"--tenant-tz expects SLUG=ZONE, got {value!r}")
+        try:
+            ZoneInfo(zone)
+        except Exception:
+            raise SystemExit(f"Unknown time zone: {zone!r}")
+        zones["" if slug in ("-", "default") else slug] = zone
+    return zones
+
+
+# --- traces ---------------------------------------------------------------------
+
+
+def _open_text(path: str):
+    if path == "-":
+        return io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8")
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8")
+    return open(path, encoding="utf-8")
+
+
+def _ts(value) -> float:
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return float(value)
+    except ValueError:
+        stamp = datetime.fromisoformat(value)
+    if stamp.tzinfo is None:
+        stamp = stamp.replace(tzinfo=timezone.utc)
+    return stamp.timestamp()
+
+
+def read_trace(path: str) -> Iterator[Request]:
+    with _open_text(path) as f:
+        first = f.readline()
+        if first.lstrip().startswith("{"):
+            for n, line in enumerate(itertools.chain([first], f), start=1):
+                if not line.strip():
+                    continue
+                try:
+                    r = json.loads(line)
+                    req = (
+                        _ts(r["ts"]),
+                        r["route"],
+                        r.get("method", "GET").upper(),
+                        r.get("org") or "",
+                        r.get("player") or "",
+                        r.get("date") or "",
+                        str(r.get("param") or ""),
+                    )
+                except (ValueError, KeyError, TypeError, AttributeError) as exc:
+                    raise SystemExit(f"{path}:{n}: bad trace record ({exc!r})")
+                yield req
+            return
+        if first.rstrip("\r\n") != TRACE_HEADER:
+            raise SystemExit(f"{path}: expected the header {TRACE_HEADER!r}")
+        for n, line in enumerate(f, start=2):
+            parts = line.rstrip("\r\n").split("\t")
+            if len(parts) != 7:
+                if line.strip():
+                    raise SystemExit(f"{path}:{n}: expected 7 fields, found {len(parts)}")
+                continue
+            try:
+                parts[0] = _ts(parts[0])
+            except ValueError:
+                raise SystemExit(f"{path}:{n}: bad timestamp {parts[0]!r}")
+            yield tuple(parts)
+
+
+# --- policies -------------------------------------------------------------------
+
+
+@dataclass
+class Policy:
+    name: str
+    ttl: float | None = None
+    lru: int | None = None
+    midnight: bool = False
+    purge: bool = False
+    key: tuple[str, ...] = DEFAULT_KEY
+    routes: frozenset[str] | None = None
+    entries: dict = field(default_factory=dict)
+    evictions: int = 0
+
+    def caches(self, route: str) -> bool:
+        return self.routes is None or route in self.routes
+
+
+def parse_policy(text: str) -> Policy:
+    policy = Policy(name=text)
+    for option in filter(None, (o.strip() for o in text.split(","))):
+        name, _, value = option.partition("=")
+        try:
+            if name == "ttl":
+                policy.ttl = float(value)
+            elif name == "lru":
+                policy.lru = int(value)
+                policy.entries = OrderedDict()
+            elif name == "midnight" and not value:
+                policy.midnight = True
+            elif name == "purge" and not value:
+                policy.purge = True
+            elif name == "key":
+                fields = tuple(f for f in value.split("+") if f)
+                unknown = [f for f in fields if f not in KEY_FIELDS]
+                if unknown:
+                    raise SystemExit(f"Policy {text!r}: unknown key field(s) {', '.join(unknown)} (expected {', '.join(KEY_FIELDS)})")
+                policy.key = tuple(f for f in KEY_FIELDS if f in fields)
+            elif name == "routes":
+                routes = frozenset(r for r in value.split("+") if r)
+                known = {route for route, _ in ROUTES}
+                if routes - known:
+                    raise SystemExit(f"Policy {text!r}: unknown route(s) {', '.join(sorted(routes - known))}")
+                policy.routes = routes
+            else:
+                raise SystemExit(f"Policy {text!r}: unknown option {option!r}")
+        except ValueError:
+            raise SystemExit(f"Policy {text!r}: bad value in {option!r}")
+    if policy.ttl is None and policy.lru is None and not policy.midnight:
+        raise SystemExit(f"Policy {text!r}: needs at least one of ttl=, lru=, midnight")
+    if (policy.ttl is not None and policy.ttl <= 0) or (policy.lru is not None and policy.lru < 1):
+        raise SystemExit(f"Policy {text!r}: ttl and lru must be positive")
+    return policy
+
+
+# --- simulation -----------------------------------------------------------------
+
+
+# Per (policy, route) counters, in this order.
+COUNTERS = ("requests", "hits", "stale", "stale_write", "stale_day", "wrong_variant", "queries", "queries_avoided", "fresh_queries_avoided")
+REQUESTS, HITS, STALE, STALE_WRITE, STALE_DAY, WRONG_VARIANT, QUERIES, AVOIDED, FRESH_AVOIDED = range(len(COUNTERS))
+
+
+@dataclass
+class SimulationResult:
+    policies: list[Policy]
+    counters: dict[tuple[int, str], list[int]]  # (policy index, "route METHOD") -> COUNTERS
+    requests: int
+    unknown: dict[str, int]
+    out_of_order: int
+    first_ts: float | None
+    last_ts: float | None
+    seconds: float
+
+
+def _filed(templates: tuple[str, ...]) -> tuple[tuple[str, str], ...]:
+    # (date variable, template): versions are filed under the day they belong to,
+    # "" for undated data, so whole days can be retired at once.
+    return tuple(("yday" if "{yday}" in t else "day" if "{day}" in t else "", t) for t in templates)
+
+
+def simulate(requests: Iterable[Request], policies: list[Policy], clocks: Clocks) -> SimulationResult:
+    counters: dict[tuple[int, str], list[int]] = {}
+    versions: dict[str, dict[str, int]] = {}  # day -> data key -> writes
+    unwritten: dict[str, int] = {}
+    unknown: dict[str, int] = {}
+    n = out_of_order = 0
+    first_ts = last_ts = None
+    key_sets = sorted({p.key for p in policies})
+    # (route, method) -> spec, label, filed reads, filed writes, read day variable,
+    #                    [(policy, counters, caches, key index)]
+    plans: dict[tuple[str, str], tuple] = {}
+    started = time.perf_counter()
+
+    for req in requests:
+        ts, route, method, org, player, explicit, param = req
+        n += 1
+        if n % SWEEP_EVERY == 0:
+            horizon = (datetime.fromtimestamp(ts, timezone.utc).date() - timedelta(days=RETAIN_DAYS)).isoformat()
+            for d in [d for d in versions if d and d < horizon]:
+                del versions[d]
+            for policy in policies:
+                if policy.lru is None:
+                    policy.entries = {k: e for k, e in policy.entries.items() if e[0] > ts and not "" < e[4] < horizon}
+                else:
+                    policy.entries = OrderedDict((k, e) for k, e in policy.entries.items() if not "" < e[4] < horizon)
+        if last_ts is not None and ts < last_ts:
+            out_of_order += 1
+        else:
+            last_ts = ts
+        if first_ts is None:
+            first_ts = ts
+        plan = plans.get((route, method))
+        if plan is None:
+            spec = ROUTES.get((route, method))
+            label = f"{route} {method}"
+            if spec is None:
+                unknown[label] = unknown.get(label, 0) + 1
+                continue
+            lanes = []
+            for i, policy in enumerate(policies):
+                c = counters[(i, label)] = [0] * len(COUNTERS)
+                caches = spec.cacheable and (policy.routes is None or route in policy.routes)
+                lanes.append((policy, c, caches, key_sets.index(policy.key)))
+            reads, writes = _filed(spec.reads), _filed(spec.writes)
+            read_vars = {var for var, _ in reads}
+            read_var = "yday" if "yday" in read_vars else "day" if "day" in read_vars else ""
+            plan = plans[(route, method)] = (spec, label, reads, writes, read_var, lanes)
+        spec, label, reads, writes, read_var, lanes = plan
+
+        clock = clocks[org]
+        today = clock.day(ts)
+        day = explicit or today
+        values = {"org": org, "day": day, "player": player, "param": param, "": ""}
+        if read_var == "yday":
+            values["yday"] = previous_day(day)
+        for var, tmpl in writes:
+            filed = versions.get(values[var])
+            if filed is None:
+                filed = versions[values[var]] = {}
+            k = tmpl.format_map(values)
+            filed[k] = filed.get(k, 0) + 1
+
+        queries = spec.queries
+        if not spec.cacheable:
+            for _, c, _, _ in lanes:
+                c[REQUESTS] += 1
+                c[QUERIES] += queries
+            continue
+
+        deps = tuple([versions.get(values[var], unwritten).get(t.format_map(values), 0) for var, t in reads])
+        fields = {"org": org, "date": explicit, "player": player, "param": param}
+        variant = tuple([fields[f] for f in spec.varies])
+        implicit_day = today if spec.today and not explicit else ""
+        keys = [(label,) + tuple([fields[f] for f in ks]) for ks in key_sets]
+
+        for policy, c, caches, ki in lanes:
+            c[REQUESTS] += 1
+            c[QUERIES] += queries
+            if not caches:
+                continue
+            entries = policy.entries
+            key = keys[ki]
+            entry = entries.get(key)
+            if entry is not None and entry[0] > ts:
+                write_stale = entry[3] != deps
+                if not (write_stale and policy.purge):  # purge: the write dropped the entry
+                    c[HITS] += 1
+                    c[AVOIDED] += queries
+                    fresh = True
+                    if write_stale:
+                        c[STALE_WRITE] += 1
+                        fresh = False
+                    if entry[2] != implicit_day:
+                        c[STALE_DAY] += 1
+                        fresh = False
+                    if entry[1] != variant:
+                        c[WRONG_VARIANT] += 1
+                        fresh = False
+                    if fresh:
+                        c[FRESH_AVOIDED] += queries
+                    else:
+                        c[STALE] += 1
+                    if policy.lru is not None:
+                        entries.move_to_end(key)
+                    continue
+
+            expires = math.inf
+            if policy.ttl is not None:
+                expires = ts + policy.ttl
+            if policy.midnight:
+                expires = min(expires, clock.next_midnight(ts))
+            entries[key] = (expires, variant, implicit_day, deps, values[read_var])
+            if policy.lru is not None:
+                entries.move_to_end(key)
+                if len(entries) > policy.lru:
+                    entries.popitem(last=False)
+                    policy.evictions += 1
+
+    return SimulationResult(policies, counters, n, unknown, out_of_order, first_ts, last_ts, time.perf_counter() - started)
+
+
+# --- reporting ------------------------------------------------------------------
+
+
+def report_rows(result: SimulationResult) -> list[dict]:
+    rows = []
+    for i, policy in enumerate(result.policies):
+        totals = [0] * len(COUNTERS)
+        labels = sorted({label for (j, label) in result.counters if j == i})
+        for label in labels + ["TOTAL"]:
+            c = totals if label == "TOTAL" else result.counters[(i, label)]
+            if label != "TOTAL":
+                totals = [a + b for a, b in zip(totals, c)]
+            row = {"policy": policy.name, "route": label}
+            row.update(zip(COUNTERS, c))
+            row["hit_ratio"] = c[HITS] / c[REQUESTS] if c[REQUESTS] else 0.0
+            row["stale_ratio"] = c[STALE] / c[HITS] if c[HITS] else 0.0
+            row["queries_avoided_ratio"] = c[AVOIDED] / c[QUERIES] if c[QUERIES] else 0.0
+            rows.append(row)
+    return rows
+
+
+REPORT_COLUMNS = ("policy", "route", *COUNTERS, "hit_ratio", "stale_ratio", "queries_avoided_ratio")
+
+
+def write_report(path: Path, rows: list[dict], result: SimulationResult) -> None:
+    if path.suffix == ".json":
+        meta = {
+            "requests": result.requests,
+            "unknown_routes": result.unknown,
+            "out_of_order": result.out_of_order,
+            "policies": [
+                {"name": p.name, "evictions": p.evictions} for p in result.policies
+            ],
+        }
+        path.write_text(json.dumps({"summary": meta, "rows": rows}, indent=1) + "\n", encoding="utf-8")
+        return
+    lines = ["\t".join(c.upper() for c in REPORT_COLUMNS)]
+    for row in rows:
+        lines.append("\t".join(f"{row[c]:.4f}" if isinstance(row[c], float) else str(row[c]) for c in REPORT_COLUMNS))
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def print_summary(rows: list[dict], result: SimulationResult, *, per_route: bool) -> None:
+    span = ""
+    if result.first_ts is not None and result.last_ts is not None:
+        span = f" over {(result.last_ts - result.first_ts) / 86400:.1f} days"
+    rate = result.requests / result.seconds if result.seconds > 0 else 0.0
+    print(f"Requests: {result.requests:,}{span}  replayed in {result.seconds:.1f}s ({rate:,.0f}/s, {len(result.policies)} policies)")
+    if result.unknown:
+        print("Unknown routes (passed through): " + ", ".join(f"{k} {v}" for k, v in sorted(result.unknown.items())))
+    if result.out_of_order:
+        print(f"Warning: {result.out_of_order:,} requests earlier than their predecessor; traces should be time-ordered")
+    header = f"  {'route':<28} {'hit%':>6} {'stale%':>7} {'write':>8} {'day':>8} {'variant':>8} {'queries avoided':>16} {'fresh':>7}"
+    for policy in result.policies:
+        print(f"\n{policy.name}" + (f"  (evictions {policy.evictions:,})" if policy.lru is not None else ""))
+        print(header)
+        for row in rows:
+            if row["policy"] != policy.name or (not per_route and row["route"] != "TOTAL"):
+                continue
+            if row["route"] != "TOTAL" and row["hits"] == 0:
+                continue
+            fresh = row["fresh_queries_avoided"] / row["queries"] if row["queries"] else 0.0
+            print(
+                f"  {row['route']:<28} {row['hit_ratio']:>6.1%} {row['stale_ratio']:>7.1%} {row['stale_write']:>8,} "
+                f"{row['stale_day']:>8,} {row['wrong_variant']:>8,} {row['queries_avoided']:>9,} {row['queries_avoided_ratio']:>6.1%} {fresh:>7.1%}"
+            )
+
+
+def cmd_simulate(args: argparse.Namespace) -> None:
+    policies = [parse_policy(p) for p in (args.policy or DEFAULT_POLICIES)]
+    names = [p.name for p in policies]
+    if len(set(names)) != len(names):
+        raise SystemExit("Duplicate --policy")
+    clocks = Clocks(parse_zones(args.tenant_tz), args.default_tz)
+
+    def requests() -> Iterator[Request]:
+        for path in args.trace:
+            yield from read_trace(path)
+
+    result = simulate(requests(), policies, clocks)
+    rows = report_rows(result)
+    print_summary(rows, result, per_route=not args.totals_only)
+    if args.output is not None:
+        write_report(args.output, rows, result)
+        print(f"\nWrote: {args.output}")
+
+
+# --- synthetic traces -----------------------------------------------------------
+
+
+# Share of sessions starting in each local hour (0-23).
+DIURNAL = (1, 1, 1, 1, 1, 2, 4, 7, 8, 7, 6, 6, 7, 6, 5, 5, 6, 7, 8, 8, 7, 5, 3, 2)
+GUESS_COUNTS = (1, 2, 3, 4, 5, 6)
+GUESS_WEIGHTS = (1, 6, 22, 34, 25, 12)
+GOLF_GUESS_WEIGHTS = (1, 8, 25, 33, 22, 11)
+LEADERBOARD_PERIODS = ("today", "week", "month", "year", "all")
+GUESS_CUM = list(itertools.accumulate(GUESS_WEIGHTS))
+GOLF_GUESS_CUM = list(itertools.accumulate(GOLF_GUESS_WEIGHTS))
+OPENERS = 50
+
+
+@dataclass(frozen=True)
+class SyntheticConfig:
+    tenants: int
+    players: int
+    days: int
+    start: date
+    golf_share: float
+    vocabulary: int
+    seed: int
+
+
+def _session(rng: random.Random, t: float, org: str, player: str, day: str, cfg: SyntheticConfig, words: list[int], cum: list[float]) -> list[Request]:
+    out: list[Request] = []
+
+    def add(route: str, method: str, *, who: str = "", d: str = "", param: str = "") -> None:
+        out.append((round(t, 3), route, method, org, who, d, param))
+
+    # Page load (App.jsx), then the daily game (useScores, Game).
+    add("tenant-settings", "GET")
+    add("motd", "GET", d=day)
+    add("yesterday-winners", "GET")
+    add("game-state", "GET", d=day)
+    add("status", "GET", d=day)
+    t += rng.uniform(2, 15)
+    add("start", "POST", who=player, d=day)
+    guesses = rng.choices(GUESS_COUNTS, cum_weights=GUESS_CUM)[0]
+    for g in range(guesses):
+        t += rng.uniform(6, 45)
+        # Openers come from a few dozen popular words.
+        if g == 0:
+            word = rng.choices(words[:OPENERS], cum_weights=cum[:OPENERS])[0]
+        else:
+            word = rng.choices(words, cum_weights=cum)[0]
+        add("validate-word", "POST", param=str(word))
+        add("save-game", "POST", who=player, d=day)
+    add("submit", "POST", who=player, d=day)
+    t += rng.uniform(1, 5)
+    add("status", "GET", d=day)
+    if rng.random() < 0.5:
+        add("completed-games", "GET", d=day)
+    if rng.random() < 0.3:
+        t += rng.uniform(5, 60)
+        add("leaderboard", "GET", param=rng.choice(LEADERBOARD_PERIODS))
+
+    if rng.random() < cfg.golf_share:
+        t += rng.uniform(10, 120)
+        add("golf-start", "POST", who=player)
+        add("golf-game-state", "POST", who=player)
+        for hole in range(1, 10):
+            add("golf-get-hole", "POST", who=player, param=str(hole))
+            for _ in range(rng.choices(GUESS_COUNTS, cum_weights=GOLF_GUESS_CUM)[0]):
+                t += rng.uniform(6, 40)
+                add("validate-word", "POST", param=str(rng.choices(words, cum_weights=cum)[0]))
+                add("golf-save-guesses", "POST", who=player)
+            add("golf-submit", "POST", who=player)
+            if hole < 9:
+                add("golf-next-hole", "POST", who=player)
+        t += rng.uniform(1, 5)
+        add("golf-leaderboard", "GET", param="weekly")
+        add("golf-leaderboard", "GET", param="monthly")
+        if rng.random() < 0.5:
+            add("completed-golf-rounds", "GET", d=day)
+    return out
+
+
+def generate_trace(cfg: SyntheticConfig, clocks: Clocks) -> Iterator[Request]:
+    """Synthetic requests in timestamp order, one local day at a time."""
+    rng = random.Random(cfg.seed)
+    orgs = [""] + [f"tenant{i:04d}" for i in range(1, cfg.tenants)]
+    # Tenant sizes follow a Zipf curve scaled to a mean of --players.
+    zipf = [1 / (i + 1) for i in range(len(orgs))]
+    scale = cfg.players * len(orgs) / sum(zipf)
+    sizes = {org: max(1, round(z * scale)) for org, z in zip(orgs, zipf)}
+    words = list(range(cfg.vocabulary))
+    cum = list(itertools.accumulate(1 / (i + 1) ** 1.1 for i in words))
+    hours = list(range(24))
+    hour_cum = list(itertools.accumulate(DIURNAL))
+
+    pending: list[Request] = []
+    for offset in range(cfg.days):
+        day = (cfg.start + timedelta(days=offset)).isoformat()
+        batch: list[Request] = []
+        boundary = math.inf
+        for org in orgs:
+            clock = clocks[org]
+            midnight = datetime.fromisoformat(day).replace(tzinfo=clock.zone).timestamp()
+            boundary = min(boundary, clock.next_midnight(midnight))
+            population = sizes[org] * 3  # returning players, a third play on a given day
+            for p in rng.sample(range(population), sizes[org]):
+                t = midnight + rng.choices(hours, cum_weights=hour_cum)[0] * 3600 + rng.uniform(0, 3600)
+                batch.extend(_session(rng, t, org, f"player{p}", day, cfg, words, cum))
+            # Occasional admin writes.
+            if rng.random() < 0.3:
+                batch.append((round(midnight + rng.uniform(0, 86400), 3), "motd", "POST", org, "admin", day, ""))
+            if org and rng.random() < 0.02:
+                batch.append((round(midnight + rng.uniform(0, 86400), 3), "tenant-settings", "PUT", org, "admin", "", ""))
+            if rng.random() < 0.05:
+                batch.append((round(midnight + rng.uniform(0, 86400), 3), "edit-daily-score", "POST", org, "admin", day, ""))
+        pending.extend(batch)
+        pending.sort(key=lambda r: r[0])
+        cut = next((i for i, r in enumerate(pending) if r[0] >= boundary), len(pending))
+        yield from pending[:cut]
+        pending = pending[cut:]
+    yield from pending
+
+
+def format_request(r: Request) -> str:
+    return f"{r[0]:.3f}\t{r[1]}\t{r[2]}\t{r[3]}\t{r[4]}\t{r[5]}\t{r[6]}\n"
+
+
+def cmd_generate(args: argparse.Namespace) -> None:
+    try:
+        start = date.fromisoformat(args.start)
+    except ValueError:
+        raise SystemExit(f"Invalid --start date: {args.start!r} (expected YYYY-MM-DD)")
+    if args.tenants < 1 or args.players < 1 or args.days < 1:
+        raise SystemExit("--tenants, --players and --days must be >= 1")
+    cfg = SyntheticConfig(args.tenants, args.players, args.days, start, args.golf_share, args.vocabulary, args.seed)
+    clocks = Clocks(parse_zones(args.tenant_tz), args.default_tz)
+    started = time.perf_counter()
+    n = 0
+    opener = gzip.open if args.output.suffix == ".gz" else open
+    with opener(args.output, "wt", encoding="utf-8") as f:
+        f.write(TRACE_HEADER + "\n")
+        chunk: list[str] = []
+        for r in generate_trace(cfg, clocks):
+            chunk.append(format_request(r))
+            if len(chunk) >= 100_000:
+                f.writelines(chunk)
+                n += len(chunk)
+                chunk.clear()
+        f.writelines(chunk)
+        n += len(chunk)
+    print(f"Requests: {n:,} ({args.tenants} tenants, ~{args.players} players/tenant/day, {args.days} days) in {time.perf_counter() - started:.1f}s")
+    print(f"Wrote: {args.output}")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Trace-driven edge cache simulator for the API routes.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    def zone_args(p: argparse.ArgumentParser) -> None:
+        p.add_argument("--default-tz", default=DEFAULT_TZ, help=f"Tenant time zone unless overridden (default {DEFAULT_TZ})")
+        p.add_argument("--tenant-tz", action="append", default=[], help="SLUG=ZONE local time zone for one tenant (repeatable; 'default' for grordle.com)")
+
+    p = sub.add_parser("simulate", help="Replay traces against cache policies.")
+    p.add_argument("trace", nargs="+", help="Trace files (TSV or JSON lines, optionally .gz; - for stdin), replayed in order")
+    p.add_argument("--policy", action="append", default=[], help=f"Cache policy (repeatable; default: {' '.join(DEFAULT_POLICIES)})")
+    p.add_argument("--output", type=Path, default=None, help="Per-route report (.json, else TSV)")
+    p.add_argument("--totals-only", action="store_true", help="Print one line per policy instead of per route")
+    zone_args(p)
+    p.set_defaults(func=cmd_simulate)
+
+    p = sub.add_parser("generate", help="Write a synthetic trace from the client's route mix.")
+    p.add_argument("output", type=Path, help="Trace path (.gz to compress)")
+    p.add_argument("--tenants", type=int, default=20, help="Tenants including grordle.com (default 20)")
+    p.add_argument("--players", type=int, default=200, help="Mean players per tenant per day (default 200)")
+    p.add_argument("--days", type=int, default=7, help="Days (default 7)")
+    p.add_argument("--start", default="2026-01-05", help="First local date (default 2026-01-05)")
+    p.add_argument("--golf-share", type=float, default=0.3, help="Share of players who also play golf (default 0.3)")
+    p.add_argument("--vocabulary", type=int, default=13953, help="Distinct guess words, Zipf-weighted (default 13953)")
+    p.add_argument("--seed", type=int, default=0)
+    zone_args(p)
+    p.set_defaults(func=cmd_generate)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,509 @@
+#!/usr/bin/env python3
+"""Compact game history older than a retention window.
+
+games, daily_players, scores, player_games, golf_rounds and golf_holes grow
+forever, and the per-request checks in start.js and friends slow down as they
+do. This job moves everything before a cutoff day out of those tables:
+
+  1. rolls the rows into per-tenant, per-day summary rows
+     (daily_history_summaries, golf_history_summaries; schema in
+     tools/sql/history-compaction.sql, created if missing),
+  2. archives the raw rows as gzip'd COPY text files, and
+  3. deletes them.
+
+Work is done in bounded batches of parent rows (games or golf_rounds). Each
+batch is one transaction that:
+  - locks its parents FOR UPDATE, so no child row can be added mid-batch
+  - writes the summaries
+  - writes and fsyncs the archive files
+  - deletes children, then parents, checking every delete count against the
+    archived count
+  - advances a keyset checkpoint (history_compaction_checkpoints)
+  - appends and fsyncs the batch's manifest entries, marked "pending"
+After the commit a "committed" line for the batch follows.
+
+If a run is interrupted, the next run resumes from the checkpoint with the
+same cutoff. A batch that rolled back is redone under the same archive file
+names, so nothing is archived twice.
+
+Archives land in <archive-dir>/<source>/<table>-<first id>-<last id>.copy.gz.
+Each file is listed in <archive-dir>/manifest.jsonl with its row count,
+column list and sha256, under a batch id. Only batches whose latest status
+line is "committed" hold deleted rows. If a run dies between the commit and
+the "committed" line, the next run settles every still-pending batch from the
+checkpoint (committed iff the checkpoint reached its last id) before doing
+anything else, so no archive of deleted rows goes unlisted. Restore parents
+before children, e.g.:
+
+  gunzip -c archive/daily/games-0000000001-0000000100.copy.gz | psql "$DATABASE_URL" -c "COPY games FROM STDIN"
+
+Per-player totals for compacted days survive only in the materialized
+leaderboard tables. The job therefore refuses to delete rows that
+tools/materialize_leaderboards.py has not yet consumed, unless
+--ignore-leaderboards is given. Once history is compacted, the live
+handler SQL (and materialize_leaderboards.py --verify) only sees the
+retained window.
+
+Usage:
+  python tools/compact_history.py --keep-days 365 --dry-run
+  python tools/compact_history.py --keep-days 365 --archive-dir /var/backups/grordle
+  python tools/compact_history.py --before 2025-10-01 --only golf
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+import psycopg
+from psycopg import sql
+
+
+SCHEMA_SQL = Path(__file__).resolve().parent / "sql" / "history-compaction.sql"
+DEFAULT_ARCHIVE_DIR = Path(__file__).resolve().parent.parent / "data" / "history-archive"
+MANIFEST_NAME = "manifest.jsonl"
+
+
+@dataclass(frozen=True)
+class Source:
+    name: str
+    parent: str
+    children: tuple[tuple[str, str], ...]  # (table, column referencing parent.id)
+    select_sql: str
+    summary_sql: str
+
+
+DAILY_SUMMARY_SQL = """
+WITH g AS (
+  SELECT id, COALESCE(org_id, 0) AS org_key, play_date FROM games WHERE id = ANY(%(ids)s)
+),
+dp AS (
+  SELECT game_id, COUNT(*) AS n FROM daily_players WHERE game_id = ANY(%(ids)s) GROUP BY game_id
+),
+s AS (
+  SELECT game_id,
+         COUNT(*) AS n,
+         COUNT(*) FILTER (WHERE success) AS ok,
+         SUM(attempts) AS attempts,
+         MIN(attempts) FILTER (WHERE success) AS best,
+         COUNT(*) FILTER (WHERE success AND attempts = 1) AS h1,
+         COUNT(*) FILTER (WHERE success AND attempts = 2) AS h2,
+         COUNT(*) FILTER (WHERE success AND attempts = 3) AS h3,
+         COUNT(*) FILTER (WHERE success AND attempts = 4) AS h4,
+         COUNT(*) FILTER (WHERE success AND attempts = 5) AS h5,
+         COUNT(*) FILTER (WHERE success AND attempts = 6) AS h6
+  FROM scores WHERE game_id = ANY(%(ids)s) GROUP BY game_id
+),
+pg AS (
+  SELECT game_id, COUNT(*) AS n, COUNT(*) FILTER (WHERE completed) AS done
+  FROM player_games WHERE game_id = ANY(%(ids)s) GROUP BY game_id
+)
+INSERT INTO daily_history_summaries AS t
+  (org_key, play_date, games, players, scores, successes, total_attempts, best_attempts,
+   solved_histogram, player_games, completed_player_games)
+SELECT g.org_key, g.play_date, COUNT(*),
+       COALESCE(SUM(dp.n), 0), COALESCE(SUM(s.n), 0), COALESCE(SUM(s.ok), 0), COALESCE(SUM(s.attempts), 0),
+       MIN(s.best),
+       ARRAY[COALESCE(SUM(s.h1), 0), COALESCE(SUM(s.h2), 0), COALESCE(SUM(s.h3), 0),
+             COALESCE(SUM(s.h4), 0), COALESCE(SUM(s.h5), 0), COALESCE(SUM(s.h6), 0)]::int[],
+       COALESCE(SUM(pg.n), 0), COALESCE(SUM(pg.done), 0)
+FROM g
+LEFT JOIN dp ON dp.game_id = g.id
+LEFT JOIN s ON s.game_id = g.id
+LEFT JOIN pg ON pg.game_id = g.id
+GROUP BY g.org_key, g.play_date
+ON CONFLICT (org_key, play_date) DO UPDATE SET
+  games = t.games + EXCLUDED.games,
+  players = t.players + EXCLUDED.players,
+  scores = t.scores + EXCLUDED.scores,
+  successes = t.successes + EXCLUDED.successes,
+  total_attempts = t.total_attempts + EXCLUDED.total_attempts,
+  best_attempts = LEAST(t.best_attempts, EXCLUDED.best_attempts),
+  solved_histogram = ARRAY(SELECT a + b FROM unnest(t.solved_histogram, EXCLUDED.solved_histogram) AS u(a, b)),
+  player_games = t.player_games + EXCLUDED.player_games,
+  completed_player_games = t.completed_player_games + EXCLUDED.completed_player_games,
+  compacted_at = NOW()
+"""
+
+GOLF_SUMMARY_SQL = """
+WITH r AS (
+  SELECT id, COALESCE(org_id, 0) AS org_key, COALESCE(completed_at, started_at)::date AS day,
+         is_completed, total_score
+  FROM golf_rounds WHERE id = ANY(%(ids)s)
+),
+h AS (
+  SELECT round_id, COUNT(*) AS n, COALESCE(SUM(attempts), 0) AS attempts
+  FROM golf_holes WHERE round_id = ANY(%(ids)s) GROUP BY round_id
+)
+INSERT INTO golf_history_summaries AS t
+  (org_key, day, rounds, completed_rounds, total_score, best_score, holes, hole_attempts)
+SELECT r.org_key, r.day, COUNT(*),
+       COUNT(*) FILTER (WHERE r.is_completed),
+       COALESCE(SUM(r.total_score) FILTER (WHERE r.is_completed), 0),
+       MIN(r.total_score) FILTER (WHERE r.is_completed),
+       COALESCE(SUM(h.n), 0), COALESCE(SUM(h.attempts), 0)
+FROM r LEFT JOIN h ON h.round_id = r.id
+GROUP BY r.org_key, r.day
+ON CONFLICT (org_key, day) DO UPDATE SET
+  rounds = t.rounds + EXCLUDED.rounds,
+  completed_rounds = t.completed_rounds + EXCLUDED.completed_rounds,
+  total_score = t.total_score + EXCLUDED.total_score,
+  best_score = LEAST(t.best_score, EXCLUDED.best_score),
+  holes = t.holes + EXCLUDED.holes,
+  hole_attempts = t.hole_attempts + EXCLUDED.hole_attempts,
+  compacted_at = NOW()
+"""
+
+SOURCES = {
+    "daily": Source(
+        name="daily",
+        parent="games",
+        children=(("scores", "game_id"), ("daily_players", "game_id"), ("player_games", "game_id")),
+        select_sql="""
+            SELECT id FROM games
+            WHERE id > %(last_id)s AND play_date < %(cutoff)s
+            ORDER BY id LIMIT %(limit)s {lock}
+        """,
+        summary_sql=DAILY_SUMMARY_SQL,
+    ),
+    "golf": Source(
+        name="golf",
+        parent="golf_rounds",
+        children=(("golf_holes", "round_id"),),
+        # Abandoned rounds never complete; they age out by started_at.
+        select_sql="""
+            SELECT id FROM golf_rounds
+            WHERE id > %(last_id)s AND COALESCE(completed_at, started_at) < %(cutoff)s
+            ORDER BY id LIMIT %(limit)s {lock}
+        """,
+        summary_sql=GOLF_SUMMARY_SQL,
+    ),
+}
+
+
+@dataclass
+class PassStats:
+    batches: int = 0
+    parents: int = 0
+    archived: int = 0
+    deleted: int = 0
+    bytes_written: int = 0
+    seconds: float = 0.0
+
+    def line(self, name: str) -> str:
+        rate = self.deleted / self.seconds if self.seconds > 0 else 0.0
+        return (
+            f"  {name:<6} batches={self.batches:<5} parents={self.parents:<7} archived={self.archived:<8} "
+            f"deleted={self.deleted:<8} {self.bytes_written / 1e6:7.2f} MB  {self.seconds:7.2f}s  {rate:,.0f} rows/s"
+        )
+
+
+# --- archive files ------------------------------------------------------------
+
+
+def table_columns(cur: psycopg.Cursor, table: str) -> list[str]:
+    cur.execute(
+        """SELECT column_name FROM information_schema.columns
+           WHERE table_schema = current_schema() AND table_name = %s ORDER BY ordinal_position""",
+        (table,),
+    )
+    return [name for (name,) in cur.fetchall()]
+
+
+def archive_rows(cur: psycopg.Cursor, table: str, column: str, ids: list[int], path: Path) -> dict:
+    """COPY the matching rows into a gzip file (written atomically, fsynced)."""
+    statement = sql.SQL("COPY (SELECT * FROM {} WHERE {} = ANY(%s) ORDER BY id) TO STDOUT").format(
+        sql.Identifier(table), sql.Identifier(column)
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    digest = hashlib.sha256()
+    rows = 0
+    with tmp.open("wb") as raw:
+        with gzip.GzipFile(fileobj=raw, mode="wb", mtime=0) as out, cur.copy(statement, (ids,)) as copy:
+            for chunk in copy:
+                data = bytes(chunk)
+                out.write(data)
+                digest.update(data)
+                # COPY text format escapes embedded newlines, so one per row.
+                rows += data.count(b"\n")
+        raw.flush()
+        os.fsync(raw.fileno())
+    tmp.replace(path)
+    return {"table": table, "file": str(path), "rows": rows, "sha256": digest.hexdigest(), "bytes": path.stat().st_size}
+
+
+def append_manifest(archive_dir: Path, entries: list[dict]) -> None:
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    with (archive_dir / MANIFEST_NAME).open("a", encoding="utf-8") as f:
+        for entry in entries:
+            f.write(json.dumps(entry, sort_keys=True) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def settle_manifest(archive_dir: Path, source: str, checkpoint: tuple[date, int, datetime | None] | None) -> int:
+    """Mark batches left "pending" by an interrupted run; returns how many."""
+    path = archive_dir / MANIFEST_NAME
+    if not path.exists():
+        return 0
+    pending: dict[str, tuple[str, int]] = {}
+    with path.open(encoding="utf-8") as f:
+        for line in f:
+            record = json.loads(line)
+            if record.get("source") != source or "batch" not in record:
+                continue
+            if record["status"] == "pending":
+                pending[record["batch"]] = (record["cutoff"], record["last_id"])
+            else:
+                pending.pop(record["batch"], None)
+    settled = []
+    for batch, (cutoff, last_id) in pending.items():
+        # The checkpoint moves in the batch's own transaction, so it says whether that committed.
+        committed = checkpoint is not None and checkpoint[0].isoformat() == cutoff and checkpoint[1] >= last_id
+        settled.append({"source": source, "batch": batch, "status": "committed" if committed else "rolled_back"})
+    if settled:
+        append_manifest(archive_dir, settled)
+    return len(settled)
+
+
+# --- checkpoints --------------------------------------------------------------
+
+
+def load_checkpoint(cur: psycopg.Cursor, source: str) -> tuple[date, int, datetime | None] | None:
+    cur.execute("SELECT to_regclass('history_compaction_checkpoints') IS NOT NULL")
+    if not cur.fetchone()[0]:
+        return None  # dry run before the first real run
+    cur.execute("SELECT cutoff, last_id, finished_at FROM history_compaction_checkpoints WHERE source = %s", (source,))
+    return cur.fetchone()
+
+
+def start_pass(cur: psycopg.Cursor, source: str, cutoff: date) -> None:
+    cur.execute(
+        """INSERT INTO history_compaction_checkpoints (source, cutoff) VALUES (%s, %s)
+           ON CONFLICT (source) DO UPDATE SET cutoff = EXCLUDED.cutoff, last_id = 0, batches = 0,
+             rows_archived = 0, rows_deleted = 0, started_at = NOW(), updated_at = NOW(), finished_at = NULL""",
+        (source, cutoff),
+    )
+
+
+def save_checkpoint(cur: psycopg.Cursor, source: str, last_id: int, archived: int, deleted: int) -> None:
+    cur.execute(
+        """UPDATE history_compaction_checkpoints
+           SET last_id = %s, batches = batches + 1, rows_archived = rows_archived + %s,
+               rows_deleted = rows_deleted + %s, updated_at = NOW()
+           WHERE source = %s""",
+        (last_id, archived, deleted, source),
+    )
+
+
+def finish_pass(cur: psycopg.Cursor, source: str) -> None:
+    cur.execute("UPDATE history_compaction_checkpoints SET finished_at = NOW() WHERE source = %s", (source,))
+
+
+# --- leaderboard guard --------------------------------------------------------
+
+
+def unmaterialized_rows(cur: psycopg.Cursor, cutoff: date, sources: list[str]) -> dict[str, int] | None:
+    """Rows before the cutoff that materialize_leaderboards.py has not consumed (None: no summaries)."""
+    cur.execute("SELECT to_regclass('leaderboard_watermarks') IS NOT NULL")
+    if not cur.fetchone()[0]:
+        return None
+    cur.execute("SELECT source, last_id, last_ts FROM leaderboard_watermarks")
+    marks = {source: (last_id, last_ts) for source, last_id, last_ts in cur.fetchall()}
+    missing: dict[str, int] = {}
+    if "daily" in sources:
+        cur.execute(
+            """SELECT COUNT(*) FROM scores s JOIN games g ON g.id = s.game_id
+               WHERE g.play_date < %s AND s.id > %s""",
+            (cutoff, marks.get("scores", (0, None))[0]),
+        )
+        missing["scores"] = cur.fetchone()[0]
+        cur.execute("SELECT COUNT(*) FROM games WHERE play_date < %s AND id > %s", (cutoff, marks.get("games", (0, None))[0]))
+        missing["games"] = cur.fetchone()[0]
+    if "golf" in sources:
+        last_id, last_ts = marks.get("golf_rounds", (0, None))
+        cur.execute(
+            """SELECT COUNT(*) FROM golf_rounds
+               WHERE is_completed = TRUE AND completed_at < %s
+                 AND (%s::timestamp IS NULL OR (completed_at, id) > (%s::timestamp, %s))""",
+            (cutoff, last_ts, last_ts, last_id),
+        )
+        missing["golf_rounds"] = cur.fetchone()[0]
+    return {k: v for k, v in missing.items() if v}
+
+
+# --- compaction ---------------------------------------------------------------
+
+
+def count_rows(cur: psycopg.Cursor, table: str, column: str, ids: list[int]) -> int:
+    cur.execute(sql.SQL("SELECT COUNT(*) FROM {} WHERE {} = ANY(%s)").format(sql.Identifier(table), sql.Identifier(column)), (ids,))
+    return cur.fetchone()[0]
+
+
+def run_batch(
+    cur: psycopg.Cursor, source: Source, ids: list[int], cutoff: date, archive_dir: Path, stats: PassStats
+) -> list[dict]:
+    cur.execute(source.summary_sql, {"ids": ids})
+    tag = f"{ids[0]:010d}-{ids[-1]:010d}"
+    entries: list[dict] = []
+    tables = list(source.children) + [(source.parent, "id")]
+    for table, column in tables:
+        entry = archive_rows(cur, table, column, ids, archive_dir / source.name / f"{table}-{tag}.copy.gz")
+        entry.update(
+            source=source.name,
+            cutoff=cutoff.isoformat(),
+            columns=table_columns(cur, table),
+            batch=tag,
+            last_id=ids[-1],
+            status="pending",
+        )
+        entries.append(entry)
+
+    archived = {e["table"]: e["rows"] for e in entries}
+    for table, column in tables:
+        cur.execute(sql.SQL("DELETE FROM {} WHERE {} = ANY(%s)").format(sql.Identifier(table), sql.Identifier(column)), (ids,))
+        if cur.rowcount != archived[table]:
+            # Raising rolls the batch back; the archive files are rewritten next run.
+            raise SystemExit(f"{table}: deleted {cur.rowcount} rows but archived {archived[table]}; rolled back")
+
+    total = sum(archived.values())
+    save_checkpoint(cur, source.name, ids[-1], total, total)
+    stats.archived += total
+    stats.deleted += total
+    stats.bytes_written += sum(e["bytes"] for e in entries)
+    append_manifest(archive_dir, entries)
+    return entries
+
+
+def compact_source(
+    conn: psycopg.Connection, source: Source, cutoff: date, batch_size: int, archive_dir: Path, *, dry_run: bool
+) -> PassStats:
+    stats = PassStats()
+    started = time.perf_counter()
+
+    with conn.cursor() as cur:
+        checkpoint = load_checkpoint(cur, source.name)
+    if not dry_run:
+        settled = settle_manifest(archive_dir, source.name, checkpoint)
+        if settled:
+            print(f"  {source.name}: settled {settled} pending manifest batch(es) from an interrupted run")
+    last_id = 0
+    if checkpoint is not None and checkpoint[2] is None:
+        # An interrupted pass finishes with the cutoff it started with.
+        cutoff, last_id = checkpoint[0], checkpoint[1]
+        print(f"  {source.name}: resuming pass with cutoff {cutoff} after id {last_id}")
+    elif not dry_run:
+        with conn.transaction(), conn.cursor() as cur:
+            start_pass(cur, source.name, cutoff)
+
+    select = source.select_sql.format(lock="" if dry_run else "FOR UPDATE")
+    while True:
+        with conn.transaction(), conn.cursor() as cur:
+            cur.execute(select, {"last_id": last_id, "cutoff": cutoff, "limit": batch_size})
+            ids = [row[0] for row in cur.fetchall()]
+            if not ids:
+                if not dry_run:
+                    finish_pass(cur, source.name)
+                break
+            if dry_run:
+                rows = count_rows(cur, source.parent, "id", ids)
+                rows += sum(count_rows(cur, table, column, ids) for table, column in source.children)
+                stats.archived += rows
+                entries = []
+            else:
+                entries = run_batch(cur, source, ids, cutoff, archive_dir, stats)
+        if entries:
+            append_manifest(archive_dir, [{"source": source.name, "batch": entries[0]["batch"], "status": "committed"}])
+        last_id = ids[-1]
+        stats.batches += 1
+        stats.parents += len(ids)
+    stats.seconds = time.perf_counter() - started
+    return stats
+
+
+def sydney_today() -> date:
+    return datetime.now(ZoneInfo("Australia/Sydney")).date()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Summarize, archive and delete game history older than a retention window.")
+    parser.add_argument("--dsn", default=os.environ.get("DATABASE_URL"), help="Postgres DSN (default: $DATABASE_URL)")
+    window = parser.add_mutually_exclusive_group(required=True)
+    window.add_argument("--keep-days", type=int, default=None, help="Keep this many days before today (Australia/Sydney)")
+    window.add_argument("--before", default=None, help="Compact rows dated before YYYY-MM-DD")
+    parser.add_argument("--only", choices=tuple(SOURCES), default=None, help="Compact one game type only")
+    parser.add_argument("--daily-batch", type=int, default=100, help="games rows (with their children) per transaction (default 100)")
+    parser.add_argument("--golf-batch", type=int, default=1000, help="golf_rounds rows (with their holes) per transaction (default 1000)")
+    parser.add_argument("--archive-dir", type=Path, default=DEFAULT_ARCHIVE_DIR)
+    parser.add_argument("--dry-run", action="store_true", help="Count what would be compacted; change nothing")
+    parser.add_argument(
+        "--ignore-leaderboards",
+        action="store_true",
+        help="Compact even if materialize_leaderboards.py has not consumed the rows (their per-player totals are lost)",
+    )
+    args = parser.parse_args(argv)
+
+    if not args.dsn:
+        raise SystemExit("No database: pass --dsn or set DATABASE_URL")
+    if args.before is not None:
+        try:
+            cutoff = date.fromisoformat(args.before)
+        except ValueError:
+            raise SystemExit(f"Invalid --before date: {args.before!r}")
+    else:
+        if args.keep_days < 1:
+            raise SystemExit("--keep-days must be >= 1")
+        cutoff = sydney_today() - timedelta(days=args.keep_days)
+    if args.daily_batch <= 0 or args.golf_batch <= 0:
+        raise SystemExit("Batch sizes must be > 0")
+
+    names = [args.only] if args.only else list(SOURCES)
+    batch_sizes = {"daily": args.daily_batch, "golf": args.golf_batch}
+    with psycopg.connect(args.dsn) as conn:
+        conn.autocommit = True
+        if not args.dry_run:
+            conn.execute(SCHEMA_SQL.read_text(encoding="utf-8"))
+
+        with conn.cursor() as cur:
+            missing = unmaterialized_rows(cur, cutoff, names)
+        if not args.ignore_leaderboards:
+            if missing is None:
+                raise SystemExit(
+                    "No leaderboard summaries found; run tools/materialize_leaderboards.py first "
+                    "or pass --ignore-leaderboards"
+                )
+            if missing:
+                listed = ", ".join(f"{table}={n}" for table, n in missing.items())
+                raise SystemExit(
+                    f"Rows before {cutoff} not yet materialized ({listed}); "
+                    "run tools/materialize_leaderboards.py first or pass --ignore-leaderboards"
+                )
+
+        print(f"Cutoff: rows dated before {cutoff}{'  (dry run)' if args.dry_run else ''}")
+        results: list[tuple[str, PassStats]] = []
+        for name in names:
+            results.append((name, compact_source(conn, SOURCES[name], cutoff, batch_sizes[name], args.archive_dir, dry_run=args.dry_run)))
+
+    if args.dry_run:
+        print("Would compact:")
+        for name, s in results:
+            print(f"  {name:<6} parents={s.parents:<7} rows={s.archived:<8} batches={s.batches}")
+        return
+    print("Compacted:")
+    for name, s in results:
+        print(s.line(name))
+    if any(s.batches for _, s in results):
+        print(f"Wrote: {args.archive_dir / MANIFEST_NAME}")
+
+
+if __name__ == "__main__":
+    main()
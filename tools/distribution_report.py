@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""One-pass distribution and threshold-sweep reports for word lists.
+
+Picking cutoffs (a Zipf floor in filter_common_words.py, PAR percentages in
+generate_wordlist_table.py) used to mean rescanning the whole list once per
+candidate threshold. A Distribution sorts a metric once and keeps cumulative
+counts and sums over its distinct values. After that, every threshold count,
+quantile and histogram bin is a bisect, so sweeping hundreds of cutoffs over
+a million-word list costs no more than the sort.
+
+The report covers whichever of these metrics the input has:
+  zipf        wordfreq Zipf frequency (from --state, or looked up)
+  difficulty  DIFFICULTY column of a wordlist table
+  scrabble    SCRABBLE_SCORE column (or scored from the word)
+  par         PAR column
+
+Input is either a wordlist table (WORD, DIFFICULTY, SCRABBLE_SCORE, PAR) or a
+plain word list (one word per line), which yields zipf and scrabble only.
+
+Usage:
+  python tools/distribution_report.py data/wordlist-table.txt
+  python tools/distribution_report.py data/wordlist-table.txt --state state.tsv --output report.md
+  python tools/distribution_report.py words.txt --threshold zipf=2,3,3.5,4 --format json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import sys
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from typing import Iterable
+
+from wordlist_table import HEADER as TABLE_HEADER
+from wordlist_table import format_float, read_table
+
+
+METRICS = ("zipf", "difficulty", "scrabble", "par")
+DISCRETE_METRICS = {"scrabble", "par"}  # histogram by value instead of by bin
+DEFAULT_QUANTILES = (0.01, 0.05, 0.1, 0.25, 0.5, 0.75, 0.9, 0.95, 0.99)
+DEFAULT_THRESHOLDS: dict[str, tuple[float, ...]] = {
+    "zipf": (1.0, 2.0, 2.5, 3.0, 3.5, 4.0, 5.0),
+    "difficulty": (10.0, 20.0, 40.0, 60.0, 80.0, 90.0),
+    "scrabble": (5.0, 8.0, 10.0, 12.0, 15.0),
+    "par": (4.0, 5.0),
+}
+DEFAULT_BINS = 10
+
+
+class Distribution:
+    """Sorted values of one metric; counts, sums and quantiles by bisect."""
+
+    def __init__(self, name: str, values: Iterable[float]):
+        ordered = sorted(values)
+        self.name = name
+        self.count = len(ordered)
+        # distinct[i] is the i-th distinct value; cumulative[i] / cumulative_sum[i]
+        # are the count / sum of all values below distinct[i].
+        self.distinct: list[float] = []
+        self.cumulative: list[int] = [0]
+        self.cumulative_sum: list[float] = [0.0]
+        total = 0.0
+        for i, v in enumerate(ordered):
+            if not self.distinct or v != self.distinct[-1]:
+                if self.distinct:
+                    self.cumulative.append(i)
+                    self.cumulative_sum.append(total)
+                self.distinct.append(v)
+            total += v
+        if self.distinct:
+            self.cumulative.append(self.count)
+            self.cumulative_sum.append(total)
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def minimum(self) -> float | None:
+        return self.distinct[0] if self.distinct else None
+
+    @property
+    def maximum(self) -> float | None:
+        return self.distinct[-1] if self.distinct else None
+
+    @property
+    def mean(self) -> float | None:
+        return self.cumulative_sum[-1] / self.count if self.count else None
+
+    def count_below(self, threshold: float) -> int:
+        return self.cumulative[bisect_left(self.distinct, threshold)]
+
+    def count_at_most(self, threshold: float) -> int:
+        return self.cumulative[bisect_right(self.distinct, threshold)]
+
+    def count_at_least(self, threshold: float) -> int:
+        return self.count - self.count_below(threshold)
+
+    def count_between(self, low: float, high: float) -> int:
+        """Values with low <= v <= high."""
+        if high < low:
+            return 0
+        return self.count_at_most(high) - self.count_below(low)
+
+    def mean_at_least(self, threshold: float) -> float | None:
+        i = bisect_left(self.distinct, threshold)
+        kept = self.count - self.cumulative[i]
+        return (self.cumulative_sum[-1] - self.cumulative_sum[i]) / kept if kept else None
+
+    def value_at(self, rank: int) -> float:
+        """The rank-th smallest value (0-based)."""
+        if not 0 <= rank < self.count:
+            raise IndexError(rank)
+        return self.distinct[bisect_right(self.cumulative, rank) - 1]
+
+    def quantile(self, q: float) -> float | None:
+        # Linear interpolation between closest ranks (numpy's default method).
+        if not self.count:
+            return None
+        if not 0.0 <= q <= 1.0:
+            raise ValueError(f"quantile out of range: {q}")
+        pos = q * (self.count - 1)
+        low = math.floor(pos)
+        value = self.value_at(low)
+        if pos > low:
+            value += (self.value_at(low + 1) - value) * (pos - low)
+        return value
+
+    def value_counts(self) -> dict[float, int]:
+        return {v: self.cumulative[i + 1] - self.cumulative[i] for i, v in enumerate(self.distinct)}
+
+    def histogram(self, edges: list[float]) -> list[int]:
+        """Counts in [edges[i], edges[i + 1]); the last bin includes its upper edge."""
+        counts: list[int] = []
+        for i in range(len(edges) - 1):
+            upper = self.count_at_most(edges[i + 1]) if i == len(edges) - 2 else self.count_below(edges[i + 1])
+            counts.append(upper - self.count_below(edges[i]))
+        return counts
+
+    def even_edges(self, bins: int) -> list[float]:
+        if not self.count:
+            return []
+        low, high = self.distinct[0], self.distinct[-1]
+        if high == low:
+            return [low, high]
+        step = (high - low) / bins
+        return [low + step * i for i in range(bins)] + [high]
+
+
+def metric_report(dist: Distribution, *, thresholds: Iterable[float], quantiles: Iterable[float], bins: int) -> dict:
+    out: dict = {
+        "count": dist.count,
+        "min": dist.minimum,
+        "max": dist.maximum,
+        "mean": dist.mean,
+        "quantiles": [{"q": q, "value": dist.quantile(q)} for q in quantiles],
+        "thresholds": [
+            {
+                "threshold": t,
+                "at_least": dist.count_at_least(t),
+                "below": dist.count_below(t),
+                "share_at_least": dist.count_at_least(t) / dist.count if dist.count else 0.0,
+                "mean_at_least": dist.mean_at_least(t),
+            }
+            for t in sorted(thresholds)
+        ],
+    }
+    if dist.name in DISCRETE_METRICS:
+        out["histogram"] = [{"value": v, "count": c} for v, c in dist.value_counts().items()]
+    else:
+        edges = dist.even_edges(bins)
+        out["histogram"] = [
+            {"low": edges[i], "high": edges[i + 1], "count": c} for i, c in enumerate(dist.histogram(edges))
+        ]
+    return out
+
+
+def build_report(
+    distributions: dict[str, Distribution],
+    *,
+    source: str,
+    thresholds: dict[str, Iterable[float]] | None = None,
+    quantiles: Iterable[float] = DEFAULT_QUANTILES,
+    bins: int = DEFAULT_BINS,
+) -> dict:
+    thresholds = thresholds or {}
+    quantiles = tuple(quantiles)
+    return {
+        "source": source,
+        "metrics": {
+            name: metric_report(
+                dist,
+                thresholds=thresholds.get(name, DEFAULT_THRESHOLDS.get(name, ())),
+                quantiles=quantiles,
+                bins=bins,
+            )
+            for name, dist in distributions.items()
+        },
+    }
+
+
+def _num(value: float | None) -> str:
+    if value is None:
+        return "-"
+    if float(value).is_integer():
+        return str(int(value))
+    return format_float(value)
+
+
+def render_markdown(report: dict) -> str:
+    lines = [f"# Distribution report: {report['source']}", ""]
+    for name, m in report["metrics"].items():
+        lines += [
+            f"## {name}",
+            "",
+            f"{m['count']} values, min {_num(m['min'])}, max {_num(m['max'])}, mean {_num(m['mean'])}",
+            "",
+            "| quantile | value |",
+            "|---:|---:|",
+        ]
+        lines += [f"| {q['q']:g} | {_num(q['value'])} |" for q in m["quantiles"]]
+        if m["thresholds"]:
+            lines += ["", "| threshold | >= | < | share >= | mean >= |", "|---:|---:|---:|---:|---:|"]
+            lines += [
+                f"| {_num(t['threshold'])} | {t['at_least']} | {t['below']} | {t['share_at_least']:.1%} | {_num(t['mean_at_least'])} |"
+                for t in m["thresholds"]
+            ]
+        if name in DISCRETE_METRICS:
+            lines += ["", "| value | count |", "|---:|---:|"]
+            lines += [f"| {_num(h['value'])} | {h['count']} |" for h in m["histogram"]]
+        else:
+            lines += ["", "| bin | count |", "|---|---:|"]
+            lines += [f"| {_num(h['low'])} .. {_num(h['high'])} | {h['count']} |" for h in m["histogram"]]
+        lines.append("")
+    return "\n".join(lines)
+
+
+def write_report(path: Path, report: dict, fmt: str | None = None) -> None:
+    """Write JSON or Markdown; the format defaults from the suffix (.json, else Markdown)."""
+    fmt = fmt or ("json" if path.suffix.lower() == ".json" else "md")
+    text = json.dumps(report, indent=2) + "\n" if fmt == "json" else render_markdown(report)
+    path.write_text(text, encoding="utf-8")
+
+
+def distributions_from_columns(columns: dict[str, Iterable[float]]) -> dict[str, Distribution]:
+    return {name: Distribution(name, values) for name, values in columns.items()}
+
+
+# --- inputs -------------------------------------------------------------------
+
+
+def read_state_zipf(path: Path) -> dict[str, float]:
+    from generate_wordlist_table import read_state
+
+    rows, _ = read_state(path)
+    return {r.word: r.zipf for r in rows}
+
+
+def load_columns(path: Path, metrics: list[str], state: Path | None) -> dict[str, list[float]]:
+    with path.open(encoding="utf-8-sig") as f:
+        first = f.readline().rstrip("\r\n")
+    columns: dict[str, list[float]] = {}
+    if first == TABLE_HEADER:
+        rows = read_table(path)
+        words = [r.word.lower() for r in rows]
+        if "difficulty" in metrics:
+            columns["difficulty"] = [r.difficulty for r in rows]
+        if "scrabble" in metrics:
+            columns["scrabble"] = [r.scrabble for r in rows]
+        if "par" in metrics:
+            columns["par"] = [r.par for r in rows]
+    else:
+        seen: set[str] = set()
+        words = []
+        for raw in path.read_text(encoding="utf-8").splitlines():
+            w = raw.strip().lower()
+            if w and w not in seen:
+                seen.add(w)
+                words.append(w)
+        if "scrabble" in metrics:
+            from generate_wordlist_table import scrabble_score
+
+            columns["scrabble"] = [scrabble_score(w) for w in words]
+    if not words:
+        raise SystemExit(f"No words in {path}")
+
+    if "zipf" in metrics:
+        if state is not None:
+            by_word = read_state_zipf(state)
+            missing = [w for w in words if w not in by_word]
+            if missing:
+                raise SystemExit(f"{state}: no Zipf value for {len(missing)} word(s), e.g. {missing[0].upper()}")
+            columns["zipf"] = [by_word[w] for w in words]
+        else:
+            from wordfreq import zipf_frequency
+
+            columns["zipf"] = [zipf_frequency(w, "en") for w in words]
+    # Keep the report in METRICS order.
+    return {name: columns[name] for name in METRICS if name in columns}
+
+
+def parse_thresholds(values: list[str]) -> dict[str, list[float]]:
+    out: dict[str, list[float]] = {}
+    for item in values:
+        name, sep, spec = item.partition("=")
+        if not sep or name not in METRICS:
+            raise SystemExit(f"--threshold expects METRIC=V1,V2,... with METRIC in {', '.join(METRICS)}: {item!r}")
+        try:
+            out.setdefault(name, []).extend(float(v) for v in spec.split(",") if v)
+        except ValueError:
+            raise SystemExit(f"Invalid --threshold value: {item!r}")
+    return out
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Distribution, quantile and threshold-sweep report for a word list or wordlist table.")
+    parser.add_argument("input", type=Path, help="Wordlist table (TSV with header) or plain word list")
+    parser.add_argument("--state", type=Path, default=None, help="Read Zipf values from a generate_wordlist_table.py --state file")
+    parser.add_argument("--metric", action="append", choices=METRICS, default=None, help="Report this metric (repeatable; default all available)")
+    parser.add_argument("--threshold", action="append", default=[], metavar="METRIC=V1,V2", help="Cutoffs to sweep (repeatable)")
+    parser.add_argument("--quantiles", default=None, help="Comma-separated quantiles (default 0.01,0.05,...,0.99)")
+    parser.add_argument("--bins", type=int, default=DEFAULT_BINS, help=f"Histogram bins for continuous metrics (default {DEFAULT_BINS})")
+    parser.add_argument("--format", choices=("md", "json"), default=None, help="Output format (default: from --output suffix, else md)")
+    parser.add_argument("--output", type=Path, default=None, help="Write the report here instead of stdout")
+    args = parser.parse_args(argv)
+
+    if args.bins <= 0:
+        raise SystemExit("--bins must be > 0")
+    quantiles = DEFAULT_QUANTILES
+    if args.quantiles is not None:
+        try:
+            quantiles = tuple(float(q) for q in args.quantiles.split(",") if q)
+        except ValueError:
+            raise SystemExit(f"Invalid --quantiles: {args.quantiles!r}")
+        if any(not 0.0 <= q <= 1.0 for q in quantiles):
+            raise SystemExit("Quantiles must be between 0 and 1")
+
+    columns = load_columns(args.input, args.metric or list(METRICS), args.state)
+    report = build_report(
+        distributions_from_columns(columns),
+        source=args.input.name,
+        thresholds=parse_thresholds(args.threshold),
+        quantiles=quantiles,
+        bins=args.bins,
+    )
+    if args.output is None:
+        if args.format == "json":
+            json.dump(report, sys.stdout, indent=2)
+            print()
+        else:
+            print(render_markdown(report), end="")
+        return
+    write_report(args.output, report, args.format)
+    print(f"Wrote: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
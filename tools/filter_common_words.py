@@ -1,61 +1,101 @@
-from wordfreq import word_frequency
-import sys
-
-# Read the word list
-with open('filtered-wordlist.txt', 'r') as f:
-    words = [line.strip() for line in f if line.strip()]
-
-print(f"Total words: {len(words)}")
-
-# Get word frequencies (wordfreq uses lowercase)
-word_freq_pairs = []
-for word in words:
-    freq = word_frequency(word.lower(), 'en')
-    word_freq_pairs.append((word, freq))
-
-# Sort by frequency (most common first)
-word_freq_pairs.sort(key=lambda x: x[1], reverse=True)
-
-# Let's see the distribution
-print("\nMost common words:")
-for word, freq in word_freq_pairs[:10]:
-    print(f"  {word}: {freq:.2e}")
-
-print("\nLeast common words:")
-for word, freq in word_freq_pairs[-10:]:
-    print(f"  {word}: {freq:.2e}")
-
-# Filter by frequency threshold
-# wordfreq uses a log scale where:
-# - 1e-3 (0.001) = very common words
-# - 1e-6 (0.000001) = uncommon but known words
-# - 1e-7 and below = very rare/obscure words
-
-# Let's try different thresholds and see the counts
-thresholds = [1e-5, 1e-6, 1e-7, 1e-8]
-print("\nWords at different frequency thresholds:")
-for threshold in thresholds:
-    count = sum(1 for _, freq in word_freq_pairs if freq >= threshold)
-    print(f"  >= {threshold:.0e}: {count} words")
-
-# Use a reasonable threshold (1e-7 includes less common but known words)
-THRESHOLD = 1e-7
-common_words = [word for word, freq in word_freq_pairs if freq >= THRESHOLD]
-
-print(f"\nFiltering with threshold {THRESHOLD:.0e}")
-print(f"Kept: {len(common_words)} words")
-print(f"Removed: {len(words) - len(common_words)} words")
-
-# Save the filtered list (sorted by frequency)
-with open('common-wordlist.txt', 'w') as f:
-    f.write('\n'.join(common_words))
-
-print("\nFiltered word list saved to common-wordlist.txt")
-
-# Also save a version with frequencies for review
-with open('wordlist-with-frequencies.txt', 'w') as f:
-    for word, freq in word_freq_pairs:
-        if freq >= THRESHOLD:
-            f.write(f"{word}\t{freq:.2e}\n")
-
-print("Word list with frequencies saved to wordlist-with-frequencies.txt")
+import argparse
+import math
+from pathlib import Path
+
+from distribution_report import build_report, distributions_from_columns, write_report
+from parallel_filter import map_ordered
+
+
+def lower_frequency(word):
+    from wordfreq import word_frequency
+
+    # wordfreq uses lowercase
+    return word_frequency(word.lower(), 'en')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Keep words at or above a wordfreq frequency threshold.")
+    parser.add_argument('input', nargs='?', default='filtered-wordlist.txt', help="Input word list (default: filtered-wordlist.txt)")
+    parser.add_argument('output', nargs='?', default='common-wordlist.txt', help="Output word list (default: common-wordlist.txt)")
+    parser.add_argument('--threshold', type=float, default=1e-7, help="Minimum word frequency to keep (default: 1e-7)")
+    parser.add_argument('--jobs', type=int, default=1, help="Worker processes for frequency lookups; 0 = one per CPU (default: 1)")
+    parser.add_argument('--chunk-size', type=int, default=None, help="Words per worker task (default: ~4 chunks per worker)")
+    parser.add_argument('--sweep', default='1e-5,1e-6,1e-7,1e-8', help="Comma-separated thresholds to report counts for (default: 1e-5,1e-6,1e-7,1e-8)")
+    parser.add_argument('--report', type=Path, default=None, help="Also write a Zipf/scrabble distribution report (.json, else Markdown)")
+    args = parser.parse_args(argv)
+
+    # Read the word list
+    with open(args.input, 'r') as f:
+        words = [line.strip() for line in f if line.strip()]
+
+    print(f"Total words: {len(words)}")
+
+    # Get word frequencies (sharded across processes with --jobs, merged in input order)
+    freqs = map_ordered(lower_frequency, words, jobs=args.jobs, chunk_size=args.chunk_size)
+    word_freq_pairs = list(zip(words, freqs))
+
+    # Sort by frequency (most common first)
+    word_freq_pairs.sort(key=lambda x: x[1], reverse=True)
+
+    # Let's see the distribution
+    print("\nMost common words:")
+    for word, freq in word_freq_pairs[:10]:
+        print(f"  {word}: {freq:.2e}")
+
+    print("\nLeast common words:")
+    for word, freq in word_freq_pairs[-10:]:
+        print(f"  {word}: {freq:.2e}")
+
+    # Filter by frequency threshold
+    # wordfreq uses a log scale where:
+    # - 1e-3 (0.001) = very common words
+    # - 1e-6 (0.000001) = uncommon but known words
+    # - 1e-7 and below = very rare/obscure words
+
+    # Let's try different thresholds and see the counts (one sort, then a bisect per threshold)
+    try:
+        thresholds = [float(t) for t in args.sweep.split(',') if t]
+    except ValueError:
+        raise SystemExit(f"Invalid --sweep: {args.sweep!r}")
+    freq_dist = distributions_from_columns({'frequency': freqs})['frequency']
+    print("\nWords at different frequency thresholds:")
+    for threshold in thresholds:
+        count = freq_dist.count_at_least(threshold)
+        print(f"  >= {threshold:.0e}: {count} words")
+
+    # Use a reasonable threshold (1e-7 includes less common but known words)
+    THRESHOLD = args.threshold
+    common_words = [word for word, freq in word_freq_pairs if freq >= THRESHOLD]
+
+    print(f"\nFiltering with threshold {THRESHOLD:.0e}")
+    print(f"Kept: {len(common_words)} words")
+    print(f"Removed: {len(words) - len(common_words)} words")
+
+    # Save the filtered list (sorted by frequency)
+    with open(args.output, 'w') as f:
+        f.write('\n'.join(common_words))
+
+    print(f"\nFiltered word list saved to {args.output}")
+
+    # Also save a version with frequencies for review
+    with open('wordlist-with-frequencies.txt', 'w') as f:
+        for word, freq in word_freq_pairs:
+            if freq >= THRESHOLD:
+                f.write(f"{word}\t{freq:.2e}\n")
+
+    print("Word list with frequencies saved to wordlist-with-frequencies.txt")
+
+    if args.report is not None:
+        from generate_wordlist_table import scrabble_score
+
+        # Zipf = log10(frequency per billion words); wordfreq reports 0 for unknown words.
+        zipfs = [math.log10(freq) + 9 if freq > 0 else 0.0 for freq in freqs]
+        sweep = [math.log10(t) + 9 for t in thresholds if t > 0]
+        columns = {'zipf': zipfs, 'scrabble': [scrabble_score(w.lower()) for w in words]}
+        report = build_report(distributions_from_columns(columns), source=args.input, thresholds={'zipf': sweep})
+        write_report(args.report, report)
+        print(f"Distribution report saved to {args.report}")
+
+
+if __name__ == '__main__':
+    main()
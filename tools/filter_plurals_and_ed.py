@@ -4,9 +4,10 @@ from __future__ import annotations
 
 import argparse
 from dataclasses import dataclass
+from functools import lru_cache, partial
 from pathlib import Path
 
-from wordfreq import zipf_frequency
+from parallel_filter import map_ordered
 
 
 @dataclass(frozen=True)
@@ -17,6 +18,8 @@ class Stats:
     removed_plural_s: int
     blank_lines: int
     duplicates_removed: int
+
+
 def min_zipf_for_len(length: int, *, min_zipf_3: float, min_zipf_4: float, min_zipf_5: float) -> float:
     if length <= 3:
         return min_zipf_3
@@ -33,7 +36,15 @@ def is_likely_real_word(
     min_zipf_5: float,
 ) -> bool:
     threshold = min_zipf_for_len(len(word), min_zipf_3=min_zipf_3, min_zipf_4=min_zipf_4, min_zipf_5=min_zipf_5)
-    return zipf_frequency(word, "en") >= threshold
+    return cached_zipf(word) >= threshold
+
+
+@lru_cache(maxsize=None)
+def cached_zipf(word: str) -> float:
+    # Base candidates repeat a lot (race/raced/races); each worker keeps its own warm cache.
+    from wordfreq import zipf_frequency
+
+    return zipf_frequency(word, "en")
 
 
 def plural_base_candidates(word: str) -> list[str]:
@@ -67,13 +78,50 @@ def past_tense_base_candidates(word: str) -> list[str]:
     return []
 
 
+def classify_line(
+    raw: str,
+    *,
+    min_zipf_3: float,
+    min_zipf_4: float,
+    min_zipf_5: float,
+) -> tuple[str, str]:
+    """Return (verdict, word) where verdict is "blank", "ed", "s" or "keep"."""
+    w = raw.strip().lower()
+    if not w:
+        return "blank", w
+
+    if w.endswith("ed"):
+        candidates = past_tense_base_candidates(w)
+        if any(
+            is_likely_real_word(c, min_zipf_3=min_zipf_3, min_zipf_4=min_zipf_4, min_zipf_5=min_zipf_5)
+            for c in candidates
+        ):
+            return "ed", w
+
+    if w.endswith("s"):
+        candidates = plural_base_candidates(w)
+        if any(
+            is_likely_real_word(c, min_zipf_3=min_zipf_3, min_zipf_4=min_zipf_4, min_zipf_5=min_zipf_5)
+            for c in candidates
+        ):
+            return "s", w
+
+    return "keep", w
+
+
 def filter_words(
     lines: list[str],
     *,
     min_zipf_3: float,
     min_zipf_4: float,
     min_zipf_5: float,
+    jobs: int = 1,
+    chunk_size: int | None = None,
 ) -> tuple[list[str], Stats]:
+    classify = partial(classify_line, min_zipf_3=min_zipf_3, min_zipf_4=min_zipf_4, min_zipf_5=min_zipf_5)
+    verdicts = map_ordered(classify, lines, jobs=jobs, chunk_size=chunk_size)
+
+    # Serial merge in input order keeps the `seen` de-dupe identical to a single-process run.
     kept: list[str] = []
     seen: set[str] = set()
     removed_ed = 0
@@ -81,29 +129,18 @@ def filter_words(
     blank_lines = 0
     duplicates_removed = 0
 
-    for raw in lines:
-        w = raw.strip().lower()
-        if not w:
+    for verdict, w in verdicts:
+        if verdict == "blank":
             blank_lines += 1
             continue
 
-        if w.endswith("ed"):
-            candidates = past_tense_base_candidates(w)
-            if any(
-                is_likely_real_word(c, min_zipf_3=min_zipf_3, min_zipf_4=min_zipf_4, min_zipf_5=min_zipf_5)
-                for c in candidates
-            ):
-                removed_ed += 1
-                continue
-
-        if w.endswith("s"):
-            candidates = plural_base_candidates(w)
-            if any(
-                is_likely_real_word(c, min_zipf_3=min_zipf_3, min_zipf_4=min_zipf_4, min_zipf_5=min_zipf_5)
-                for c in candidates
-            ):
-                removed_plural_s += 1
-                continue
+        if verdict == "ed":
+            removed_ed += 1
+            continue
+
+        if verdict == "s":
+            removed_plural_s += 1
+            continue
 
         if w in seen:
             duplicates_removed += 1
@@ -122,7 +159,7 @@ def filter_words(
     return kept, stats
 
 
-def main() -> None:
+def main(argv: list[str] | None = None) -> None:
     parser = argparse.ArgumentParser(
         description="Filter a word list to remove -ed words and likely plurals ending in 's'."
     )
@@ -146,7 +183,19 @@ def main() -> None:
         default=2.0,
         help="Zipf threshold for 5+ letter base candidates (default: 2.0)",
     )
-    args = parser.parse_args()
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for the per-word checks; 0 = one per CPU (default: 1)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=None,
+        help="Words per worker task (default: split evenly, ~4 chunks per worker)",
+    )
+    args = parser.parse_args(argv)
 
     lines = args.input.read_text(encoding="utf-8").splitlines()
     kept, stats = filter_words(
@@ -154,6 +203,8 @@ def main() -> None:
         min_zipf_3=args.min_zipf_3,
         min_zipf_4=args.min_zipf_4,
         min_zipf_5=args.min_zipf_5,
+        jobs=args.jobs,
+        chunk_size=args.chunk_size,
     )
 
     args.output.write_text("\n".join(kept) + "\n", encoding="utf-8")
@@ -1,122 +1,184 @@
-from wordfreq import word_frequency
-import nltk
-from nltk.corpus import words as nltk_words
-import enchant
-
-# Download required NLTK data
-try:
-    nltk.data.find('corpora/words')
-except LookupError:
-    nltk.download('words', quiet=True)
-
-# Read the common word list
-with open('common-wordlist.txt', 'r') as f:
-    word_list = [line.strip() for line in f if line.strip()]
-
-print(f"Starting with: {len(word_list)} words")
-
-# Initialize enchant dictionary for standard English
-d = enchant.Dict("en_US")
-
-# Get NLTK words for reference
-nltk_word_set = set(w.upper() for w in nltk_words.words())
-
-# Known proper nouns and place names (common ones in 5-letter format)
-PROPER_NOUNS = {
-    'JAMES', 'JONES', 'SMITH', 'DAVID', 'MARIA', 'SARAH', 'PETER', 'ALICE',
-    'CHINA', 'JAPAN', 'INDIA', 'SPAIN', 'ITALY', 'PARIS', 'TOKYO', 'CAIRO',
-    'TEXAS', 'MAINE', 'IDAHO', 'NEPAL', 'CHILE', 'CONGO', 'GHANA', 'HAITI',
-    'KENYA', 'LIBYA', 'NIGER', 'SUDAN', 'WALES', 'SYRIA', 'YEMEN', 'BENIN',
-    'GABON', 'QATAR', 'SAMOA', 'TONGA', 'MALTA'
-}
-
-# Common slang/informal words to remove
-SLANG_INFORMAL = {
-    'GONNA', 'WANNA', 'GOTTA', 'KINDA', 'SORTA', 'DUNNO', 'LEMME', 'GIMME',
-    'AIN\'T', 'YALL', 'NOPE', 'YEAH', 'YIKES', 'DUDES', 'BROS', 'DAWG'
-}
-
-filtered_words = []
-removed_proper = []
-removed_plural = []
-removed_slang = []
-removed_other = []
-
-# Create a set for quick lookup
-word_set = set(word_list)
-
-for word in word_list:
+import argparse
+
+from lexicon_index import LexiconIndex, TAG_ENCHANT, TAG_ENCHANT_CHECKED, TAG_NLTK, TAG_PROPER_NOUN, TAG_SLANG
+from lexicon_sources import PROPER_NOUNS, SLANG_INFORMAL
+from parallel_filter import map_ordered
+
+# Per-process state, warmed once per worker by init_worker()
+_dictionary = None
+_nltk_word_set = None
+_word_set = None
+_index = None
+
+
+def _load_dictionary():
+    # Imported lazily: pyenchant is only needed without an index, or for words
+    # the index never checked.
+    global _dictionary
+    if _dictionary is None:
+        import enchant
+        _dictionary = enchant.Dict("en_US")
+    return _dictionary
+
+
+def init_worker(word_set, index_path=None):
+    global _nltk_word_set, _word_set, _index
+
+    # Create a set for quick lookup
+    _word_set = word_set
+
+    if index_path is not None:
+        # Prebuilt index (tools/lexicon_index.py): mmap once, no NLTK/enchant startup
+        _index = LexiconIndex(index_path)
+        return
+    _index = None
+
+    # Initialize enchant dictionary for standard English
+    _load_dictionary()
+
+    # Get NLTK words for reference (kept across calls, e.g. in a toolbox.py daemon)
+    if _nltk_word_set is None:
+        import nltk
+        from nltk.corpus import words as nltk_words
+
+        # Download required NLTK data
+        try:
+            nltk.data.find('corpora/words')
+        except LookupError:
+            nltk.download('words', quiet=True)
+
+        _nltk_word_set = set(w.upper() for w in nltk_words.words())
+
+
+def in_dictionary(lower_word):
+    if _index is not None:
+        tags = _index.tags(lower_word)
+        if tags >> TAG_ENCHANT_CHECKED & 1:
+            return bool(tags >> TAG_ENCHANT & 1)
+    return _load_dictionary().check(lower_word)
+
+
+def in_nltk(word):
+    if _index is not None:
+        return _index.has(word, TAG_NLTK)
+    return word in _nltk_word_set
+
+
+def classify(word):
+    """Return the removal category for a word, or None if it passes all filters."""
+    lower_word = word.lower()
+    tags = _index.tags(lower_word) if _index is not None else 0
+
     # Check if it's a known proper noun or place name
-    if word in PROPER_NOUNS:
-        removed_proper.append(word)
-        continue
-    
+    if tags >> TAG_PROPER_NOUN & 1 or lower_word in PROPER_NOUNS:
+        return 'proper'
+
     # Check if it's known slang
-    if word in SLANG_INFORMAL:
-        removed_slang.append(word)
-        continue
-    
+    if tags >> TAG_SLANG & 1 or lower_word in SLANG_INFORMAL:
+        return 'slang'
+
     # Check for plurals (ends in S and root word exists)
     if word.endswith('S') and len(word) > 1:
         root = word[:-1]
-        if root in word_set:
-            removed_plural.append(word)
-            continue
+        if root in _word_set:
+            return 'plural'
         # Also check for -ES plurals
         if word.endswith('ES') and len(word) > 2:
             root_es = word[:-2]
-            if root_es in word_set:
-                removed_plural.append(word)
-                continue
-    
+            if root_es in _word_set:
+                return 'plural'
+
     # Additional check: if word is not in standard dictionary, might be slang
     # But be careful - some valid words might not be in enchant
-    lower_word = word.lower()
-    if not d.check(lower_word):
+    if not in_dictionary(lower_word):
         # Double-check with NLTK corpus
-        if word not in nltk_word_set:
+        if not in_nltk(word):
             # Check if it's a very rare word (likely slang/informal if freq is low)
+            from wordfreq import word_frequency
+
             freq = word_frequency(lower_word, 'en')
             if freq < 1e-7:
-                removed_other.append(word)
-                continue
-    
-    # Word passed all filters
-    filtered_words.append(word)
-
-print(f"\nFiltering results:")
-print(f"  Removed proper nouns/places: {len(removed_proper)}")
-print(f"  Removed plurals: {len(removed_plural)}")
-print(f"  Removed slang/informal: {len(removed_slang)}")
-print(f"  Removed other (not in dictionaries): {len(removed_other)}")
-print(f"  Total removed: {len(word_list) - len(filtered_words)}")
-print(f"  Remaining words: {len(filtered_words)}")
-
-# Show some examples of what was removed
-if removed_proper:
-    print(f"\nSample proper nouns removed: {', '.join(removed_proper[:10])}")
-if removed_plural:
-    print(f"Sample plurals removed: {', '.join(removed_plural[:10])}")
-if removed_slang:
-    print(f"Sample slang removed: {', '.join(removed_slang[:10])}")
-if removed_other:
-    print(f"Sample other removed: {', '.join(removed_other[:10])}")
-
-# Save the refined list
-with open('refined-wordlist.txt', 'w') as f:
-    f.write('\n'.join(filtered_words))
-
-print("\nRefined word list saved to refined-wordlist.txt")
-
-# Save removed words for review
-with open('removed-words.txt', 'w') as f:
-    f.write("=== PROPER NOUNS/PLACES ===\n")
-    f.write('\n'.join(removed_proper))
-    f.write("\n\n=== PLURALS ===\n")
-    f.write('\n'.join(removed_plural))
-    f.write("\n\n=== SLANG/INFORMAL ===\n")
-    f.write('\n'.join(removed_slang))
-    f.write("\n\n=== OTHER (NOT IN DICTIONARIES) ===\n")
-    f.write('\n'.join(removed_other))
-
-print("Removed words saved to removed-words.txt for review")
+                return 'other'
+
+    return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Remove proper nouns, plurals, slang and non-dictionary words.")
+    parser.add_argument('input', nargs='?', default='common-wordlist.txt', help="Input word list (default: common-wordlist.txt)")
+    parser.add_argument('output', nargs='?', default='refined-wordlist.txt', help="Output word list (default: refined-wordlist.txt)")
+    parser.add_argument('--jobs', type=int, default=1, help="Worker processes for the per-word checks; 0 = one per CPU (default: 1)")
+    parser.add_argument('--chunk-size', type=int, default=None, help="Words per worker task (default: ~4 chunks per worker)")
+    parser.add_argument('--index', default=None, help="Prebuilt lexicon index from lexicon_index.py build (skips NLTK/enchant startup)")
+    args = parser.parse_args(argv)
+
+    # Read the common word list
+    with open(args.input, 'r') as f:
+        word_list = [line.strip() for line in f if line.strip()]
+
+    print(f"Starting with: {len(word_list)} words")
+
+    # Classify in parallel (each worker loads enchant/NLTK or maps the index once), then merge in input order
+    verdicts = map_ordered(
+        classify,
+        word_list,
+        jobs=args.jobs,
+        chunk_size=args.chunk_size,
+        initializer=init_worker,
+        initargs=(set(word_list), args.index),
+    )
+
+    filtered_words = []
+    removed = {'proper': [], 'plural': [], 'slang': [], 'other': []}
+    for word, verdict in zip(word_list, verdicts):
+        if verdict is None:
+            # Word passed all filters
+            filtered_words.append(word)
+        else:
+            removed[verdict].append(word)
+
+    removed_proper = removed['proper']
+    removed_plural = removed['plural']
+    removed_slang = removed['slang']
+    removed_other = removed['other']
+
+    print(f"\nFiltering results:")
+    print(f"  Removed proper nouns/places: {len(removed_proper)}")
+    print(f"  Removed plurals: {len(removed_plural)}")
+    print(f"  Removed slang/informal: {len(removed_slang)}")
+    print(f"  Removed other (not in dictionaries): {len(removed_other)}")
+    print(f"  Total removed: {len(word_list) - len(filtered_words)}")
+    print(f"  Remaining words: {len(filtered_words)}")
+
+    # Show some examples of what was removed
+    if removed_proper:
+        print(f"\nSample proper nouns removed: {', '.join(removed_proper[:10])}")
+    if removed_plural:
+        print(f"Sample plurals removed: {', '.join(removed_plural[:10])}")
+    if removed_slang:
+        print(f"Sample slang removed: {', '.join(removed_slang[:10])}")
+    if removed_other:
+        print(f"Sample other removed: {', '.join(removed_other[:10])}")
+
+    # Save the refined list
+    with open(args.output, 'w') as f:
+        f.write('\n'.join(filtered_words))
+
+    print(f"\nRefined word list saved to {args.output}")
+
+    # Save removed words for review
+    with open('removed-words.txt', 'w') as f:
+        f.write("=== PROPER NOUNS/PLACES ===\n")
+        f.write('\n'.join(removed_proper))
+        f.write("\n\n=== PLURALS ===\n")
+        f.write('\n'.join(removed_plural))
+        f.write("\n\n=== SLANG/INFORMAL ===\n")
+        f.write('\n'.join(removed_slang))
+        f.write("\n\n=== OTHER (NOT IN DICTIONARIES) ===\n")
+        f.write('\n'.join(removed_other))
+
+    print("Removed words saved to removed-words.txt for review")
+
+
+if __name__ == '__main__':
+    main()
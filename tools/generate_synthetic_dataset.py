@@ -0,0 +1,483 @@
+#!/usr/bin/env python3
+"""Stream a deterministic synthetic multi-tenant dataset as Postgres COPY files.
+
+Rows are generated day by day and written straight to per-table COPY (text
+format) files, so memory stays proportional to the number of players rather than
+the number of games played. The same --seed always produces byte-identical
+output.
+
+Load into a throwaway database with:
+
+    psql "$DATABASE_URL" -f tools/sql/schema.sql
+    psql "$DATABASE_URL" -f <output-dir>/load.sql
+"""
+
+from __future__ import annotations
+
+import argparse
+import bisect
+import itertools
+import json
+import math
+import random
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+from wordlist_table import DEFAULT_TABLE, read_table, target_word_for_date
+
+
+DEFAULT_VALIDATION = Path(__file__).resolve().parent.parent / "public" / "validation-words.txt"
+
+PAR_DISTRIBUTION = [5, 5, 3, 3, 4, 4, 4, 4, 4]
+
+# Columns in load order (parents before children).
+TABLE_COLUMNS: dict[str, tuple[str, ...]] = {
+    "organizations": ("id", "slug", "name", "display_name", "motd", "created_at", "settings"),
+    "players": ("id", "player_name", "password_hash", "created_at", "org_id"),
+    "wordlist": ("id", "word", "difficulty", "scrabble_score", "par"),
+    "validation_words": ("id", "word"),
+    "games": ("id", "play_date", "org_id"),
+    "daily_players": ("id", "game_id", "player_id"),
+    "scores": ("id", "game_id", "player_id", "attempts", "success", "played_at"),
+    "player_games": ("id", "game_id", "player_id", "guesses", "completed", "target_word", "updated_at"),
+    "daily_golf_course": ("id", "course_date", "hole_number", "target_word", "start_word", "par"),
+    "golf_rounds": (
+        "id",
+        "player_id",
+        "started_at",
+        "completed_at",
+        "total_score",
+        "current_hole",
+        "is_completed",
+        "org_id",
+    ),
+    "golf_holes": (
+        "id",
+        "round_id",
+        "hole_number",
+        "target_word",
+        "start_word",
+        "par",
+        "guesses",
+        "attempts",
+        "score",
+        "completed_at",
+    ),
+    "word_votes": ("word", "username", "vote", "date", "game_type"),
+}
+
+# Tables with a SERIAL id whose sequence must be advanced after an explicit-id load.
+SERIAL_TABLES = tuple(t for t, cols in TABLE_COLUMNS.items() if cols[0] == "id")
+
+FIRST_NAMES = (
+    "alex", "sam", "jo", "kim", "lee", "max", "ash", "kai", "ren", "sky",
+    "pat", "rob", "mel", "ned", "liv", "tom", "bea", "gus", "ivy", "zac",
+)
+
+# Attempts distribution for solved games (1..6), roughly what real Wordle players see.
+ATTEMPT_WEIGHTS = (1, 6, 23, 33, 24, 13)
+
+
+@dataclass(frozen=True)
+class DatasetConfig:
+    seed: int
+    orgs: int
+    players: int
+    start: date
+    days: int
+    tenant_skew: float
+    player_skew: float
+    daily_active: float
+    golf_rate: float
+    vote_rate: float
+    success_rate: float
+
+
+@dataclass
+class Tenant:
+    org_id: int | None
+    player_ids: list[int]
+    player_names: list[str]
+    join_days: list[int]
+    sorted_join_days: list[int]
+    cum_weights: list[float]
+
+
+def copy_value(value) -> str:
+    # COPY text format: \N for NULL, backslash-escape the delimiter/newlines.
+    if value is None:
+        return "\\N"
+    if value is True:
+        return "t"
+    if value is False:
+        return "f"
+    s = str(value)
+    if "\\" in s or "\t" in s or "\n" in s or "\r" in s:
+        s = s.replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+    return s
+
+
+class CopyWriter:
+    def __init__(self, out_dir: Path) -> None:
+        self.out_dir = out_dir
+        self.files = {t: (out_dir / f"{t}.copy").open("w", encoding="utf-8", newline="\n") for t in TABLE_COLUMNS}
+        self.counts = {t: 0 for t in TABLE_COLUMNS}
+        self.next_ids = {t: 1 for t in SERIAL_TABLES}
+
+    def next_id(self, table: str) -> int:
+        value = self.next_ids[table]
+        self.next_ids[table] = value + 1
+        return value
+
+    def write(self, table: str, *values) -> None:
+        self.files[table].write("\t".join(copy_value(v) for v in values) + "\n")
+        self.counts[table] += 1
+
+    def close(self) -> None:
+        for f in self.files.values():
+            f.close()
+
+    def write_load_script(self) -> Path:
+        lines = ["-- Generated by tools/generate_synthetic_dataset.py", "BEGIN;"]
+        for table, cols in TABLE_COLUMNS.items():
+            path = (self.out_dir / f"{table}.copy").resolve()
+            lines.append(f"\\copy {table} ({', '.join(cols)}) FROM '{path}'")
+        for table in SERIAL_TABLES:
+            last = self.next_ids[table] - 1
+            if last > 0:
+                lines.append(f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), {last});")
+        lines.append("COMMIT;")
+        lines.extend(f"ANALYZE {table};" for table in TABLE_COLUMNS)
+        path = self.out_dir / "load.sql"
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        return path
+
+
+def zipf_weights(n: int, s: float) -> list[float]:
+    return [1.0 / math.pow(rank, s) for rank in range(1, n + 1)]
+
+
+def split_by_weight(total: int, weights: list[float]) -> list[int]:
+    # Largest-remainder apportionment so sizes always sum to `total`.
+    wsum = sum(weights)
+    raw = [total * w / wsum for w in weights]
+    sizes = [int(r) for r in raw]
+    order = sorted(range(len(raw)), key=lambda i: (-(raw[i] - sizes[i]), i))
+    for i in order[: total - sum(sizes)]:
+        sizes[i] += 1
+    return sizes
+
+
+def timestamp(day: date, rng: random.Random, *, start_hour: int = 0, span_hours: int = 24) -> datetime:
+    seconds = rng.randrange(start_hour * 3600, min(24, start_hour + span_hours) * 3600)
+    return datetime(day.year, day.month, day.day) + timedelta(seconds=seconds)
+
+
+def play_guesses(rng: random.Random, words: list[str], target: str, attempts: int, success: bool) -> list[str]:
+    guesses = [rng.choice(words) for _ in range(attempts - 1)]
+    guesses.append(target if success else rng.choice(words))
+    return guesses
+
+
+def sample_active(rng: random.Random, tenant: Tenant, k: int, day_index: int) -> list[int]:
+    # Weighted sampling (long-tail activity) restricted to players who have joined.
+    chosen: set[int] = set()
+    n = len(tenant.player_ids)
+    total = tenant.cum_weights[-1]
+    attempts = 0
+    while len(chosen) < k and attempts < k * 4:
+        attempts += 1
+        idx = bisect.bisect_left(tenant.cum_weights, rng.random() * total)
+        idx = min(idx, n - 1)
+        if tenant.join_days[idx] <= day_index:
+            chosen.add(idx)
+    return sorted(chosen)
+
+
+def build_tenants(cfg: DatasetConfig, rng: random.Random, writer: CopyWriter) -> list[Tenant]:
+    # Tenant 0 is the default tenant (org_id NULL, grordle.com); it is also the heaviest.
+    sizes = split_by_weight(cfg.players, zipf_weights(cfg.orgs + 1, cfg.tenant_skew))
+    base_ts = datetime(cfg.start.year, cfg.start.month, cfg.start.day)
+
+    tenants: list[Tenant] = []
+    for t, size in enumerate(sizes):
+        org_id = None
+        if t > 0:
+            org_id = writer.next_id("organizations")
+            slug = f"tenant{org_id:04d}"
+            writer.write(
+                "organizations",
+                org_id,
+                slug,
+                f"Tenant {org_id}",
+                f"Tenant {org_id} Grordle",
+                None,
+                base_ts - timedelta(days=1),
+                json.dumps({"synthetic": True}),
+            )
+
+        ids: list[int] = []
+        names: list[str] = []
+        joins: list[int] = []
+        weights: list[float] = []
+        for _ in range(size):
+            pid = writer.next_id("players")
+            name = f"{rng.choice(FIRST_NAMES)}{pid}"
+            # A third of players are there from day one, the rest trickle in over the history.
+            join = 0 if rng.random() < 0.33 else rng.randrange(cfg.days)
+            writer.write("players", pid, name, f"{rng.getrandbits(256):064x}", base_ts + timedelta(days=join), org_id)
+            ids.append(pid)
+            names.append(name)
+            joins.append(join)
+            # Pareto activity weights: a few daily regulars, a long tail of occasional players.
+            weights.append(rng.paretovariate(cfg.player_skew))
+        tenants.append(
+            Tenant(
+                org_id=org_id,
+                player_ids=ids,
+                player_names=names,
+                join_days=joins,
+                sorted_join_days=sorted(joins),
+                cum_weights=list(itertools.accumulate(weights)),
+            )
+        )
+    return tenants
+
+
+def write_reference_tables(writer: CopyWriter, table_path: Path, validation_path: Path) -> tuple[list[str], dict[int, list[str]]]:
+    rows = read_table(table_path)
+    by_par: dict[int, list[str]] = {3: [], 4: [], 5: []}
+    for r in rows:
+        writer.write("wordlist", writer.next_id("wordlist"), r.word, f"{r.difficulty:.2f}", r.scrabble, r.par)
+        by_par.setdefault(r.par, []).append(r.word)
+
+    if validation_path.exists():
+        for raw in validation_path.read_text(encoding="utf-8").splitlines():
+            w = raw.strip().upper()
+            if len(w) == 5 and w.isalpha():
+                writer.write("validation_words", writer.next_id("validation_words"), w)
+
+    return [r.word for r in rows], by_par
+
+
+def write_golf_course(
+    writer: CopyWriter, rng: random.Random, day: date, by_par: dict[int, list[str]]
+) -> list[tuple[int, str, int]]:
+    pars = PAR_DISTRIBUTION[:]
+    rng.shuffle(pars)
+    used: set[str] = set()
+    holes: list[tuple[int, str, int]] = []
+    for hole_number, par in enumerate(pars, start=1):
+        word = rng.choice(by_par[par])
+        while word in used:
+            word = rng.choice(by_par[par])
+        used.add(word)
+        writer.write("daily_golf_course", writer.next_id("daily_golf_course"), day, hole_number, word, "", par)
+        holes.append((hole_number, word, par))
+    return holes
+
+
+def generate(cfg: DatasetConfig, out_dir: Path, table_path: Path, validation_path: Path) -> CopyWriter:
+    rng = random.Random(cfg.seed)
+    writer = CopyWriter(out_dir)
+    try:
+        words, by_par = write_reference_tables(writer, table_path, validation_path)
+        if not words:
+            raise SystemExit(f"No rows found in {table_path}")
+        for par in (3, 4, 5):
+            if len(by_par.get(par, [])) < PAR_DISTRIBUTION.count(par):
+                raise SystemExit(f"Not enough PAR {par} words in {table_path} to build a golf course")
+
+        tenants = build_tenants(cfg, rng, writer)
+        attempt_values = list(range(1, 7))
+        last_day = cfg.days - 1
+
+        for day_index in range(cfg.days):
+            day = cfg.start + timedelta(days=day_index)
+            day_str = day.isoformat()
+            target = target_word_for_date(words, day_str)
+            course = write_golf_course(writer, rng, day, by_par)
+
+            for tenant in tenants:
+                if not tenant.player_ids:
+                    continue
+                joined = bisect.bisect_right(tenant.sorted_join_days, day_index)
+                expected = cfg.daily_active * joined
+                k = min(joined, max(0, int(rng.gauss(expected, math.sqrt(expected) + 1e-9))))
+                if k == 0:
+                    continue
+
+                game_id = writer.next_id("games")
+                writer.write("games", game_id, day, tenant.org_id)
+
+                for idx in sample_active(rng, tenant, k, day_index):
+                    pid = tenant.player_ids[idx]
+                    name = tenant.player_names[idx]
+
+                    writer.write("daily_players", writer.next_id("daily_players"), game_id, pid)
+                    success = rng.random() < cfg.success_rate
+                    attempts = rng.choices(attempt_values, weights=ATTEMPT_WEIGHTS)[0] if success else 6
+                    played_at = timestamp(day, rng, start_hour=6, span_hours=18)
+                    guesses = play_guesses(rng, words, target, attempts, success)
+                    writer.write("scores", writer.next_id("scores"), game_id, pid, attempts, success, played_at)
+                    writer.write(
+                        "player_games",
+                        writer.next_id("player_games"),
+                        game_id,
+                        pid,
+                        json.dumps(guesses),
+                        True,
+                        target,
+                        played_at,
+                    )
+
+                    if rng.random() < cfg.vote_rate:
+                        writer.write("word_votes", target, name, "up" if rng.random() < 0.8 else "down", day, "daily")
+
+                    if rng.random() >= cfg.golf_rate:
+                        continue
+
+                    round_id = writer.next_id("golf_rounds")
+                    started_at = timestamp(day, rng, start_hour=6, span_hours=16)
+                    # Rounds on the final day may still be in progress.
+                    holes_played = 9 if day_index < last_day or rng.random() < 0.6 else rng.randint(1, 8)
+                    total = 0
+                    finished_at = started_at
+                    for hole_number, word, par in course:
+                        if hole_number > holes_played:
+                            writer.write(
+                                "golf_holes",
+                                writer.next_id("golf_holes"),
+                                round_id,
+                                hole_number,
+                                word,
+                                "",
+                                par,
+                                "[]",
+                                None,
+                                None,
+                                None,
+                            )
+                            continue
+                        hole_success = rng.random() < cfg.success_rate
+                        hole_attempts = rng.choices(attempt_values, weights=ATTEMPT_WEIGHTS)[0] if hole_success else 6
+                        score = hole_attempts - par if hole_success else hole_attempts + 1 - par
+                        total += score
+                        finished_at = finished_at + timedelta(seconds=rng.randint(30, 600))
+                        writer.write(
+                            "golf_holes",
+                            writer.next_id("golf_holes"),
+                            round_id,
+                            hole_number,
+                            word,
+                            "",
+                            par,
+                            json.dumps(play_guesses(rng, words, word, hole_attempts, hole_success)),
+                            hole_attempts,
+                            score,
+                            finished_at,
+                        )
+                    completed = holes_played == 9
+                    writer.write(
+                        "golf_rounds",
+                        round_id,
+                        pid,
+                        started_at,
+                        finished_at if completed else None,
+                        total if completed else None,
+                        9 if completed else holes_played + 1,
+                        completed,
+                        tenant.org_id,
+                    )
+                    if completed and rng.random() < cfg.vote_rate:
+                        hole_word = course[rng.randrange(len(course))][1]
+                        writer.write("word_votes", hole_word, name, "up" if rng.random() < 0.7 else "down", day, "golf")
+    finally:
+        writer.close()
+    return writer
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Generate a synthetic multi-tenant Grordle dataset as streaming COPY files."
+    )
+    parser.add_argument("output", type=Path, help="Output directory for <table>.copy files and load.sql")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed (default: 42)")
+    parser.add_argument("--orgs", type=int, default=20, help="Number of non-default tenants (default: 20)")
+    parser.add_argument("--players", type=int, default=20000, help="Total players across all tenants (default: 20000)")
+    parser.add_argument("--years", type=float, default=2.0, help="Years of history (default: 2)")
+    parser.add_argument(
+        "--start-date",
+        type=date.fromisoformat,
+        default=None,
+        help="First play date YYYY-MM-DD (default: --years before 2026-01-01)",
+    )
+    parser.add_argument(
+        "--tenant-skew",
+        type=float,
+        default=1.1,
+        help="Zipf exponent for tenant sizes; higher = heavier top tenants (default: 1.1)",
+    )
+    parser.add_argument(
+        "--player-skew",
+        type=float,
+        default=1.3,
+        help="Pareto shape for player activity; lower = longer tail (default: 1.3)",
+    )
+    parser.add_argument(
+        "--daily-active",
+        type=float,
+        default=0.15,
+        help="Expected fraction of a tenant's joined players playing on a given day (default: 0.15)",
+    )
+    parser.add_argument("--golf-rate", type=float, default=0.4, help="Fraction of daily players who also play golf (default: 0.4)")
+    parser.add_argument("--vote-rate", type=float, default=0.1, help="Fraction of games that leave a word vote (default: 0.1)")
+    parser.add_argument("--success-rate", type=float, default=0.92, help="Fraction of games solved (default: 0.92)")
+    parser.add_argument("--table", type=Path, default=DEFAULT_TABLE, help="wordlist-table TSV (default: data/wordlist-table.txt)")
+    parser.add_argument(
+        "--validation",
+        type=Path,
+        default=DEFAULT_VALIDATION,
+        help="Validation word list (default: public/validation-words.txt)",
+    )
+    args = parser.parse_args(argv)
+
+    if args.orgs < 0 or args.players <= 0 or args.years <= 0:
+        raise SystemExit("--orgs must be >= 0, --players and --years must be > 0")
+    for name in ("daily_active", "golf_rate", "vote_rate", "success_rate"):
+        value = getattr(args, name)
+        if not 0.0 <= value <= 1.0:
+            raise SystemExit(f"--{name.replace('_', '-')} must be between 0 and 1")
+
+    days = max(1, int(round(args.years * 365)))
+    start = args.start_date or (date(2026, 1, 1) - timedelta(days=days))
+
+    cfg = DatasetConfig(
+        seed=args.seed,
+        orgs=args.orgs,
+        players=args.players,
+        start=start,
+        days=days,
+        tenant_skew=args.tenant_skew,
+        player_skew=args.player_skew,
+        daily_active=args.daily_active,
+        golf_rate=args.golf_rate,
+        vote_rate=args.vote_rate,
+        success_rate=args.success_rate,
+    )
+
+    args.output.mkdir(parents=True, exist_ok=True)
+    writer = generate(cfg, args.output, args.table, args.validation)
+    load_script = writer.write_load_script()
+
+    print(f"Seed:      {cfg.seed}")
+    print(f"History:   {cfg.start} .. {cfg.start + timedelta(days=cfg.days - 1)} ({cfg.days} days)")
+    for table, count in writer.counts.items():
+        print(f"  {table:<20}{count:>12}")
+    print(f"Wrote: {args.output}")
+    print(f"Load with: psql \"$DATABASE_URL\" -f tools/sql/schema.sql && psql \"$DATABASE_URL\" -f {load_script}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 import argparse
-from dataclasses import dataclass
+import itertools
+import json
+import time
+from dataclasses import dataclass, fields
 from pathlib import Path
 
-from wordfreq import zipf_frequency
+from distribution_report import build_report, distributions_from_columns, write_report
 
 
 SCRABBLE_POINTS: dict[str, int] = {
@@ -90,7 +93,314 @@ def load_words(path: Path) -> list[str]:
     return words
 
 
-def main() -> None:
+@dataclass(frozen=True)
+class TableParams:
+    weight_commonality: float = 0.8
+    weight_scrabble: float = 0.2
+    easy_percent: float = 0.20
+    hard_percent: float = 0.20
+
+    def normalized_weights(self) -> tuple[float, float]:
+        if self.weight_commonality < 0 or self.weight_scrabble < 0:
+            raise SystemExit("Weights must be non-negative")
+        weight_sum = self.weight_commonality + self.weight_scrabble
+        if weight_sum <= 0:
+            raise SystemExit("At least one weight must be > 0")
+        return self.weight_commonality / weight_sum, self.weight_scrabble / weight_sum
+
+
+@dataclass(frozen=True)
+class BuiltTable:
+    rows_by_common: list[WordRow]
+    difficulty_by_word: dict[str, float]
+    par_by_word: dict[str, int]
+    scr_min: float
+    scr_max: float
+
+    def output_lines(self) -> list[str]:
+        # Emit rows in commonality order (most common first), matching the existing file's intent.
+        out_lines: list[str] = ["WORD\tDIFFICULTY\tSCRABBLE_SCORE\tPAR"]
+        for r in self.rows_by_common:
+            out_lines.append(
+                "\t".join(
+                    [
+                        r.word.upper(),
+                        format_float(self.difficulty_by_word[r.word]),
+                        str(r.scrabble),
+                        str(self.par_by_word[r.word]),
+                    ]
+                )
+            )
+        return out_lines
+
+
+def commonality_key(r: WordRow) -> tuple[float, str]:
+    return (-r.zipf, r.word)
+
+
+def commonality_score(idx: int, n: int) -> float:
+    if n == 1:
+        return 0.0
+    percentile = idx / (n - 1)  # 0..1 (0 easiest)
+    return percentile * 100.0
+
+
+def par_counts(n: int, params: TableParams) -> tuple[int, int]:
+    easy_count = int(n * params.easy_percent)
+    hard_count = int(n * params.hard_percent)
+    if easy_count < 0:
+        easy_count = 0
+    if hard_count < 0:
+        hard_count = 0
+    if easy_count + hard_count > n:
+        # Clamp in a predictable way.
+        hard_count = max(0, n - easy_count)
+    return easy_count, hard_count
+
+
+def par_for_index(idx: int, n: int, easy_count: int, hard_count: int) -> int:
+    if idx < easy_count:
+        return 3
+    if idx >= n - hard_count:
+        return 5
+    return 4
+
+
+def build_table(rows: list[WordRow], params: TableParams) -> BuiltTable:
+    w_common, w_scrabble = params.normalized_weights()
+
+    # Commonality component: rank by zipf descending (more common => easier => lower score).
+    rows_by_common = sorted(rows, key=commonality_key)
+    n = len(rows_by_common)
+
+    commonality_score_by_word: dict[str, float] = {}
+    for idx, r in enumerate(rows_by_common):
+        commonality_score_by_word[r.word] = commonality_score(idx, n)
+
+    scrabble_scores = [r.scrabble for r in rows]
+    scr_min = float(min(scrabble_scores))
+    scr_max = float(max(scrabble_scores))
+
+    difficulty_by_word: dict[str, float] = {}
+    for r in rows:
+        common_score = commonality_score_by_word[r.word]
+        scr_norm = normalize(float(r.scrabble), min_value=scr_min, max_value=scr_max) * 100.0
+        difficulty = w_common * common_score + w_scrabble * scr_norm
+        difficulty_by_word[r.word] = difficulty
+
+    # Assign PAR buckets by difficulty (lower = easier): 20% PAR 3, middle 60% PAR 4, 20% PAR 5.
+    rows_by_diff = sorted(rows, key=lambda r: (difficulty_by_word[r.word], r.word))
+    easy_count, hard_count = par_counts(n, params)
+
+    par_by_word: dict[str, int] = {}
+    for idx, r in enumerate(rows_by_diff):
+        par_by_word[r.word] = par_for_index(idx, n, easy_count, hard_count)
+
+    return BuiltTable(
+        rows_by_common=rows_by_common,
+        difficulty_by_word=difficulty_by_word,
+        par_by_word=par_by_word,
+        scr_min=scr_min,
+        scr_max=scr_max,
+    )
+
+
+# Holes per PAR in one daily golf course (parDistribution in golf-start.js).
+GOLF_PAR_MIX = (5, 5, 3, 3, 4, 4, 4, 4, 4)
+PARS = (3, 4, 5)
+
+
+@dataclass(frozen=True)
+class SweepResult:
+    params: TableParams
+    par_distribution: dict[int, int]
+    changed: int  # words in both tables whose PAR differs from the baseline
+    moves: dict[tuple[int, int], int]  # (baseline PAR, new PAR) -> words
+    golf_churn: dict[int, int]  # words entering + leaving each golf PAR pool
+    golf_days: int  # days of distinct-word courses the PAR pools can supply
+
+
+def golf_supply_days(par_distribution: dict[int, int]) -> int:
+    demand = {p: GOLF_PAR_MIX.count(p) for p in PARS}
+    return min(par_distribution.get(p, 0) // demand[p] for p in PARS)
+
+
+def sweep_tables(rows: list[WordRow], grid: list[TableParams], baseline_par: dict[str, int]) -> list[SweepResult]:
+    """PAR assignments for every configuration in one batch.
+
+    Commonality scores and normalized scrabble scores do not depend on the
+    parameters, so they are computed once. The difficulty vectors for all
+    distinct weight pairs form one matrix, ranked with one stable argsort per
+    row. The PAR cutoffs then apply to the ranks by broadcasting. Results
+    match build_table() exactly: the same float operations, and ties broken
+    by word because the columns are in alphabetical order.
+    """
+    import numpy as np
+
+    words = sorted(r.word for r in rows)
+    n = len(words)
+    column = {w: i for i, w in enumerate(words)}
+    by_word = {r.word: r for r in rows}
+
+    common = np.empty(n)
+    for idx, r in enumerate(sorted(rows, key=commonality_key)):
+        common[column[r.word]] = commonality_score(idx, n)
+    scr_min = float(min(r.scrabble for r in rows))
+    scr_max = float(max(r.scrabble for r in rows))
+    scrabble = np.array(
+        [normalize(float(by_word[w].scrabble), min_value=scr_min, max_value=scr_max) * 100.0 for w in words]
+    )
+
+    weights = sorted({p.normalized_weights() for p in grid})
+    w = np.array(weights)
+    difficulty = w[:, :1] * common + w[:, 1:] * scrabble  # (weight pairs, words)
+    order = np.argsort(difficulty, axis=1, kind="stable")
+    ranks = np.empty_like(order)
+    np.put_along_axis(ranks, order, np.broadcast_to(np.arange(n), order.shape), axis=1)
+
+    cutoffs = np.array([par_counts(n, p) for p in grid]).reshape(-1, 2)
+    row_of = {pair: i for i, pair in enumerate(weights)}
+    r = ranks[[row_of[p.normalized_weights()] for p in grid]]  # (configs, words)
+    par = np.where(r < cutoffs[:, :1], 3, np.where(r >= n - cutoffs[:, 1:], 5, 4))
+
+    base = np.array([baseline_par.get(w, 0) for w in words])
+    in_base = base > 0
+    removed = {p: sum(1 for w, bp in baseline_par.items() if bp == p and w not in column) for p in PARS}
+    counts = {p: (par == p).sum(axis=1) for p in PARS}
+    changed = ((par != base) & in_base).sum(axis=1)
+    moves = {(a, b): ((base == a) & (par == b)).sum(axis=1) for a in PARS for b in PARS if a != b}
+    churn = {p: ((par == p) & (base != p)).sum(axis=1) + ((base == p) & (par != p)).sum(axis=1) + removed[p] for p in PARS}
+
+    results: list[SweepResult] = []
+    for i, params in enumerate(grid):
+        dist = {p: int(counts[p][i]) for p in PARS}
+        results.append(
+            SweepResult(
+                params=params,
+                par_distribution=dist,
+                changed=int(changed[i]),
+                moves={k: int(v[i]) for k, v in moves.items()},
+                golf_churn={p: int(churn[p][i]) for p in PARS},
+                golf_days=golf_supply_days(dist),
+            )
+        )
+    return results
+
+
+def parse_sweep(values: list[str], defaults: TableParams) -> list[TableParams]:
+    """Grid from NAME=V1,V2,... items; unswept parameters keep their option values."""
+    names = [f.name for f in fields(TableParams)]
+    axes: dict[str, list[float]] = {name: [getattr(defaults, name)] for name in names}
+    for item in values:
+        key, sep, spec = item.partition("=")
+        name = key.replace("-", "_")
+        if not sep or name not in axes:
+            raise SystemExit(f"--sweep expects NAME=V1,V2,... with NAME in {', '.join(names)}: {item!r}")
+        try:
+            axes[name] = [float(v) for v in spec.split(",") if v]
+        except ValueError:
+            raise SystemExit(f"Invalid --sweep values: {item!r}")
+        if not axes[name]:
+            raise SystemExit(f"No values in --sweep {item!r}")
+    grid = [TableParams(**dict(zip(names, combo))) for combo in itertools.product(*(axes[n] for n in names))]
+    for params in grid:
+        params.normalized_weights()
+    return grid
+
+
+SWEEP_HEADER = [
+    "WEIGHT_COMMONALITY",
+    "WEIGHT_SCRABBLE",
+    "EASY_PERCENT",
+    "HARD_PERCENT",
+    "PAR3",
+    "PAR4",
+    "PAR5",
+    "CHANGED",
+    *(f"MOVED_{a}_{b}" for a in PARS for b in PARS if a != b),
+    "GOLF_CHURN3",
+    "GOLF_CHURN4",
+    "GOLF_CHURN5",
+    "GOLF_DAYS",
+]
+
+
+def write_sweep(path: Path, results: list[SweepResult]) -> None:
+    if path.suffix.lower() == ".json":
+        out = [
+            {
+                **{f.name: getattr(r.params, f.name) for f in fields(TableParams)},
+                "par_distribution": r.par_distribution,
+                "changed": r.changed,
+                "moves": {f"{a}->{b}": c for (a, b), c in r.moves.items()},
+                "golf_churn": r.golf_churn,
+                "golf_days": r.golf_days,
+            }
+            for r in results
+        ]
+        path.write_text(json.dumps(out, indent=2) + "\n", encoding="utf-8")
+        return
+    lines = ["\t".join(SWEEP_HEADER)]
+    for r in results:
+        p = r.params
+        values = [p.weight_commonality, p.weight_scrabble, p.easy_percent, p.hard_percent]
+        lines.append(
+            "\t".join(
+                [f"{v:g}" for v in values]
+                + [str(r.par_distribution[q]) for q in PARS]
+                + [str(r.changed)]
+                + [str(c) for c in r.moves.values()]
+                + [str(r.golf_churn[q]) for q in PARS]
+                + [str(r.golf_days)]
+            )
+        )
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+STATE_HEADER = "WORD\tZIPF\tSCRABBLE_SCORE"
+
+
+def write_state(path: Path, rows: list[WordRow], params: TableParams) -> None:
+    # Zipf values and build parameters needed to update the table incrementally
+    # (tools/wordlist_delta.py) without re-querying wordfreq.
+    lines = [
+        "# "
+        + " ".join(
+            [
+                f"weight_commonality={params.weight_commonality!r}",
+                f"weight_scrabble={params.weight_scrabble!r}",
+                f"easy_percent={params.easy_percent!r}",
+                f"hard_percent={params.hard_percent!r}",
+            ]
+        ),
+        STATE_HEADER,
+    ]
+    for r in sorted(rows, key=commonality_key):
+        lines.append(f"{r.word.upper()}\t{r.zipf!r}\t{r.scrabble}")
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def read_state(path: Path) -> tuple[list[WordRow], TableParams]:
+    rows: list[WordRow] = []
+    settings: dict[str, float] = {}
+    for raw in path.read_text(encoding="utf-8").splitlines():
+        if raw.startswith("#"):
+            for item in raw[1:].split():
+                key, _, value = item.partition("=")
+                settings[key] = float(value)
+            continue
+        if not raw.strip() or raw == STATE_HEADER:
+            continue
+        word, zipf, scrabble = raw.split("\t")
+        rows.append(WordRow(word=word.lower(), zipf=float(zipf), scrabble=int(scrabble)))
+    try:
+        params = TableParams(**settings)
+    except TypeError:
+        raise SystemExit(f"{path}: unrecognised build parameters {sorted(settings)}")
+    return rows, params
+
+
+def main(argv: list[str] | None = None) -> None:
     parser = argparse.ArgumentParser(
         description=(
             "Generate a tab-delimited wordlist-table file: WORD, DIFFICULTY, SCRABBLE_SCORE, PAR. "
@@ -98,7 +408,7 @@ def main() -> None:
         )
     )
     parser.add_argument("input", type=Path, help="Input word list (one word per line)")
-    parser.add_argument("output", type=Path, help="Output TSV file")
+    parser.add_argument("output", type=Path, help="Output TSV file (with --sweep: the sweep report, .json or TSV)")
     parser.add_argument(
         "--weight-commonality",
         type=float,
@@ -123,99 +433,131 @@ def main() -> None:
         default=0.20,
         help="Fraction of words assigned PAR 5 (default 0.20)",
     )
+    parser.add_argument(
+        "--feature-cache",
+        type=Path,
+        default=None,
+        help="Read Zipf and scrabble columns from the word_features.py cache in this directory (built on a miss)",
+    )
+    parser.add_argument(
+        "--state",
+        type=Path,
+        default=None,
+        help="Also write the Zipf/scrabble state file used by wordlist_delta.py for incremental updates",
+    )
+    parser.add_argument(
+        "--sweep",
+        action="append",
+        default=[],
+        metavar="NAME=V1,V2",
+        help=(
+            "Sweep a parameter grid instead of writing a table (repeatable; NAME is weight_commonality, "
+            "weight_scrabble, easy_percent or hard_percent). Reports PAR counts, bucket changes against "
+            "--baseline and golf PAR pool churn per configuration"
+        ),
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=None,
+        help="Table to compare against in --sweep mode (default data/wordlist-table.txt)",
+    )
+    parser.add_argument(
+        "--report",
+        type=Path,
+        default=None,
+        help="Also write a Zipf/difficulty/scrabble/PAR distribution report (.json, else Markdown)",
+    )
 
-    args = parser.parse_args()
-
-    if args.weight_commonality < 0 or args.weight_scrabble < 0:
-        raise SystemExit("Weights must be non-negative")
-    weight_sum = args.weight_commonality + args.weight_scrabble
-    if weight_sum <= 0:
-        raise SystemExit("At least one weight must be > 0")
+    args = parser.parse_args(argv)
 
-    w_common = args.weight_commonality / weight_sum
-    w_scrabble = args.weight_scrabble / weight_sum
+    params = TableParams(
+        weight_commonality=args.weight_commonality,
+        weight_scrabble=args.weight_scrabble,
+        easy_percent=args.easy_percent,
+        hard_percent=args.hard_percent,
+    )
+    w_common, w_scrabble = params.normalized_weights()
 
     words = load_words(args.input)
     if not words:
         raise SystemExit("No valid 5-letter words found in input")
 
     rows: list[WordRow] = []
-    for w in words:
-        z = float(zipf_frequency(w, "en"))
-        rows.append(WordRow(word=w, zipf=z, scrabble=scrabble_score(w)))
-
-    # Commonality component: rank by zipf descending (more common => easier => lower score).
-    rows_by_common = sorted(rows, key=lambda r: (-r.zipf, r.word))
-    n = len(rows_by_common)
+    if args.feature_cache is not None:
+        from word_features import load_features
 
-    commonality_score_by_word: dict[str, float] = {}
-    if n == 1:
-        commonality_score_by_word[rows_by_common[0].word] = 0.0
+        features, _ = load_features(words, cache_dir=args.feature_cache)
+        for w, z, s in zip(words, features.column("zipf").tolist(), features.column("score_scrabble").tolist()):
+            rows.append(WordRow(word=w, zipf=z, scrabble=int(s)))
     else:
-        for idx, r in enumerate(rows_by_common):
-            percentile = idx / (n - 1)  # 0..1 (0 easiest)
-            commonality_score_by_word[r.word] = percentile * 100.0
-
-    scrabble_scores = [r.scrabble for r in rows]
-    scr_min = float(min(scrabble_scores))
-    scr_max = float(max(scrabble_scores))
-
-    difficulty_by_word: dict[str, float] = {}
-    for r in rows:
-        common_score = commonality_score_by_word[r.word]
-        scr_norm = normalize(float(r.scrabble), min_value=scr_min, max_value=scr_max) * 100.0
-        difficulty = w_common * common_score + w_scrabble * scr_norm
-        difficulty_by_word[r.word] = difficulty
-
-    # Assign PAR buckets by difficulty (lower = easier): 20% PAR 3, middle 60% PAR 4, 20% PAR 5.
-    rows_by_diff = sorted(rows, key=lambda r: (difficulty_by_word[r.word], r.word))
-
-    easy_count = int(n * args.easy_percent)
-    hard_count = int(n * args.hard_percent)
-    if easy_count < 0:
-        easy_count = 0
-    if hard_count < 0:
-        hard_count = 0
-    if easy_count + hard_count > n:
-        # Clamp in a predictable way.
-        hard_count = max(0, n - easy_count)
-
-    par_by_word: dict[str, int] = {}
-    hard_start = n - hard_count
-
-    for idx, r in enumerate(rows_by_diff):
-        if idx < easy_count:
-            par_by_word[r.word] = 3
-        elif idx >= hard_start:
-            par_by_word[r.word] = 5
-        else:
-            par_by_word[r.word] = 4
-
-    # Emit rows in commonality order (most common first), matching the existing file's intent.
-    out_lines: list[str] = ["WORD\tDIFFICULTY\tSCRABBLE_SCORE\tPAR"]
-    for r in rows_by_common:
-        out_lines.append(
-            "\t".join(
-                [
-                    r.word.upper(),
-                    format_float(difficulty_by_word[r.word]),
-                    str(r.scrabble),
-                    str(par_by_word[r.word]),
-                ]
-            )
+        from wordfreq import zipf_frequency
+
+        for w in words:
+            z = float(zipf_frequency(w, "en"))
+            rows.append(WordRow(word=w, zipf=z, scrabble=scrabble_score(w)))
+
+    if args.sweep:
+        from wordlist_table import DEFAULT_TABLE, read_table
+
+        baseline_path = args.baseline or DEFAULT_TABLE
+        baseline_par = {r.word.lower(): r.par for r in read_table(baseline_path)}
+        grid = parse_sweep(args.sweep, params)
+        started = time.perf_counter()
+        results = sweep_tables(rows, grid, baseline_par)
+        elapsed = time.perf_counter() - started
+        write_sweep(args.output, results)
+
+        base_dist = {p: sum(1 for v in baseline_par.values() if v == p) for p in PARS}
+        print(f"Words: {len(rows)}  (baseline {baseline_path.name}: {len(baseline_par)} words, {len(set(baseline_par) - {r.word for r in rows})} not in input)")
+        print(
+            "Baseline PAR distribution: "
+            + ", ".join(f"{p}={base_dist[p]}" for p in PARS)
+            + f"  golf supply {golf_supply_days(base_dist)} days"
         )
+        print(f"Configurations: {len(grid)} in {elapsed:.3f}s")
+        best = sorted(results, key=lambda r: (r.changed, -r.golf_days))[:5]
+        print("Fewest bucket changes:")
+        for r in best:
+            p = r.params
+            print(
+                f"  commonality={p.weight_commonality:g} scrabble={p.weight_scrabble:g} "
+                f"easy={p.easy_percent:g} hard={p.hard_percent:g}: "
+                + ", ".join(f"{q}={r.par_distribution[q]}" for q in PARS)
+                + f"  changed={r.changed}  golf churn="
+                + "/".join(str(r.golf_churn[q]) for q in PARS)
+                + f"  golf days={r.golf_days}"
+            )
+        print(f"Wrote: {args.output}")
+        return
 
-    args.output.write_text("\n".join(out_lines) + "\n", encoding="utf-8")
+    table = build_table(rows, params)
+    args.output.write_text("\n".join(table.output_lines()) + "\n", encoding="utf-8")
+    if args.state is not None:
+        write_state(args.state, rows, params)
 
     # Summary
-    par3 = sum(1 for v in par_by_word.values() if v == 3)
-    par4 = sum(1 for v in par_by_word.values() if v == 4)
-    par5 = sum(1 for v in par_by_word.values() if v == 5)
-    print(f"Words: {n}")
-    print(f"Scrabble score range: {int(scr_min)}..{int(scr_max)}")
+    distributions = distributions_from_columns(
+        {
+            "zipf": [r.zipf for r in rows],
+            "difficulty": table.difficulty_by_word.values(),
+            "scrabble": [r.scrabble for r in rows],
+            "par": table.par_by_word.values(),
+        }
+    )
+    par_mix = distributions["par"].value_counts()
+    difficulty = distributions["difficulty"]
+    print(f"Words: {len(rows)}")
+    print(f"Scrabble score range: {int(table.scr_min)}..{int(table.scr_max)}")
     print(f"Weights: commonality={w_common:.2f}, scrabble={w_scrabble:.2f}")
-    print(f"PAR distribution: 3={par3}, 4={par4}, 5={par5}")
+    print("PAR distribution: " + ", ".join(f"{p}={par_mix.get(p, 0)}" for p in (3, 4, 5)))
+    print("Difficulty quartiles: " + ", ".join(format_float(difficulty.quantile(q)) for q in (0.25, 0.5, 0.75)))
     print(f"Wrote: {args.output}")
+    if args.state is not None:
+        print(f"Wrote: {args.state}")
+    if args.report is not None:
+        write_report(args.report, build_report(distributions, source=args.input.name))
+        print(f"Wrote: {args.report}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""Plan daily golf courses over a date horizon with balanced difficulty.
+
+golf-start.js builds a course on demand. It shuffles the PAR mix
+[5, 5, 3, 3, 4, 4, 4, 4, 4] and picks each hole's word with ORDER BY RANDOM()
+among the unused words of that PAR. Nothing ties one day's course to another.
+Some days get nine obscure words and others nine trivial ones, and a word can
+return the next day. This tool assigns the words for every day up front.
+golf-start.js only generates a course when none exists for the day, so
+pre-inserted courses are served as they are.
+
+The plan is a greedy pass over the days, one PAR pool at a time (PAR 5, then
+PAR 3, then PAR 4):
+
+  - A word used on day d is not available again before day d + window.
+  - Of the available words, the --candidates least recently used form the
+    candidate set. Never-used words come first, in a seeded random order.
+  - Every k-subset of the candidates (k = holes of that PAR) is scored at
+    once with numpy. The tool picks the subset whose difficulty sum brings the
+    day closest to the target total, the sum of k * pool mean over all PARs.
+    Later pools absorb what earlier ones missed; PAR 4, with five holes, has
+    the most room.
+
+Least-recently-used candidates keep every word in rotation: a word that
+does not fit today stays at the front until a day it does. Course difficulty
+is the mean DIFFICULTY of the nine holes. The summary compares it with a
+simulation of golf-start.js over the same horizon.
+
+With --dsn, courses already in daily_golf_course count as history. Days in
+the horizon that already have a course are kept (unless --overwrite), and
+the window covers words used before --start.
+
+Usage:
+  python tools/golf_course_optimizer.py --start 2026-01-01 --days 365
+  python tools/golf_course_optimizer.py --dsn "$DATABASE_URL" --window 180 --sql golf-courses.sql
+  python tools/start_word_optimizer.py --golf-course golf-courses.tsv --sql golf-start-words.sql
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import itertools
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+import numpy as np
+
+from generate_wordlist_table import GOLF_PAR_MIX, PARS
+from wordlist_table import DEFAULT_TABLE, format_float, read_table
+
+
+# Pools are filled in this order; the last one has the most holes to correct with.
+FILL_ORDER = (5, 3, 4)
+
+COURSE_HEADER = "\t".join(["COURSE_DATE", "HOLE_NUMBER", "TARGET_WORD", "PAR", "DIFFICULTY"])
+
+HISTORY_SQL = """
+SELECT course_date, hole_number, UPPER(target_word), par
+FROM daily_golf_course
+WHERE course_date >= %s AND course_date < %s
+ORDER BY course_date, hole_number
+"""
+
+
+@dataclass(frozen=True)
+class Pool:
+    par: int
+    words: list[str]
+    difficulty: np.ndarray
+    holes: int  # holes of this PAR per course
+
+    @property
+    def mean(self) -> float:
+        return float(self.difficulty.mean())
+
+
+@dataclass(frozen=True)
+class Hole:
+    course_date: str
+    hole_number: int
+    word: str
+    par: int
+    difficulty: float
+
+    def format(self) -> str:
+        return "\t".join([self.course_date, str(self.hole_number), self.word, str(self.par), format_float(self.difficulty)])
+
+
+@dataclass(frozen=True)
+class PlanStats:
+    course_difficulty: np.ndarray  # mean hole difficulty per day
+    repeats_in_window: int
+    min_gap: int | None  # fewest days between two uses of a word
+    uses_per_word: tuple[int, int]  # (min, max) over the pools' words
+
+
+def sydney_today() -> date:
+    return datetime.now(ZoneInfo("Australia/Sydney")).date()
+
+
+def load_pools(path: Path) -> dict[int, Pool]:
+    demand = {p: GOLF_PAR_MIX.count(p) for p in PARS}
+    by_par: dict[int, list[tuple[str, float]]] = {p: [] for p in PARS}
+    for row in read_table(path):
+        if row.par in by_par:
+            by_par[row.par].append((row.word, row.difficulty))
+    pools: dict[int, Pool] = {}
+    for par, items in by_par.items():
+        if len(items) < demand[par]:
+            raise SystemExit(f"{path}: only {len(items)} PAR {par} words, a course needs {demand[par]}")
+        pools[par] = Pool(
+            par=par,
+            words=[w for w, _ in items],
+            difficulty=np.array([d for _, d in items], dtype=np.float64),
+            holes=demand[par],
+        )
+    return pools
+
+
+def max_window(pools: dict[int, Pool]) -> int:
+    """Longest no-repeat window the pools can sustain indefinitely."""
+    return min(len(p.words) // p.holes for p in pools.values())
+
+
+def load_history(dsn: str, first: date, last: date) -> dict[date, list[tuple[int, str, int]]]:
+    import psycopg
+
+    history: dict[date, list[tuple[int, str, int]]] = {}
+    with psycopg.connect(dsn) as conn:
+        for course_date, hole, word, par in conn.execute(HISTORY_SQL, (first, last)):
+            history.setdefault(course_date, []).append((hole, word, par))
+    return history
+
+
+@functools.lru_cache(maxsize=None)
+def subset_indices(m: int, k: int) -> np.ndarray:
+    """All k-subsets of range(m) as rows, in lexicographic order."""
+    return np.array(list(itertools.combinations(range(m), k)), dtype=np.intp)
+
+
+def plan_courses(
+    pools: dict[int, Pool],
+    dates: list[date],
+    *,
+    window: int,
+    candidates: int,
+    seed: int,
+    fixed: dict[date, list[tuple[int, str, int]]] | None = None,
+) -> list[Hole]:
+    """Assign words to holes for every date; days in `fixed` are kept as given.
+
+    Dates before dates[0] in `fixed` only seed the no-repeat window.
+    """
+    rng = np.random.default_rng(seed)
+    fixed = fixed or {}
+    first = dates[0]
+    never = -(1 << 31)  # keeps used * n + jitter well inside int64
+    index = {par: {w: i for i, w in enumerate(pool.words)} for par, pool in pools.items()}
+    last_used = {par: np.full(len(pool.words), never, dtype=np.int64) for par, pool in pools.items()}
+    # Seeded tie-break among words last used on the same day (or never).
+    jitter = {par: rng.permutation(len(pool.words)).astype(np.int64) for par, pool in pools.items()}
+    target = sum(pool.holes * pool.mean for pool in pools.values())
+    expected_after = {par: sum(pools[q].holes * pools[q].mean for q in FILL_ORDER[i + 1 :]) for i, par in enumerate(FILL_ORDER)}
+
+    def mark(day: int, par: int, word: str) -> None:
+        i = index.get(par, {}).get(word)
+        if i is not None:
+            last_used[par][i] = max(last_used[par][i], day)
+
+    for d in sorted(fixed):
+        if d < first:
+            for _, word, par in fixed[d]:
+                mark((d - first).days, par, word)
+
+    holes: list[Hole] = []
+    for t, d in enumerate(dates):
+        iso = d.isoformat()
+        if d in fixed:
+            for hole, word, par in sorted(fixed[d]):
+                mark(t, par, word)
+                i = index.get(par, {}).get(word)
+                diff = float(pools[par].difficulty[i]) if i is not None else float("nan")
+                holes.append(Hole(iso, hole, word, par, diff))
+            continue
+
+        chosen: dict[int, list[int]] = {}
+        total = 0.0
+        for par in FILL_ORDER:
+            pool = pools[par]
+            used = last_used[par]
+            n = len(pool.words)
+            key = np.where(used <= t - window, used * n + jitter[par], np.iinfo(np.int64).max)
+            available = int(np.count_nonzero(used <= t - window))
+            if available < pool.holes:
+                raise SystemExit(f"{iso}: only {available} PAR {par} words outside the {window}-day window")
+            m = min(candidates, available)
+            cand = np.argpartition(key, m - 1)[:m] if m < n else np.arange(n)
+            cand = cand[np.argsort(key[cand], kind="stable")]
+            subsets = subset_indices(m, pool.holes)
+            sums = pool.difficulty[cand][subsets].sum(axis=1)
+            want = target - total - expected_after[par]
+            # argmin keeps the first best subset: combinations are in
+            # lexicographic order, so ties go to the least recently used words.
+            pick = cand[subsets[int(np.argmin(np.abs(sums - want)))]]
+            used[pick] = t
+            chosen[par] = [int(i) for i in pick]
+            total += float(pool.difficulty[pick].sum())
+
+        order = rng.permutation(GOLF_PAR_MIX)
+        slots = {par: iter(rng.permutation(chosen[par])) for par in chosen}
+        for hole_number, par in enumerate(order, start=1):
+            i = next(slots[int(par)])
+            pool = pools[int(par)]
+            holes.append(Hole(iso, hole_number, pool.words[i], pool.par, float(pool.difficulty[i])))
+    return holes
+
+
+def random_baseline(pools: dict[int, Pool], days: int, seed: int) -> list[list[tuple[int, int]]]:
+    """golf-start.js over `days` days: per PAR, random words distinct within a day."""
+    rng = np.random.default_rng(seed)
+    courses = []
+    for _ in range(days):
+        course = []
+        for par in PARS:
+            pool = pools[par]
+            course.extend((par, int(i)) for i in rng.choice(len(pool.words), pool.holes, replace=False))
+        courses.append(course)
+    return courses
+
+
+def plan_stats(pools: dict[int, Pool], courses: list[list[tuple[int, int]]], window: int) -> PlanStats:
+    difficulty = np.array([np.mean([pools[p].difficulty[i] for p, i in course]) for course in courses])
+    last: dict[tuple[int, int], int] = {}
+    uses: dict[tuple[int, int], int] = {}
+    repeats = 0
+    min_gap = None
+    for t, course in enumerate(courses):
+        for key in course:
+            if key in last:
+                gap = t - last[key]
+                min_gap = gap if min_gap is None else min(min_gap, gap)
+                repeats += gap < window
+            last[key] = t
+            uses[key] = uses.get(key, 0) + 1
+    counts = [uses.get((par, i), 0) for par, pool in pools.items() for i in range(len(pool.words))]
+    return PlanStats(difficulty, repeats, min_gap, (min(counts), max(counts)))
+
+
+def courses_from_holes(pools: dict[int, Pool], holes: list[Hole]) -> list[list[tuple[int, int]]]:
+    index = {par: {w: i for i, w in enumerate(pool.words)} for par, pool in pools.items()}
+    by_day: dict[str, list[tuple[int, int]]] = {}
+    for h in holes:
+        i = index.get(h.par, {}).get(h.word)
+        if i is not None:
+            by_day.setdefault(h.course_date, []).append((h.par, i))
+    return list(by_day.values())
+
+
+def summarize(label: str, stats: PlanStats, window: int) -> None:
+    d = stats.course_difficulty
+    gap = "n/a" if stats.min_gap is None else str(stats.min_gap)
+    print(
+        f"{label}: course difficulty mean {d.mean():.4f} std {d.std():.4f} var {d.var():.6f} "
+        f"range {d.min():.4f}..{d.max():.4f}"
+    )
+    print(
+        f"  repeats within {window} days: {stats.repeats_in_window}  min gap {gap} days  "
+        f"uses per word {stats.uses_per_word[0]}..{stats.uses_per_word[1]}"
+    )
+
+
+def write_sql(path: Path, holes: list[Hole], *, overwrite: bool) -> None:
+    def q(s: str) -> str:
+        return "'" + s.replace("'", "''") + "'"
+
+    lines = ["-- Generated by tools/golf_course_optimizer.py", "BEGIN;"]
+    if holes:
+        lines.append("INSERT INTO daily_golf_course (course_date, hole_number, target_word, start_word, par) VALUES")
+        values = [f"  ({q(h.course_date)}, {h.hole_number}, {q(h.word)}, '', {h.par})" for h in holes]
+        lines.append(",\n".join(values))
+        if overwrite:
+            lines.append(
+                "ON CONFLICT (course_date, hole_number) DO UPDATE SET "
+                "target_word = EXCLUDED.target_word, start_word = EXCLUDED.start_word, par = EXCLUDED.par;"
+            )
+        else:
+            lines.append("ON CONFLICT (course_date, hole_number) DO NOTHING;")
+    lines.append("COMMIT;")
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Plan golf courses over a date horizon with balanced difficulty.")
+    parser.add_argument("--table", type=Path, default=DEFAULT_TABLE, help=f"Wordlist table (default {DEFAULT_TABLE})")
+    parser.add_argument("--start", default=None, help="First course date YYYY-MM-DD (default: today, Australia/Sydney)")
+    parser.add_argument("--days", type=int, default=365, help="Number of course dates from --start (default 365)")
+    parser.add_argument("--window", type=int, default=180, help="Days before a word may be used again (default 180)")
+    parser.add_argument("--candidates", type=int, default=16, help="Least recently used words considered per PAR and day (default 16)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for hole order and tie-breaks (default 0)")
+    parser.add_argument("--dsn", default=None, help="Read existing daily_golf_course rows as history (e.g. $DATABASE_URL)")
+    parser.add_argument("--output", type=Path, default=Path("golf-courses.tsv"), help="Course TSV (default golf-courses.tsv)")
+    parser.add_argument("--sql", type=Path, default=None, help="Also write SQL inserting the planned courses")
+    parser.add_argument("--overwrite", action="store_true", help="Replan days that already have a course; SQL replaces them")
+    args = parser.parse_args(argv)
+
+    if args.days < 1:
+        raise SystemExit("--days must be >= 1")
+    if args.window < 1:
+        raise SystemExit("--window must be >= 1")
+    try:
+        first = date.fromisoformat(args.start) if args.start else sydney_today()
+    except ValueError:
+        raise SystemExit(f"Invalid --start date: {args.start!r} (expected YYYY-MM-DD)")
+
+    pools = load_pools(args.table)
+    if args.candidates < max(p.holes for p in pools.values()):
+        raise SystemExit(f"--candidates must be >= {max(p.holes for p in pools.values())}")
+    limit = max_window(pools)
+    if args.window > limit:
+        sizes = ", ".join(f"PAR {p}: {len(pools[p].words)}" for p in PARS)
+        raise SystemExit(f"--window {args.window} exceeds what the pools sustain ({limit} days; {sizes})")
+    print("Pools: " + "  ".join(f"PAR {p}: {len(pools[p].words)} words, mean difficulty {pools[p].mean:.4f}" for p in PARS))
+
+    dates = [first + timedelta(days=i) for i in range(args.days)]
+    history: dict[date, list[tuple[int, str, int]]] = {}
+    if args.dsn:
+        history = load_history(args.dsn, first - timedelta(days=args.window), dates[-1] + timedelta(days=1))
+        if args.overwrite:
+            history = {d: rows for d, rows in history.items() if d < first}
+        kept = sum(1 for d in history if d >= first)
+        print(f"History: {sum(1 for d in history if d < first)} earlier courses in the window, {kept} existing courses kept")
+
+    started = time.perf_counter()
+    holes = plan_courses(pools, dates, window=args.window, candidates=args.candidates, seed=args.seed, fixed=history)
+    elapsed = time.perf_counter() - started
+    print(f"Planned {args.days} courses in {elapsed * 1000:.0f} ms")
+
+    planned = [h for h in holes if date.fromisoformat(h.course_date) not in history]
+    kept = f", {args.days - len(planned) // len(GOLF_PAR_MIX)} kept" if len(planned) < len(holes) else ""
+    summarize(f"Optimized ({len(planned) // len(GOLF_PAR_MIX)} planned{kept})", plan_stats(pools, courses_from_holes(pools, holes), args.window), args.window)
+    summarize("Random (golf-start.js)", plan_stats(pools, random_baseline(pools, args.days, args.seed), args.window), args.window)
+
+    args.output.write_text("\n".join([COURSE_HEADER] + [h.format() for h in planned]) + "\n", encoding="utf-8")
+    print(f"Wrote: {args.output}")
+    if args.sql is not None:
+        write_sql(args.sql, planned, overwrite=args.overwrite)
+        print(f"Wrote: {args.sql}")
+
+
+if __name__ == "__main__":
+    main()
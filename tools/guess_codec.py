@@ -0,0 +1,544 @@
+#!/usr/bin/env python3
+"""Packed word-id codec for stored guess histories.
+
+golf_holes.guesses and player_games.guesses (the saved game state start.js
+reads back) are JSONB arrays of five-letter strings. Each guess costs about
+eight bytes of text plus JSONB framing, and every read parses it again.
+This codec stores each guess as a uint16 id from a shared dictionary
+instead.
+
+Dictionary (data/guess-dictionary.txt): one uppercase word per line, in
+sections headed `@version N`. A word's id is its position among the word
+lines. The file is append-only, so ids never change: `build` adds words
+missing from the sources as a new version, and never reorders or deletes.
+Version 1 is public/validation-words.txt, sorted.
+
+Packed layout:
+  byte 0     bits 0-6: the lowest dictionary version that covers every id
+             used (0 if none), bit 7: the history contains escapes
+  then       one little-endian uint16 id per guess; id 0xFFFF is an escape,
+             followed by a uint8 length and that many UTF-8 bytes, the guess
+             as stored
+
+Escapes keep the codec lossless for guesses outside the dictionary. That
+covers words added to the validation list since the last build, and any
+lowercase or malformed value. A decoder only needs a dictionary at least as
+new as byte 0 says. Histories without escapes decode with a single
+struct.unpack. base64 of the same bytes is there for text transports.
+
+`migrate` fills a guesses_packed BYTEA column beside each JSONB column, in
+keyset batches of --batch-size rows, one transaction per batch. The columns
+and trigger come from migrations/add-guesses-packed.js; `migrate` and
+`verify` refuse to start until it has been run. A row is only written if its guesses still
+equal what was read, and a trigger clears guesses_packed when guesses
+changes. A non-NULL packed value therefore always matches its row, and
+re-runs pick up rows that changed or arrived since. The handlers keep
+reading and writing the JSONB column.
+
+Usage:
+  python tools/guess_codec.py build
+  python tools/guess_codec.py build --source public/validation-words.txt --source data/wordlist-table.txt
+  python tools/guess_codec.py bench --histories 200000
+  python tools/guess_codec.py migrate --dsn "$DATABASE_URL" --batch-size 5000
+  python tools/guess_codec.py verify --dsn "$DATABASE_URL"
+  python tools/guess_codec.py decode AawGEjE=
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import json
+import os
+import random
+import struct
+import time
+from bisect import bisect_left
+from dataclasses import dataclass
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_DICTIONARY = ROOT / "data" / "guess-dictionary.txt"
+DEFAULT_SOURCES = (ROOT / "public" / "validation-words.txt",)
+
+ESCAPE = 0xFFFF
+MAX_WORDS = ESCAPE  # ids 0..0xFFFE
+MAX_VERSION = 0x7F
+ESCAPE_FLAG = 0x80
+TABLES = ("golf_holes", "player_games")
+
+DICTIONARY_HEADER = """\
+# Guess dictionary for tools/guess_codec.py. A word's id is its position
+# among the word lines, starting at 0. Append-only: never reorder or delete
+# lines, or packed histories will decode to the wrong words.
+"""
+
+
+class GuessDictionary:
+    """Word <-> uint16 id mapping with append-only versions."""
+
+    def __init__(self, words: list[str], version_ends: list[int]):
+        # version_ends[v - 1] is the number of words in version v.
+        self.words = words
+        self.version_ends = version_ends
+        self.ids = {w: i for i, w in enumerate(words)}
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    @property
+    def version(self) -> int:
+        return len(self.version_ends)
+
+    @classmethod
+    def read(cls, path: Path) -> "GuessDictionary":
+        words: list[str] = []
+        ends: list[int] = []
+        start = None  # first word index of the open section
+        for n, raw in enumerate(path.read_text(encoding="utf-8").splitlines(), start=1):
+            line = raw.strip()
+            if not line or line.startswith("#"):
+                continue
+            if line.startswith("@version"):
+                if start is not None:
+                    if start == len(words):
+                        raise SystemExit(f"{path}:{n}: version {len(ends) + 1} is empty")
+                    ends.append(len(words))
+                if line.split()[1:] != [str(len(ends) + 1)]:
+                    raise SystemExit(f"{path}:{n}: expected @version {len(ends) + 1}")
+                start = len(words)
+                continue
+            if start is None:
+                raise SystemExit(f"{path}:{n}: word before @version 1")
+            words.append(line)
+        if start is not None:
+            if start == len(words):
+                raise SystemExit(f"{path}: version {len(ends) + 1} is empty")
+            ends.append(len(words))
+        if len(set(words)) != len(words):
+            raise SystemExit(f"{path}: duplicate words")
+        if len(words) > MAX_WORDS or len(ends) > MAX_VERSION:
+            raise SystemExit(f"{path}: {len(words)} words / {len(ends)} versions exceed the format")
+        return cls(words, ends)
+
+    def write(self, path: Path) -> None:
+        lines = [DICTIONARY_HEADER.rstrip("\n")]
+        start = 0
+        for v, end in enumerate(self.version_ends, start=1):
+            lines.append(f"@version {v}")
+            lines.extend(self.words[start:end])
+            start = end
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    def append(self, words: list[str]) -> list[str]:
+        """Add unseen words as a new version; returns the words added."""
+        added = sorted({w for w in words if w not in self.ids})
+        if not added:
+            return []
+        if len(self.words) + len(added) > MAX_WORDS or self.version + 1 > MAX_VERSION:
+            raise SystemExit(f"Dictionary full: {len(self.words)} + {len(added)} words, version {self.version + 1}")
+        for w in added:
+            self.ids[w] = len(self.words)
+            self.words.append(w)
+        self.version_ends.append(len(self.words))
+        return added
+
+    def version_for(self, word_id: int) -> int:
+        """Lowest version that contains `word_id`."""
+        return bisect_left(self.version_ends, word_id + 1) + 1
+
+    def encode(self, guesses: list[str]) -> bytes:
+        try:
+            packed = list(map(self.ids.__getitem__, guesses))
+        except (KeyError, TypeError):
+            return self._encode_escaped(guesses)
+        if not packed:
+            return b"\0"
+        top = max(packed)
+        version = 1 if top < self.version_ends[0] else self.version_for(top)
+        return _struct(len(packed)).pack(version, *packed)
+
+    def _encode_escaped(self, guesses: list[str]) -> bytes:
+        out = bytearray(1)
+        top = -1
+        escaped = False
+        for g in guesses:
+            if not isinstance(g, str):
+                raise ValueError(f"guess {g!r} is not a string")
+            i = self.ids.get(g)
+            if i is None:
+                raw = g.encode("utf-8")
+                if len(raw) > 0xFF:
+                    raise ValueError(f"guess {g[:20]!r}... is longer than 255 bytes")
+                out += struct.pack("<HB", ESCAPE, len(raw)) + raw
+                escaped = True
+            else:
+                out += struct.pack("<H", i)
+                top = max(top, i)
+        out[0] = (self.version_for(top) if top >= 0 else 0) | (ESCAPE_FLAG if escaped else 0)
+        return bytes(out)
+
+    def decode(self, data: bytes) -> list[str]:
+        if not data:
+            raise ValueError("empty packed history")
+        head = data[0]
+        if (head & MAX_VERSION) > self.version:
+            raise ValueError(f"packed with dictionary version {head & MAX_VERSION}, have {self.version}")
+        words = self.words
+        if not head & ESCAPE_FLAG:
+            count, odd = divmod(len(data) - 1, 2)
+            if odd:
+                raise ValueError("truncated packed history")
+            return list(map(words.__getitem__, _ids(count).unpack_from(data, 1)))
+        out: list[str] = []
+        pos = 1
+        end = len(data)
+        while pos < end:
+            (i,) = struct.unpack_from("<H", data, pos)
+            pos += 2
+            if i == ESCAPE:
+                n = data[pos]
+                out.append(data[pos + 1 : pos + 1 + n].decode("utf-8"))
+                pos += 1 + n
+            else:
+                out.append(words[i])
+        if pos != end:
+            raise ValueError("truncated packed history")
+        return out
+
+    def encode_b64(self, guesses: list[str]) -> str:
+        return base64.b64encode(self.encode(guesses)).decode("ascii")
+
+    def decode_b64(self, text: str) -> list[str]:
+        return self.decode(base64.b64decode(text, validate=True))
+
+
+_STRUCTS: dict[int, struct.Struct] = {}
+
+
+def _struct(n: int) -> struct.Struct:
+    s = _STRUCTS.get(n)
+    if s is None:
+        s = _STRUCTS[n] = struct.Struct(f"<B{n}H")
+    return s
+
+
+_IDS: dict[int, struct.Struct] = {}
+
+
+def _ids(n: int) -> struct.Struct:
+    s = _IDS.get(n)
+    if s is None:
+        s = _IDS[n] = struct.Struct(f"<{n}H")
+    return s
+
+
+def read_source_words(path: Path) -> list[str]:
+    # Plain word lists, or a wordlist table (first column, WORD header skipped).
+    out = []
+    for line in path.read_text(encoding="utf-8-sig").splitlines():
+        word = line.split("\t")[0].strip().upper()
+        if len(word) == 5 and word.isascii() and word.isalpha():
+            out.append(word)
+    return out
+
+
+def load_dictionary(path: Path) -> GuessDictionary:
+    if not path.exists():
+        raise SystemExit(f"No dictionary at {path}; run `guess_codec.py build` first")
+    return GuessDictionary.read(path)
+
+
+# --- build ----------------------------------------------------------------------
+
+
+def cmd_build(args: argparse.Namespace) -> None:
+    sources = args.source or list(DEFAULT_SOURCES)
+    words: list[str] = []
+    for src in sources:
+        words.extend(read_source_words(src))
+    if args.dictionary.exists():
+        dictionary = GuessDictionary.read(args.dictionary)
+    else:
+        dictionary = GuessDictionary([], [])
+    before = len(dictionary)
+    added = dictionary.append(words)
+    if not added:
+        print(f"Dictionary {args.dictionary}: version {dictionary.version}, {before} words, nothing to add")
+        return
+    dictionary.write(args.dictionary)
+    print(f"Dictionary version {dictionary.version}: +{len(added)} words ({before} -> {len(dictionary)})")
+    print(f"Wrote: {args.dictionary}")
+
+
+# --- bench ----------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class BenchRow:
+    label: str
+    encode_s: float
+    decode_s: float
+    total_bytes: int
+
+
+def synthetic_histories(dictionary: GuessDictionary, count: int, *, unknown_rate: float, seed: int) -> list[list[str]]:
+    """Histories of 1..6 guesses (golf rounds can run to 10) from the dictionary."""
+    rng = random.Random(seed)
+    lengths = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    weights = [2, 10, 21, 28, 20, 12, 3, 2, 1, 1]
+    alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    words = dictionary.words
+    out = []
+    for n in rng.choices(lengths, weights, k=count):
+        h = []
+        for _ in range(n):
+            if rng.random() < unknown_rate:
+                h.append("".join(rng.choices(alphabet, k=5)) + "Q")
+            else:
+                h.append(rng.choice(words))
+        out.append(h)
+    return out
+
+
+def _timed(func, items) -> tuple[list, float]:
+    started = time.perf_counter()
+    out = [func(x) for x in items]
+    return out, time.perf_counter() - started
+
+
+def cmd_bench(args: argparse.Namespace) -> None:
+    dictionary = load_dictionary(args.dictionary)
+    histories = synthetic_histories(dictionary, args.histories, unknown_rate=args.unknown_rate, seed=args.seed)
+    guesses = sum(len(h) for h in histories)
+    print(f"Histories: {len(histories)}  guesses: {guesses}  unknown rate: {args.unknown_rate}  dictionary v{dictionary.version} ({len(dictionary)} words)")
+
+    rows: list[BenchRow] = []
+    text, enc = _timed(json.dumps, histories)
+    back, dec = _timed(json.loads, text)
+    assert back == histories
+    rows.append(BenchRow("json text", enc, dec, sum(len(t.encode("utf-8")) for t in text)))
+
+    packed, enc = _timed(dictionary.encode, histories)
+    back, dec = _timed(dictionary.decode, packed)
+    assert back == histories
+    rows.append(BenchRow("packed", enc, dec, sum(len(p) for p in packed)))
+
+    b64, enc = _timed(dictionary.encode_b64, histories)
+    back, dec = _timed(dictionary.decode_b64, b64)
+    assert back == histories
+    rows.append(BenchRow("packed base64", enc, dec, sum(len(b) for b in b64)))
+
+    base = rows[0].total_bytes
+    print(f"{'format':<14} {'encode/s':>12} {'decode/s':>12} {'bytes/history':>14} {'vs json':>8}")
+    for r in rows:
+        print(
+            f"{r.label:<14} {len(histories) / r.encode_s:>12,.0f} {len(histories) / r.decode_s:>12,.0f} "
+            f"{r.total_bytes / len(histories):>14.2f} {r.total_bytes / base:>8.1%}"
+        )
+    print("Round trips: OK")
+
+
+# --- database -------------------------------------------------------------------
+
+
+SELECT_BATCH_SQL = """
+SELECT id, guesses FROM {table}
+WHERE id > %s AND guesses_packed IS NULL
+ORDER BY id
+LIMIT %s
+"""
+
+UPDATE_BATCH_SQL = """
+UPDATE {table} AS t SET guesses_packed = v.packed
+FROM unnest(%s::int[], %s::bytea[], %s::text[]) AS v(id, packed, guesses)
+WHERE t.id = v.id AND t.guesses_packed IS NULL AND t.guesses = v.guesses::jsonb
+"""
+
+STORAGE_SQL = """
+SELECT count(*), count(guesses_packed),
+       coalesce(sum(pg_column_size(guesses)), 0),
+       coalesce(sum(pg_column_size(guesses_packed)), 0),
+       coalesce(sum(pg_column_size(guesses)) FILTER (WHERE guesses_packed IS NOT NULL), 0)
+FROM {table}
+"""
+
+
+def _tables(value: str) -> list[str]:
+    tables = [t.strip() for t in value.split(",") if t.strip()]
+    unknown = [t for t in tables if t not in TABLES]
+    if unknown:
+        raise SystemExit(f"Unknown table(s): {', '.join(unknown)} (expected {', '.join(TABLES)})")
+    return tables
+
+
+def require_packed_columns(conn, tables: list[str]) -> None:
+    missing = [
+        table
+        for table in tables
+        if conn.execute(
+            "SELECT 1 FROM information_schema.columns WHERE table_schema = current_schema() AND table_name = %s AND column_name = 'guesses_packed'",
+            (table,),
+        ).fetchone()
+        is None
+    ]
+    if missing:
+        raise SystemExit(
+            f"{', '.join(t + '.guesses_packed' for t in missing)} missing; "
+            "run `node migrations/run-migration.js add-guesses-packed up` first"
+        )
+
+
+def migrate_table(conn, dictionary: GuessDictionary, table: str, *, batch_size: int, max_batches: int | None, pause: float) -> tuple[int, int, int]:
+    """Pack rows with guesses_packed IS NULL; returns (written, skipped, batches)."""
+    last_id = 0
+    written = skipped = batches = 0
+    select = SELECT_BATCH_SQL.format(table=table)
+    update = UPDATE_BATCH_SQL.format(table=table)
+    while max_batches is None or batches < max_batches:
+        with conn.transaction():
+            rows = conn.execute(select, (last_id, batch_size)).fetchall()
+            if not rows:
+                break
+            ids, packed, texts = [], [], []
+            for row_id, guesses in rows:
+                if not isinstance(guesses, list):
+                    skipped += 1
+                    continue
+                try:
+                    data = dictionary.encode(guesses)
+                except ValueError:
+                    skipped += 1
+                    continue
+                ids.append(row_id)
+                packed.append(data)
+                texts.append(json.dumps(guesses))
+            if ids:
+                written += conn.execute(update, (ids, packed, texts)).rowcount
+            last_id = rows[-1][0]
+        batches += 1
+        if pause > 0:
+            time.sleep(pause)
+    return written, skipped, batches
+
+
+def print_storage(conn, tables: list[str]) -> None:
+    for table in tables:
+        rows, packed, json_bytes, packed_bytes, json_packed_bytes = conn.execute(STORAGE_SQL.format(table=table)).fetchone()
+        ratio = f"{packed_bytes / json_packed_bytes:.1%}" if json_packed_bytes else "n/a"
+        print(
+            f"  {table}: {packed}/{rows} rows packed; guesses {json_bytes:,} bytes, "
+            f"guesses_packed {packed_bytes:,} bytes ({ratio} of the packed rows' JSONB)"
+        )
+
+
+def cmd_migrate(args: argparse.Namespace) -> None:
+    import psycopg
+
+    if not args.dsn:
+        raise SystemExit("No database: pass --dsn or set DATABASE_URL")
+    if args.batch_size < 1:
+        raise SystemExit("--batch-size must be >= 1")
+    dictionary = load_dictionary(args.dictionary)
+    tables = _tables(args.tables)
+    with psycopg.connect(args.dsn, autocommit=True) as conn:
+        require_packed_columns(conn, tables)
+        for table in tables:
+            started = time.perf_counter()
+            written, skipped, batches = migrate_table(
+                conn, dictionary, table, batch_size=args.batch_size, max_batches=args.max_batches, pause=args.pause
+            )
+            elapsed = time.perf_counter() - started
+            rate = written / elapsed if elapsed > 0 else 0.0
+            note = f", {skipped} not arrays of strings" if skipped else ""
+            print(f"{table}: packed {written} rows in {batches} batches, {elapsed:.2f}s ({rate:,.0f} rows/s){note}")
+        print("Storage:")
+        print_storage(conn, tables)
+
+
+def cmd_verify(args: argparse.Namespace) -> None:
+    import psycopg
+
+    if not args.dsn:
+        raise SystemExit("No database: pass --dsn or set DATABASE_URL")
+    dictionary = load_dictionary(args.dictionary)
+    tables = _tables(args.tables)
+    problems = 0
+    with psycopg.connect(args.dsn) as conn:
+        require_packed_columns(conn, tables)
+        for table in tables:
+            checked = 0
+            last_id = 0
+            while True:
+                rows = conn.execute(
+                    f"SELECT id, guesses, guesses_packed FROM {table} WHERE id > %s AND guesses_packed IS NOT NULL ORDER BY id LIMIT %s",
+                    (last_id, args.batch_size),
+                ).fetchall()
+                if not rows:
+                    break
+                for row_id, guesses, packed in rows:
+                    try:
+                        ok = dictionary.decode(bytes(packed)) == guesses
+                    except (ValueError, IndexError):
+                        ok = False
+                    if not ok:
+                        problems += 1
+                        if problems <= 10:
+                            print(f"  {table} id {row_id}: packed value does not decode to guesses")
+                checked += len(rows)
+                last_id = rows[-1][0]
+            print(f"{table}: {checked} packed rows checked")
+    if problems:
+        raise SystemExit(f"{problems} mismatches")
+    print("OK")
+
+
+def cmd_decode(args: argparse.Namespace) -> None:
+    dictionary = load_dictionary(args.dictionary)
+    for value in args.value:
+        try:
+            data = bytes.fromhex(value[2:]) if value.startswith("\\x") else base64.b64decode(value, validate=True)
+            print(json.dumps(dictionary.decode(data)))
+        except ValueError as e:
+            raise SystemExit(f"{value}: {e}")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Packed word-id codec for guess histories.")
+    parser.add_argument("--dictionary", type=Path, default=DEFAULT_DICTIONARY, help=f"Guess dictionary (default {DEFAULT_DICTIONARY})")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("build", help="Append unseen source words to the dictionary as a new version.")
+    p.add_argument("--source", type=Path, action="append", default=[], help="Word list or wordlist table (repeatable; default public/validation-words.txt)")
+    p.set_defaults(func=cmd_build)
+
+    p = sub.add_parser("bench", help="Encode/decode throughput and size against JSON on synthetic histories.")
+    p.add_argument("--histories", type=int, default=100_000, help="Synthetic histories (default 100000)")
+    p.add_argument("--unknown-rate", type=float, default=0.01, help="Share of guesses outside the dictionary (default 0.01)")
+    p.add_argument("--seed", type=int, default=0)
+    p.set_defaults(func=cmd_bench)
+
+    for name, func, help_text in (
+        ("migrate", cmd_migrate, "Fill guesses_packed in bounded batches."),
+        ("verify", cmd_verify, "Check every guesses_packed value against guesses."),
+    ):
+        p = sub.add_parser(name, help=help_text)
+        p.add_argument("--dsn", default=os.environ.get("DATABASE_URL"), help="Postgres DSN (default: $DATABASE_URL)")
+        p.add_argument("--tables", default=",".join(TABLES), help=f"Comma-separated tables (default {','.join(TABLES)})")
+        p.add_argument("--batch-size", type=int, default=5000, help="Rows per batch (default 5000)")
+        if name == "migrate":
+            p.add_argument("--max-batches", type=int, default=None, help="Stop after this many batches per table")
+            p.add_argument("--pause", type=float, default=0.0, help="Seconds to sleep between batches (default 0)")
+        p.set_defaults(func=func)
+
+    p = sub.add_parser("decode", help="Decode base64 (or \\x-hex bytea) values.")
+    p.add_argument("value", nargs="+")
+    p.set_defaults(func=cmd_decode)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
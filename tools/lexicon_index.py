@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""Build and query the prebuilt five-letter lexicon membership index.
+
+The word filters used to rebuild NLTK's 236k-word set and open an enchant
+dictionary on every run. This compiles those sources (plus the curated sets in
+lexicon_sources.py and the repo word lists) once into a flat, memory-mappable
+file: one tag byte per possible five-letter word, addressed directly by the
+word's base-26 code. Lookups are a single byte read with no parsing.
+
+File layout (little-endian):
+  header  magic, format version, tag count, data offset, table size,
+          word count, sha256 of the table, then newline-separated tag names
+  table   26**5 bytes at `data offset`; bit i set means tag i applies
+
+Usage:
+  python tools/lexicon_index.py build [--word-list common-wordlist.txt] [--proper-nouns proper_nouns_5_letters.txt]
+  python tools/lexicon_index.py lookup crane paris gonna
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import mmap
+import re
+import struct
+from pathlib import Path
+from typing import Iterable
+
+from lexicon_sources import PROPER_NOUNS, PROPER_NOUNS_EXTENDED, SLANG_INFORMAL
+from wordlist_table import iter_table
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_INDEX = REPO_ROOT / "data" / "lexicon-index.bin"
+DEFAULT_VALIDATION = REPO_ROOT / "public" / "validation-words.txt"
+DEFAULT_WORDLIST = REPO_ROOT / "data" / "wordlist-table.txt"
+
+MAGIC = b"GRLEXIDX"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<8sHHIII32s")
+DATA_OFFSET = 4096
+TABLE_SIZE = 26**5
+
+# Bit positions in the per-word tag byte. Order is part of the file format.
+TAG_VALIDATION = 0
+TAG_WORDLIST = 1
+TAG_NLTK = 2
+TAG_ENCHANT = 3
+TAG_ENCHANT_CHECKED = 4  # enchant was consulted for this word (TAG_ENCHANT is meaningful)
+TAG_PROPER_NOUN = 5
+TAG_PROPER_NOUN_EXTENDED = 6
+TAG_SLANG = 7
+
+TAG_NAMES = (
+    "validation",
+    "wordlist",
+    "nltk",
+    "enchant",
+    "enchant_checked",
+    "proper_noun",
+    "proper_noun_extended",
+    "slang",
+)
+
+_FIVE_LETTERS = re.compile(r"^[a-z]{5}$")
+
+
+def word_code(word: str) -> int:
+    """Base-26 code of a five-letter word (case-insensitive), or -1 if it has no slot."""
+    if len(word) != 5:
+        return -1
+    code = 0
+    for ch in word.lower():
+        offset = ord(ch) - 97
+        if not 0 <= offset < 26:
+            return -1
+        code = code * 26 + offset
+    return code
+
+
+def code_word(code: int) -> str:
+    letters = []
+    for _ in range(5):
+        code, offset = divmod(code, 26)
+        letters.append(chr(97 + offset))
+    return "".join(reversed(letters))
+
+
+class LexiconIndex:
+    """Read-only view over a built index file."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        with self.path.open("rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, tag_count, data_offset, table_size, word_count, digest = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            raise SystemExit(f"{self.path} is not a lexicon index")
+        if version != FORMAT_VERSION:
+            raise SystemExit(f"{self.path} has format version {version}, expected {FORMAT_VERSION}; rebuild it")
+        if table_size != TABLE_SIZE or len(self._mm) < data_offset + table_size:
+            raise SystemExit(f"{self.path} is truncated")
+
+        names = bytes(self._mm[HEADER.size : data_offset]).rstrip(b"\0").decode("ascii").split("\n")
+        if tuple(names[:tag_count]) != TAG_NAMES:
+            raise SystemExit(f"{self.path} has unexpected tags {names[:tag_count]}; rebuild it")
+
+        self.word_count = word_count
+        self.digest = digest.hex()
+        self._offset = data_offset
+
+    @property
+    def version(self) -> str:
+        # Short content hash; changes whenever any source changes.
+        return self.digest[:12]
+
+    def close(self) -> None:
+        self._mm.close()
+
+    def __enter__(self) -> "LexiconIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def tags(self, word: str) -> int:
+        code = word_code(word)
+        if code < 0:
+            return 0
+        return self._mm[self._offset + code]
+
+    def has(self, word: str, tag: int) -> bool:
+        return bool(self.tags(word) >> tag & 1)
+
+    def tag_names(self, word: str) -> list[str]:
+        mask = self.tags(word)
+        return [name for bit, name in enumerate(TAG_NAMES) if mask >> bit & 1]
+
+
+def read_words(path: Path) -> Iterable[str]:
+    with path.open("r", encoding="utf-8-sig") as f:
+        for line in f:
+            word = line.split("\t", 1)[0].strip().lower()
+            if _FIVE_LETTERS.match(word):
+                yield word
+
+
+def load_nltk_words() -> set[str]:
+    try:
+        import nltk
+        from nltk.corpus import words as nltk_words
+    except ImportError:
+        raise SystemExit("nltk is not installed; pip install nltk or pass --no-nltk")
+
+    try:
+        nltk.data.find("corpora/words")
+    except LookupError:
+        nltk.download("words", quiet=True)
+    return {w.lower() for w in nltk_words.words() if _FIVE_LETTERS.match(w.lower())}
+
+
+def load_enchant_dict():
+    try:
+        import enchant
+    except ImportError:
+        raise SystemExit("pyenchant is not installed; pip install pyenchant or pass --no-enchant")
+    return enchant.Dict("en_US")
+
+
+def build_table(
+    *,
+    validation: Path | None,
+    wordlist: Path | None,
+    word_lists: list[Path],
+    proper_noun_lists: list[Path],
+    use_nltk: bool,
+    use_enchant: bool,
+) -> tuple[bytearray, dict[str, int]]:
+    table = bytearray(TABLE_SIZE)
+    counts: dict[str, int] = {}
+
+    def tag(words: Iterable[str], bit: int) -> None:
+        n = 0
+        for word in words:
+            code = word_code(word)
+            if code >= 0:
+                table[code] |= 1 << bit
+                n += 1
+        counts[TAG_NAMES[bit]] = counts.get(TAG_NAMES[bit], 0) + n
+
+    if validation is not None:
+        tag(set(read_words(validation)), TAG_VALIDATION)
+    if wordlist is not None:
+        tag({row.word.lower() for row in iter_table(wordlist)}, TAG_WORDLIST)
+    if use_nltk:
+        tag(load_nltk_words(), TAG_NLTK)
+
+    tag(PROPER_NOUNS, TAG_PROPER_NOUN)
+    # The comprehensive filter's list plus any generated name lists
+    # (e.g. generate_5_letter_proper_nouns.py output) share one tag.
+    extended = set(PROPER_NOUNS_EXTENDED)
+    for path in proper_noun_lists:
+        extended.update(read_words(path))
+    tag(extended, TAG_PROPER_NOUN_EXTENDED)
+    tag(SLANG_INFORMAL, TAG_SLANG)
+
+    if use_enchant:
+        # enchant cannot be enumerated, so check every word any source knows
+        # about plus the extra candidate lists. Filters fall back to a live
+        # check for words outside this universe (no enchant_checked bit).
+        candidates = {code_word(code) for code, mask in enumerate(table) if mask}
+        for path in word_lists:
+            candidates.update(read_words(path))
+        dictionary = load_enchant_dict()
+        tag(sorted(candidates), TAG_ENCHANT_CHECKED)
+        tag((w for w in sorted(candidates) if dictionary.check(w)), TAG_ENCHANT)
+
+    return table, counts
+
+
+def write_index(path: Path, table: bytearray) -> str:
+    digest = hashlib.sha256(table).digest()
+    word_count = TABLE_SIZE - table.count(0)
+    names = "\n".join(TAG_NAMES).encode("ascii")
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, len(TAG_NAMES), DATA_OFFSET, TABLE_SIZE, word_count, digest) + names
+    if len(header) > DATA_OFFSET:
+        raise SystemExit("Tag names do not fit in the index header")
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with tmp.open("wb") as f:
+        f.write(header.ljust(DATA_OFFSET, b"\0"))
+        f.write(table)
+    tmp.replace(path)
+    return digest.hex()
+
+
+def cmd_build(args: argparse.Namespace) -> None:
+    table, counts = build_table(
+        validation=None if args.no_validation else args.validation,
+        wordlist=None if args.no_wordlist else args.wordlist,
+        word_lists=args.word_list,
+        proper_noun_lists=args.proper_nouns,
+        use_nltk=not args.no_nltk,
+        use_enchant=not args.no_enchant,
+    )
+    digest = write_index(args.output, table)
+
+    print(f"Wrote: {args.output}")
+    print(f"Version: {digest[:12]}  words: {TABLE_SIZE - table.count(0)}")
+    for name in TAG_NAMES:
+        if name in counts:
+            print(f"  {name}: {counts[name]}")
+
+
+def cmd_lookup(args: argparse.Namespace) -> None:
+    with LexiconIndex(args.index) as index:
+        print(f"Index: {index.path} (version {index.version}, {index.word_count} words)")
+        for word in args.words:
+            names = index.tag_names(word)
+            print(f"  {word}: {', '.join(names) if names else '-'}")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Build or query the five-letter lexicon membership index.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("build", help="Compile reference sources into the index.")
+    p.add_argument("--output", type=Path, default=DEFAULT_INDEX)
+    p.add_argument("--validation", type=Path, default=DEFAULT_VALIDATION)
+    p.add_argument("--wordlist", type=Path, default=DEFAULT_WORDLIST)
+    p.add_argument("--no-validation", action="store_true")
+    p.add_argument("--no-wordlist", action="store_true")
+    p.add_argument(
+        "--word-list",
+        type=Path,
+        action="append",
+        default=[],
+        help="Extra candidate words to check against enchant (repeatable), e.g. the filter inputs.",
+    )
+    p.add_argument(
+        "--proper-nouns",
+        type=Path,
+        action="append",
+        default=[],
+        help="Extra proper-noun lists merged into the proper_noun_extended tag (repeatable).",
+    )
+    p.add_argument("--no-nltk", action="store_true", help="Skip the NLTK words corpus.")
+    p.add_argument("--no-enchant", action="store_true", help="Skip enchant checks (filters will check live).")
+    p.set_defaults(func=cmd_build)
+
+    p = sub.add_parser("lookup", help="Print the tags recorded for some words.")
+    p.add_argument("words", nargs="+")
+    p.add_argument("--index", type=Path, default=DEFAULT_INDEX)
+    p.set_defaults(func=cmd_lookup)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Curated reference word sets shared by the word filter tools.
+
+Every entry is a lowercase five-letter ASCII word (^[a-z]{5}$): the filters only
+ever see five-letter candidates, so longer names ('albania', 'alas!') could never
+match and are not kept here. lexicon_index.py compiles these sets, alongside the
+NLTK/enchant dictionaries, into the prebuilt membership index.
+"""
+
+from __future__ import annotations
+
+
+# Well-known names and places removed by filter_refined_words.py
+PROPER_NOUNS = frozenset({
+    'alice', 'benin', 'cairo', 'chile', 'china', 'congo', 'david', 'gabon', 'ghana',
+    'haiti', 'idaho', 'india', 'italy', 'james', 'japan', 'jones', 'kenya', 'libya',
+    'maine', 'malta', 'maria', 'nepal', 'niger', 'paris', 'peter', 'qatar', 'samoa',
+    'sarah', 'smith', 'spain', 'sudan', 'syria', 'texas', 'tokyo', 'tonga', 'wales',
+    'yemen',
+})
+
+# Broader name/place/brand list used by filter-plurals-comprehensive.py. It
+# deliberately includes words that double as common nouns ('green', 'ghost'),
+# so it is kept separate from PROPER_NOUNS rather than merged into it.
+PROPER_NOUNS_EXTENDED = frozenset({
+    'aaron', 'abbey', 'adams', 'agnes', 'aidan', 'aiden', 'aisha', 'aisle', 'akbar',
+    'alana', 'alarm', 'alden', 'alexa', 'alice', 'allan', 'allen', 'amber', 'amish',
+    'andre', 'angel', 'angie', 'anglo', 'anita', 'annie', 'anton', 'april', 'arabs',
+    'argus', 'ariel', 'aries', 'arlen', 'arnie', 'asian', 'assam', 'atlas', 'avery',
+    'avril', 'bacon', 'badge', 'baker', 'banks', 'baron', 'barry', 'basil', 'baton',
+    'belle', 'benny', 'betty', 'bible', 'biden', 'billy', 'blake', 'bobby', 'boris',
+    'bosch', 'boxer', 'brady', 'brand', 'brent', 'brett', 'brian', 'brice', 'brick',
+    'bruce', 'bruno', 'bryan', 'bryce', 'byron', 'cabot', 'cairo', 'caleb', 'camel',
+    'canon', 'carey', 'carlo', 'carol', 'casey', 'cathy', 'cecil', 'cedar', 'cesar',
+    'chang', 'chaos', 'chase', 'chess', 'china', 'chloe', 'choir', 'chuck', 'clara',
+    'clark', 'cliff', 'clyde', 'cohen', 'colin', 'comet', 'congo', 'corey', 'costa',
+    'craig', 'croat', 'crowe', 'crown', 'crude', 'cuban', 'curry', 'cyril', 'czech',
+    'daily', 'dairy', 'daisy', 'damon', 'danny', 'dante', 'darcy', 'daryl', 'dated',
+    'davis', 'deane', 'delhi', 'delta', 'demon', 'derek', 'devon', 'diana', 'diane',
+    'diego', 'dixie', 'dodge', 'dolly', 'donna', 'doris', 'dover', 'drake', 'duane',
+    'dudes', 'dummy', 'dunne', 'dutch', 'dwarf', 'dylan', 'eddie', 'edgar', 'edith',
+    'edwin', 'egypt', 'elena', 'elias', 'ellen', 'ellis', 'elton', 'elves', 'emily',
+    'enoch', 'enron', 'erica', 'ernst', 'essex', 'ethan', 'euler', 'euros', 'evans',
+    'fairy', 'faith', 'fargo', 'felix', 'finns', 'fiona', 'flame', 'floyd', 'flynn',
+    'franc', 'frank', 'franz', 'freud', 'fritz', 'gable', 'gamma', 'garbo', 'gates',
+    'gavin', 'genoa', 'gerry', 'ghana', 'ghost', 'giant', 'giles', 'glenn', 'goats',
+    'golan', 'golda', 'gomez', 'goths', 'grace', 'grady', 'grant', 'greek', 'green',
+    'greta', 'grimm', 'haiti', 'hamas', 'hardy', 'harry', 'hatch', 'haven', 'hayes',
+    'hazel', 'heath', 'heidi', 'helen', 'henry', 'hicks', 'hindu', 'hobbs', 'hogan',
+    'homer', 'honda', 'hurst', 'idaho', 'india', 'indie', 'intel', 'iraqi', 'irene',
+    'irish', 'isaac', 'islam', 'italy', 'ivory', 'jacob', 'jaime', 'jakob', 'james',
+    'jamie', 'janet', 'japan', 'jason', 'jeans', 'jenna', 'jenny', 'jerry', 'jesse',
+    'jesus', 'jimmy', 'johan', 'jones', 'jorge', 'josef', 'joyce', 'judas', 'judge',
+    'jules', 'julia', 'julie', 'julio', 'kafka', 'karen', 'kathy', 'katie', 'keith',
+    'kelly', 'kenny', 'kenya', 'kevin', 'kings', 'klein', 'korea', 'kuala', 'kurds',
+    'kyoto', 'laden', 'lagos', 'lance', 'larry', 'latin', 'laura', 'leahy', 'leeds',
+    'leigh', 'lemon', 'lenin', 'leone', 'lewis', 'libya', 'linda', 'lions', 'lloyd',
+    'logan', 'lopez', 'loren', 'louis', 'lucas', 'lucia', 'lydia', 'lyman', 'lynch',
+    'lyons', 'mabel', 'mafia', 'magna', 'maine', 'major', 'malay', 'malta', 'mambo',
+    'mamma', 'manga', 'maori', 'march', 'marco', 'maria', 'marie', 'mario', 'marks',
+    'marty', 'mason', 'mateo', 'mavis', 'maxim', 'mayan', 'mayer', 'mazda', 'mccoy',
+    'mecca', 'megan', 'metro', 'meyer', 'miami', 'micah', 'milan', 'miles', 'mills',
+    'mindy', 'minor', 'minsk', 'molly', 'monte', 'moore', 'morse', 'moses', 'myers',
+    'myrna', 'nancy', 'naomi', 'nazis', 'negro', 'nepal', 'niger', 'nikki', 'nikon',
+    'nixon', 'nobel', 'noble', 'nolan', 'norma', 'notre', 'nyack', 'oasis', 'oates',
+    'obama', 'ocean', 'olsen', 'olson', 'omaha', 'omega', 'opera', 'oprah', 'oscar',
+    'pablo', 'paddy', 'paige', 'papal', 'papua', 'paris', 'patel', 'patty', 'paula',
+    'pearl', 'pedro', 'peggy', 'penny', 'perry', 'perth', 'peter', 'petra', 'piper',
+    'plato', 'plaza', 'pluto', 'polar', 'poles', 'polly', 'pratt', 'punic', 'putin',
+    'queen', 'quinn', 'rabbi', 'ralph', 'rambo', 'ramos', 'randy', 'raoul', 'raven',
+    'rebel', 'reese', 'reims', 'renee', 'rhine', 'rhoda', 'riley', 'ringo', 'roach',
+    'robin', 'rocky', 'rodeo', 'roger', 'roman', 'romeo', 'roses', 'rosie', 'rouge',
+    'rowan', 'royal', 'rufus', 'rugby', 'russo', 'rusty', 'saint', 'salem', 'sally',
+    'samoa', 'sandy', 'santa', 'santo', 'sarah', 'sarge', 'satan', 'saudi', 'saxon',
+    'scala', 'scott', 'seoul', 'serbs', 'shane', 'sharp', 'shaun', 'shawn', 'sheba',
+    'silas', 'silva', 'simon', 'sinai', 'singh', 'sioux', 'smith', 'snake', 'sofia',
+    'sonia', 'sonya', 'south', 'space', 'spain', 'stark', 'stein', 'steve', 'stone',
+    'storm', 'sudan', 'sugar', 'sunny', 'super', 'susan', 'susie', 'sweet', 'swiss',
+    'syria', 'tampa', 'tango', 'tanya', 'teddy', 'terri', 'terry', 'tesla', 'tessa',
+    'texan', 'texas', 'tibet', 'tiger', 'timmy', 'titus', 'tokyo', 'tommy', 'tonga',
+    'tonic', 'tonto', 'torah', 'tracy', 'trent', 'tribe', 'trout', 'trudy', 'trump',
+    'tucci', 'tudor', 'tulsa', 'tupac', 'turin', 'turks', 'tyler', 'uncle', 'union',
+    'unity', 'urban', 'vader', 'vance', 'vegas', 'venus', 'vichy', 'vicki', 'villa',
+    'vince', 'viola', 'virgo', 'volga', 'volta', 'wales', 'walsh', 'wanda', 'watts',
+    'wayne', 'weber', 'wells', 'welsh', 'wendy', 'white', 'wilde', 'wiley', 'wolfe',
+    'woods', 'woody', 'wyatt', 'xerox', 'yahoo', 'yemen', 'young', 'youth', 'yukon',
+    'zaire', 'zelda',
+})
+
+# Common slang/informal words removed by filter_refined_words.py
+SLANG_INFORMAL = frozenset({
+    'dudes', 'dunno', 'gimme', 'gonna', 'gotta', 'kinda', 'lemme', 'sorta', 'wanna',
+    'yikes',
+})
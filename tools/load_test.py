@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""Replay realistic player sessions against the API and report per-route latency.
+
+Each virtual user repeatedly plays a full day as a fresh player:
+
+    start -> validate-word (per guess) -> save-game -> submit
+    golf-start -> (golf-get-hole -> golf-submit) for each remaining hole
+
+Tenants are selected the same way production does it, via the Host header
+(`<slug>.grordle.com`), so point --base-url at `wrangler pages dev` to exercise
+the multi-tenant paths. server.js (port 3001) only mounts the legacy api/
+handlers and ignores tenants; validate-word is not mounted there and will show
+up as errors.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+import aiohttp
+
+
+ROUTES: tuple[str, ...] = (
+    "start",
+    "validate-word",
+    "save-game",
+    "submit",
+    "golf-start",
+    "golf-get-hole",
+    "golf-submit",
+)
+
+GOLF_HOLES = 9
+MAX_GUESSES = 6
+
+
+@dataclass
+class RouteStats:
+    latencies: list[float] = field(default_factory=list)  # seconds, successful requests only
+    errors: int = 0
+
+
+@dataclass
+class LoadConfig:
+    base_url: str
+    orgs: list[str]
+    date: str
+    profile: str
+    players: int
+    duration: float
+    think_time: float
+    success_rate: float
+    golf: bool
+    seed: int
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    # Nearest-rank percentile; callers pass an already sorted list.
+    if not sorted_values:
+        return 0.0
+    rank = math.ceil(pct / 100.0 * len(sorted_values))
+    return sorted_values[max(0, min(len(sorted_values) - 1, rank - 1))]
+
+
+def australian_date() -> str:
+    # Matches getAustralianDate() in the route handlers.
+    return datetime.now(ZoneInfo("Australia/Sydney")).strftime("%Y-%m-%d")
+
+
+def load_guess_words(path: Path) -> list[str]:
+    words: list[str] = []
+    for raw in path.read_text(encoding="utf-8").splitlines():
+        w = raw.split("\t", 1)[0].strip().upper()
+        if len(w) == 5 and w.isalpha():
+            words.append(w)
+    return words
+
+
+def host_for_org(slug: str) -> str | None:
+    return f"{slug}.grordle.com" if slug else None
+
+
+class Harness:
+    def __init__(self, config: LoadConfig, words: list[str], session: aiohttp.ClientSession) -> None:
+        self.config = config
+        self.words = words
+        self.session = session
+        self.stats: dict[str, RouteStats] = {route: RouteStats() for route in ROUTES}
+        self.sessions_completed = 0
+        self.run_id = uuid.uuid4().hex[:8]
+
+    async def call(self, route: str, payload: dict, *, host: str | None) -> dict | None:
+        headers = {"Host": host} if host else None
+        url = f"{self.config.base_url}/api/{route}"
+        stats = self.stats[route]
+        started = time.perf_counter()
+        try:
+            async with self.session.post(url, json=payload, headers=headers) as resp:
+                body = await resp.read()
+                elapsed = time.perf_counter() - started
+                if resp.status >= 400:
+                    stats.errors += 1
+                    return None
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            stats.errors += 1
+            return None
+
+        stats.latencies.append(elapsed)
+        try:
+            return json.loads(body)
+        except ValueError:
+            return {}
+
+    async def think(self, rng: random.Random) -> None:
+        if self.config.think_time > 0:
+            await asyncio.sleep(rng.expovariate(1.0 / self.config.think_time))
+
+    async def play_session(self, vu: int, n: int, rng: random.Random) -> None:
+        cfg = self.config
+        org = cfg.orgs[vu % len(cfg.orgs)]
+        host = host_for_org(org)
+        player = f"lt-{self.run_id}-{vu}-{n}"
+
+        started = await self.call("start", {"date": cfg.date, "playerName": player}, host=host)
+        if started is None:
+            return
+
+        target = rng.choice(self.words)
+        success = rng.random() < cfg.success_rate
+        attempts = rng.randint(1, MAX_GUESSES) if success else MAX_GUESSES
+        guesses = [rng.choice(self.words) for _ in range(attempts - 1)]
+        guesses.append(target if success else rng.choice(self.words))
+
+        for guess in guesses:
+            await self.think(rng)
+            await self.call("validate-word", {"word": guess}, host=host)
+
+        await self.call(
+            "save-game",
+            {
+                "date": cfg.date,
+                "playerName": player,
+                "guesses": guesses,
+                "completed": True,
+                "targetWord": target,
+            },
+            host=host,
+        )
+        await self.call(
+            "submit",
+            {"date": cfg.date, "playerName": player, "attempts": attempts, "success": success},
+            host=host,
+        )
+
+        if cfg.golf:
+            round_data = await self.call("golf-start", {"playerName": player}, host=host)
+            if round_data and round_data.get("roundId") and not round_data.get("roundCompleted"):
+                round_id = round_data["roundId"]
+                for hole in range(int(round_data.get("currentHole") or 1), GOLF_HOLES + 1):
+                    await self.think(rng)
+                    await self.call("golf-get-hole", {"roundId": round_id, "holeNumber": hole}, host=host)
+                    hole_success = rng.random() < cfg.success_rate
+                    await self.call(
+                        "golf-submit",
+                        {
+                            "roundId": round_id,
+                            "holeNumber": hole,
+                            "attempts": rng.randint(2, MAX_GUESSES),
+                            "success": hole_success,
+                        },
+                        host=host,
+                    )
+
+        self.sessions_completed += 1
+
+    async def virtual_user(self, vu: int, start_delay: float, deadline: float) -> None:
+        rng = random.Random(self.config.seed * 1_000_003 + vu)
+        await asyncio.sleep(start_delay)
+        n = 0
+        while time.monotonic() < deadline:
+            await self.play_session(vu, n, rng)
+            n += 1
+
+    async def run(self) -> float:
+        cfg = self.config
+        begin = time.monotonic()
+        deadline = begin + cfg.duration
+        tasks = []
+        for vu in range(cfg.players):
+            if cfg.profile == "ramp":
+                # Linear ramp: user i joins at i/players of the run, so concurrency
+                # climbs from 1 to --players across --duration.
+                delay = cfg.duration * vu / cfg.players
+            else:
+                delay = 0.0
+            tasks.append(asyncio.create_task(self.virtual_user(vu, delay, deadline)))
+        await asyncio.gather(*tasks)
+        return time.monotonic() - begin
+
+
+def build_report(harness: Harness, elapsed: float) -> dict:
+    routes = {}
+    for route, stats in harness.stats.items():
+        values = sorted(stats.latencies)
+        count = len(values)
+        routes[route] = {
+            "requests": count + stats.errors,
+            "errors": stats.errors,
+            "throughput_rps": round((count + stats.errors) / elapsed, 2) if elapsed > 0 else 0.0,
+            "p50_ms": round(percentile(values, 50) * 1000, 2),
+            "p95_ms": round(percentile(values, 95) * 1000, 2),
+            "p99_ms": round(percentile(values, 99) * 1000, 2),
+            "max_ms": round(values[-1] * 1000, 2) if values else 0.0,
+        }
+    total = sum(r["requests"] for r in routes.values())
+    return {
+        "profile": harness.config.profile,
+        "players": harness.config.players,
+        "orgs": harness.config.orgs,
+        "elapsed_s": round(elapsed, 2),
+        "sessions_completed": harness.sessions_completed,
+        "total_requests": total,
+        "total_rps": round(total / elapsed, 2) if elapsed > 0 else 0.0,
+        "routes": routes,
+    }
+
+
+def print_report(report: dict) -> None:
+    print(f"Profile:   {report['profile']} ({report['players']} players, orgs={','.join(o or '(default)' for o in report['orgs'])})")
+    print(f"Elapsed:   {report['elapsed_s']}s")
+    print(f"Sessions:  {report['sessions_completed']}")
+    print(f"Requests:  {report['total_requests']} ({report['total_rps']} req/s)")
+    print()
+    print(f"{'ROUTE':<15}{'REQS':>8}{'ERRS':>7}{'RPS':>9}{'P50ms':>9}{'P95ms':>9}{'P99ms':>9}{'MAXms':>9}")
+    for route, r in report["routes"].items():
+        print(
+            f"{route:<15}{r['requests']:>8}{r['errors']:>7}{r['throughput_rps']:>9}"
+            f"{r['p50_ms']:>9}{r['p95_ms']:>9}{r['p99_ms']:>9}{r['max_ms']:>9}"
+        )
+
+
+async def run_load(config: LoadConfig, words: list[str], *, connections: int, timeout: float) -> dict:
+    connector = aiohttp.TCPConnector(limit=connections, keepalive_timeout=30)
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
+    async with aiohttp.ClientSession(connector=connector, timeout=client_timeout) as session:
+        harness = Harness(config, words, session)
+        elapsed = await harness.run()
+    return build_report(harness, elapsed)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Asyncio load generator that replays daily + golf player sessions against the API."
+    )
+    parser.add_argument(
+        "--base-url",
+        default="http://localhost:8788",
+        help="API origin (default: wrangler pages dev on :8788; server.js uses :3001)",
+    )
+    parser.add_argument(
+        "--orgs",
+        default="",
+        help="Comma-separated org slugs to spread players across; empty entry = default tenant (default: default tenant only)",
+    )
+    parser.add_argument("--profile", choices=("ramp", "soak"), default="soak", help="Load profile (default: soak)")
+    parser.add_argument("--players", type=int, default=50, help="Peak concurrent virtual players (default: 50)")
+    parser.add_argument("--duration", type=float, default=60.0, help="Run length in seconds (default: 60)")
+    parser.add_argument("--connections", type=int, default=100, help="HTTP connection pool size (default: 100)")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Per-request timeout in seconds (default: 30)")
+    parser.add_argument(
+        "--think-time",
+        type=float,
+        default=0.5,
+        help="Mean think time between guesses/holes in seconds, 0 to disable (default: 0.5)",
+    )
+    parser.add_argument("--success-rate", type=float, default=0.9, help="Fraction of games solved (default: 0.9)")
+    parser.add_argument("--no-golf", action="store_true", help="Skip the golf part of each session")
+    parser.add_argument("--date", default=None, help="Play date YYYY-MM-DD (default: today in Australia/Sydney)")
+    parser.add_argument(
+        "--words",
+        type=Path,
+        default=Path(__file__).resolve().parent.parent / "data" / "wordlist-table.txt",
+        help="Word source for guesses (word list or wordlist-table TSV)",
+    )
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for guess/outcome choices (default: 1)")
+    parser.add_argument("--json", type=Path, default=None, help="Also write the report as JSON to this path")
+    args = parser.parse_args(argv)
+
+    if args.players <= 0:
+        raise SystemExit("--players must be > 0")
+    if args.duration <= 0:
+        raise SystemExit("--duration must be > 0")
+
+    words = load_guess_words(args.words)
+    if not words:
+        raise SystemExit(f"No 5-letter words found in {args.words}")
+
+    config = LoadConfig(
+        base_url=args.base_url.rstrip("/"),
+        orgs=[o.strip() for o in args.orgs.split(",")],
+        date=args.date or australian_date(),
+        profile=args.profile,
+        players=args.players,
+        duration=args.duration,
+        think_time=args.think_time,
+        success_rate=args.success_rate,
+        golf=not args.no_golf,
+        seed=args.seed,
+    )
+
+    report = asyncio.run(run_load(config, words, connections=args.connections, timeout=args.timeout))
+    print_report(report)
+
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"\nWrote: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
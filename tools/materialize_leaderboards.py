@@ -0,0 +1,706 @@
+#!/usr/bin/env python3
+"""Incrementally materialize per-tenant leaderboard aggregates.
+
+yesterday-winners.js, leaderboard.js and golf-leaderboard.js recompute
+winners and totals on every page load. This job maintains summary tables
+instead (schema: tools/sql/leaderboard-summaries.sql, created if missing):
+
+  leaderboard_player_totals   per player: day / week / all-time played, total, best
+  leaderboard_period_totals   per tenant: day / week / all-time games, entries, best
+
+Each run reads only rows past the stored watermarks:
+  - scores.id
+  - games.id
+  - (golf_rounds.completed_at, id) for completed rounds
+
+It turns them into dirty (tenant, day, player) keys and recomputes just those
+groups, plus the week and all-time groups above them. Writes are set-based
+upserts from unnest() arrays, one transaction per batch. A crash therefore
+never advances a watermark past unapplied rows. Rows written in the last
+--lag-seconds are left for the next run, since a transaction still in flight
+can commit below the newest visible id or completed_at. Daily games need the
+games.created_at column from migrations/add-games-created-at.js.
+
+Watermarks only see new rows. Edited scores (edit-daily-score.js) and deletes
+(reset-player-status.js) are picked up with --refresh-since, which recomputes
+every group in a date window. --rebuild starts over from scratch.
+
+Once tools/compact_history.py has deleted old rows, the summaries are the only
+per-player record of those days: --refresh-since is clamped to the first
+retained day, --rebuild is refused, and --verify skips the all-time check.
+
+Usage:
+  python tools/materialize_leaderboards.py                 # incremental
+  python tools/materialize_leaderboards.py --refresh-since 2026-01-01
+  python tools/materialize_leaderboards.py --rebuild --verify
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+
+import psycopg
+
+
+SCHEMA_SQL = Path(__file__).resolve().parent / "sql" / "leaderboard-summaries.sql"
+ALL_TIME = date(1970, 1, 1)
+
+
+def week_start(d: date) -> date:
+    # leaderboard.js: 7-day blocks from 1 January, restarting each year.
+    jan1 = date(d.year, 1, 1)
+    return jan1 + timedelta(days=7 * ((d - jan1).days // 7))
+
+
+# --- player-level recomputes ----------------------------------------------
+# Each statement upserts the recomputed groups for the given keys and deletes
+# summary rows whose source rows have disappeared.
+
+_PLAYER_UPSERT = """
+up AS (
+  INSERT INTO leaderboard_player_totals AS t (org_key, game_type, period, period_start, player_id, played, total, best)
+  SELECT org_key, %(game_type)s, %(period)s, ps, player_id, played, total, best FROM agg
+  ON CONFLICT (org_key, game_type, period, period_start, player_id) DO UPDATE
+    SET played = EXCLUDED.played, total = EXCLUDED.total, best = EXCLUDED.best
+    WHERE (t.played, t.total, t.best) IS DISTINCT FROM (EXCLUDED.played, EXCLUDED.total, EXCLUDED.best)
+  RETURNING 1
+),
+gone AS (
+  DELETE FROM leaderboard_player_totals t USING k
+  WHERE t.org_key = k.org_key AND t.game_type = %(game_type)s AND t.period = %(period)s
+    AND t.period_start = k.ps AND t.player_id = k.player_id
+    AND NOT EXISTS (SELECT 1 FROM agg a WHERE a.org_key = k.org_key AND a.ps = k.ps AND a.player_id = k.player_id)
+  RETURNING 1
+)
+SELECT (SELECT COUNT(*) FROM up), (SELECT COUNT(*) FROM gone);
+"""
+
+_PLAYER_KEYS = """
+WITH k AS (
+  SELECT DISTINCT * FROM unnest(%(orgs)s::int[], %(starts)s::date[], %(players)s::int[]) AS k(org_key, ps, player_id)
+),
+"""
+
+DAILY_PLAYER_DAY_SQL = _PLAYER_KEYS + """
+agg AS (
+  SELECT k.org_key, k.ps, k.player_id,
+         COUNT(s.id) AS played,
+         COALESCE(SUM(s.attempts), 0) AS total,
+         MIN(s.attempts) FILTER (WHERE s.success) AS best
+  FROM k
+  JOIN games g ON g.play_date = k.ps AND COALESCE(g.org_id, 0) = k.org_key
+  JOIN scores s ON s.game_id = g.id AND s.player_id = k.player_id
+  GROUP BY k.org_key, k.ps, k.player_id
+),
+""" + _PLAYER_UPSERT
+
+GOLF_PLAYER_DAY_SQL = _PLAYER_KEYS + """
+agg AS (
+  SELECT k.org_key, k.ps, k.player_id,
+         COUNT(gr.id) AS played,
+         COALESCE(SUM(gr.total_score), 0) AS total,
+         MIN(gr.total_score) AS best
+  FROM k
+  JOIN golf_rounds gr ON gr.player_id = k.player_id
+    AND gr.is_completed = TRUE
+    AND gr.completed_at >= k.ps AND gr.completed_at < k.ps + 1
+    AND COALESCE(gr.org_id, 0) = k.org_key
+  GROUP BY k.org_key, k.ps, k.player_id
+),
+""" + _PLAYER_UPSERT
+
+# Week rows roll up day rows; all-time rows roll up week rows.
+_PLAYER_ROLLUP_SQL = _PLAYER_KEYS + """
+agg AS (
+  SELECT k.org_key, k.ps, k.player_id,
+         SUM(c.played)::int AS played,
+         SUM(c.total)::int AS total,
+         MIN(c.best) AS best
+  FROM k
+  JOIN leaderboard_player_totals c ON c.org_key = k.org_key AND c.game_type = %(game_type)s
+    AND c.period = %(child)s AND c.player_id = k.player_id
+    AND c.period_start >= k.ps AND c.period_start < {end}
+  GROUP BY k.org_key, k.ps, k.player_id
+),
+""" + _PLAYER_UPSERT
+
+_WEEK_END = "LEAST(k.ps + 7, make_date(EXTRACT(YEAR FROM k.ps)::int + 1, 1, 1))"
+PLAYER_WEEK_SQL = _PLAYER_ROLLUP_SQL.format(end=_WEEK_END)
+PLAYER_ALL_SQL = _PLAYER_ROLLUP_SQL.format(end="'infinity'::date")
+
+# --- tenant-level recomputes ----------------------------------------------
+
+_PERIOD_UPSERT = """
+up AS (
+  INSERT INTO leaderboard_period_totals AS t (org_key, game_type, period, period_start, games, entries, best)
+  SELECT org_key, %(game_type)s, %(period)s, ps, games, entries, best FROM agg
+  WHERE games > 0 OR entries > 0
+  ON CONFLICT (org_key, game_type, period, period_start) DO UPDATE
+    SET games = EXCLUDED.games, entries = EXCLUDED.entries, best = EXCLUDED.best
+    WHERE (t.games, t.entries, t.best) IS DISTINCT FROM (EXCLUDED.games, EXCLUDED.entries, EXCLUDED.best)
+  RETURNING 1
+),
+gone AS (
+  DELETE FROM leaderboard_period_totals t USING agg a
+  WHERE t.org_key = a.org_key AND t.game_type = %(game_type)s AND t.period = %(period)s
+    AND t.period_start = a.ps AND a.games = 0 AND a.entries = 0
+  RETURNING 1
+)
+SELECT (SELECT COUNT(*) FROM up), (SELECT COUNT(*) FROM gone);
+"""
+
+_PERIOD_KEYS = """
+WITH k AS (
+  SELECT DISTINCT * FROM unnest(%(orgs)s::int[], %(starts)s::date[]) AS k(org_key, ps)
+),
+"""
+
+# leaderboard.js counts a day once a games row exists, even with no scores yet.
+DAILY_PERIOD_DAY_SQL = _PERIOD_KEYS + """
+agg AS (
+  SELECT k.org_key, k.ps,
+         (EXISTS (SELECT 1 FROM games g WHERE g.play_date = k.ps AND COALESCE(g.org_id, 0) = k.org_key))::int AS games,
+         COUNT(c.player_id)::int AS entries,
+         MIN(c.best) AS best
+  FROM k
+  LEFT JOIN leaderboard_player_totals c ON c.org_key = k.org_key AND c.game_type = %(game_type)s
+    AND c.period = 'day' AND c.period_start = k.ps
+  GROUP BY k.org_key, k.ps
+),
+""" + _PERIOD_UPSERT
+
+GOLF_PERIOD_DAY_SQL = _PERIOD_KEYS + """
+agg AS (
+  SELECT k.org_key, k.ps,
+         (COUNT(c.player_id) > 0)::int AS games,
+         COUNT(c.player_id)::int AS entries,
+         MIN(c.best) AS best
+  FROM k
+  LEFT JOIN leaderboard_player_totals c ON c.org_key = k.org_key AND c.game_type = %(game_type)s
+    AND c.period = 'day' AND c.period_start = k.ps
+  GROUP BY k.org_key, k.ps
+),
+""" + _PERIOD_UPSERT
+
+_PERIOD_ROLLUP_SQL = _PERIOD_KEYS + """
+agg AS (
+  SELECT k.org_key, k.ps,
+         COALESCE(SUM(c.games), 0)::int AS games,
+         COALESCE(SUM(c.entries), 0)::int AS entries,
+         MIN(c.best) AS best
+  FROM k
+  LEFT JOIN leaderboard_period_totals c ON c.org_key = k.org_key AND c.game_type = %(game_type)s
+    AND c.period = %(child)s AND c.period_start >= k.ps AND c.period_start < {end}
+  GROUP BY k.org_key, k.ps
+),
+""" + _PERIOD_UPSERT
+
+PERIOD_WEEK_SQL = _PERIOD_ROLLUP_SQL.format(end=_WEEK_END)
+PERIOD_ALL_SQL = _PERIOD_ROLLUP_SQL.format(end="'infinity'::date")
+
+# --- new-row scans ----------------------------------------------------------
+
+# SERIAL ids and NOW() stamps are taken before commit, so a transaction can
+# commit a row below one a previous run already consumed. Each keyset therefore
+# stops short of the first row stamped within the last `lag` seconds, assuming
+# no handler transaction stays open that long. NULL stamps count as old.
+
+SCORES_SINCE_SQL = """
+WITH fence AS (
+  SELECT MIN(id) AS id FROM scores
+  WHERE id > %(last_id)s AND played_at > NOW() - make_interval(secs => %(lag)s)
+)
+SELECT s.id, COALESCE(g.org_id, 0), g.play_date, s.player_id
+FROM scores s
+JOIN games g ON g.id = s.game_id
+CROSS JOIN fence
+WHERE s.id > %(last_id)s AND (fence.id IS NULL OR s.id < fence.id)
+ORDER BY s.id
+LIMIT %(limit)s
+"""
+
+GAMES_SINCE_SQL = """
+WITH fence AS (
+  SELECT MIN(id) AS id FROM games
+  WHERE id > %(last_id)s AND created_at > NOW() - make_interval(secs => %(lag)s)
+)
+SELECT g.id, COALESCE(g.org_id, 0), g.play_date
+FROM games g
+CROSS JOIN fence
+WHERE g.id > %(last_id)s AND (fence.id IS NULL OR g.id < fence.id)
+ORDER BY g.id
+LIMIT %(limit)s
+"""
+
+# Rounds completing right now may commit out of completed_at order; the same
+# lag applies to the (completed_at, id) keyset.
+GOLF_SINCE_SQL = """
+SELECT id, completed_at, COALESCE(org_id, 0), completed_at::date AS completed_day, player_id
+FROM golf_rounds
+WHERE is_completed = TRUE
+  AND completed_at IS NOT NULL
+  AND (completed_at, id) > (%s, %s)
+  AND completed_at <= NOW() - make_interval(secs => %s)
+ORDER BY completed_at, id
+LIMIT %s
+"""
+
+
+@dataclass
+class SourceStats:
+    rows: int = 0
+    batches: int = 0
+    keys: int = 0
+    upserted: int = 0
+    deleted: int = 0
+    seconds: float = 0.0
+
+    def line(self, name: str) -> str:
+        rate = self.rows / self.seconds if self.seconds > 0 else 0.0
+        return (
+            f"  {name:<12} rows={self.rows:<8} batches={self.batches:<4} keys={self.keys:<8} "
+            f"upserted={self.upserted:<8} deleted={self.deleted:<6} {self.seconds:7.2f}s  {rate:,.0f} rows/s"
+        )
+
+
+@dataclass
+class DirtyKeys:
+    players: set[tuple[int, date, int]] = field(default_factory=set)  # (org_key, day, player_id)
+    days: set[tuple[int, date]] = field(default_factory=set)  # (org_key, day)
+
+    def __len__(self) -> int:
+        return len(self.players) + len(self.days)
+
+
+def _player_params(keys: set[tuple[int, date, int]], game_type: str, period: str, child: str | None = None) -> dict:
+    ordered = sorted(keys)
+    return {
+        "orgs": [k[0] for k in ordered],
+        "starts": [k[1] for k in ordered],
+        "players": [k[2] for k in ordered],
+        "game_type": game_type,
+        "period": period,
+        "child": child,
+    }
+
+
+def _period_params(keys: set[tuple[int, date]], game_type: str, period: str, child: str | None = None) -> dict:
+    ordered = sorted(keys)
+    return {
+        "orgs": [k[0] for k in ordered],
+        "starts": [k[1] for k in ordered],
+        "game_type": game_type,
+        "period": period,
+        "child": child,
+    }
+
+
+def refresh(cur: psycopg.Cursor, game_type: str, dirty: DirtyKeys, stats: SourceStats) -> None:
+    """Recompute every summary group that depends on the dirty day keys."""
+    day_players = dirty.players
+    week_players = {(o, week_start(d), p) for o, d, p in day_players}
+    all_players = {(o, ALL_TIME, p) for o, _, p in day_players}
+    days = dirty.days | {(o, d) for o, d, _ in day_players}
+    weeks = {(o, week_start(d)) for o, d in days}
+    all_days = {(o, ALL_TIME) for o, _ in days}
+
+    day_sql = DAILY_PLAYER_DAY_SQL if game_type == "daily" else GOLF_PLAYER_DAY_SQL
+    period_day_sql = DAILY_PERIOD_DAY_SQL if game_type == "daily" else GOLF_PERIOD_DAY_SQL
+    steps = []
+    if day_players:
+        steps += [
+            (day_sql, _player_params(day_players, game_type, "day")),
+            (PLAYER_WEEK_SQL, _player_params(week_players, game_type, "week", "day")),
+            (PLAYER_ALL_SQL, _player_params(all_players, game_type, "all", "week")),
+        ]
+    if days:
+        steps += [
+            (period_day_sql, _period_params(days, game_type, "day")),
+            (PERIOD_WEEK_SQL, _period_params(weeks, game_type, "week", "day")),
+            (PERIOD_ALL_SQL, _period_params(all_days, game_type, "all", "week")),
+        ]
+    for sql, params in steps:
+        cur.execute(sql, params)
+        upserted, deleted = cur.fetchone()
+        stats.upserted += upserted
+        stats.deleted += deleted
+    stats.keys += len(dirty)
+
+
+def has_column(cur: psycopg.Cursor, table: str, column: str) -> bool:
+    cur.execute(
+        "SELECT 1 FROM information_schema.columns WHERE table_schema = current_schema() AND table_name = %s AND column_name = %s",
+        (table, column),
+    )
+    return cur.fetchone() is not None
+
+
+def load_watermark(cur: psycopg.Cursor, source: str) -> tuple[int, object]:
+    cur.execute(
+        "INSERT INTO leaderboard_watermarks (source) VALUES (%s) ON CONFLICT (source) DO NOTHING",
+        (source,),
+    )
+    cur.execute("SELECT last_id, last_ts FROM leaderboard_watermarks WHERE source = %s FOR UPDATE", (source,))
+    return cur.fetchone()
+
+
+def save_watermark(cur: psycopg.Cursor, source: str, last_id: int, last_ts, rows: int) -> None:
+    cur.execute(
+        """UPDATE leaderboard_watermarks
+           SET last_id = %s, last_ts = %s, rows_processed = rows_processed + %s, updated_at = NOW()
+           WHERE source = %s""",
+        (last_id, last_ts, rows, source),
+    )
+
+
+def run_scores(conn: psycopg.Connection, batch_size: int, lag_seconds: float) -> SourceStats:
+    stats = SourceStats()
+    started = time.perf_counter()
+    while True:
+        with conn.transaction(), conn.cursor() as cur:
+            last_id, _ = load_watermark(cur, "scores")
+            cur.execute(SCORES_SINCE_SQL, {"last_id": last_id, "lag": lag_seconds, "limit": batch_size})
+            rows = cur.fetchall()
+            if not rows:
+                break
+            dirty = DirtyKeys(players={(org, d, player) for _, org, d, player in rows})
+            refresh(cur, "daily", dirty, stats)
+            save_watermark(cur, "scores", rows[-1][0], None, len(rows))
+        stats.rows += len(rows)
+        stats.batches += 1
+    stats.seconds = time.perf_counter() - started
+    return stats
+
+
+def run_games(conn: psycopg.Connection, batch_size: int, lag_seconds: float) -> SourceStats:
+    stats = SourceStats()
+    started = time.perf_counter()
+    while True:
+        with conn.transaction(), conn.cursor() as cur:
+            last_id, _ = load_watermark(cur, "games")
+            cur.execute(GAMES_SINCE_SQL, {"last_id": last_id, "lag": lag_seconds, "limit": batch_size})
+            rows = cur.fetchall()
+            if not rows:
+                break
+            refresh(cur, "daily", DirtyKeys(days={(org, d) for _, org, d in rows}), stats)
+            save_watermark(cur, "games", rows[-1][0], None, len(rows))
+        stats.rows += len(rows)
+        stats.batches += 1
+    stats.seconds = time.perf_counter() - started
+    return stats
+
+
+def run_golf(conn: psycopg.Connection, batch_size: int, lag_seconds: float) -> SourceStats:
+    stats = SourceStats()
+    started = time.perf_counter()
+    while True:
+        with conn.transaction(), conn.cursor() as cur:
+            last_id, last_ts = load_watermark(cur, "golf_rounds")
+            cur.execute(GOLF_SINCE_SQL, (last_ts or date.min, last_id, lag_seconds, batch_size))
+            rows = cur.fetchall()
+            if not rows:
+                break
+            dirty = DirtyKeys(players={(org, d, player) for _, _, org, d, player in rows})
+            refresh(cur, "golf", dirty, stats)
+            save_watermark(cur, "golf_rounds", rows[-1][0], rows[-1][1], len(rows))
+        stats.rows += len(rows)
+        stats.batches += 1
+    stats.seconds = time.perf_counter() - started
+    return stats
+
+
+WINDOW_KEY_SQL = {
+    "daily": """
+        SELECT DISTINCT COALESCE(g.org_id, 0), g.play_date, s.player_id
+        FROM scores s JOIN games g ON g.id = s.game_id
+        WHERE g.play_date >= %(since)s
+        UNION
+        SELECT org_key, period_start, player_id FROM leaderboard_player_totals
+        WHERE game_type = 'daily' AND period = 'day' AND period_start >= %(since)s
+    """,
+    "golf": """
+        SELECT DISTINCT COALESCE(org_id, 0), completed_at::date, player_id
+        FROM golf_rounds
+        WHERE is_completed = TRUE AND completed_at >= %(since)s
+        UNION
+        SELECT org_key, period_start, player_id FROM leaderboard_player_totals
+        WHERE game_type = 'golf' AND period = 'day' AND period_start >= %(since)s
+    """,
+}
+
+WINDOW_DAY_SQL = """
+    SELECT DISTINCT COALESCE(org_id, 0), play_date FROM games WHERE play_date >= %(since)s
+    UNION
+    SELECT org_key, period_start FROM leaderboard_period_totals
+    WHERE game_type = 'daily' AND period = 'day' AND period_start >= %(since)s
+"""
+
+
+def run_window(conn: psycopg.Connection, game_type: str, since: date, batch_size: int) -> SourceStats:
+    """Recompute every group from `since` on, catching edits and deletes."""
+    stats = SourceStats()
+    started = time.perf_counter()
+    with conn.cursor() as cur:
+        cur.execute(WINDOW_KEY_SQL[game_type], {"since": since})
+        player_keys = sorted(cur.fetchall())
+        day_keys: list = []
+        if game_type == "daily":
+            cur.execute(WINDOW_DAY_SQL, {"since": since})
+            day_keys = sorted(cur.fetchall())
+
+    for i in range(0, max(len(player_keys), len(day_keys)), batch_size):
+        dirty = DirtyKeys(players=set(player_keys[i : i + batch_size]), days=set(day_keys[i : i + batch_size]))
+        with conn.transaction(), conn.cursor() as cur:
+            refresh(cur, game_type, dirty, stats)
+        stats.rows += len(dirty)
+        stats.batches += 1
+    stats.seconds = time.perf_counter() - started
+    return stats
+
+
+# --- verification against the live handler SQL ------------------------------
+
+# leaderboard.js, period=all (verbatim apart from whitespace and a player_name tie-break).
+HANDLER_ALL_TIME_SQL = """
+WITH game_dates AS (
+  SELECT DISTINCT play_date FROM games
+  WHERE COALESCE(org_id, 0) = COALESCE(%(org)s, 0)
+),
+game_count AS (
+  SELECT COUNT(*) as total_games FROM game_dates
+),
+player_scores AS (
+  SELECT
+    p.id as player_id,
+    p.player_name,
+    COUNT(s.id) as games_played,
+    COALESCE(SUM(s.attempts), 0) as total_attempts
+  FROM players p
+  LEFT JOIN scores s ON s.player_id = p.id
+  LEFT JOIN games g ON s.game_id = g.id
+    AND COALESCE(g.org_id, 0) = COALESCE(%(org)s, 0)
+  WHERE COALESCE(p.org_id, 0) = COALESCE(%(org)s, 0)
+  GROUP BY p.id, p.player_name
+)
+SELECT
+  ps.player_name,
+  ps.games_played,
+  ps.total_attempts,
+  gc.total_games,
+  (ps.total_attempts + (gc.total_games - ps.games_played) * 8) as total_score
+FROM player_scores ps
+CROSS JOIN game_count gc
+WHERE gc.total_games > 0
+ORDER BY total_score ASC, ps.player_name
+"""
+
+SUMMARY_ALL_TIME_SQL = """
+SELECT p.player_name, COALESCE(t.played, 0), COALESCE(t.total, 0), pt.games,
+       COALESCE(t.total, 0) + (pt.games - COALESCE(t.played, 0)) * 8 AS total_score
+FROM players p
+JOIN leaderboard_period_totals pt
+  ON pt.org_key = COALESCE(%(org)s, 0) AND pt.game_type = 'daily' AND pt.period = 'all'
+LEFT JOIN leaderboard_player_totals t
+  ON t.org_key = pt.org_key AND t.game_type = 'daily' AND t.period = 'all' AND t.player_id = p.id
+WHERE COALESCE(p.org_id, 0) = COALESCE(%(org)s, 0) AND pt.games > 0
+ORDER BY total_score ASC, p.player_name
+"""
+
+# yesterday-winners.js (verbatim apart from whitespace).
+HANDLER_DAILY_WINNERS_SQL = """
+SELECT p.player_name, s.attempts
+FROM scores s
+JOIN players p ON s.player_id = p.id
+JOIN games g ON s.game_id = g.id
+WHERE g.play_date = %(day)s
+  AND s.success = true
+  AND COALESCE(p.org_id, 0) = COALESCE(%(org)s, 0)
+  AND COALESCE(g.org_id, 0) = COALESCE(%(org)s, 0)
+  AND s.attempts = (
+    SELECT MIN(s2.attempts)
+    FROM scores s2
+    JOIN games g2 ON s2.game_id = g2.id
+    WHERE g2.play_date = %(day)s
+      AND s2.success = true
+      AND COALESCE(g2.org_id, 0) = COALESCE(%(org)s, 0)
+  )
+ORDER BY p.player_name ASC
+"""
+
+HANDLER_GOLF_WINNERS_SQL = """
+SELECT p.player_name, gr.total_score
+FROM golf_rounds gr
+JOIN players p ON gr.player_id = p.id
+WHERE gr.is_completed = true
+  AND gr.completed_at::date = %(day)s
+  AND COALESCE(p.org_id, 0) = COALESCE(%(org)s, 0)
+  AND COALESCE(gr.org_id, 0) = COALESCE(%(org)s, 0)
+  AND gr.total_score = (
+    SELECT MIN(gr2.total_score)
+    FROM golf_rounds gr2
+    JOIN players p2 ON gr2.player_id = p2.id
+    WHERE gr2.is_completed = true
+      AND gr2.completed_at::date = %(day)s
+      AND COALESCE(p2.org_id, 0) = COALESCE(%(org)s, 0)
+      AND COALESCE(gr2.org_id, 0) = COALESCE(%(org)s, 0)
+  )
+ORDER BY p.player_name ASC
+"""
+
+SUMMARY_WINNERS_SQL = """
+SELECT p.player_name, t.best
+FROM leaderboard_player_totals t
+JOIN leaderboard_period_totals pt USING (org_key, game_type, period, period_start)
+JOIN players p ON p.id = t.player_id
+WHERE t.org_key = COALESCE(%(org)s, 0) AND t.game_type = %(game_type)s AND t.period = 'day'
+  AND t.period_start = %(day)s AND t.best = pt.best
+  AND COALESCE(p.org_id, 0) = COALESCE(%(org)s, 0)
+ORDER BY p.player_name ASC
+"""
+
+
+def compacted_through(cur: psycopg.Cursor, game_type: str) -> date | None:
+    """Last day tools/compact_history.py has removed from the source tables."""
+    table = {"daily": "daily_history_summaries", "golf": "golf_history_summaries"}[game_type]
+    cur.execute("SELECT to_regclass(%s) IS NOT NULL", (table,))
+    if not cur.fetchone()[0]:
+        return None
+    cur.execute(f"SELECT MAX({'play_date' if game_type == 'daily' else 'day'}) FROM {table}")
+    return cur.fetchone()[0]
+
+
+def verify(conn: psycopg.Connection, days: int, *, all_time: bool = True) -> list[str]:
+    problems: list[str] = []
+    with conn.cursor() as cur:
+        cur.execute("SELECT DISTINCT org_id FROM games")
+        orgs = [r[0] for r in cur.fetchall()]
+        cur.execute("SELECT MAX(play_date) FROM games")
+        last = cur.fetchone()[0]
+        if last is None:
+            return problems
+
+        for org in orgs:
+            if all_time:
+                cur.execute(HANDLER_ALL_TIME_SQL, {"org": org})
+                expected = cur.fetchall()
+                cur.execute(SUMMARY_ALL_TIME_SQL, {"org": org})
+                got = cur.fetchall()
+                if expected != got:
+                    problems.append(f"org {org}: all-time leaderboard differs ({len(expected)} vs {len(got)} rows)")
+
+            for i in range(days):
+                day = last - timedelta(days=i)
+                for game_type, handler_sql in (("daily", HANDLER_DAILY_WINNERS_SQL), ("golf", HANDLER_GOLF_WINNERS_SQL)):
+                    cur.execute(handler_sql, {"org": org, "day": day})
+                    expected = cur.fetchall()
+                    cur.execute(SUMMARY_WINNERS_SQL, {"org": org, "day": day, "game_type": game_type})
+                    got = cur.fetchall()
+                    if expected != got:
+                        problems.append(f"org {org} {day} {game_type} winners: {expected[:3]} vs {got[:3]}")
+    return problems
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Incrementally materialize per-tenant leaderboard aggregates.")
+    parser.add_argument("--dsn", default=os.environ.get("DATABASE_URL"), help="Postgres DSN (default: $DATABASE_URL)")
+    parser.add_argument("--batch-size", type=int, default=5000, help="Source rows per transaction (default 5000)")
+    parser.add_argument("--only", choices=("daily", "golf"), default=None, help="Materialize one game type only")
+    parser.add_argument(
+        "--lag-seconds",
+        "--golf-lag-seconds",
+        dest="lag_seconds",
+        type=float,
+        default=300.0,
+        help="Leave rows written in the last N seconds for the next run (default 300)",
+    )
+    parser.add_argument("--refresh-since", default=None, help="Also recompute every group from this date (YYYY-MM-DD) on")
+    parser.add_argument("--rebuild", action="store_true", help="Drop all summary rows and watermarks first")
+    parser.add_argument("--verify", action="store_true", help="Compare summaries with the handlers' live SQL")
+    parser.add_argument("--verify-days", type=int, default=14, help="Recent days to check winners for (default 14)")
+    args = parser.parse_args(argv)
+
+    if not args.dsn:
+        raise SystemExit("No database: pass --dsn or set DATABASE_URL")
+    if args.batch_size <= 0:
+        raise SystemExit("--batch-size must be > 0")
+    if args.lag_seconds < 0:
+        raise SystemExit("--lag-seconds must be >= 0")
+    since = None
+    if args.refresh_since is not None:
+        try:
+            since = date.fromisoformat(args.refresh_since)
+        except ValueError:
+            raise SystemExit(f"Invalid --refresh-since date: {args.refresh_since!r}")
+
+    game_types = [args.only] if args.only else ["daily", "golf"]
+    with psycopg.connect(args.dsn) as conn:
+        conn.autocommit = True
+        conn.execute(SCHEMA_SQL.read_text(encoding="utf-8"))
+        with conn.cursor() as cur:
+            if "daily" in game_types and not has_column(cur, "games", "created_at"):
+                raise SystemExit(
+                    "games.created_at is missing; run `node migrations/run-migration.js add-games-created-at up` "
+                    "first (or pass --only golf)"
+                )
+            compacted = {game_type: compacted_through(cur, game_type) for game_type in game_types}
+
+        if args.rebuild:
+            if any(compacted.values()):
+                raise SystemExit(
+                    "History before the retention window has been compacted; "
+                    "a rebuild would lose per-player totals for those days"
+                )
+            with conn.transaction():
+                for game_type in game_types:
+                    conn.execute("DELETE FROM leaderboard_player_totals WHERE game_type = %s", (game_type,))
+                    conn.execute("DELETE FROM leaderboard_period_totals WHERE game_type = %s", (game_type,))
+                sources = {"daily": ["scores", "games"], "golf": ["golf_rounds"]}
+                for game_type in game_types:
+                    conn.execute("DELETE FROM leaderboard_watermarks WHERE source = ANY(%s)", (sources[game_type],))
+            print("Rebuild: cleared summaries and watermarks")
+
+        results: list[tuple[str, SourceStats]] = []
+        if "daily" in game_types:
+            results.append(("scores", run_scores(conn, args.batch_size, args.lag_seconds)))
+            results.append(("games", run_games(conn, args.batch_size, args.lag_seconds)))
+        if "golf" in game_types:
+            results.append(("golf_rounds", run_golf(conn, args.batch_size, args.lag_seconds)))
+        if since is not None:
+            for game_type in game_types:
+                start = since
+                if compacted[game_type] is not None and start <= compacted[game_type]:
+                    # Compacted days have no source rows; a window over them would delete their groups.
+                    start = compacted[game_type] + timedelta(days=1)
+                    print(f"Refresh {game_type}: history compacted through {compacted[game_type]}, starting at {start}")
+                results.append((f"window:{game_type}", run_window(conn, game_type, start, args.batch_size)))
+
+        total = SourceStats()
+        for _, s in results:
+            total.rows += s.rows
+            total.batches += s.batches
+            total.keys += s.keys
+            total.upserted += s.upserted
+            total.deleted += s.deleted
+            total.seconds += s.seconds
+        print("Processed:")
+        for name, s in results:
+            print(s.line(name))
+        print(total.line("total"))
+
+        if args.verify:
+            started = time.perf_counter()
+            problems = verify(conn, args.verify_days, all_time=not any(compacted.values()))
+            print(f"Verify: {'OK' if not problems else f'{len(problems)} mismatch(es)'} ({time.perf_counter() - started:.2f}s)")
+            for p in problems[:20]:
+                print(f"  {p}")
+            if problems:
+                raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""Order-statistic containers for incremental rank maintenance.
+
+SortedBlocks keeps keys in sorted blocks of bounded size, with a Fenwick tree
+over the block lengths, so add/remove/rank/select are all O(log n) plus a short
+in-block shift. Used by wordlist_delta.py to keep commonality and difficulty
+ranks current without re-sorting the whole list.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from typing import Generic, Iterable, Iterator, TypeVar
+
+
+K = TypeVar("K")
+
+
+class Fenwick:
+    """Prefix sums over a fixed-length array of non-negative counts."""
+
+    def __init__(self, counts: Iterable[int] = ()):
+        self._tree = [0]
+        for c in counts:
+            self._tree.append(c)
+        size = len(self._tree)
+        for i in range(1, size):
+            parent = i + (i & -i)
+            if parent < size:
+                self._tree[parent] += self._tree[i]
+        n = size - 1
+        self._top = 1 << (n.bit_length() - 1) if n else 0
+
+    def __len__(self) -> int:
+        return len(self._tree) - 1
+
+    def add(self, i: int, delta: int) -> None:
+        i += 1
+        size = len(self._tree)
+        while i < size:
+            self._tree[i] += delta
+            i += i & -i
+
+    def prefix(self, i: int) -> int:
+        # Sum of counts[0:i].
+        total = 0
+        while i > 0:
+            total += self._tree[i]
+            i -= i & -i
+        return total
+
+    def find(self, k: int) -> tuple[int, int]:
+        """Return (i, offset) with prefix(i) <= k < prefix(i + 1), offset = k - prefix(i)."""
+        pos = 0
+        step = self._top
+        size = len(self._tree)
+        while step:
+            nxt = pos + step
+            if nxt < size and self._tree[nxt] <= k:
+                pos = nxt
+                k -= self._tree[nxt]
+            step >>= 1
+        return pos, k
+
+
+class SortedBlocks(Generic[K]):
+    """Sorted set of unique keys with O(log n) rank and select."""
+
+    def __init__(self, items: Iterable[K] = (), *, load: int = 256):
+        self._load = load
+        ordered = sorted(items)
+        self._blocks: list[list[K]] = [ordered[i : i + load] for i in range(0, len(ordered), load)]
+        self._len = len(ordered)
+        self._reindex()
+
+    def _reindex(self) -> None:
+        self._maxes = [b[-1] for b in self._blocks]
+        self._sizes = Fenwick(len(b) for b in self._blocks)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[K]:
+        for block in self._blocks:
+            yield from block
+
+    def __contains__(self, key: K) -> bool:
+        i = bisect_left(self._maxes, key)
+        if i == len(self._blocks):
+            return False
+        block = self._blocks[i]
+        j = bisect_left(block, key)
+        return j < len(block) and block[j] == key
+
+    def add(self, key: K) -> None:
+        if not self._blocks:
+            self._blocks.append([key])
+            self._len = 1
+            self._reindex()
+            return
+
+        i = bisect_left(self._maxes, key)
+        if i == len(self._blocks):
+            i -= 1
+        block = self._blocks[i]
+        insort(block, key)
+        self._maxes[i] = block[-1]
+        self._len += 1
+
+        if len(block) > 2 * self._load:
+            self._blocks[i : i + 1] = [block[: self._load], block[self._load :]]
+            self._reindex()
+        else:
+            self._sizes.add(i, 1)
+
+    def remove(self, key: K) -> None:
+        i = bisect_left(self._maxes, key)
+        if i == len(self._blocks):
+            raise KeyError(key)
+        block = self._blocks[i]
+        j = bisect_left(block, key)
+        if j == len(block) or block[j] != key:
+            raise KeyError(key)
+        del block[j]
+        self._len -= 1
+
+        if not block:
+            del self._blocks[i]
+            self._reindex()
+        else:
+            self._maxes[i] = block[-1]
+            self._sizes.add(i, -1)
+
+    def rank(self, key: K) -> int:
+        """Number of keys strictly less than `key`."""
+        i = bisect_left(self._maxes, key)
+        if i == len(self._blocks):
+            return self._len
+        return self._sizes.prefix(i) + bisect_left(self._blocks[i], key)
+
+    def __getitem__(self, idx: int) -> K:
+        if idx < 0:
+            idx += self._len
+        if not 0 <= idx < self._len:
+            raise IndexError(idx)
+        i, offset = self._sizes.find(idx)
+        return self._blocks[i][offset]
+
+    def islice(self, start: int, stop: int) -> Iterator[K]:
+        """Yield keys with rank in [start, stop)."""
+        start = max(start, 0)
+        stop = min(stop, self._len)
+        if start >= stop:
+            return
+        i, offset = self._sizes.find(start)
+        remaining = stop - start
+        while remaining > 0:
+            block = self._blocks[i]
+            part = block[offset : offset + remaining]
+            yield from part
+            remaining -= len(part)
+            i += 1
+            offset = 0
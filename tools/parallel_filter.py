@@ -0,0 +1,63 @@
+"""Order-preserving process-pool map shared by the word filter tools.
+
+Filters classify each word independently, then merge the verdicts serially so
+order-dependent bookkeeping (the `seen` de-dupe set, removal counters) behaves
+exactly as in a single-process run. Only the per-word predicate is sharded.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Callable, Iterable, TypeVar
+
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def resolve_jobs(jobs: int) -> int:
+    # --jobs 0 means "one worker per CPU".
+    if jobs <= 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def _apply_chunk(func: Callable[[T], R], chunk: list[T]) -> list[R]:
+    return [func(item) for item in chunk]
+
+
+def map_ordered(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    *,
+    jobs: int = 1,
+    chunk_size: int | None = None,
+    initializer: Callable[..., None] | None = None,
+    initargs: tuple = (),
+) -> list[R]:
+    """Apply `func` to every item, returning results in input order.
+
+    `func` and `initializer` must be module-level so they can be pickled. The
+    initializer runs once per worker, which is where heavy per-process caches
+    (dictionaries, frequency tables) should be warmed.
+    """
+    items = list(items)
+    jobs = resolve_jobs(jobs)
+
+    if jobs == 1 or len(items) < 2:
+        if initializer is not None:
+            initializer(*initargs)
+        return [func(item) for item in items]
+
+    if chunk_size is None or chunk_size <= 0:
+        # A few chunks per worker keeps the pool busy without much pickling overhead.
+        chunk_size = max(1, -(-len(items) // (jobs * 4)))
+    chunks = [items[i : i + chunk_size] for i in range(0, len(items), chunk_size)]
+
+    results: list[R] = []
+    with ProcessPoolExecutor(max_workers=jobs, initializer=initializer, initargs=initargs) as pool:
+        for part in pool.map(_apply_chunk, repeat(func), chunks):
+            results.extend(part)
+    return results
@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+"""Prerender the date- and tenant-determined API responses as static JSON.
+
+get-target-word, the start word, motd and tenant-settings answer with data
+fixed by the date and the organization. Each request still costs Postgres
+round trips: the whole wordlist for get-target-word, daily_start_words,
+message_of_day, organizations. This tool renders those responses for a
+horizon of dates and every tenant, so they can ship as static assets (Vite
+copies public/ into dist/) and be served from the edge cache.
+
+Payloads are byte-for-byte what the handlers return (JSON.stringify layout):
+
+  <tenant>/tenant-settings.json            GET /api/tenant-settings
+  <tenant>/<date>/get-target-word.json     GET /api/get-target-word?date=
+  <tenant>/<date>/start-word.json          the startWord part of POST /api/start
+  <tenant>/<date>/motd.json                GET /api/motd?date=
+
+<tenant> is the organization slug, or _default for grordle.com (org_id
+NULL). An underscore cannot appear in a subdomain, so it never clashes with
+a slug. tenant-settings never includes admin_password: the query does not
+select it, and it is dropped from --organizations input.
+
+The target word follows get-target-word.js over the table in file (id) order.
+The start word is the stored daily_start_words row if there is one, else
+start.js's seed over the sorted list.
+
+Everything goes under <out>/v<PAYLOAD_VERSION>/. A format change therefore
+publishes beside the old files instead of over them. manifest.json maps each
+path to the sha256 of its bytes and carries a digest over all entries.
+Re-runs only rewrite files whose hash changed; --prune deletes files the new
+manifest no longer lists. Tenants are written in parallel with --jobs. The
+manifest is replaced last, atomically, so it never names a file that is not
+on disk yet.
+
+Usage:
+  python tools/prerender_payloads.py --dsn "$DATABASE_URL" --days 30
+  python tools/prerender_payloads.py --organizations orgs.json --start 2026-01-01 --days 365 --jobs 0 --prune
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+from parallel_filter import map_ordered
+from wordlist_table import DEFAULT_TABLE, date_seed, read_table, target_word_for_date
+
+
+PAYLOAD_VERSION = 1
+DEFAULT_OUT = Path(__file__).resolve().parent.parent / "public" / "static-api"
+DEFAULT_TENANT = "_default"
+
+# tenant-settings.js, GET: columns returned for an organization, minus admin_password.
+SETTINGS_FIELDS = ("name", "display_name", "motd", "primary_color", "secondary_color", "settings")
+DEFAULT_SETTINGS = {
+    "name": "Grordle",
+    "display_name": "Grordle",
+    "motd": None,
+    "primary_color": "#8b5cf6",
+    "secondary_color": "#7c3aed",
+}
+
+ORGANIZATIONS_SQL = """
+SELECT id, slug, domain, name, display_name, motd, primary_color, secondary_color, settings
+FROM organizations
+ORDER BY slug
+"""
+START_WORDS_SQL = "SELECT play_date, word FROM daily_start_words WHERE play_date >= %s AND play_date < %s"
+MOTD_SQL = "SELECT message_date, message, created_by FROM message_of_day WHERE message_date >= %s AND message_date < %s"
+
+
+@dataclass(frozen=True)
+class Tenant:
+    key: str  # directory name: slug, or DEFAULT_TENANT
+    org_id: int | None
+    domain: str | None
+    settings: dict
+
+
+@dataclass(frozen=True)
+class TenantResult:
+    key: str
+    settings_sha256: str
+    written: int
+    unchanged: int
+
+
+def sydney_today() -> date:
+    return datetime.now(ZoneInfo("Australia/Sydney")).date()
+
+
+def encode(payload: dict) -> bytes:
+    # Same layout as JSON.stringify, which Hono's c.json() uses.
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def settings_payload(row: dict) -> dict:
+    return {field: row.get(field) for field in SETTINGS_FIELDS}
+
+
+def default_tenant() -> Tenant:
+    return Tenant(DEFAULT_TENANT, None, None, dict(DEFAULT_SETTINGS))
+
+
+def load_organizations_file(path: Path) -> list[Tenant]:
+    try:
+        rows = json.loads(path.read_text(encoding="utf-8"))
+    except json.JSONDecodeError as e:
+        raise SystemExit(f"{path}: invalid JSON ({e})")
+    if not isinstance(rows, list):
+        raise SystemExit(f"{path}: expected a list of organizations rows")
+    tenants = []
+    for row in rows:
+        if not isinstance(row, dict) or not row.get("slug"):
+            raise SystemExit(f"{path}: every organization needs a slug")
+        row = {k: v for k, v in row.items() if k != "admin_password"}
+        row.setdefault("settings", {})
+        tenants.append(Tenant(str(row["slug"]), row.get("id"), row.get("domain"), settings_payload(row)))
+    return tenants
+
+
+def load_database(dsn: str, first: date, last: date) -> tuple[list[Tenant], dict[str, str], dict[str, tuple[str, str]]]:
+    import psycopg
+    from psycopg.rows import dict_row
+
+    with psycopg.connect(dsn) as conn:
+        with conn.cursor(row_factory=dict_row) as cur:
+            cur.execute(ORGANIZATIONS_SQL)
+            tenants = [Tenant(row["slug"], row["id"], row["domain"], settings_payload(row)) for row in cur.fetchall()]
+        start_words = {d.isoformat(): word for d, word in conn.execute(START_WORDS_SQL, (first, last))}
+        messages = {d.isoformat(): (message, created_by or "") for d, message, created_by in conn.execute(MOTD_SQL, (first, last))}
+    return tenants, start_words, messages
+
+
+def date_payloads(
+    words: list[str],
+    dates: list[str],
+    start_words: dict[str, str],
+    messages: dict[str, tuple[str, str]],
+) -> dict[str, tuple[bytes, str]]:
+    """Rendered bytes and hash for every date file; these are the same for all tenants."""
+    ordered = sorted(words)
+    out: dict[str, tuple[bytes, str]] = {}
+    for d in dates:
+        from_seed = ordered[date_seed("START:", d) % len(ordered)]
+        message, created_by = messages.get(d, ("", ""))
+        for name, payload in (
+            ("get-target-word.json", {"ok": True, "targetWord": target_word_for_date(words, d), "date": d, "wordlistSize": len(words)}),
+            ("start-word.json", {"ok": True, "date": d, "startWord": start_words.get(d, from_seed), "startWordOwner": "System"}),
+            ("motd.json", {"ok": True, "message": message, "createdBy": created_by}),
+        ):
+            data = encode(payload)
+            out[f"{d}/{name}"] = (data, sha256(data))
+    return out
+
+
+# Worker state, set by init_worker.
+_root: Path | None = None
+_shared: dict[str, tuple[bytes, str]] = {}
+_previous: dict[str, str] = {}
+
+
+def init_worker(root: str, shared: dict[str, tuple[bytes, str]], previous: dict[str, str]) -> None:
+    global _root, _shared, _previous
+    _root = Path(root)
+    _shared = shared
+    _previous = previous
+
+
+def render_tenant(tenant: Tenant) -> TenantResult:
+    settings = encode(tenant.settings)
+    settings_digest = sha256(settings)
+    items = [("tenant-settings.json", settings, settings_digest)]
+    items.extend((rel, body, digest) for rel, (body, digest) in _shared.items())
+    written = unchanged = 0
+    made: set[Path] = set()
+    for rel, body, digest in items:
+        key = f"{tenant.key}/{rel}"
+        path = _root / key
+        if _previous.get(key) == digest and path.exists():
+            unchanged += 1
+            continue
+        if path.parent not in made:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            made.add(path.parent)
+        path.write_bytes(body)
+        written += 1
+    return TenantResult(tenant.key, settings_digest, written, unchanged)
+
+
+def manifest_files(results: list[TenantResult], shared: dict[str, tuple[bytes, str]]) -> dict[str, str]:
+    files: dict[str, str] = {}
+    for r in results:
+        files[f"{r.key}/tenant-settings.json"] = r.settings_sha256
+        files.update((f"{r.key}/{rel}", digest) for rel, (_, digest) in shared.items())
+    return files
+
+
+def read_manifest(path: Path) -> dict[str, str]:
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text(encoding="utf-8")).get("files", {})
+    except (json.JSONDecodeError, AttributeError):
+        return {}
+
+
+def manifest_digest(files: dict[str, str]) -> str:
+    h = hashlib.sha256()
+    for rel in sorted(files):
+        h.update(f"{rel}\t{files[rel]}\n".encode("utf-8"))
+    return h.hexdigest()
+
+
+def write_manifest(path: Path, manifest: dict) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(manifest, indent=1, sort_keys=True) + "\n", encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def prune(root: Path, previous: dict[str, str], files: dict[str, str]) -> int:
+    removed = 0
+    for rel in sorted(set(previous) - set(files)):
+        path = root / rel
+        if path.exists():
+            path.unlink()
+            removed += 1
+        for parent in path.parents:
+            if parent == root:
+                break
+            try:
+                parent.rmdir()
+            except OSError:
+                break
+    return removed
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Prerender per-date, per-tenant API payloads as static JSON.")
+    parser.add_argument("--table", type=Path, default=DEFAULT_TABLE, help=f"Wordlist table in id order (default {DEFAULT_TABLE})")
+    parser.add_argument("--start", default=None, help="First date YYYY-MM-DD (default: today, Australia/Sydney)")
+    parser.add_argument("--days", type=int, default=30, help="Number of dates from --start (default 30)")
+    parser.add_argument("--dsn", default=os.environ.get("DATABASE_URL"), help="Postgres DSN for organizations, stored start words and messages (default: $DATABASE_URL)")
+    parser.add_argument("--organizations", type=Path, default=None, help="JSON list of organizations rows instead of the database")
+    parser.add_argument("--out", type=Path, default=DEFAULT_OUT, help=f"Output directory (default {DEFAULT_OUT})")
+    parser.add_argument("--prune", action="store_true", help="Delete files from the previous manifest that are no longer rendered")
+    parser.add_argument("--jobs", type=int, default=1, help="Worker processes for writing tenants; 0 = one per CPU (default: 1)")
+    parser.add_argument("--chunk-size", type=int, default=None, help="Tenants per worker task (default: ~4 chunks per worker)")
+    args = parser.parse_args(argv)
+
+    if args.days < 1:
+        raise SystemExit("--days must be >= 1")
+    try:
+        first = date.fromisoformat(args.start) if args.start else sydney_today()
+    except ValueError:
+        raise SystemExit(f"Invalid --start date: {args.start!r} (expected YYYY-MM-DD)")
+    dates = [(first + timedelta(days=i)).isoformat() for i in range(args.days)]
+
+    started = time.perf_counter()
+    words = [row.word for row in read_table(args.table)]
+    if not words:
+        raise SystemExit(f"No rows in {args.table}")
+
+    tenants = [default_tenant()]
+    start_words: dict[str, str] = {}
+    messages: dict[str, tuple[str, str]] = {}
+    if args.dsn:
+        orgs, start_words, messages = load_database(args.dsn, first, first + timedelta(days=args.days))
+        if args.organizations is None:
+            tenants.extend(orgs)
+    elif args.organizations is None:
+        print("No database: default tenant only, seeded start words, empty messages")
+    if args.organizations is not None:
+        tenants.extend(load_organizations_file(args.organizations))
+    keys = [t.key for t in tenants]
+    if len(set(keys)) != len(keys):
+        raise SystemExit("Duplicate tenant slugs")
+
+    shared = date_payloads(words, dates, start_words, messages)
+    root = args.out / f"v{PAYLOAD_VERSION}"
+    root.mkdir(parents=True, exist_ok=True)
+    manifest_path = root / "manifest.json"
+    previous = read_manifest(manifest_path)
+    loaded = time.perf_counter()
+    print(
+        f"Tenants: {len(tenants)}  dates: {dates[0]}..{dates[-1]}  wordlist: {len(words)}  "
+        f"stored start words: {len(start_words)}  messages: {len(messages)}  ({(loaded - started) * 1000:.0f} ms)"
+    )
+
+    results = map_ordered(
+        render_tenant,
+        tenants,
+        jobs=args.jobs,
+        chunk_size=args.chunk_size,
+        initializer=init_worker,
+        initargs=(str(root), shared, previous),
+    )
+    files = manifest_files(results, shared)
+    written = sum(r.written for r in results)
+    unchanged = sum(r.unchanged for r in results)
+    rendered = time.perf_counter()
+
+    manifest = {
+        "version": PAYLOAD_VERSION,
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "wordlist": {"table": args.table.name, "size": len(words), "sha256": sha256(args.table.read_bytes())},
+        "dates": {"first": dates[0], "last": dates[-1]},
+        "tenants": {t.key: {"org_id": t.org_id, "domain": t.domain} for t in tenants},
+        "digest": manifest_digest(files),
+        "files": files,
+    }
+    write_manifest(manifest_path, manifest)
+    removed = prune(root, previous, files) if args.prune else 0
+    stale = 0 if args.prune else len(set(previous) - set(files))
+
+    elapsed = rendered - loaded
+    rate = len(files) / elapsed if elapsed > 0 else float("inf")
+    print(f"Files: {len(files)}  written {written}  unchanged {unchanged}  in {elapsed * 1000:.0f} ms ({rate:,.0f} files/s, jobs={args.jobs})")
+    if removed:
+        print(f"Pruned: {removed}")
+    if stale:
+        print(f"Not in this manifest (use --prune to delete): {stale}")
+    print(f"Digest: {manifest['digest']}")
+    print(f"Wrote: {manifest_path}")
+
+
+if __name__ == "__main__":
+    main()
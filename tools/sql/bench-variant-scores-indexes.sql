@@ -0,0 +1,9 @@
+-- Candidate indexes for tools/sql_bench.py (applied in a rolled-back transaction).
+-- scores has no index on game_id, so start.js's completed-score check and the
+-- yesterday-winners MIN(attempts) subquery scan the whole table.
+CREATE INDEX idx_scores_game_player ON scores(game_id, player_id);
+CREATE INDEX idx_scores_game_success_attempts ON scores(game_id, attempts) WHERE success = TRUE;
+
+-- yesterday-winners / golf-leaderboard filter on completed_at::date.
+CREATE INDEX idx_golf_rounds_completed_date ON golf_rounds(((completed_at)::date), COALESCE(org_id, 0))
+  WHERE is_completed = TRUE;
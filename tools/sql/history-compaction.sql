@@ -0,0 +1,49 @@
+-- Summary and checkpoint tables maintained by tools/compact_history.py.
+-- Safe to run repeatedly; the job applies it on every run.
+--
+-- Raw rows older than the retention cutoff are archived to gzip'd COPY files
+-- and deleted; these rows keep the per-tenant, per-day aggregates. Every
+-- column is additive (or a MIN), so a day compacted across several batches or
+-- runs merges into one row. Per-player history lives on in
+-- leaderboard_player_totals (tools/materialize_leaderboards.py).
+
+CREATE TABLE IF NOT EXISTS daily_history_summaries (
+  org_key INTEGER NOT NULL,          -- COALESCE(games.org_id, 0)
+  play_date DATE NOT NULL,
+  games INTEGER NOT NULL,            -- games rows (one per tenant and day)
+  players INTEGER NOT NULL,          -- daily_players rows
+  scores INTEGER NOT NULL,           -- scores rows
+  successes INTEGER NOT NULL,
+  total_attempts INTEGER NOT NULL,   -- SUM(attempts) over all scores
+  best_attempts INTEGER,             -- MIN(attempts) over successes
+  solved_histogram INTEGER[] NOT NULL, -- successes in 1..6 attempts
+  player_games INTEGER NOT NULL,     -- player_games rows
+  completed_player_games INTEGER NOT NULL,
+  compacted_at TIMESTAMP DEFAULT NOW(),
+  PRIMARY KEY (org_key, play_date)
+);
+
+CREATE TABLE IF NOT EXISTS golf_history_summaries (
+  org_key INTEGER NOT NULL,          -- COALESCE(golf_rounds.org_id, 0)
+  day DATE NOT NULL,                 -- COALESCE(completed_at, started_at)::date
+  rounds INTEGER NOT NULL,
+  completed_rounds INTEGER NOT NULL,
+  total_score INTEGER NOT NULL,      -- SUM(total_score) over completed rounds
+  best_score INTEGER,                -- MIN(total_score) over completed rounds
+  holes INTEGER NOT NULL,            -- golf_holes rows
+  hole_attempts INTEGER NOT NULL,    -- SUM(golf_holes.attempts)
+  compacted_at TIMESTAMP DEFAULT NOW(),
+  PRIMARY KEY (org_key, day)
+);
+
+CREATE TABLE IF NOT EXISTS history_compaction_checkpoints (
+  source TEXT PRIMARY KEY,           -- 'daily' (games tree) or 'golf' (golf_rounds tree)
+  cutoff DATE NOT NULL,              -- rows before this day are compacted
+  last_id BIGINT NOT NULL DEFAULT 0, -- keyset over games.id / golf_rounds.id
+  batches INTEGER NOT NULL DEFAULT 0,
+  rows_archived BIGINT NOT NULL DEFAULT 0,
+  rows_deleted BIGINT NOT NULL DEFAULT 0,
+  started_at TIMESTAMP DEFAULT NOW(),
+  updated_at TIMESTAMP DEFAULT NOW(),
+  finished_at TIMESTAMP              -- NULL while a pass is in progress
+);
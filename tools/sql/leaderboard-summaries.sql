@@ -0,0 +1,67 @@
+-- Materialized leaderboard aggregates maintained by tools/materialize_leaderboards.py.
+-- Safe to run repeatedly; the job applies it on every run.
+--
+-- org_key is COALESCE(org_id, 0) so the default tenant has a real key.
+-- game_type is 'daily' (scores) or 'golf' (completed golf_rounds).
+-- period is 'day', 'week' or 'all'. period_start is the day, the week start or
+-- 1970-01-01 respectively. Weeks follow leaderboard.js: 7-day blocks counted
+-- from 1 January, restarting every year, so the last block of a year is short.
+-- Golf days use completed_at::date, as in golf-leaderboard.js and
+-- yesterday-winners.js.
+
+CREATE TABLE IF NOT EXISTS leaderboard_player_totals (
+  org_key INTEGER NOT NULL,
+  game_type TEXT NOT NULL,
+  period TEXT NOT NULL,
+  period_start DATE NOT NULL,
+  player_id INTEGER NOT NULL,
+  played INTEGER NOT NULL,      -- scores rows / completed rounds
+  total INTEGER NOT NULL,       -- SUM(attempts) / SUM(total_score)
+  best INTEGER,                 -- MIN(attempts) over successes / MIN(total_score)
+  PRIMARY KEY (org_key, game_type, period, period_start, player_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_leaderboard_player_totals_player
+  ON leaderboard_player_totals(org_key, game_type, player_id, period);
+
+CREATE TABLE IF NOT EXISTS leaderboard_period_totals (
+  org_key INTEGER NOT NULL,
+  game_type TEXT NOT NULL,
+  period TEXT NOT NULL,
+  period_start DATE NOT NULL,
+  games INTEGER NOT NULL,       -- days with a game row (daily) / days with a completed round (golf)
+  entries INTEGER NOT NULL,     -- player-day rows
+  best INTEGER,                 -- winning score for 'day'; lowest player best otherwise
+  PRIMARY KEY (org_key, game_type, period, period_start)
+);
+
+CREATE TABLE IF NOT EXISTS leaderboard_watermarks (
+  source TEXT PRIMARY KEY,      -- 'scores', 'games' or 'golf_rounds'
+  last_id BIGINT NOT NULL DEFAULT 0,
+  last_ts TIMESTAMP,            -- golf_rounds keyset is (completed_at, id)
+  rows_processed BIGINT NOT NULL DEFAULT 0,
+  updated_at TIMESTAMP DEFAULT NOW()
+);
+
+-- Example reads:
+--
+-- Yesterday's daily winners (yesterday-winners.js):
+--   SELECT p.player_name, t.best AS attempts
+--   FROM leaderboard_player_totals t
+--   JOIN leaderboard_period_totals pt USING (org_key, game_type, period, period_start)
+--   JOIN players p ON p.id = t.player_id
+--   WHERE t.org_key = COALESCE($2, 0) AND t.game_type = 'daily' AND t.period = 'day'
+--     AND t.period_start = $1 AND t.best = pt.best
+--   ORDER BY p.player_name;
+--
+-- All-time daily leaderboard (leaderboard.js, period=all):
+--   SELECT p.player_name, COALESCE(t.played, 0) AS games_played, COALESCE(t.total, 0) AS total_attempts,
+--          pt.games AS total_games,
+--          COALESCE(t.total, 0) + (pt.games - COALESCE(t.played, 0)) * 8 AS total_score
+--   FROM players p
+--   JOIN leaderboard_period_totals pt
+--     ON pt.org_key = COALESCE($1, 0) AND pt.game_type = 'daily' AND pt.period = 'all'
+--   LEFT JOIN leaderboard_player_totals t
+--     ON t.org_key = pt.org_key AND t.game_type = 'daily' AND t.period = 'all' AND t.player_id = p.id
+--   WHERE COALESCE(p.org_id, 0) = COALESCE($1, 0) AND pt.games > 0
+--   ORDER BY total_score;
@@ -0,0 +1,174 @@
+-- Local schema for benchmarking and maintenance tooling.
+-- Mirrors the tables created by api/*.js, api/setup-database.js and the SQL
+-- migrations (including 001-add-multi-tenant-support.sql) as they exist in
+-- production, so synthetic data from tools/generate_synthetic_dataset.py can
+-- be loaded into a throwaway Postgres with:
+--
+--   psql "$DATABASE_URL" -f tools/sql/schema.sql
+--   psql "$DATABASE_URL" -f <output-dir>/load.sql
+
+CREATE TABLE IF NOT EXISTS organizations (
+  id SERIAL PRIMARY KEY,
+  slug TEXT UNIQUE NOT NULL,
+  name TEXT NOT NULL,
+  display_name TEXT,
+  domain TEXT UNIQUE,
+  admin_password TEXT,
+  motd TEXT,
+  primary_color TEXT DEFAULT '#8b5cf6',
+  secondary_color TEXT DEFAULT '#7c3aed',
+  created_at TIMESTAMP DEFAULT NOW(),
+  settings JSONB DEFAULT '{}'::jsonb
+);
+
+CREATE TABLE IF NOT EXISTS players (
+  id SERIAL PRIMARY KEY,
+  player_name TEXT NOT NULL,
+  password_hash TEXT,
+  password_reset_required BOOLEAN DEFAULT FALSE,
+  created_at TIMESTAMP DEFAULT NOW(),
+  org_id INTEGER REFERENCES organizations(id) ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS games (
+  id SERIAL PRIMARY KEY,
+  play_date DATE NOT NULL,
+  org_id INTEGER REFERENCES organizations(id) ON DELETE CASCADE,
+  created_at TIMESTAMP DEFAULT NOW()
+);
+
+CREATE TABLE IF NOT EXISTS daily_players (
+  id SERIAL PRIMARY KEY,
+  game_id INTEGER NOT NULL REFERENCES games(id) ON DELETE CASCADE,
+  player_id INTEGER NOT NULL REFERENCES players(id) ON DELETE CASCADE,
+  UNIQUE(game_id, player_id)
+);
+
+CREATE TABLE IF NOT EXISTS scores (
+  id SERIAL PRIMARY KEY,
+  game_id INTEGER NOT NULL REFERENCES games(id) ON DELETE CASCADE,
+  player_id INTEGER NOT NULL REFERENCES players(id) ON DELETE CASCADE,
+  attempts INTEGER NOT NULL,
+  success BOOLEAN NOT NULL,
+  played_at TIMESTAMP DEFAULT NOW()
+);
+
+CREATE TABLE IF NOT EXISTS player_games (
+  id SERIAL PRIMARY KEY,
+  game_id INTEGER NOT NULL REFERENCES games(id) ON DELETE CASCADE,
+  player_id INTEGER NOT NULL REFERENCES players(id) ON DELETE CASCADE,
+  guesses JSONB NOT NULL DEFAULT '[]',
+  guesses_packed BYTEA,
+  completed BOOLEAN NOT NULL DEFAULT FALSE,
+  target_word TEXT,
+  updated_at TIMESTAMP DEFAULT NOW(),
+  UNIQUE(game_id, player_id)
+);
+
+CREATE TABLE IF NOT EXISTS daily_start_words (
+  id SERIAL PRIMARY KEY,
+  play_date DATE NOT NULL UNIQUE,
+  word TEXT NOT NULL,
+  member_name TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS message_of_day (
+  id SERIAL PRIMARY KEY,
+  message_date DATE NOT NULL UNIQUE,
+  message TEXT NOT NULL,
+  created_by TEXT,
+  updated_at TIMESTAMP DEFAULT NOW()
+);
+
+CREATE TABLE IF NOT EXISTS wordlist (
+  id SERIAL PRIMARY KEY,
+  word VARCHAR(5) NOT NULL UNIQUE,
+  difficulty DECIMAL(5,2) NOT NULL,
+  scrabble_score INTEGER NOT NULL,
+  par INTEGER NOT NULL CHECK (par IN (3, 4, 5))
+);
+
+CREATE TABLE IF NOT EXISTS validation_words (
+  id SERIAL PRIMARY KEY,
+  word TEXT NOT NULL UNIQUE
+);
+
+CREATE TABLE IF NOT EXISTS daily_golf_course (
+  id SERIAL PRIMARY KEY,
+  course_date DATE NOT NULL,
+  hole_number INTEGER NOT NULL CHECK (hole_number >= 1 AND hole_number <= 9),
+  target_word TEXT NOT NULL,
+  start_word TEXT NOT NULL,
+  par INTEGER NOT NULL,
+  UNIQUE(course_date, hole_number)
+);
+
+CREATE TABLE IF NOT EXISTS golf_rounds (
+  id SERIAL PRIMARY KEY,
+  player_id INTEGER NOT NULL REFERENCES players(id) ON DELETE CASCADE,
+  started_at TIMESTAMP DEFAULT NOW(),
+  completed_at TIMESTAMP,
+  total_score INTEGER,
+  current_hole INTEGER DEFAULT 1,
+  is_completed BOOLEAN DEFAULT FALSE,
+  org_id INTEGER REFERENCES organizations(id) ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS golf_holes (
+  id SERIAL PRIMARY KEY,
+  round_id INTEGER NOT NULL REFERENCES golf_rounds(id) ON DELETE CASCADE,
+  hole_number INTEGER NOT NULL CHECK (hole_number >= 1 AND hole_number <= 9),
+  target_word TEXT NOT NULL,
+  start_word TEXT NOT NULL,
+  par INTEGER NOT NULL,
+  guesses JSONB DEFAULT '[]',
+  guesses_packed BYTEA,
+  attempts INTEGER,
+  score INTEGER,
+  completed_at TIMESTAMP,
+  UNIQUE(round_id, hole_number)
+);
+
+CREATE TABLE IF NOT EXISTS word_votes (
+  word VARCHAR(32) NOT NULL,
+  username VARCHAR(64) NOT NULL,
+  vote VARCHAR(8) NOT NULL CHECK (vote IN ('up', 'down')),
+  date DATE NOT NULL,
+  game_type VARCHAR(16) NOT NULL,
+  PRIMARY KEY (word, username, date, game_type)
+);
+
+-- Indexes as created by the handlers and 001-add-multi-tenant-support.sql
+CREATE INDEX IF NOT EXISTS idx_wordlist_word ON wordlist(word);
+CREATE INDEX IF NOT EXISTS idx_wordlist_par ON wordlist(par);
+CREATE INDEX IF NOT EXISTS idx_daily_start_words_date ON daily_start_words(play_date);
+CREATE INDEX IF NOT EXISTS idx_daily_golf_course_date ON daily_golf_course(course_date);
+CREATE INDEX IF NOT EXISTS idx_golf_rounds_player ON golf_rounds(player_id);
+CREATE INDEX IF NOT EXISTS idx_golf_holes_round ON golf_holes(round_id);
+CREATE INDEX IF NOT EXISTS idx_golf_rounds_completed_at ON golf_rounds(completed_at) WHERE is_completed = TRUE;
+CREATE INDEX IF NOT EXISTS idx_validation_words_word ON validation_words(word);
+
+CREATE INDEX IF NOT EXISTS idx_players_org_id ON players(org_id);
+CREATE INDEX IF NOT EXISTS idx_players_org_name ON players(org_id, player_name);
+CREATE INDEX IF NOT EXISTS idx_games_org_id ON games(org_id);
+CREATE INDEX IF NOT EXISTS idx_games_org_date ON games(org_id, play_date);
+CREATE INDEX IF NOT EXISTS idx_golf_rounds_org_id ON golf_rounds(org_id);
+CREATE INDEX IF NOT EXISTS idx_golf_rounds_org_player ON golf_rounds(org_id, player_id);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_players_name_org_unique
+  ON players(LOWER(player_name), COALESCE(org_id, 0));
+CREATE UNIQUE INDEX IF NOT EXISTS idx_games_date_org_unique
+  ON games(play_date, COALESCE(org_id, 0));
+
+CREATE OR REPLACE FUNCTION clear_stale_guesses_packed() RETURNS trigger AS $$
+BEGIN
+  IF NEW.guesses IS DISTINCT FROM OLD.guesses THEN
+    NEW.guesses_packed := NULL;
+  END IF;
+  RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE TRIGGER golf_holes_guesses_packed BEFORE UPDATE OF guesses ON golf_holes
+  FOR EACH ROW EXECUTE FUNCTION clear_stale_guesses_packed();
+CREATE OR REPLACE TRIGGER player_games_guesses_packed BEFORE UPDATE OF guesses ON player_games
+  FOR EACH ROW EXECUTE FUNCTION clear_stale_guesses_packed();
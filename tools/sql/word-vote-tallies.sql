@@ -0,0 +1,44 @@
+-- Incremental word_votes aggregates maintained by tools/word_vote_queue.py.
+-- Safe to run repeatedly; the job applies it on every run.
+--
+-- word is UPPER(word_votes.word) to match the wordlist table. Weighted columns
+-- hold votes scaled by 2^((day - 2025-01-01) / half_life_days): later votes
+-- weigh more, so old sums never need rescaling. Multiplying by
+-- 2^(-(as_of - 2025-01-01) / half_life_days) turns them into decayed counts.
+
+CREATE TABLE IF NOT EXISTS word_vote_days (
+  word TEXT NOT NULL,
+  game_type TEXT NOT NULL,
+  day DATE NOT NULL,
+  up INTEGER NOT NULL,
+  down INTEGER NOT NULL,
+  PRIMARY KEY (word, game_type, day)
+);
+
+CREATE TABLE IF NOT EXISTS word_vote_tallies (
+  word TEXT NOT NULL,
+  game_type TEXT NOT NULL,
+  up INTEGER NOT NULL,
+  down INTEGER NOT NULL,
+  up_weight DOUBLE PRECISION NOT NULL,
+  down_weight DOUBLE PRECISION NOT NULL,
+  first_vote DATE NOT NULL,
+  last_vote DATE NOT NULL,
+  updated_at TIMESTAMP DEFAULT NOW(),
+  PRIMARY KEY (word, game_type)
+);
+
+-- Single row. The keyset is (date, game_type, word, username) over closed days.
+CREATE TABLE IF NOT EXISTS word_vote_watermark (
+  id BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (id),
+  last_date DATE,
+  last_game_type TEXT,
+  last_word TEXT,
+  last_username TEXT,
+  half_life_days DOUBLE PRECISION NOT NULL,
+  rows_processed BIGINT NOT NULL DEFAULT 0,
+  updated_at TIMESTAMP DEFAULT NOW()
+);
+
+-- word_votes has no surrogate key; this index serves the keyset scan.
+CREATE INDEX IF NOT EXISTS idx_word_votes_keyset ON word_votes(date, game_type, word, username);
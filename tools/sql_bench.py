@@ -0,0 +1,575 @@
+#!/usr/bin/env python3
+"""Benchmark the route handlers' hot SQL against a local Postgres.
+
+The statements below mirror functions/api/routes/*.js verbatim (modulo
+whitespace); `check` verifies they still match their source files so the
+harness does not silently drift from production.
+
+    # load a large synthetic dataset first (tools/generate_synthetic_dataset.py)
+    python tools/sql_bench.py check
+    python tools/sql_bench.py run --out bench.json \
+        --variant scores-indexes=tools/sql/bench-variant-scores-indexes.sql
+    python tools/sql_bench.py diff bench.json:base bench.json:scores-indexes
+
+Each variant's DDL runs inside a transaction that is rolled back afterwards, so
+index experiments never persist.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import re
+import statistics
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+import psycopg
+
+
+ROUTES_DIR = Path(__file__).resolve().parent.parent / "functions" / "api" / "routes"
+
+
+@dataclass
+class Samples:
+    players: list[tuple[str, int | None]]
+    games: list[tuple[int, str, int | None]]  # (game_id, play_date, org_id)
+    game_players: list[tuple[int, int, str]]  # (game_id, player_id, play_date)
+    rounds: list[tuple[int, int]]  # (round_id, hole_number)
+    round_players: list[tuple[int, str, int | None]]  # (player_id, started_date, org_id)
+    dates: list[tuple[str, int | None]]  # (date, org_id) with completed golf/daily play
+    orgs: list[int | None]
+    words: list[str]
+    words_by_par: dict[int, list[str]]
+
+
+@dataclass(frozen=True)
+class BenchQuery:
+    name: str
+    source: str  # route file the statement is mirrored from
+    sql: str
+    params: Callable[[Samples, random.Random], list]
+    exact: bool = True  # False for statements the handler assembles dynamically
+
+
+def _golf_pick_sql(excluded: int) -> str:
+    # golf-start.js builds the NOT IN list from the words already chosen for the course.
+    query = "SELECT word, par FROM wordlist WHERE par = $1"
+    if excluded:
+        query += f" AND word NOT IN ({', '.join(f'${i + 2}' for i in range(excluded))})"
+    return query + " ORDER BY RANDOM() LIMIT 1;"
+
+
+def _golf_pick_params(s: Samples, rng: random.Random) -> list:
+    par = rng.choice([3, 4, 5])
+    return [par, *rng.sample(s.words, 4)]
+
+
+QUERIES: tuple[BenchQuery, ...] = (
+    BenchQuery(
+        "player_lookup",
+        "start.js",
+        "SELECT id, player_name FROM players WHERE LOWER(player_name) = LOWER($1) AND COALESCE(org_id, 0) = COALESCE($2, 0);",
+        lambda s, rng: list(rng.choice(s.players)),
+    ),
+    BenchQuery(
+        "auth_player_lookup",
+        "auth.js",
+        "SELECT id, player_name, password_hash, password_reset_required FROM players WHERE LOWER(player_name) = $1 AND COALESCE(org_id, 0) = COALESCE($2, 0);",
+        lambda s, rng: (lambda p: [p[0].lower(), p[1]])(rng.choice(s.players)),
+    ),
+    BenchQuery(
+        "game_lookup",
+        "start.js",
+        "SELECT id FROM games WHERE play_date = $1 AND COALESCE(org_id, 0) = COALESCE($2, 0);",
+        lambda s, rng: (lambda g: [g[1], g[2]])(rng.choice(s.games)),
+    ),
+    BenchQuery(
+        "daily_player_check",
+        "start.js",
+        """SELECT id FROM daily_players
+       WHERE game_id = $1 AND player_id = $2
+       LIMIT 1;""",
+        lambda s, rng: list(rng.choice(s.game_players)[:2]),
+    ),
+    BenchQuery(
+        "completed_score_check",
+        "start.js",
+        """SELECT id FROM scores
+         WHERE game_id = $1 AND player_id = $2 AND success = TRUE
+         LIMIT 1;""",
+        lambda s, rng: list(rng.choice(s.game_players)[:2]),
+    ),
+    BenchQuery(
+        "daily_players_list",
+        "start.js",
+        """SELECT p.player_name
+       FROM daily_players dp
+       JOIN players p ON dp.player_id = p.id
+       WHERE dp.game_id = $1
+       ORDER BY LOWER(p.player_name);""",
+        lambda s, rng: [rng.choice(s.games)[0]],
+    ),
+    BenchQuery(
+        "player_game_state",
+        "start.js",
+        """SELECT pg.guesses, pg.completed, pg.target_word
+       FROM player_games pg
+       JOIN games g ON pg.game_id = g.id
+       WHERE pg.game_id = $1 AND pg.player_id = $2 AND g.play_date = $3;""",
+        lambda s, rng: list(rng.choice(s.game_players)),
+    ),
+    BenchQuery(
+        "start_word_wordlist",
+        "start.js",
+        "SELECT word FROM wordlist ORDER BY word",
+        lambda s, rng: [],
+    ),
+    BenchQuery(
+        "validate_word",
+        "validate-word.js",
+        """SELECT
+        v.word,
+        w.difficulty,
+        w.par
+       FROM validation_words v
+       LEFT JOIN wordlist w ON v.word = w.word
+       WHERE v.word = $1""",
+        lambda s, rng: [rng.choice(s.words)],
+    ),
+    BenchQuery(
+        "yesterday_daily_winners",
+        "yesterday-winners.js",
+        """SELECT p.player_name, s.attempts
+       FROM scores s
+       JOIN players p ON s.player_id = p.id
+       JOIN games g ON s.game_id = g.id
+       WHERE g.play_date = $1
+         AND s.success = true
+         AND COALESCE(p.org_id, 0) = COALESCE($2, 0)
+         AND COALESCE(g.org_id, 0) = COALESCE($2, 0)
+         AND s.attempts = (
+           SELECT MIN(s2.attempts)
+           FROM scores s2
+           JOIN games g2 ON s2.game_id = g2.id
+           WHERE g2.play_date = $1
+             AND s2.success = true
+             AND COALESCE(g2.org_id, 0) = COALESCE($2, 0)
+         )
+       ORDER BY p.player_name ASC""",
+        lambda s, rng: list(rng.choice(s.dates)),
+    ),
+    BenchQuery(
+        "yesterday_golf_winners",
+        "yesterday-winners.js",
+        """SELECT p.player_name, gr.total_score
+       FROM golf_rounds gr
+       JOIN players p ON gr.player_id = p.id
+       WHERE gr.is_completed = true
+         AND gr.completed_at::date = $1
+         AND COALESCE(p.org_id, 0) = COALESCE($2, 0)
+         AND COALESCE(gr.org_id, 0) = COALESCE($2, 0)
+         AND gr.total_score = (
+           SELECT MIN(gr2.total_score)
+           FROM golf_rounds gr2
+           JOIN players p2 ON gr2.player_id = p2.id
+           WHERE gr2.is_completed = true
+             AND gr2.completed_at::date = $1
+             AND COALESCE(p2.org_id, 0) = COALESCE($2, 0)
+             AND COALESCE(gr2.org_id, 0) = COALESCE($2, 0)
+         )
+       ORDER BY p.player_name ASC""",
+        lambda s, rng: list(rng.choice(s.dates)),
+    ),
+    BenchQuery(
+        "golf_today_round",
+        "golf-start.js",
+        """SELECT id, current_hole, is_completed,
+              (started_at AT TIME ZONE 'UTC' AT TIME ZONE 'Australia/Sydney')::date as started_date
+       FROM golf_rounds
+       WHERE player_id = $1
+       AND (started_at AT TIME ZONE 'UTC' AT TIME ZONE 'Australia/Sydney')::date = $2::date
+       AND COALESCE(org_id, 0) = COALESCE($3, 0)
+       ORDER BY started_at DESC LIMIT 1;""",
+        lambda s, rng: list(rng.choice(s.round_players)),
+    ),
+    BenchQuery(
+        "golf_course_exists",
+        "golf-start.js",
+        "SELECT COUNT(*) as count FROM daily_golf_course WHERE course_date = $1",
+        lambda s, rng: [rng.choice(s.dates)[0]],
+    ),
+    BenchQuery(
+        "golf_pick_word_random",
+        "golf-start.js",
+        _golf_pick_sql(4),
+        _golf_pick_params,
+        exact=False,
+    ),
+    BenchQuery(
+        "golf_get_hole",
+        "golf-get-hole.js",
+        """SELECT
+        hole_number,
+        target_word,
+        start_word,
+        par,
+        guesses,
+        attempts,
+        score
+      FROM golf_holes
+      WHERE round_id = $1 AND hole_number = $2""",
+        lambda s, rng: list(rng.choice(s.rounds)),
+    ),
+    BenchQuery(
+        "leaderboard_all",
+        "leaderboard.js",
+        """WITH game_dates AS (
+          SELECT DISTINCT play_date FROM games
+          WHERE COALESCE(org_id, 0) = COALESCE($1, 0)
+        ),
+        game_count AS (
+          SELECT COUNT(*) as total_games FROM game_dates
+        ),
+        player_scores AS (
+          SELECT
+            p.id as player_id,
+            p.player_name,
+            COUNT(s.id) as games_played,
+            COALESCE(SUM(s.attempts), 0) as total_attempts
+          FROM players p
+          LEFT JOIN scores s ON s.player_id = p.id
+          LEFT JOIN games g ON s.game_id = g.id
+            AND COALESCE(g.org_id, 0) = COALESCE($1, 0)
+          WHERE COALESCE(p.org_id, 0) = COALESCE($1, 0)
+          GROUP BY p.id, p.player_name
+        )
+        SELECT
+          ps.player_name,
+          ps.games_played,
+          ps.total_attempts,
+          gc.total_games,
+          (ps.total_attempts + (gc.total_games - ps.games_played) * 8) as total_score
+        FROM player_scores ps
+        CROSS JOIN game_count gc
+        WHERE gc.total_games > 0
+        ORDER BY total_score ASC""",
+        lambda s, rng: [rng.choice(s.orgs)],
+    ),
+    BenchQuery(
+        "golf_leaderboard_daily",
+        "golf-leaderboard.js",
+        """SELECT
+        p.player_name,
+        gr.id as round_id,
+        gr.total_score,
+        gr.completed_at,
+        json_agg(
+          json_build_object(
+            'hole', gh.hole_number,
+            'par', gh.par,
+            'attempts', gh.attempts,
+            'score', gh.score,
+            'word', gh.target_word
+          ) ORDER BY gh.hole_number
+        ) as holes
+      FROM golf_rounds gr
+      JOIN players p ON gr.player_id = p.id
+      LEFT JOIN golf_holes gh ON gr.id = gh.round_id
+      WHERE gr.is_completed = TRUE
+        AND COALESCE(gr.org_id, 0) = COALESCE($2, 0)
+        AND gr.completed_at::date = $1::date
+      GROUP BY p.player_name, gr.id, gr.total_score, gr.completed_at
+      ORDER BY gr.total_score ASC, gr.completed_at ASC
+      LIMIT 100;""",
+        lambda s, rng: list(rng.choice(s.dates)),
+        exact=False,
+    ),
+)
+
+
+def normalize_sql(text: str) -> str:
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def to_psycopg(sql: str) -> str:
+    # $N placeholders -> named psycopg placeholders (psycopg re-numbers them server side).
+    return re.sub(r"\$(\d+)", r"%(p\1)s", sql.replace("%", "%%"))
+
+
+def bind(params: list) -> dict:
+    return {f"p{i}": v for i, v in enumerate(params, start=1)}
+
+
+def check_sources(queries=QUERIES) -> list[str]:
+    drifted: list[str] = []
+    cache: dict[str, str] = {}
+    for q in queries:
+        if not q.exact:
+            continue
+        if q.source not in cache:
+            cache[q.source] = normalize_sql((ROUTES_DIR / q.source).read_text(encoding="utf-8"))
+        if normalize_sql(q.sql) not in cache[q.source]:
+            drifted.append(f"{q.name} ({q.source})")
+    return drifted
+
+
+def collect_samples(conn: psycopg.Connection, *, size: int, seed: int) -> Samples:
+    with conn.cursor() as cur:
+        cur.execute("SELECT setseed(%s)", [((seed % 1000) / 1000.0)])
+
+        def rows(sql: str) -> list[tuple]:
+            cur.execute(sql, [size])
+            return [tuple(r) for r in cur.fetchall()]
+
+        players = rows("SELECT player_name, org_id FROM players ORDER BY random() LIMIT %s")
+        games = rows("SELECT id, play_date::text, org_id FROM games ORDER BY random() LIMIT %s")
+        game_players = rows(
+            """SELECT dp.game_id, dp.player_id, g.play_date::text
+               FROM daily_players dp JOIN games g ON g.id = dp.game_id
+               ORDER BY random() LIMIT %s"""
+        )
+        rounds = rows("SELECT round_id, hole_number FROM golf_holes ORDER BY random() LIMIT %s")
+        round_players = rows(
+            """SELECT player_id,
+                      ((started_at AT TIME ZONE 'UTC' AT TIME ZONE 'Australia/Sydney')::date)::text,
+                      org_id
+               FROM golf_rounds ORDER BY random() LIMIT %s"""
+        )
+        dates = rows(
+            """SELECT play_date::text, org_id
+               FROM (SELECT DISTINCT play_date, org_id FROM games) d
+               ORDER BY random() LIMIT %s"""
+        )
+        cur.execute("SELECT DISTINCT org_id FROM players")
+        orgs = [r[0] for r in cur.fetchall()]
+        cur.execute("SELECT word, par FROM wordlist")
+        wordlist = cur.fetchall()
+
+    if not (players and games and game_players and wordlist):
+        raise SystemExit("Database looks empty; load data with tools/generate_synthetic_dataset.py first")
+
+    by_par: dict[int, list[str]] = {}
+    for word, par in wordlist:
+        by_par.setdefault(par, []).append(word)
+
+    return Samples(
+        players=players,
+        games=games,
+        game_players=game_players,
+        rounds=rounds or [(0, 1)],
+        round_players=round_players or [(0, "2000-01-01", None)],
+        dates=dates,
+        orgs=orgs or [None],
+        words=[w for w, _ in wordlist],
+        words_by_par=by_par,
+    )
+
+
+def plan_signature(node: dict) -> list[str]:
+    # Flatten a JSON plan into "Node Type[ on relation][ using index]" strings.
+    label = node.get("Node Type", "?")
+    if node.get("Relation Name"):
+        label += f" on {node['Relation Name']}"
+    if node.get("Index Name"):
+        label += f" using {node['Index Name']}"
+    out = [label]
+    for child in node.get("Plans", []):
+        out.extend(plan_signature(child))
+    return out
+
+
+def run_query(cur: psycopg.Cursor, q: BenchQuery, samples: Samples, rng: random.Random, repeat: int) -> dict:
+    explain = "EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " + to_psycopg(q.sql)
+    runs = []
+    for _ in range(repeat):
+        params = q.params(samples, rng)
+        started = time.perf_counter()
+        cur.execute(explain, bind(params))
+        wall_ms = (time.perf_counter() - started) * 1000
+        doc = cur.fetchone()[0]
+        doc = doc[0] if isinstance(doc, list) else json.loads(doc)[0]
+        runs.append(
+            {
+                "execution_ms": doc.get("Execution Time", 0.0),
+                "planning_ms": doc.get("Planning Time", 0.0),
+                "wall_ms": wall_ms,
+                "plan": doc["Plan"],
+            }
+        )
+
+    runs.sort(key=lambda r: r["execution_ms"])
+    median_run = runs[len(runs) // 2]
+    exec_times = [r["execution_ms"] for r in runs]
+    return {
+        "source": q.source,
+        "runs": len(runs),
+        "execution_ms": {
+            "min": round(exec_times[0], 3),
+            "median": round(statistics.median(exec_times), 3),
+            "p95": round(exec_times[min(len(exec_times) - 1, int(len(exec_times) * 0.95))], 3),
+            "max": round(exec_times[-1], 3),
+        },
+        "planning_ms_median": round(statistics.median(r["planning_ms"] for r in runs), 3),
+        "wall_ms_median": round(statistics.median(r["wall_ms"] for r in runs), 3),
+        "total_cost": median_run["plan"].get("Total Cost"),
+        "plan_signature": plan_signature(median_run["plan"]),
+        "plan": median_run["plan"],
+    }
+
+
+def run_variant(
+    conn: psycopg.Connection,
+    name: str,
+    ddl: str | None,
+    samples: Samples,
+    *,
+    repeat: int,
+    seed: int,
+    only: set[str] | None,
+) -> dict:
+    rng = random.Random(seed)
+    results: dict[str, dict] = {}
+    with conn.transaction(force_rollback=True):
+        with conn.cursor() as cur:
+            if ddl:
+                cur.execute(ddl)
+                cur.execute("ANALYZE")
+            for q in QUERIES:
+                if only and q.name not in only:
+                    continue
+                results[q.name] = run_query(cur, q, samples, rng, repeat)
+                med = results[q.name]["execution_ms"]["median"]
+                print(f"  [{name}] {q.name:<28}{med:>10.3f} ms")
+    return results
+
+
+def parse_variant(spec: str) -> tuple[str, Path]:
+    if "=" not in spec:
+        raise SystemExit(f"--variant must be NAME=path.sql, got {spec!r}")
+    name, path = spec.split("=", 1)
+    return name, Path(path)
+
+
+def load_side(spec: str) -> tuple[str, dict]:
+    # "results.json[:variant]" -> (label, {query: result})
+    path_str, _, variant = spec.partition(":")
+    doc = json.loads(Path(path_str).read_text(encoding="utf-8"))
+    variants = doc["variants"]
+    if not variant:
+        variant = next(iter(variants))
+    if variant not in variants:
+        raise SystemExit(f"Variant {variant!r} not in {path_str} (have: {', '.join(variants)})")
+    return f"{Path(path_str).name}:{variant}", variants[variant]
+
+
+def cmd_check(args: argparse.Namespace) -> None:
+    drifted = check_sources()
+    checked = sum(1 for q in QUERIES if q.exact)
+    if drifted:
+        print("Mirrored SQL no longer matches its route handler:")
+        for d in drifted:
+            print(f"  {d}")
+        raise SystemExit(1)
+    print(f"All {checked} verbatim statements match functions/api/routes/")
+
+
+def cmd_run(args: argparse.Namespace) -> None:
+    drifted = check_sources()
+    if drifted:
+        print(f"Warning: mirrored SQL drifted from source: {', '.join(drifted)}")
+
+    variants: list[tuple[str, str | None]] = [("base", None)]
+    for spec in args.variant:
+        name, path = parse_variant(spec)
+        variants.append((name, path.read_text(encoding="utf-8")))
+
+    only = set(args.only.split(",")) if args.only else None
+    if only:
+        unknown = only - {q.name for q in QUERIES}
+        if unknown:
+            raise SystemExit(f"Unknown queries: {', '.join(sorted(unknown))}")
+
+    with psycopg.connect(args.dsn) as conn:
+        samples = collect_samples(conn, size=args.samples, seed=args.seed)
+        with conn.cursor() as cur:
+            cur.execute("SELECT current_setting('server_version')")
+            server_version = cur.fetchone()[0]
+        out = {"server_version": server_version, "repeat": args.repeat, "seed": args.seed, "variants": {}}
+        for name, ddl in variants:
+            print(f"Variant: {name}")
+            out["variants"][name] = run_variant(
+                conn, name, ddl, samples, repeat=args.repeat, seed=args.seed, only=only
+            )
+
+    args.out.write_text(json.dumps(out, indent=2, default=str) + "\n", encoding="utf-8")
+    print(f"Wrote: {args.out}")
+
+
+def cmd_diff(args: argparse.Namespace) -> None:
+    left_label, left = load_side(args.left)
+    right_label, right = load_side(args.right)
+
+    print(f"LEFT:  {left_label}")
+    print(f"RIGHT: {right_label}")
+    print(f"{'QUERY':<28}{'LEFT ms':>11}{'RIGHT ms':>11}{'SPEEDUP':>9}  PLAN")
+    for name in left:
+        if name not in right:
+            continue
+        lm = left[name]["execution_ms"]["median"]
+        rm = right[name]["execution_ms"]["median"]
+        speedup = f"{lm / rm:.2f}x" if rm > 0 else "-"
+        plan_changed = left[name]["plan_signature"] != right[name]["plan_signature"]
+        print(f"{name:<28}{lm:>11.3f}{rm:>11.3f}{speedup:>9}  {'CHANGED' if plan_changed else 'same'}")
+        if plan_changed and args.plans:
+            before = set(left[name]["plan_signature"])
+            after = set(right[name]["plan_signature"])
+            for node in sorted(before - after):
+                print(f"      - {node}")
+            for node in sorted(after - before):
+                print(f"      + {node}")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="EXPLAIN ANALYZE benchmark for the API's hot SQL statements.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_check = sub.add_parser("check", help="Verify mirrored SQL still matches the route handlers")
+    p_check.set_defaults(func=cmd_check)
+
+    p_run = sub.add_parser("run", help="Run every statement under EXPLAIN ANALYZE for each schema variant")
+    p_run.add_argument("--dsn", default=os.environ.get("DATABASE_URL"), help="Postgres DSN (default: $DATABASE_URL)")
+    p_run.add_argument("--out", type=Path, default=Path("sql-bench.json"), help="Results JSON (default: sql-bench.json)")
+    p_run.add_argument(
+        "--variant",
+        action="append",
+        default=[],
+        help="NAME=path.sql schema/index variant, applied in a rolled-back transaction (repeatable)",
+    )
+    p_run.add_argument("--repeat", type=int, default=25, help="Executions per statement per variant (default: 25)")
+    p_run.add_argument("--samples", type=int, default=500, help="Parameter sample size per kind (default: 500)")
+    p_run.add_argument("--only", default=None, help="Comma-separated subset of query names")
+    p_run.add_argument("--seed", type=int, default=1, help="Parameter sampling seed (default: 1)")
+    p_run.set_defaults(func=cmd_run)
+
+    p_diff = sub.add_parser("diff", help="Compare two result sets (file.json[:variant])")
+    p_diff.add_argument("left")
+    p_diff.add_argument("right")
+    p_diff.add_argument("--plans", action="store_true", help="Show plan nodes that appeared/disappeared")
+    p_diff.set_defaults(func=cmd_diff)
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        if not args.dsn:
+            raise SystemExit("No database: pass --dsn or set DATABASE_URL")
+        if args.repeat <= 0:
+            raise SystemExit("--repeat must be > 0")
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""Pre-generate start words that land each target at its intended PAR.
+
+start.js picks the daily start word with the "START:" seed over the
+alphabetical wordlist, so the start word has no relation to the target.
+golf-start.js leaves start_word empty. This tool scores every wordlist word
+as a start word against each target instead.
+
+After a start word S, the words still possible for target T are the
+partition class of S's feedback on T; call its size r. The expected guess
+count is modelled as
+
+  1 (the start word) + 1 (r == 1) or 1 + log2(r) / bits_per_guess (r > 1)
+
+The tool picks the S whose estimate is closest to the target's PAR. Ties
+go to the more informative start word (higher partition entropy).
+
+Feedback patterns for the whole wordlist are computed once with numpy. They
+are cached, memory-mapped, under the feature cache directory, keyed by the
+word-list hash. Per-guess partition sizes are derived from that matrix.
+Targets are scored in parallel chunks with --jobs.
+
+Inputs:
+  - the wordlist table (file order = wordlist id order, as in get-target-word.js)
+  - a date range for the daily game
+  - optionally a golf course TSV with COURSE_DATE, HOLE_NUMBER, TARGET_WORD, PAR
+
+Outputs:
+  - an assignment TSV
+  - optional SQL for daily_start_words and daily_golf_course.start_word
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from dataclasses import dataclass
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+
+from parallel_filter import map_ordered
+from wordle_patterns import (
+    cached_pattern_matrix,
+    partition_entropy,
+    partition_sizes,
+    pattern_cache_path,
+    pattern_matrix,
+)
+from wordlist_table import DEFAULT_TABLE, read_table, start_word_for_date, target_word_for_date
+
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parents[1] / "data" / "feature-cache"
+
+ASSIGNMENT_HEADER = "\t".join(
+    [
+        "DATE",
+        "HOLE",
+        "TARGET",
+        "PAR",
+        "START_WORD",
+        "REMAINING",
+        "EXPECTED_GUESSES",
+        "START_ENTROPY",
+        "BASELINE_START_WORD",
+        "BASELINE_EXPECTED",
+    ]
+)
+
+
+@dataclass(frozen=True)
+class Target:
+    date: str
+    hole: int | None  # None for the daily game
+    word: str
+    par: int
+
+
+@dataclass(frozen=True)
+class Assignment:
+    target: Target
+    start_word: str
+    remaining: int
+    expected: float
+    entropy: float
+    baseline_word: str | None
+    baseline_expected: float | None
+
+    def format(self) -> str:
+        t = self.target
+        return "\t".join(
+            [
+                t.date,
+                "" if t.hole is None else str(t.hole),
+                t.word,
+                str(t.par),
+                self.start_word,
+                str(self.remaining),
+                f"{self.expected:.2f}",
+                f"{self.entropy:.2f}",
+                self.baseline_word or "",
+                "" if self.baseline_expected is None else f"{self.baseline_expected:.2f}",
+            ]
+        )
+
+
+def expected_guesses(remaining: np.ndarray, bits_per_guess: float) -> np.ndarray:
+    r = np.asarray(remaining, dtype=np.float64)
+    solve = np.where(r <= 1, 1.0, 1.0 + np.log2(np.maximum(r, 1.0)) / bits_per_guess)
+    return 1.0 + solve
+
+
+def date_range(start: str, days: int) -> list[str]:
+    try:
+        first = date.fromisoformat(start)
+    except ValueError:
+        raise SystemExit(f"Invalid --start date: {start!r} (expected YYYY-MM-DD)")
+    return [(first + timedelta(days=i)).isoformat() for i in range(days)]
+
+
+def read_golf_course(path: Path) -> list[Target]:
+    lines = [l for l in path.read_text(encoding="utf-8-sig").splitlines() if l.strip()]
+    if not lines:
+        return []
+    header = [h.strip().lower() for h in lines[0].split("\t")]
+    try:
+        cols = [header.index(c) for c in ("course_date", "hole_number", "target_word", "par")]
+    except ValueError:
+        raise SystemExit(f"{path}: expected a header with COURSE_DATE, HOLE_NUMBER, TARGET_WORD, PAR")
+    out: list[Target] = []
+    for line in lines[1:]:
+        parts = line.split("\t")
+        d, hole, word, par = (parts[i].strip() for i in cols)
+        word = word.upper()
+        if len(word) != 5 or not word.isascii() or not word.isalpha():
+            raise SystemExit(f"{path}: bad target word {word!r}")
+        out.append(Target(date=d[:10], hole=int(hole), word=word, par=int(par)))
+    return out
+
+
+# Per-process state, set once per worker by init_worker()
+_patterns: np.ndarray | None = None
+_counts: np.ndarray | None = None
+_entropy: np.ndarray | None = None
+_words: list[str] = []
+_index: dict[str, int] = {}
+_bits: float = 3.0
+
+
+def init_worker(words: list[str], patterns: str | np.ndarray, counts: np.ndarray, entropy: np.ndarray, bits: float) -> None:
+    # `patterns` is the cached .npy path (memory-mapped per worker) or, when the
+    # cache is disabled, the matrix itself.
+    global _patterns, _counts, _entropy, _words, _index, _bits
+    _words = words
+    _index = {w: i for i, w in enumerate(words)}
+    _counts = counts
+    _entropy = entropy
+    _bits = bits
+    _patterns = np.load(patterns, mmap_mode="r") if isinstance(patterns, str) else patterns
+
+
+def _target_column(word: str) -> tuple[np.ndarray, int]:
+    # Feedback of every candidate start word on `word`, plus 1 if the target is
+    # not itself in the answer pool (its own class then has one extra member).
+    idx = _index.get(word)
+    if idx is not None:
+        return np.asarray(_patterns[:, idx]), 0
+    return pattern_matrix(_words, [word])[:, 0], 1
+
+
+def score_target(word: str, par: int) -> tuple[int, int, float]:
+    """Best start word index, its remaining count and expected guesses for one target."""
+    column, extra = _target_column(word)
+    m = len(_words)
+    remaining = _counts[np.arange(m), column] + extra
+    est = expected_guesses(remaining, _bits)
+    gap = np.abs(est - par)
+    own = _index.get(word)
+    if own is not None:
+        gap[own] = np.inf  # never hand out the answer as the start word
+    order = np.lexsort((np.arange(m), -_entropy, gap))
+    best = int(order[0])
+    return best, int(remaining[best]), float(est[best])
+
+
+def expected_for(start: str, word: str) -> float:
+    column, extra = _target_column(word)
+    idx = _index[start]
+    return float(expected_guesses([_counts[idx, column[idx]] + extra], _bits)[0])
+
+
+def score_item(item: tuple[str, int]) -> tuple[int, int, float]:
+    word, par = item
+    return score_target(word, par)
+
+
+def build_patterns(words: list[str], *, jobs: int, cache_dir: Path | None) -> tuple[np.ndarray, Path | None, bool]:
+    if cache_dir is not None:
+        patterns, hit = cached_pattern_matrix(words, words, cache_dir)
+        return patterns, pattern_cache_path(cache_dir, words, words), hit
+
+    # Uncached: build blocks of guess rows in parallel.
+    step = 256
+    blocks = map_ordered(
+        _pattern_block,
+        [words[i : i + step] for i in range(0, len(words), step)],
+        jobs=jobs,
+        chunk_size=1,
+        initializer=_set_answers,
+        initargs=(words,),
+    )
+    return np.vstack(blocks), None, False
+
+
+_answers: list[str] = []
+
+
+def _set_answers(words: list[str]) -> None:
+    global _answers
+    _answers = words
+
+
+def _pattern_block(guesses: list[str]) -> np.ndarray:
+    return pattern_matrix(guesses, _answers)
+
+
+def write_sql(path: Path, daily: list[Assignment], golf: list[Assignment], *, member_name: str, overwrite: bool) -> None:
+    def q(s: str) -> str:
+        return "'" + s.replace("'", "''") + "'"
+
+    lines = ["-- Generated by tools/start_word_optimizer.py", "BEGIN;"]
+    if daily:
+        lines.append("INSERT INTO daily_start_words (play_date, word, member_name) VALUES")
+        values = [f"  ({q(a.target.date)}, {q(a.start_word)}, {q(member_name)})" for a in daily]
+        lines.append(",\n".join(values))
+        if overwrite:
+            lines.append("ON CONFLICT (play_date) DO UPDATE SET word = EXCLUDED.word, member_name = EXCLUDED.member_name;")
+        else:
+            lines.append("ON CONFLICT (play_date) DO NOTHING;")
+    for a in golf:
+        where = f"course_date = {q(a.target.date)} AND hole_number = {a.target.hole} AND target_word = {q(a.target.word)}"
+        if not overwrite:
+            where += " AND start_word = ''"
+        lines.append(f"UPDATE daily_golf_course SET start_word = {q(a.start_word)} WHERE {where};")
+    lines.append("COMMIT;")
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def summarize(label: str, rows: list[Assignment]) -> None:
+    if not rows:
+        return
+    gaps = [abs(a.expected - a.target.par) for a in rows]
+    hits = sum(1 for a in rows if round(a.expected) == a.target.par)
+    print(f"{label}: {len(rows)} targets, mean |expected - PAR| = {sum(gaps) / len(gaps):.3f}, rounded hits {hits}/{len(rows)}")
+    base = [a for a in rows if a.baseline_expected is not None]
+    if base:
+        base_gaps = [abs(a.baseline_expected - a.target.par) for a in base]
+        base_hits = sum(1 for a in base if round(a.baseline_expected) == a.target.par)
+        print(f"  seeded baseline: mean |expected - PAR| = {sum(base_gaps) / len(base_gaps):.3f}, rounded hits {base_hits}/{len(base)}")
+    by_par: dict[int, list[float]] = {}
+    for a in rows:
+        by_par.setdefault(a.target.par, []).append(a.expected)
+    for par in sorted(by_par):
+        vals = by_par[par]
+        print(f"  PAR {par}: {len(vals)} targets, mean expected {sum(vals) / len(vals):.2f}")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Pick start words per target so each hole plays to its PAR.")
+    parser.add_argument("--table", type=Path, default=DEFAULT_TABLE, help=f"Wordlist table in id order (default {DEFAULT_TABLE})")
+    parser.add_argument("--start", default=None, help="First play date YYYY-MM-DD for daily_start_words")
+    parser.add_argument("--days", type=int, default=30, help="Number of dates from --start (default 30)")
+    parser.add_argument("--golf-course", type=Path, default=None, help="TSV of COURSE_DATE, HOLE_NUMBER, TARGET_WORD, PAR")
+    parser.add_argument("--output", type=Path, default=Path("start-word-assignments.tsv"), help="Assignment TSV (default start-word-assignments.tsv)")
+    parser.add_argument("--sql", type=Path, default=None, help="Also write SQL for daily_start_words / daily_golf_course")
+    parser.add_argument("--overwrite", action="store_true", help="SQL replaces existing start words instead of only filling gaps")
+    parser.add_argument("--member-name", default="System", help="member_name for daily_start_words rows (default System, as start.js)")
+    parser.add_argument("--bits-per-guess", type=float, default=3.0, help="Information per follow-up guess in the model (default 3.0)")
+    parser.add_argument("--cache-dir", type=Path, default=DEFAULT_CACHE_DIR, help=f"Pattern matrix cache (default {DEFAULT_CACHE_DIR})")
+    parser.add_argument("--no-cache", action="store_true", help="Do not read or write the pattern cache")
+    parser.add_argument("--jobs", type=int, default=1, help="Worker processes for target scoring; 0 = one per CPU (default: 1)")
+    parser.add_argument("--chunk-size", type=int, default=None, help="Targets per worker task (default: ~4 chunks per worker)")
+    args = parser.parse_args(argv)
+
+    if args.start is None and args.golf_course is None:
+        raise SystemExit("Nothing to do: pass --start and/or --golf-course")
+    if args.bits_per_guess <= 0:
+        raise SystemExit("--bits-per-guess must be > 0")
+
+    rows = read_table(args.table)
+    if not rows:
+        raise SystemExit(f"No rows in {args.table}")
+    words = [r.word for r in rows]
+    par_by_word = {r.word: r.par for r in rows}
+
+    targets: list[Target] = []
+    if args.start is not None:
+        for d in date_range(args.start, args.days):
+            word = target_word_for_date(words, d)
+            targets.append(Target(date=d, hole=None, word=word, par=par_by_word[word]))
+    if args.golf_course is not None:
+        targets.extend(read_golf_course(args.golf_course))
+
+    started = time.perf_counter()
+    cache_dir = None if args.no_cache else args.cache_dir
+    patterns, patterns_path, hit = build_patterns(words, jobs=args.jobs, cache_dir=cache_dir)
+    counts = partition_sizes(np.asarray(patterns))
+    entropy = partition_entropy(counts)
+    prepared = time.perf_counter()
+    print(f"Words: {len(words)}  pattern matrix {'cache hit' if hit else 'built'} in {(prepared - started) * 1000:.0f} ms")
+
+    initargs = (words, patterns if patterns_path is None else str(patterns_path), counts, entropy, args.bits_per_guess)
+    unique = list(dict.fromkeys((t.word, t.par) for t in targets))
+    results = map_ordered(
+        score_item,
+        unique,
+        jobs=args.jobs,
+        chunk_size=args.chunk_size,
+        initializer=init_worker,
+        initargs=initargs,
+    )
+    best_by_target = dict(zip(unique, results))
+
+    # Baseline (start.js seed) for daily rows, scored in-process.
+    init_worker(*initargs)
+
+    daily: list[Assignment] = []
+    golf: list[Assignment] = []
+    for t in targets:
+        best, remaining, est = best_by_target[(t.word, t.par)]
+        baseline_word = baseline_est = None
+        if t.hole is None:
+            baseline_word = start_word_for_date(words, t.date)
+            baseline_est = expected_for(baseline_word, t.word)
+        a = Assignment(
+            target=t,
+            start_word=words[best],
+            remaining=remaining,
+            expected=est,
+            entropy=float(entropy[best]),
+            baseline_word=baseline_word,
+            baseline_expected=baseline_est,
+        )
+        (daily if t.hole is None else golf).append(a)
+    scored = time.perf_counter()
+
+    args.output.write_text("\n".join([ASSIGNMENT_HEADER] + [a.format() for a in daily + golf]) + "\n", encoding="utf-8")
+    print(f"Scored {len(unique)} distinct targets in {(scored - prepared) * 1000:.0f} ms (jobs={args.jobs})")
+    summarize("Daily", daily)
+    summarize("Golf", golf)
+    print(f"Wrote: {args.output}")
+    if args.sql is not None:
+        write_sql(args.sql, daily, golf, member_name=args.member_name, overwrite=args.overwrite)
+        print(f"Wrote: {args.sql}")
+
+
+if __name__ == "__main__":
+    main()
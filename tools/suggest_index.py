@@ -0,0 +1,491 @@
+#!/usr/bin/env python3
+"""Build and query the "did you mean" index for rejected guesses.
+
+validate-word.js only answers `valid: false` for an unknown guess. Scanning
+the ~14k validation words with an edit-distance function on every rejection
+is too slow for the request path. This tool compiles a symmetric-deletion
+(SymSpell) index over the validation list once. Lookups then need only
+bisects plus a handful of distance checks.
+
+Every word and every query is reduced to all strings reachable by deleting up
+to `max distance` letters ("deletes"). Two words within that edit distance
+always share a delete, so the candidates for a query are the union of the
+posting lists of its own deletes. Candidates are verified with the optimal
+string alignment (OSA) distance, where an adjacent transposition counts as one
+edit. Suggestions stop at distance 2; further out they are noise for
+five-letter words.
+
+Words are stored in descending Zipf order, so a word id is its frequency rank
+and each posting list is already sorted by rank. Results are ordered by
+distance, then by rank.
+
+File layout (little-endian, every section 8-byte aligned):
+  header    magic, format version, max distance, word count, key count,
+            posting count, sha256 of everything after the header
+  words     word count x 5 ASCII bytes, id order
+  zipf      word count x uint16, Zipf * 100
+  keys      key count x uint32, sorted; a delete encodes as base 27 with
+            a=1 .. z=26, so keys of different lengths never collide
+  offsets   (key count + 1) x uint32 into postings
+  postings  posting count x uint16 word ids, ascending within a key
+
+Usage:
+  python tools/suggest_index.py build
+  python tools/suggest_index.py lookup crnae xylyl -k 5
+  python tools/suggest_index.py bench --queries 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import heapq
+import mmap
+import random
+import re
+import statistics
+import struct
+import sys
+import time
+from bisect import bisect_left
+from dataclasses import dataclass
+from itertools import combinations
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_INDEX = REPO_ROOT / "data" / "suggest-index.bin"
+DEFAULT_VALIDATION = REPO_ROOT / "public" / "validation-words.txt"
+
+MAGIC = b"GRSUGIDX"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<8sHHIII32s")
+WORD_LENGTH = 5
+
+_FIVE_LETTERS = re.compile(r"^[a-z]{5}$")
+
+
+@dataclass(frozen=True)
+class Suggestion:
+    word: str
+    distance: int
+    rank: int  # 0 = most frequent validation word
+    zipf: float
+
+
+def _align(n: int) -> int:
+    return (n + 7) & ~7
+
+
+def key_code(text: str) -> int:
+    code = 0
+    for ch in text:
+        code = code * 27 + (ord(ch) - 96)
+    return code
+
+
+def deletes(word: str, max_distance: int) -> set[str]:
+    """`word` and every string made by deleting up to `max_distance` letters."""
+    out = {word}
+    n = len(word)
+    for d in range(1, min(max_distance, n) + 1):
+        for drop in combinations(range(n), d):
+            out.add("".join(ch for i, ch in enumerate(word) if i not in drop))
+    return out
+
+
+def osa_distance(a: str, b: str) -> int:
+    """Optimal string alignment distance (Levenshtein plus adjacent swaps).
+
+    The reference implementation; lookups use `distance_upto_two`.
+    """
+    la, lb = len(a), len(b)
+    prev2: list[int] = []
+    prev = list(range(lb + 1))
+    for i in range(1, la + 1):
+        cur = [i] + [0] * lb
+        ai = a[i - 1]
+        for j in range(1, lb + 1):
+            cost = 0 if ai == b[j - 1] else 1
+            best = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+            if i > 1 and j > 1 and ai == b[j - 2] and a[i - 2] == b[j - 1]:
+                best = min(best, prev2[j - 2] + 1)
+            cur[j] = best
+        prev2, prev = prev, cur
+    return prev[lb]
+
+
+def _is_swap(a: str, b: str, i: int) -> bool:
+    return a[i] == b[i + 1] and a[i + 1] == b[i]
+
+
+def _aligned_distance(a: str, b: str, allow_swap_at=None) -> int:
+    # Equal lengths, no insertions or deletions: substitutions and adjacent
+    # swaps only, capped at 3.
+    mismatches = [i for i in range(len(a)) if a[i] != b[i]]
+    m = len(mismatches)
+    if m <= 1:
+        return m
+
+    def swap(i: int) -> bool:
+        return _is_swap(a, b, i) and (allow_swap_at is None or allow_swap_at(i))
+
+    if m == 2:
+        i, j = mismatches
+        return 1 if j == i + 1 and swap(i) else 2
+    if m == 3:
+        i, j, l = mismatches
+        return 2 if (j == i + 1 and swap(i)) or (l == j + 1 and swap(j)) else 3
+    if m == 4:
+        i, j, l, n = mismatches
+        return 2 if j == i + 1 and n == l + 1 and swap(i) and swap(l) else 3
+    return 3
+
+
+def distance_upto_two(a: str, b: str) -> int:
+    """`osa_distance(a, b)` when it is at most 2, otherwise 3.
+
+    Distances this small decompose into a few fixed shapes (substitutions,
+    swaps, one or two deletions, a deletion plus an insertion), which is an
+    order of magnitude cheaper than the dynamic programme in pure Python.
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    gap = len(a) - len(b)
+    if gap > 2:
+        return 3
+    if gap == 2:
+        return 2 if b in deletes(a, 2) else 3
+    if gap == 1:
+        best = 3
+        for i in range(len(a)):
+            shorter = a[:i] + a[i + 1 :]
+            if shorter == b:
+                return 1
+            # OSA never edits a swapped pair again, so the pair may not
+            # straddle the deleted letter.
+            best = min(best, 1 + _aligned_distance(shorter, b, lambda j, i=i: j != i - 1))
+        return min(best, 3)
+    dist = _aligned_distance(a, b)
+    if dist <= 2:
+        return dist
+    # One deletion from each side: a deletion and an insertion.
+    cut_a = {a[:i] + a[i + 1 :] for i in range(len(a))}
+    if any(b[:i] + b[i + 1 :] in cut_a for i in range(len(b))):
+        return 2
+    return 3
+
+
+# --- build ------------------------------------------------------------------
+
+
+def read_words(path: Path) -> list[str]:
+    with path.open("r", encoding="utf-8-sig") as f:
+        words = {line.strip().lower() for line in f}
+    return sorted(w for w in words if _FIVE_LETTERS.match(w))
+
+
+def zipf_scores(words: list[str]) -> list[float]:
+    try:
+        from wordfreq import zipf_frequency
+    except ImportError:
+        raise SystemExit("wordfreq is not installed; pip install wordfreq")
+    return [zipf_frequency(w, "en") for w in words]
+
+
+def build_index(words: list[str], zipf: list[float], max_distance: int) -> bytes:
+    if len(words) > 0xFFFF:
+        raise SystemExit(f"{len(words)} words do not fit 16-bit ids")
+
+    # Rank order: most frequent first, alphabetical among equal frequencies.
+    order = sorted(range(len(words)), key=lambda i: (-zipf[i], words[i]))
+    ranked = [words[i] for i in order]
+    ranked_zipf = [zipf[i] for i in order]
+
+    postings: dict[int, list[int]] = {}
+    for word_id, word in enumerate(ranked):
+        for d in deletes(word, max_distance):
+            postings.setdefault(key_code(d), []).append(word_id)
+    keys = sorted(postings)
+
+    offsets = [0]
+    flat: list[int] = []
+    for key in keys:
+        flat.extend(postings[key])  # ids were appended in rank order
+        offsets.append(len(flat))
+
+    sections = [
+        b"".join(w.encode("ascii") for w in ranked),
+        struct.pack(f"<{len(ranked)}H", *(min(round(z * 100), 0xFFFF) for z in ranked_zipf)),
+        struct.pack(f"<{len(keys)}I", *keys),
+        struct.pack(f"<{len(offsets)}I", *offsets),
+        struct.pack(f"<{len(flat)}H", *flat),
+    ]
+    body = b"".join(s.ljust(_align(len(s)), b"\0") for s in sections)
+    digest = hashlib.sha256(body).digest()
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, max_distance, len(ranked), len(keys), len(flat), digest)
+    return header.ljust(_align(HEADER.size), b"\0") + body
+
+
+def write_index(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(data)
+    tmp.replace(path)
+
+
+# --- lookup -----------------------------------------------------------------
+
+
+class SuggestIndex:
+    """Read-only view over a built index file."""
+
+    def __init__(self, path: Path):
+        if sys.byteorder != "little":
+            raise SystemExit("The suggestion index is little-endian; this platform is not supported")
+        self.path = Path(path)
+        with self.path.open("rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, max_distance, word_count, key_count, posting_count, digest = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            raise SystemExit(f"{self.path} is not a suggestion index")
+        if version != FORMAT_VERSION:
+            raise SystemExit(f"{self.path} has format version {version}, expected {FORMAT_VERSION}; rebuild it")
+
+        sizes = [word_count * WORD_LENGTH, word_count * 2, key_count * 4, (key_count + 1) * 4, posting_count * 2]
+        starts = [_align(HEADER.size)]
+        for size in sizes:
+            starts.append(starts[-1] + _align(size))
+        if len(self._mm) < starts[-1]:
+            raise SystemExit(f"{self.path} is truncated")
+
+        view = memoryview(self._mm)
+        self._views = [view[start : start + size] for start, size in zip(starts, sizes)]
+        self._words = bytes(self._views[0])
+        self._zipf = self._views[1].cast("H")
+        self._keys = self._views[2].cast("I")
+        self._offsets = self._views[3].cast("I")
+        self._postings = self._views[4].cast("H")
+
+        self.max_distance = max_distance
+        self.word_count = word_count
+        self.key_count = key_count
+        self.posting_count = posting_count
+        self.digest = digest.hex()
+
+    @property
+    def version(self) -> str:
+        return self.digest[:12]
+
+    def close(self) -> None:
+        # Views must be released before the mmap can close.
+        for v in (self._zipf, self._keys, self._offsets, self._postings, *self._views):
+            v.release()
+        self._mm.close()
+
+    def __enter__(self) -> "SuggestIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def word(self, word_id: int) -> str:
+        start = word_id * WORD_LENGTH
+        return self._words[start : start + WORD_LENGTH].decode("ascii")
+
+    def _posting(self, key: int) -> memoryview | None:
+        i = bisect_left(self._keys, key)
+        if i == len(self._keys) or self._keys[i] != key:
+            return None
+        return self._postings[self._offsets[i] : self._offsets[i + 1]]
+
+    def suggest(self, query: str, k: int = 5, max_distance: int | None = None) -> list[Suggestion]:
+        """Up to `k` validation words closest to `query`, most frequent first among ties."""
+        query = query.strip().lower()
+        if not query.isascii() or not query.isalpha():
+            return []
+        limit = self.max_distance if max_distance is None else min(max_distance, self.max_distance)
+        if abs(len(query) - WORD_LENGTH) > limit:
+            return []
+
+        # A shared delete of length L means the query and the word each lost
+        # at most max(len) - L letters, so the keys for radius r hold every
+        # word within distance r. Posting lists are in rank order; merging
+        # them visits candidates most-frequent first, so each radius stops as
+        # soon as it has produced the words still needed.
+        query_deletes = [d for d in deletes(query, limit) if len(d) <= WORD_LENGTH]
+        longest = max(len(query), WORD_LENGTH)
+        lists: list[memoryview] = []
+        distances: dict[int, int] = {}
+        picked: list[tuple[int, int]] = []
+        for radius in range(limit + 1):
+            for d in query_deletes:
+                if longest - len(d) == radius:
+                    ids = self._posting(key_code(d))
+                    if ids is not None:
+                        lists.append(ids)
+            need = k - len(picked)
+            previous = -1
+            for word_id in heapq.merge(*lists):
+                if word_id == previous:
+                    continue
+                previous = word_id
+                dist = distances.get(word_id)
+                if dist is None:
+                    dist = distances[word_id] = distance_upto_two(query, self.word(word_id))
+                if dist == radius:
+                    picked.append((word_id, dist))
+                    need -= 1
+                    if need == 0:
+                        break
+            if len(picked) >= k:
+                break
+
+        return [Suggestion(self.word(i), dist, i, self._zipf[i] / 100) for i, dist in picked]
+
+
+# --- commands ---------------------------------------------------------------
+
+
+def cmd_build(args: argparse.Namespace) -> None:
+    words = read_words(args.validation)
+    if not words:
+        raise SystemExit(f"No five-letter words in {args.validation}")
+
+    t0 = time.perf_counter()
+    zipf = zipf_scores(words)
+    t1 = time.perf_counter()
+    data = build_index(words, zipf, args.max_distance)
+    t2 = time.perf_counter()
+    write_index(args.output, data)
+
+    with SuggestIndex(args.output) as index:
+        print(f"Wrote: {args.output} ({len(data) / 1024:.0f} KiB)")
+        print(
+            f"Version: {index.version}  words: {index.word_count}  keys: {index.key_count}  "
+            f"postings: {index.posting_count}  max distance: {index.max_distance}"
+        )
+    print(f"Zipf lookup: {t1 - t0:.2f}s  index build: {t2 - t1:.2f}s")
+
+
+def cmd_lookup(args: argparse.Namespace) -> None:
+    with SuggestIndex(args.index) as index:
+        print(f"Index: {index.path} (version {index.version}, {index.word_count} words)")
+        for query in args.words:
+            found = index.suggest(query, args.k, args.max_distance)
+            listed = ", ".join(f"{s.word} (d={s.distance}, zipf {s.zipf:.2f})" for s in found)
+            print(f"  {query}: {listed or '-'}")
+
+
+def typo(word: str, rng: random.Random) -> str:
+    """One random edit of `word`: substitution, adjacent swap, insertion or deletion."""
+    i = rng.randrange(len(word))
+    letter = chr(97 + rng.randrange(26))
+    kind = rng.randrange(4)
+    if kind == 0:
+        return word[:i] + letter + word[i + 1 :]
+    if kind == 1 and i < len(word) - 1:
+        return word[:i] + word[i + 1] + word[i] + word[i + 2 :]
+    if kind == 2:
+        return word[:i] + letter + word[i:]
+    return word[:i] + word[i + 1 :]
+
+
+def make_queries(words: list[str], count: int, rng: random.Random) -> list[str]:
+    # Rejected guesses are five-letter strings (validate-word.js checks the
+    # shape first), made of one or two typos away from a real word.
+    valid = set(words)
+    out: list[str] = []
+    while len(out) < count:
+        q = rng.choice(words)
+        for _ in range(rng.choice((1, 1, 1, 2))):
+            q = typo(q, rng)
+        if len(q) == WORD_LENGTH and q not in valid:
+            out.append(q)
+    return out
+
+
+def brute_force(words: list[str], query: str, k: int, limit: int) -> list[tuple[str, int]]:
+    # `words` in rank order; the reference the index must agree with.
+    scored = [(osa_distance(query, w), i) for i, w in enumerate(words)]
+    return [(words[i], d) for d, i in sorted(x for x in scored if x[0] <= limit)[:k]]
+
+
+def percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def cmd_bench(args: argparse.Namespace) -> None:
+    rng = random.Random(args.seed)
+    t0 = time.perf_counter()
+    index = SuggestIndex(args.index)
+    open_ms = (time.perf_counter() - t0) * 1000
+    words = [index.word(i) for i in range(index.word_count)]
+    queries = make_queries(words, args.queries, rng)
+
+    print(f"Index: {index.path} (version {index.version}, {index.word_count} words, max distance {index.max_distance})")
+    print(f"Open: {open_ms:.2f}ms  queries: {len(queries)}  k={args.k}")
+
+    timings: list[float] = []
+    empty = 0
+    for q in queries:
+        t = time.perf_counter()
+        found = index.suggest(q, args.k)
+        timings.append((time.perf_counter() - t) * 1e6)
+        empty += not found
+    print(
+        f"Index lookup: mean {statistics.fmean(timings):.1f}us  p50 {percentile(timings, 0.5):.1f}us  "
+        f"p99 {percentile(timings, 0.99):.1f}us  max {max(timings):.1f}us  no suggestion: {empty}"
+    )
+
+    sample = queries[: args.verify]
+    if sample:
+        mismatches = 0
+        t = time.perf_counter()
+        for q in sample:
+            expected = brute_force(words, q, args.k, index.max_distance)
+            got = [(s.word, s.distance) for s in index.suggest(q, args.k)]
+            if got != expected:
+                mismatches += 1
+                if mismatches <= 5:
+                    print(f"  mismatch {q}: index {got} brute force {expected}")
+        per_query = (time.perf_counter() - t) / len(sample) * 1e6
+        print(f"Brute-force scan: ~{per_query:.0f}us per query  checked: {len(sample)}  mismatches: {mismatches}")
+        if mismatches:
+            raise SystemExit(1)
+    index.close()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Build, query or benchmark the did-you-mean suggestion index.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("build", help="Compile the validation list into the index.")
+    p.add_argument("--output", type=Path, default=DEFAULT_INDEX)
+    p.add_argument("--validation", type=Path, default=DEFAULT_VALIDATION)
+    p.add_argument("--max-distance", type=int, default=2, choices=(1, 2))
+    p.set_defaults(func=cmd_build)
+
+    p = sub.add_parser("lookup", help="Print suggestions for some guesses.")
+    p.add_argument("words", nargs="+")
+    p.add_argument("--index", type=Path, default=DEFAULT_INDEX)
+    p.add_argument("-k", type=int, default=5)
+    p.add_argument("--max-distance", type=int, default=None)
+    p.set_defaults(func=cmd_lookup)
+
+    p = sub.add_parser("bench", help="Time lookups on synthetic typos and check them against a full scan.")
+    p.add_argument("--index", type=Path, default=DEFAULT_INDEX)
+    p.add_argument("--queries", type=int, default=20000)
+    p.add_argument("--verify", type=int, default=200, help="Queries also checked against a brute-force scan.")
+    p.add_argument("-k", type=int, default=5)
+    p.add_argument("--seed", type=int, default=1)
+    p.set_defaults(func=cmd_bench)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
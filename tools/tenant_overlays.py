@@ -0,0 +1,597 @@
+#!/usr/bin/env python3
+"""Compile per-tenant wordlist overlays on top of one shared base table.
+
+Every organization shares the `wordlist` table. Instead of generating a full
+table per tenant, a tenant describes only its differences from the base:
+
+  include   extra words
+  exclude   base words it does not want
+  par       PAR overrides, word -> 3/4/5
+
+The base is built once from a state file (`generate_wordlist_table.py
+--state`), so its commonality and difficulty ranks are computed a single time
+for the whole run. Base words keep their base DIFFICULTY and PAR in every
+tenant. An included word is scored on the base's scale, as if it were the
+only word added to the base: its commonality rank and PAR bucket are bisected
+into the base ranks, and it sits in list order where that rank puts it. A
+tenant never re-scores the base, so overlays stay small, and the same word
+has the same PAR everywhere unless a tenant overrides it.
+
+Each overlay is a small binary file keyed to the base digest:
+
+  header     magic, format version, base digest, exclude/override/include counts
+  excludes   uint32 base ids (positions in base list order), ascending
+  overrides  uint32 base ids, ascending, then one uint8 PAR per id
+  includes   per word: 5 ASCII bytes, scrabble uint8, PAR uint8,
+             difficulty * 100 uint16, list position uint32 (insert before that
+             base id); ordered by list position
+
+TenantWordlist resolves a tenant's effective list, in list order or
+alphabetical order, straight from the base arrays and the overlay. No
+per-tenant copy of the table is built.
+
+Tenant deltas come from a JSON file keyed by organization slug, or from
+`organizations.settings->'wordlist'` with the same shape:
+
+  {"friends": {"include": ["crwth"], "exclude": ["about"], "par": {"crane": 5}}}
+
+Usage:
+  python tools/generate_wordlist_table.py words.txt data/wordlist-table.txt --state data/wordlist-state.tsv
+  python tools/tenant_overlays.py build data/wordlist-state.tsv --spec tenants.json --verify
+  python tools/tenant_overlays.py build data/wordlist-state.tsv --dsn "$DATABASE_URL"
+  python tools/tenant_overlays.py show data/wordlist-state.tsv friends --date 2026-01-05 --write friends.tsv
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import struct
+import time
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator
+
+from generate_wordlist_table import (
+    TableParams,
+    WordRow,
+    build_table,
+    commonality_key,
+    commonality_score,
+    normalize,
+    par_counts,
+    par_for_index,
+    read_state,
+    scrabble_score,
+)
+from wordlist_table import TableRow, date_seed, format_float, write_table
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_OUT_DIR = REPO_ROOT / "data" / "overlays"
+MANIFEST_NAME = "manifest.json"
+
+MAGIC = b"GROVRLAY"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<8sHxx16sIII")
+INCLUDE = struct.Struct("<5sBBHI")
+VALID_PARS = (3, 4, 5)
+
+
+# --- shared base --------------------------------------------------------------
+
+
+def base_digest(rows: list[WordRow], params: TableParams) -> bytes:
+    h = hashlib.sha256()
+    h.update(repr(params).encode())
+    for r in sorted(rows, key=commonality_key):
+        h.update(f"\n{r.word}\t{r.zipf!r}\t{r.scrabble}".encode())
+    return h.digest()[:16]
+
+
+class BaseTable:
+    """The shared table plus the rank arrays overlays are scored against."""
+
+    def __init__(self, rows: list[WordRow], params: TableParams):
+        built = build_table(rows, params)
+        self.params = params
+        self.w_common, self.w_scrabble = params.normalized_weights()
+        self.digest = base_digest(rows, params)
+
+        # Base ids are positions in list order (commonality order).
+        self.rows = built.rows_by_common
+        self.words = [r.word for r in self.rows]
+        self.id_by_word = {w: i for i, w in enumerate(self.words)}
+        self.difficulty = [built.difficulty_by_word[w] for w in self.words]
+        self.par = [built.par_by_word[w] for w in self.words]
+        self.scr_min, self.scr_max = built.scr_min, built.scr_max
+
+        self.common_keys = [commonality_key(r) for r in self.rows]
+        self.diff_keys = sorted((built.difficulty_by_word[w], w) for w in self.words)
+        self.easy_count, self.hard_count = par_counts(len(self.rows) + 1, params)
+
+        self.alpha = sorted(range(len(self.words)), key=self.words.__getitem__)
+        self.alpha_rank = [0] * len(self.words)
+        for rank, base_id in enumerate(self.alpha):
+            self.alpha_rank[base_id] = rank
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def table_row(self, base_id: int) -> TableRow:
+        r = self.rows[base_id]
+        return TableRow(word=r.word.upper(), difficulty=self.difficulty[base_id], scrabble=r.scrabble, par=self.par[base_id])
+
+    def score_include(self, row: WordRow) -> tuple[float, int, int]:
+        """(difficulty, PAR, list position) for a word added to the base alone."""
+        n = len(self.rows) + 1
+        pos = bisect_left(self.common_keys, commonality_key(row))
+        scr_norm = normalize(float(row.scrabble), min_value=self.scr_min, max_value=self.scr_max) * 100.0
+        difficulty = self.w_common * commonality_score(pos, n) + self.w_scrabble * scr_norm
+        diff_rank = bisect_left(self.diff_keys, (difficulty, row.word))
+        return difficulty, par_for_index(diff_rank, n, self.easy_count, self.hard_count), pos
+
+
+# --- overlay artifact ---------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class IncludedWord:
+    word: str  # lowercase
+    scrabble: int
+    par: int
+    difficulty: float
+    position: int  # insert before this base id
+
+    def table_row(self) -> TableRow:
+        return TableRow(word=self.word.upper(), difficulty=self.difficulty, scrabble=self.scrabble, par=self.par)
+
+
+@dataclass
+class Overlay:
+    base_digest: bytes
+    excludes: list[int] = field(default_factory=list)
+    overrides: dict[int, int] = field(default_factory=dict)
+    includes: list[IncludedWord] = field(default_factory=list)
+
+    def to_bytes(self) -> bytes:
+        ids = sorted(self.overrides)
+        parts = [
+            HEADER.pack(MAGIC, FORMAT_VERSION, self.base_digest, len(self.excludes), len(ids), len(self.includes)),
+            struct.pack(f"<{len(self.excludes)}I", *self.excludes),
+            struct.pack(f"<{len(ids)}I", *ids),
+            bytes(self.overrides[i] for i in ids),
+        ]
+        for inc in self.includes:
+            parts.append(
+                INCLUDE.pack(inc.word.encode("ascii"), inc.scrabble, inc.par, round(inc.difficulty * 100), inc.position)
+            )
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, source: str = "overlay") -> "Overlay":
+        if len(data) < HEADER.size:
+            raise SystemExit(f"{source} is truncated")
+        magic, version, digest, n_excl, n_over, n_incl = HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise SystemExit(f"{source} is not a wordlist overlay")
+        if version != FORMAT_VERSION:
+            raise SystemExit(f"{source} has format version {version}, expected {FORMAT_VERSION}; rebuild it")
+        if len(data) != HEADER.size + 4 * n_excl + 5 * n_over + INCLUDE.size * n_incl:
+            raise SystemExit(f"{source} has the wrong size")
+
+        offset = HEADER.size
+        excludes = list(struct.unpack_from(f"<{n_excl}I", data, offset))
+        offset += 4 * n_excl
+        ids = struct.unpack_from(f"<{n_over}I", data, offset)
+        offset += 4 * n_over
+        overrides = dict(zip(ids, data[offset : offset + n_over]))
+        offset += n_over
+        includes = []
+        for word, scrabble, par, centi, position in INCLUDE.iter_unpack(data[offset:]):
+            includes.append(IncludedWord(word.decode("ascii"), scrabble, par, centi / 100, position))
+        return cls(base_digest=digest, excludes=excludes, overrides=overrides, includes=includes)
+
+    @classmethod
+    def read(cls, path: Path) -> "Overlay":
+        return cls.from_bytes(path.read_bytes(), str(path))
+
+
+# --- resolution ---------------------------------------------------------------
+
+
+class SparseOrder:
+    """A base ordering with some positions removed and extra items inserted.
+
+    `removed` holds base positions (ascending); `inserted` holds the base
+    position each extra item goes before (ascending). Indexing is two bisects,
+    so nothing is copied per tenant.
+    """
+
+    def __init__(self, base_len: int, removed: list[int], inserted: list[int]):
+        self.base_len = base_len
+        self.removed = removed
+        self.inserted = inserted
+        # Effective index of extra j: its base position, less removals before
+        # it, plus the extras ahead of it.
+        self.extra_at = [pos - bisect_left(removed, pos) + j for j, pos in enumerate(inserted)]
+
+    def __len__(self) -> int:
+        return self.base_len - len(self.removed) + len(self.extra_at)
+
+    def locate(self, i: int) -> tuple[bool, int]:
+        """(True, extra index) or (False, base position) for effective index i."""
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        j = bisect_left(self.extra_at, i)
+        if j < len(self.extra_at) and self.extra_at[j] == i:
+            return True, j
+        # i is the t-th surviving base position; step to the fixed point of
+        # pos = t + (removed positions <= pos).
+        t = i - j
+        pos = t
+        while True:
+            nxt = t + bisect_right(self.removed, pos)
+            if nxt == pos:
+                return False, pos
+            pos = nxt
+
+    def __iter__(self) -> Iterator[tuple[bool, int]]:
+        removed = set(self.removed)
+        j = 0
+        for pos in range(self.base_len):
+            while j < len(self.inserted) and self.inserted[j] <= pos:
+                yield True, j
+                j += 1
+            if pos not in removed:
+                yield False, pos
+        for k in range(j, len(self.inserted)):
+            yield True, k
+
+
+class TenantWordlist:
+    """One tenant's effective wordlist, resolved lazily from base + overlay."""
+
+    def __init__(self, base: BaseTable, overlay: Overlay):
+        if overlay.base_digest != base.digest:
+            raise SystemExit("Overlay was compiled against a different base; rebuild the overlays")
+        self.base = base
+        self.overlay = overlay
+        self._excluded = set(overlay.excludes)
+        self._include_by_word = {inc.word: j for j, inc in enumerate(overlay.includes)}
+        self.list_order = SparseOrder(len(base), overlay.excludes, [inc.position for inc in overlay.includes])
+        self._alpha_order: SparseOrder | None = None
+        self._alpha_includes: list[int] = []
+
+    def __len__(self) -> int:
+        return len(self.list_order)
+
+    def _row(self, is_extra: bool, idx: int) -> TableRow:
+        if is_extra:
+            return self.overlay.includes[idx].table_row()
+        row = self.base.table_row(idx)
+        par = self.overlay.overrides.get(idx)
+        return row if par is None else TableRow(row.word, row.difficulty, row.scrabble, par)
+
+    def __getitem__(self, i: int) -> TableRow:
+        return self._row(*self.list_order.locate(i))
+
+    def __iter__(self) -> Iterator[TableRow]:
+        for is_extra, idx in self.list_order:
+            yield self._row(is_extra, idx)
+
+    def get(self, word: str) -> TableRow | None:
+        word = word.lower()
+        j = self._include_by_word.get(word)
+        if j is not None:
+            return self.overlay.includes[j].table_row()
+        base_id = self.base.id_by_word.get(word)
+        if base_id is None or base_id in self._excluded:
+            return None
+        return self._row(False, base_id)
+
+    def alphabetical(self, i: int) -> str:
+        if self._alpha_order is None:
+            removed = sorted(self.base.alpha_rank[b] for b in self.overlay.excludes)
+            ranked = sorted(
+                (bisect_left(self.base.alpha, inc.word, key=self.base.words.__getitem__), inc.word, j)
+                for j, inc in enumerate(self.overlay.includes)
+            )
+            self._alpha_includes = [j for _, _, j in ranked]
+            self._alpha_order = SparseOrder(len(self.base), removed, [pos for pos, _, _ in ranked])
+        is_extra, idx = self._alpha_order.locate(i)
+        if is_extra:
+            return self.overlay.includes[self._alpha_includes[idx]].word.upper()
+        return self.base.words[self.base.alpha[idx]].upper()
+
+    def target_word(self, date: str) -> str:
+        # get-target-word.js: wordlist in id (list) order.
+        return self[date_seed("TARGET:", date) % len(self)].word
+
+    def start_word(self, date: str) -> str:
+        # start.js: wordlist in alphabetical order.
+        return self.alphabetical(date_seed("START:", date) % len(self))
+
+    def par_distribution(self) -> dict[int, int]:
+        counts = {p: 0 for p in VALID_PARS}
+        for base_id, par in enumerate(self.base.par):
+            if base_id not in self._excluded:
+                counts[self.overlay.overrides.get(base_id, par)] += 1
+        for inc in self.overlay.includes:
+            counts[inc.par] += 1
+        return counts
+
+
+# --- compiling deltas ---------------------------------------------------------
+
+
+@dataclass
+class CompiledTenant:
+    slug: str
+    overlay: Overlay
+    include_rows: list[WordRow]
+    notes: list[str]
+
+
+def _word_list(value, slug: str, key: str) -> list[str]:
+    if value is None:
+        return []
+    if not isinstance(value, list) or not all(isinstance(w, str) for w in value):
+        raise SystemExit(f"{slug}: '{key}' must be a list of words")
+    return list(dict.fromkeys(w.strip().lower() for w in value))
+
+
+def _valid_word(word: str) -> bool:
+    return len(word) == 5 and word.isascii() and word.isalpha()
+
+
+def compile_tenant(base: BaseTable, slug: str, delta: dict, zipf_cache: dict[str, float]) -> CompiledTenant:
+    if not isinstance(delta, dict):
+        raise SystemExit(f"{slug}: wordlist settings must be an object")
+    unknown_keys = set(delta) - {"include", "exclude", "par"}
+    if unknown_keys:
+        raise SystemExit(f"{slug}: unknown wordlist settings {sorted(unknown_keys)}")
+    includes = _word_list(delta.get("include"), slug, "include")
+    excludes = _word_list(delta.get("exclude"), slug, "exclude")
+    par_raw = delta.get("par") or {}
+    if not isinstance(par_raw, dict):
+        raise SystemExit(f"{slug}: 'par' must map words to 3, 4 or 5")
+
+    notes: list[str] = []
+    clash = sorted(set(includes) & set(excludes))
+    if clash:
+        raise SystemExit(f"{slug}: words both included and excluded: {', '.join(w.upper() for w in clash)}")
+
+    exclude_ids: list[int] = []
+    for w in excludes:
+        base_id = base.id_by_word.get(w)
+        if base_id is None:
+            notes.append(f"exclude {w.upper()}: not in base")
+        else:
+            exclude_ids.append(base_id)
+
+    include_rows: list[WordRow] = []
+    for w in includes:
+        if not _valid_word(w):
+            notes.append(f"include {w.upper()}: not a five-letter word")
+        elif w in base.id_by_word:
+            notes.append(f"include {w.upper()}: already in base")
+        else:
+            if w not in zipf_cache:
+                from wordfreq import zipf_frequency
+
+                zipf_cache[w] = float(zipf_frequency(w, "en"))
+            include_rows.append(WordRow(word=w, zipf=zipf_cache[w], scrabble=scrabble_score(w)))
+
+    overrides: dict[int, int] = {}
+    include_par: dict[str, int] = {}
+    for raw_word, par in par_raw.items():
+        w = raw_word.strip().lower()
+        if par not in VALID_PARS:
+            raise SystemExit(f"{slug}: PAR for {w.upper()} must be 3, 4 or 5, not {par!r}")
+        base_id = base.id_by_word.get(w)
+        if any(r.word == w for r in include_rows):
+            include_par[w] = par
+        elif base_id is None or w in excludes:
+            notes.append(f"par {w.upper()}: not in this tenant's list")
+        elif base.par[base_id] != par:
+            overrides[base_id] = par
+
+    scored: list[tuple[int, tuple[float, str], IncludedWord]] = []
+    for r in include_rows:
+        difficulty, par, position = base.score_include(r)
+        # Stored as hundredths, which is all the table format keeps anyway.
+        inc = IncludedWord(r.word, r.scrabble, include_par.get(r.word, par), round(difficulty * 100) / 100, position)
+        scored.append((position, commonality_key(r), inc))
+    scored.sort(key=lambda item: item[:2])
+
+    overlay = Overlay(base_digest=base.digest, excludes=sorted(exclude_ids), overrides=overrides, includes=[inc for _, _, inc in scored])
+    return CompiledTenant(slug=slug, overlay=overlay, include_rows=include_rows, notes=notes)
+
+
+def load_spec(path: Path) -> dict[str, dict]:
+    spec = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(spec, dict):
+        raise SystemExit(f"{path}: expected an object keyed by organization slug")
+    return spec
+
+
+def load_spec_from_db(dsn: str) -> dict[str, dict]:
+    import psycopg
+
+    with psycopg.connect(dsn) as conn:
+        rows = conn.execute(
+            "SELECT slug, settings->'wordlist' FROM organizations WHERE settings ? 'wordlist' ORDER BY slug"
+        ).fetchall()
+    return {slug: delta for slug, delta in rows}
+
+
+# --- verification -------------------------------------------------------------
+
+
+def materialize(base: BaseTable, compiled: CompiledTenant) -> list[TableRow]:
+    """Full copy of a tenant's list, built the slow way, for --verify."""
+    excluded = {base.words[i] for i in compiled.overlay.excludes}
+    keyed: list[tuple[tuple[float, str], TableRow]] = []
+    for base_id, r in enumerate(base.rows):
+        if r.word not in excluded:
+            par = compiled.overlay.overrides.get(base_id, base.par[base_id])
+            keyed.append((commonality_key(r), TableRow(r.word.upper(), base.difficulty[base_id], r.scrabble, par)))
+    by_word = {inc.word: inc for inc in compiled.overlay.includes}
+    for r in compiled.include_rows:
+        keyed.append((commonality_key(r), by_word[r.word].table_row()))
+    keyed.sort(key=lambda item: item[0])
+    return [row for _, row in keyed]
+
+
+def verify_tenant(base: BaseTable, compiled: CompiledTenant, dates: list[str]) -> list[str]:
+    expected = materialize(base, compiled)
+    view = TenantWordlist(base, Overlay.from_bytes(compiled.overlay.to_bytes(), compiled.slug))
+    problems: list[str] = []
+    if len(view) != len(expected):
+        return [f"{compiled.slug}: {len(view)} rows, expected {len(expected)}"]
+    if list(view) != expected:
+        problems.append(f"{compiled.slug}: iteration order differs")
+    for i in range(0, len(expected), max(1, len(expected) // 200)):
+        if view[i] != expected[i]:
+            problems.append(f"{compiled.slug}: row {i} is {view[i].word}, expected {expected[i].word}")
+            break
+    alpha = sorted(r.word for r in expected)
+    for date in dates:
+        target = expected[date_seed("TARGET:", date) % len(expected)].word
+        start = alpha[date_seed("START:", date) % len(alpha)]
+        if view.target_word(date) != target or view.start_word(date) != start:
+            problems.append(f"{compiled.slug}: words for {date} differ")
+    return problems
+
+
+# --- commands -----------------------------------------------------------------
+
+
+def load_base(state: Path) -> BaseTable:
+    rows, params = read_state(state)
+    if not rows:
+        raise SystemExit(f"{state} has no rows")
+    return BaseTable(rows, params)
+
+
+def cmd_build(args: argparse.Namespace) -> None:
+    started = time.perf_counter()
+    base = load_base(args.state)
+    base_ready = time.perf_counter()
+
+    if args.spec is not None:
+        spec = load_spec(args.spec)
+    elif args.dsn:
+        spec = load_spec_from_db(args.dsn)
+    else:
+        raise SystemExit("Pass --spec or --dsn (or set DATABASE_URL)")
+
+    zipf_cache: dict[str, float] = {}
+    compiled = [compile_tenant(base, slug, delta, zipf_cache) for slug, delta in sorted(spec.items())]
+    compiled_at = time.perf_counter()
+
+    args.out_dir.mkdir(parents=True, exist_ok=True)
+    manifest = {
+        "base": {"state": str(args.state), "digest": base.digest.hex(), "words": len(base)},
+        "tenants": {},
+    }
+    total_bytes = 0
+    for tenant in compiled:
+        data = tenant.overlay.to_bytes()
+        path = args.out_dir / f"{tenant.slug}.overlay"
+        path.write_bytes(data)
+        total_bytes += len(data)
+        view = TenantWordlist(base, tenant.overlay)
+        manifest["tenants"][tenant.slug] = {
+            "file": path.name,
+            "sha256": hashlib.sha256(data).hexdigest(),
+            "words": len(view),
+            "include": len(tenant.overlay.includes),
+            "exclude": len(tenant.overlay.excludes),
+            "par_overrides": len(tenant.overlay.overrides),
+            "notes": tenant.notes,
+        }
+    manifest_path = args.out_dir / MANIFEST_NAME
+    manifest_path.write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+    written = time.perf_counter()
+
+    full_copy = sum(len(r.word) + 12 for r in base.rows) * len(compiled)
+    print(f"Base: {args.state} ({len(base)} words, digest {base.digest.hex()[:12]})")
+    print(f"Tenants: {len(compiled)}  overlay bytes: {total_bytes}  (full copies would be ~{full_copy // 1024} KiB)")
+    print(
+        f"Base ranks: {(base_ready - started) * 1000:.0f} ms  compile: {(compiled_at - base_ready) * 1000:.0f} ms  "
+        f"write: {(written - compiled_at) * 1000:.0f} ms  ({len(compiled) / max(written - base_ready, 1e-9):.0f} tenants/s)"
+    )
+    noted = [t for t in compiled if t.notes]
+    for tenant in noted[:20]:
+        print(f"  {tenant.slug}: {'; '.join(tenant.notes[:5])}")
+    print(f"Wrote: {manifest_path}")
+
+    if args.verify:
+        dates = [f"2026-{m:02d}-{d:02d}" for m in range(1, 13) for d in (1, 15)]
+        problems: list[str] = []
+        for tenant in compiled:
+            problems.extend(verify_tenant(base, tenant, dates))
+        print(f"Verify against materialized lists: {'OK' if not problems else f'{len(problems)} problem(s)'}")
+        for p in problems[:20]:
+            print(f"  {p}")
+        if problems:
+            raise SystemExit(1)
+
+
+def cmd_show(args: argparse.Namespace) -> None:
+    base = load_base(args.state)
+    manifest_path = args.out_dir / MANIFEST_NAME
+    if not manifest_path.exists():
+        raise SystemExit(f"{manifest_path} not found; run the build first")
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    entry = manifest["tenants"].get(args.slug)
+    if entry is None:
+        raise SystemExit(f"No overlay for '{args.slug}' in {manifest_path}")
+
+    view = TenantWordlist(base, Overlay.read(args.out_dir / entry["file"]))
+    counts = view.par_distribution()
+    print(f"Tenant: {args.slug}  words: {len(view)} (base {len(base)})")
+    print(f"Overlay: +{entry['include']} -{entry['exclude']} PAR overrides: {entry['par_overrides']}")
+    print(f"PAR distribution: 3={counts[3]}, 4={counts[4]}, 5={counts[5]}")
+    if args.date:
+        print(f"{args.date}: target {view.target_word(args.date)}  start {view.start_word(args.date)}")
+    for word in args.word:
+        row = view.get(word)
+        print(f"  {word.upper()}: " + ("-" if row is None else f"difficulty {format_float(row.difficulty)}, PAR {row.par}"))
+    if args.write is not None:
+        write_table(args.write, view)
+        print(f"Wrote: {args.write}")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Build or inspect per-tenant wordlist overlays over a shared base.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("build", help="Compile every tenant's deltas into overlay files.")
+    p.add_argument("state", type=Path, help="Base state file from generate_wordlist_table.py --state")
+    p.add_argument("--spec", type=Path, default=None, help="JSON deltas keyed by organization slug")
+    p.add_argument("--dsn", default=os.environ.get("DATABASE_URL"), help="Read organizations.settings->'wordlist' instead")
+    p.add_argument("--out-dir", type=Path, default=DEFAULT_OUT_DIR)
+    p.add_argument("--verify", action="store_true", help="Check every overlay against a fully materialized list")
+    p.set_defaults(func=cmd_build)
+
+    p = sub.add_parser("show", help="Resolve one tenant's effective list.")
+    p.add_argument("state", type=Path)
+    p.add_argument("slug")
+    p.add_argument("--out-dir", type=Path, default=DEFAULT_OUT_DIR)
+    p.add_argument("--date", default=None, help="Print the tenant's target and start words for YYYY-MM-DD")
+    p.add_argument("--word", action="append", default=[], help="Look up a word (repeatable)")
+    p.add_argument("--write", type=Path, default=None, help="Write the full effective table (for import or review)")
+    p.set_defaults(func=cmd_show)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
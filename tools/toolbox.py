@@ -0,0 +1,445 @@
+#!/usr/bin/env python3
+"""Single entry point for the Python tools, with an optional warm daemon.
+
+Most tool runs are dominated by start-up rather than work: importing wordfreq
+and loading its English frequency table, importing numpy or psycopg, and for
+filter_refined_words.py the NLTK word corpus and the enchant dictionary. This
+entry point imports nothing heavy itself. Each command's module is imported
+only when that command runs, and the tools load wordfreq on first use.
+
+`serve` starts a resident daemon on a Unix socket. It imports every tool
+module once and warms the frequency table, the NLTK word set and the enchant
+dictionary. Then it forks a child per request, so each command runs against
+the warm state in a fresh copy of it. The client passes its own
+stdin/stdout/stderr over the socket (SCM_RIGHTS), so output streams straight
+to the caller. Exit codes, the working directory and the environment
+(DATABASE_URL) carry over.
+
+If a loaded tool's source changes on disk, the daemon refuses further work
+and exits. Clients then fall back to a local run, so edits never meet stale
+code.
+
+Usage:
+  python tools/toolbox.py list
+  python tools/toolbox.py generate-wordlist-table words.txt data/wordlist-table.txt
+  python tools/toolbox.py serve &
+  python tools/toolbox.py --warm filter-common-words words.txt common.txt
+  python tools/toolbox.py bench --repeat 5 distribution-report data/wordlist-table.txt
+  python tools/toolbox.py stop
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import inspect
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import traceback
+from pathlib import Path
+
+
+TOOLS_DIR = Path(__file__).resolve().parent
+DEFAULT_SOCKET = Path(os.environ.get("GRORDLE_TOOLBOX_SOCKET", f"/tmp/grordle-toolbox-{os.getuid()}.sock"))
+MAX_MESSAGE = 1 << 20
+
+# command -> (module in tools/, summary)
+COMMANDS: dict[str, tuple[str, str]] = {
+    "cache-simulator": ("cache_simulator", "Replay request traces against edge cache policies"),
+    "compact-history": ("compact_history", "Summarize, archive and delete old game history"),
+    "distribution-report": ("distribution_report", "Distribution / threshold-sweep report for a word list"),
+    "filter-5letter-plurals": ("filter-5letter-plurals", "Drop likely plurals from a 5-letter list"),
+    "filter-common-words": ("filter_common_words", "Keep words above a wordfreq threshold"),
+    "filter-plurals-and-ed": ("filter_plurals_and_ed", "Drop -ed forms and plurals of known words"),
+    "filter-plurals-comprehensive": ("filter-plurals-comprehensive", "Drop plurals using the extended lexicon"),
+    "filter-refined-words": ("filter_refined_words", "Drop proper nouns, plurals, slang, non-dictionary words"),
+    "generate-synthetic-dataset": ("generate_synthetic_dataset", "Generate a synthetic multi-tenant dataset"),
+    "generate-wordlist-table": ("generate_wordlist_table", "Build the wordlist table (or sweep its parameters)"),
+    "golf-course-optimizer": ("golf_course_optimizer", "Plan balanced golf courses over a date horizon"),
+    "guess-codec": ("guess_codec", "Packed word-id codec for guess histories"),
+    "lexicon-index": ("lexicon_index", "Build / query the binary lexicon index"),
+    "load-test": ("load_test", "Replay a load test against the API"),
+    "materialize-leaderboards": ("materialize_leaderboards", "Incrementally materialize leaderboards"),
+    "prerender-payloads": ("prerender_payloads", "Prerender static per-date, per-tenant API payloads"),
+    "sql-bench": ("sql_bench", "Benchmark the handler SQL"),
+    "start-word-optimizer": ("start_word_optimizer", "Pick start words that land targets at PAR"),
+    "suggest-index": ("suggest_index", "Build / query the did-you-mean index"),
+    "tenant-overlays": ("tenant_overlays", "Build / show per-tenant wordlist overlays"),
+    "word-features": ("word_features", "Build / export the word feature cache"),
+    "word-vote-queue": ("word_vote_queue", "Tally word_votes into a curation queue"),
+    "wordlist-binary": ("wordlist_binary", "Pack / query the binary wordlist table"),
+    "wordlist-delta": ("wordlist_delta", "Apply add/remove batches to the wordlist table"),
+}
+
+
+# --- running a command ----------------------------------------------------------
+
+
+def _exit_code(exc: SystemExit) -> int:
+    if exc.code is None:
+        return 0
+    if isinstance(exc.code, int):
+        return exc.code
+    print(exc.code, file=sys.stderr)
+    return 1
+
+
+def run_command(name: str, argv: list[str]) -> int:
+    """Import the command's module and call its main(), returning an exit code."""
+    module_name = COMMANDS[name][0]
+    saved_argv = sys.argv
+    # argparse takes its prog name from argv[0]; the older scripts read sys.argv directly.
+    sys.argv = [f"{module_name}.py", *argv]
+    try:
+        module = importlib.import_module(module_name)
+        if inspect.signature(module.main).parameters:
+            result = module.main(argv)
+        else:
+            result = module.main()
+        return result if isinstance(result, int) else 0
+    except SystemExit as exc:
+        return _exit_code(exc)
+    except KeyboardInterrupt:
+        return 130
+    except Exception:
+        traceback.print_exc()
+        return 1
+    finally:
+        sys.argv = saved_argv
+        sys.stdout.flush()
+        sys.stderr.flush()
+
+
+# --- daemon ---------------------------------------------------------------------
+
+
+def _warm_wordfreq() -> None:
+    from wordfreq import zipf_frequency
+
+    zipf_frequency("grord", "en")  # loads and caches the English frequency table
+
+
+def _warm_dictionaries() -> None:
+    import filter_refined_words
+
+    filter_refined_words.init_worker(set())  # enchant en_US + the NLTK word set
+
+
+def _warm_lexicon() -> None:
+    import lexicon_index
+
+    if lexicon_index.DEFAULT_INDEX.exists():
+        lexicon_index.LexiconIndex(lexicon_index.DEFAULT_INDEX).close()
+
+
+def preload() -> list[tuple[str, float, str | None]]:
+    """Import every tool and warm the shared data; returns (step, seconds, error)."""
+    steps: list[tuple[str, object]] = [(f"import {module}", module) for module, _ in COMMANDS.values()]
+    steps += [("wordfreq en", _warm_wordfreq), ("nltk + enchant", _warm_dictionaries), ("lexicon index", _warm_lexicon)]
+    done: list[tuple[str, float, str | None]] = []
+    for label, step in steps:
+        started = time.perf_counter()
+        try:
+            if isinstance(step, str):
+                importlib.import_module(step)
+            else:
+                step()
+            error = None
+        except Exception as exc:
+            error = f"{type(exc).__name__}: {exc}"
+        done.append((label, time.perf_counter() - started, error))
+    return done
+
+
+def loaded_sources() -> dict[str, float]:
+    out: dict[str, float] = {}
+    for module in list(sys.modules.values()):
+        path = getattr(module, "__file__", None)
+        if path and Path(path).resolve().parent == TOOLS_DIR:
+            out[path] = os.stat(path).st_mtime
+    return out
+
+
+def changed_sources(sources: dict[str, float]) -> list[str]:
+    changed = []
+    for path, mtime in sources.items():
+        try:
+            if os.stat(path).st_mtime != mtime:
+                changed.append(Path(path).name)
+        except FileNotFoundError:
+            changed.append(Path(path).name)
+    return changed
+
+
+def _reply(conn: socket.socket, payload: dict) -> None:
+    try:
+        conn.sendall(json.dumps(payload).encode() + b"\n")
+    except OSError:
+        pass  # client went away
+
+
+def _serve_run(conn: socket.socket, server: socket.socket, request: dict, fds: list[int]) -> int:
+    sys.stdout.flush()
+    sys.stderr.flush()
+    pid = os.fork()
+    if pid:
+        return pid
+    # Child: become the client's process for the length of one command.
+    try:
+        server.close()
+        for target, fd in enumerate(fds[:3]):
+            os.dup2(fd, target)
+        for fd in fds:
+            os.close(fd)
+        os.chdir(request["cwd"])
+        os.environ.clear()
+        os.environ.update(request["env"])
+        started = time.perf_counter()
+        code = run_command(request["command"], request["argv"])
+        _reply(conn, {"exit": code, "seconds": time.perf_counter() - started})
+    finally:
+        os._exit(0)
+
+
+def serve(socket_path: Path) -> None:
+    if ping(socket_path) is not None:
+        raise SystemExit(f"A toolbox daemon is already listening on {socket_path}")
+    socket_path.unlink(missing_ok=True)
+
+    started = time.perf_counter()
+    steps = preload()
+    warm_seconds = time.perf_counter() - started
+    for label, seconds, error in steps:
+        if error is not None:
+            print(f"  skipped {label}: {error}", file=sys.stderr)
+    print(f"Preloaded {sum(1 for s in steps if s[2] is None)}/{len(steps)} steps in {warm_seconds:.2f}s", file=sys.stderr)
+    sources = loaded_sources()
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    old_umask = os.umask(0o177)  # socket is 0600: commands run as this user
+    try:
+        server.bind(str(socket_path))
+    finally:
+        os.umask(old_umask)
+    server.listen(16)
+    server.settimeout(1.0)
+    print(f"Listening on {socket_path} (pid {os.getpid()})", file=sys.stderr)
+
+    served = 0
+    boot = time.time()
+    try:
+        while True:
+            try:
+                while os.waitpid(-1, os.WNOHANG)[0]:
+                    pass
+            except ChildProcessError:
+                pass
+            try:
+                conn, _ = server.accept()
+            except socket.timeout:
+                continue
+            with conn:
+                msg, fds, _, _ = socket.recv_fds(conn, MAX_MESSAGE, 3)
+                request = json.loads(msg or b"{}")
+                op = request.get("op")
+                if op == "ping":
+                    _reply(conn, {"pid": os.getpid(), "uptime": time.time() - boot, "served": served, "preload_seconds": warm_seconds})
+                elif op == "stop":
+                    _reply(conn, {"stopped": True})
+                    break
+                elif op == "run":
+                    stale = changed_sources(sources)
+                    if stale:
+                        _reply(conn, {"stale": stale})
+                        print(f"Sources changed ({', '.join(stale)}); exiting", file=sys.stderr)
+                        break
+                    _serve_run(conn, server, request, fds)
+                    served += 1
+                else:
+                    _reply(conn, {"error": f"unknown op {op!r}"})
+                for fd in fds:
+                    os.close(fd)
+    finally:
+        server.close()
+        socket_path.unlink(missing_ok=True)
+
+
+# --- client ---------------------------------------------------------------------
+
+
+def call_daemon(socket_path: Path, request: dict, fds: list[int] = ()) -> dict:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(socket_path))
+        socket.send_fds(sock, [json.dumps(request).encode()], list(fds))
+        data = b""
+        while chunk := sock.recv(65536):
+            data += chunk
+    if not data:
+        raise ConnectionError("daemon closed the connection without replying")
+    return json.loads(data)
+
+
+def ping(socket_path: Path) -> dict | None:
+    try:
+        return call_daemon(socket_path, {"op": "ping"})
+    except (FileNotFoundError, ConnectionRefusedError, ConnectionError):
+        return None
+
+
+def run_warm(socket_path: Path, name: str, argv: list[str], fds: tuple[int, int, int] = (0, 1, 2)) -> int | None:
+    """Run a command on the daemon; None if there is no usable daemon."""
+    sys.stdout.flush()
+    sys.stderr.flush()
+    request = {"op": "run", "command": name, "argv": argv, "cwd": os.getcwd(), "env": dict(os.environ)}
+    try:
+        reply = call_daemon(socket_path, request, fds)
+    except (FileNotFoundError, ConnectionRefusedError, ConnectionError):
+        return None
+    if "stale" in reply:
+        print(f"toolbox: daemon had stale code ({', '.join(reply['stale'])}) and exited; running locally", file=sys.stderr)
+        return None
+    return reply["exit"]
+
+
+# --- built-in commands ----------------------------------------------------------
+
+
+def cmd_list(_args: argparse.Namespace) -> int:
+    width = max(map(len, COMMANDS))
+    for name, (_, summary) in sorted(COMMANDS.items()):
+        print(f"  {name:<{width}}  {summary}")
+    return 0
+
+
+def cmd_status(args: argparse.Namespace) -> int:
+    info = ping(args.socket)
+    if info is None:
+        print(f"No daemon on {args.socket}")
+        return 1
+    print(
+        f"Daemon pid {info['pid']} on {args.socket}: up {info['uptime']:.0f}s, "
+        f"{info['served']} command(s) served, preload {info['preload_seconds']:.2f}s"
+    )
+    return 0
+
+
+def cmd_stop(args: argparse.Namespace) -> int:
+    try:
+        call_daemon(args.socket, {"op": "stop"})
+    except (FileNotFoundError, ConnectionRefusedError, ConnectionError):
+        print(f"No daemon on {args.socket}")
+        return 1
+    print("Stopped")
+    return 0
+
+
+def _time_runs(repeat: int, run) -> list[float]:
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        code = run()
+        times.append(time.perf_counter() - started)
+        if code:
+            raise SystemExit(f"Benchmark run exited with {code}")
+    return times
+
+
+def cmd_bench(args: argparse.Namespace) -> int:
+    if args.command not in COMMANDS:
+        raise SystemExit(f"Unknown command: {args.command}")
+    module_name = COMMANDS[args.command][0]
+    python = sys.executable
+    devnull = subprocess.DEVNULL
+    script = str(TOOLS_DIR / f"{module_name}.py")
+    entry = str(TOOLS_DIR / "toolbox.py")
+
+    daemon = None
+    if ping(args.socket) is None:
+        daemon = subprocess.Popen([python, entry, "--socket", str(args.socket), "serve"], stderr=devnull)
+        deadline = time.time() + 120
+        while ping(args.socket) is None:
+            if daemon.poll() is not None or time.time() > deadline:
+                raise SystemExit("Could not start a daemon for the warm runs")
+            time.sleep(0.1)
+
+    try:
+        with open(os.devnull, "wb") as null:
+            fds = (null.fileno(), null.fileno(), null.fileno()) if not args.show_output else (0, 1, 2)
+            out = None if args.show_output else devnull
+            modes = [
+                ("cold script", lambda: subprocess.run([python, script, *args.args], stdout=out, stderr=out).returncode),
+                ("cold toolbox", lambda: subprocess.run([python, entry, args.command, *args.args], stdout=out, stderr=out).returncode),
+                (
+                    "warm toolbox",
+                    lambda: subprocess.run(
+                        [python, entry, "--socket", str(args.socket), "--warm", args.command, *args.args], stdout=out, stderr=out
+                    ).returncode,
+                ),
+                ("warm request", lambda: run_warm(args.socket, args.command, args.args, fds)),
+            ]
+            results = [(label, _time_runs(args.repeat, run)) for label, run in modes]
+    finally:
+        if daemon is not None:
+            call_daemon(args.socket, {"op": "stop"})
+            daemon.wait()
+
+    cold = statistics.mean(results[0][1])
+    print(f"{args.command} {' '.join(args.args)}  ({args.repeat} runs each)")
+    print(f"  {'mode':<13} {'mean':>9} {'min':>9} {'speedup':>8}")
+    for label, times in results:
+        mean = statistics.mean(times)
+        print(f"  {label:<13} {mean * 1000:7.0f}ms {min(times) * 1000:7.0f}ms {cold / mean:7.1f}x")
+    print("  (warm request: daemon round trip alone, as when chaining from Python)")
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Run the Python tools through one entry point, optionally on a warm daemon.",
+        usage="toolbox.py [--socket PATH] [--warm] {list,serve,stop,status,bench,<command>} [args ...]",
+    )
+    parser.add_argument("--socket", type=Path, default=DEFAULT_SOCKET, help=f"Daemon socket (default {DEFAULT_SOCKET})")
+    parser.add_argument("--warm", action="store_true", help="Run the command on the daemon (falls back to a local run)")
+    parser.add_argument("command", help="A tool command (see `list`) or list/serve/stop/status/bench")
+    parser.add_argument("args", nargs=argparse.REMAINDER, help="Arguments for the command")
+    args = parser.parse_args(argv)
+
+    if args.command == "list":
+        return cmd_list(args)
+    if args.command == "serve":
+        serve(args.socket)
+        return 0
+    if args.command == "stop":
+        return cmd_stop(args)
+    if args.command == "status":
+        return cmd_status(args)
+    if args.command == "bench":
+        bench = argparse.ArgumentParser(prog="toolbox.py bench", description="Time cold and warm runs of one command.")
+        bench.add_argument("--repeat", type=int, default=3, help="Runs per mode (default 3)")
+        bench.add_argument("--show-output", action="store_true", help="Let the command's output through")
+        bench.add_argument("command")
+        bench.add_argument("args", nargs=argparse.REMAINDER)
+        bench_args = bench.parse_args(args.args)
+        if bench_args.repeat <= 0:
+            raise SystemExit("--repeat must be > 0")
+        bench_args.socket = args.socket
+        return cmd_bench(bench_args)
+
+    if args.command not in COMMANDS:
+        raise SystemExit(f"Unknown command: {args.command} (try `toolbox.py list`)")
+    if args.warm:
+        code = run_warm(args.socket, args.command, args.args)
+        if code is not None:
+            return code
+        if not args.socket.exists():
+            print(f"toolbox: no daemon on {args.socket}; running locally", file=sys.stderr)
+    return run_command(args.command, args.args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""Vectorized per-word feature store for difficulty modelling.
+
+Computes a wide feature matrix for a whole five-letter word list in one pass
+over an (n, 5) uint8 letter matrix, and caches it as a columnar .npz keyed by a
+hash of the word list, the feature version and the letter-weight tables. New
+difficulty formulas can then load the cached columns instead of recomputing.
+
+Features (one column each, aligned with `words`):
+  zipf                      wordfreq Zipf frequency
+  score_<table>             letter-weight sum per weight table (scrabble, ...)
+  pos_freq_0..4             share of list words with this letter in slot i
+  pos_freq_mean/_min        mean / rarest positional share
+  letter_freq_mean          mean overall letter share
+  repeats                   letters beyond the first occurrence (0 for CRANE, 1 for APPLE)
+  unique_letters            distinct letters
+  vowels                    count of a/e/i/o/u
+  bigram_rarity_mean/_max   -log2 share of each adjacent bigram within the list
+
+Usage:
+  python tools/word_features.py data/wordlist-table.txt
+  python tools/word_features.py words.txt --weights wwf=wwf.json --export features.tsv
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import time
+from dataclasses import dataclass
+from importlib import metadata
+from pathlib import Path
+
+import numpy as np
+
+from generate_wordlist_table import SCRABBLE_POINTS
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_CACHE_DIR = REPO_ROOT / "data" / "feature-cache"
+
+# Bump when a feature definition changes so stale caches are ignored.
+FEATURE_VERSION = 1
+
+VOWELS = np.array([ord(c) - 97 for c in "aeiou"], dtype=np.uint8)
+
+# Built-in letter-weight tables; more can be plugged in with --weights name=file.json.
+WEIGHT_TABLES: dict[str, dict[str, float]] = {
+    "scrabble": {k: float(v) for k, v in SCRABBLE_POINTS.items()},
+}
+
+
+@dataclass(frozen=True)
+class FeatureSet:
+    key: str
+    words: list[str]
+    columns: dict[str, np.ndarray]
+
+    def column(self, name: str) -> np.ndarray:
+        try:
+            return self.columns[name]
+        except KeyError:
+            raise SystemExit(f"Unknown feature {name!r}; have {', '.join(self.columns)}")
+
+
+def load_word_list(path: Path) -> list[str]:
+    # Accepts plain word lists and wordlist-table TSVs (first column, header skipped).
+    words: list[str] = []
+    seen: set[str] = set()
+    for raw in path.read_text(encoding="utf-8-sig").splitlines():
+        w = raw.split("\t", 1)[0].strip().lower()
+        if len(w) != 5 or not w.isascii() or not w.isalpha() or w in seen:
+            continue
+        seen.add(w)
+        words.append(w)
+    return words
+
+
+def load_weight_table(path: Path) -> dict[str, float]:
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(data, dict):
+        raise SystemExit(f"{path}: expected a JSON object of letter -> weight")
+    table = {str(k).lower(): float(v) for k, v in data.items()}
+    bad = sorted(k for k in table if len(k) != 1 or not "a" <= k <= "z")
+    if bad:
+        raise SystemExit(f"{path}: non-letter keys {bad}")
+    return table
+
+
+def weight_vector(table: dict[str, float]) -> np.ndarray:
+    # Letters missing from a table weigh 0, like scrabble_score().
+    return np.array([table.get(chr(97 + i), 0.0) for i in range(26)], dtype=np.float64)
+
+
+def require_ascii(words: list[str]) -> None:
+    bad = [w for w in words if not (w.isascii() and w.isalpha() and w.islower())]
+    if bad:
+        shown = ", ".join(bad[:5]) + (" ..." if len(bad) > 5 else "")
+        raise SystemExit(f"{len(bad)} word(s) outside a-z cannot be featurized: {shown}")
+
+
+def letter_matrix(words: list[str]) -> np.ndarray:
+    require_ascii(words)
+    buf = "".join(words).encode("ascii")
+    return (np.frombuffer(buf, dtype=np.uint8).reshape(len(words), 5) - 97).astype(np.uint8)
+
+
+def wordfreq_version() -> str:
+    try:
+        return metadata.version("wordfreq")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def store_key(words: list[str], weight_tables: dict[str, dict[str, float]]) -> str:
+    h = hashlib.sha256()
+    h.update(f"v{FEATURE_VERSION}\nwordfreq={wordfreq_version()}\n".encode())
+    h.update(json.dumps(weight_tables, sort_keys=True).encode())
+    h.update(b"\n")
+    h.update("\n".join(words).encode("ascii"))
+    return h.hexdigest()
+
+
+def zipf_column(words: list[str]) -> np.ndarray:
+    from wordfreq import zipf_frequency
+
+    return np.fromiter((zipf_frequency(w, "en") for w in words), dtype=np.float64, count=len(words))
+
+
+def compute_features(
+    words: list[str],
+    *,
+    weight_tables: dict[str, dict[str, float]],
+    zipf: np.ndarray | None = None,
+) -> dict[str, np.ndarray]:
+    n = len(words)
+    letters = letter_matrix(words)
+    cols: dict[str, np.ndarray] = {}
+
+    cols["zipf"] = zipf_column(words) if zipf is None else np.asarray(zipf, dtype=np.float64)
+
+    for name, table in weight_tables.items():
+        cols[f"score_{name}"] = weight_vector(table)[letters].sum(axis=1)
+
+    # Positional letter shares: counts[i, c] = words with letter c in slot i.
+    counts = np.zeros((5, 26), dtype=np.int64)
+    for i in range(5):
+        counts[i] = np.bincount(letters[:, i], minlength=26)
+    pos_share = counts / n
+    pos = pos_share[np.arange(5), letters]  # (n, 5)
+    for i in range(5):
+        cols[f"pos_freq_{i}"] = pos[:, i]
+    cols["pos_freq_mean"] = pos.mean(axis=1)
+    cols["pos_freq_min"] = pos.min(axis=1)
+
+    letter_share = counts.sum(axis=0) / (5 * n)
+    cols["letter_freq_mean"] = letter_share[letters].mean(axis=1)
+
+    ordered = np.sort(letters, axis=1)
+    dupes = (ordered[:, 1:] == ordered[:, :-1]).sum(axis=1)
+    cols["repeats"] = dupes.astype(np.int64)
+    cols["unique_letters"] = (5 - dupes).astype(np.int64)
+    cols["vowels"] = np.isin(letters, VOWELS).sum(axis=1).astype(np.int64)
+
+    bigrams = letters[:, :-1].astype(np.int64) * 26 + letters[:, 1:]
+    bigram_counts = np.bincount(bigrams.ravel(), minlength=26 * 26)
+    rarity = -np.log2(bigram_counts[bigrams] / bigrams.size)
+    cols["bigram_rarity_mean"] = rarity.mean(axis=1)
+    cols["bigram_rarity_max"] = rarity.max(axis=1)
+
+    return cols
+
+
+def cache_path(cache_dir: Path, key: str) -> Path:
+    return cache_dir / f"features-{key[:16]}.npz"
+
+
+def read_store(path: Path, key: str) -> FeatureSet | None:
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            if str(data["__key__"]) != key:
+                return None
+            words = [str(w) for w in data["__words__"]]
+            columns = {name: data[name] for name in data.files if not name.startswith("__")}
+    except (OSError, KeyError, ValueError):
+        return None
+    return FeatureSet(key=key, words=words, columns=columns)
+
+
+def write_store(path: Path, features: FeatureSet) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp.npz")
+    np.savez_compressed(
+        tmp,
+        __key__=np.array(features.key),
+        __words__=np.array(features.words),
+        **features.columns,
+    )
+    tmp.replace(path)
+
+
+def load_features(
+    words: list[str],
+    *,
+    cache_dir: Path | None = DEFAULT_CACHE_DIR,
+    weight_tables: dict[str, dict[str, float]] | None = None,
+    zipf: np.ndarray | None = None,
+    refresh: bool = False,
+) -> tuple[FeatureSet, bool]:
+    """Return (features, cache_hit). `cache_dir=None` disables the cache."""
+    if weight_tables is None:
+        weight_tables = WEIGHT_TABLES
+    require_ascii(words)
+    key = store_key(words, weight_tables)
+
+    if cache_dir is not None and not refresh:
+        cached = read_store(cache_path(cache_dir, key), key)
+        if cached is not None:
+            return cached, True
+
+    features = FeatureSet(key=key, words=list(words), columns=compute_features(words, weight_tables=weight_tables, zipf=zipf))
+    if cache_dir is not None:
+        write_store(cache_path(cache_dir, key), features)
+    return features, False
+
+
+def export_tsv(path: Path, features: FeatureSet) -> None:
+    names = list(features.columns)
+    lines = ["\t".join(["WORD"] + [n.upper() for n in names])]
+    cols = [features.columns[n] for n in names]
+    for i, w in enumerate(features.words):
+        lines.append("\t".join([w.upper()] + [f"{c[i]:.6g}" for c in cols]))
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def parse_weight_args(values: list[str]) -> dict[str, dict[str, float]]:
+    tables = dict(WEIGHT_TABLES)
+    for spec in values:
+        name, sep, file = spec.partition("=")
+        if not sep or not name.isidentifier():
+            raise SystemExit(f"--weights expects name=path.json, got {spec!r}")
+        tables[name] = load_weight_table(Path(file))
+    return tables
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Build or load the cached per-word feature matrix for a word list.")
+    parser.add_argument("input", type=Path, help="Word list or wordlist-table TSV")
+    parser.add_argument("--cache-dir", type=Path, default=DEFAULT_CACHE_DIR, help=f"Feature cache directory (default {DEFAULT_CACHE_DIR})")
+    parser.add_argument("--no-cache", action="store_true", help="Compute without reading or writing the cache")
+    parser.add_argument("--refresh", action="store_true", help="Recompute and overwrite the cached entry")
+    parser.add_argument(
+        "--weights",
+        action="append",
+        default=[],
+        metavar="NAME=FILE",
+        help="Extra letter-weight table as JSON {letter: weight}; adds a score_NAME column (repeatable)",
+    )
+    parser.add_argument("--export", type=Path, default=None, help="Also write the matrix as a TSV")
+    args = parser.parse_args(argv)
+
+    words = load_word_list(args.input)
+    if not words:
+        raise SystemExit("No valid 5-letter words found in input")
+
+    started = time.perf_counter()
+    features, hit = load_features(
+        words,
+        cache_dir=None if args.no_cache else args.cache_dir,
+        weight_tables=parse_weight_args(args.weights),
+        refresh=args.refresh,
+    )
+    elapsed = time.perf_counter() - started
+
+    print(f"Words: {len(features.words)}")
+    print(f"Key: {features.key[:16]} ({'cache hit' if hit else 'computed'} in {elapsed * 1000:.1f} ms)")
+    print(f"{'FEATURE':<20} {'MIN':>10} {'MEAN':>10} {'MAX':>10}")
+    for name, col in features.columns.items():
+        print(f"{name:<20} {col.min():>10.4g} {col.mean():>10.4g} {col.max():>10.4g}")
+
+    if not args.no_cache:
+        print(f"Cache: {cache_path(args.cache_dir, features.key)}")
+    if args.export is not None:
+        export_tsv(args.export, features)
+        print(f"Wrote: {args.export}")
+
+
+if __name__ == "__main__":
+    main()
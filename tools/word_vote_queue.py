@@ -0,0 +1,487 @@
+#!/usr/bin/env python3
+"""Turn word_votes into a ranked removal / review queue, incrementally.
+
+word_votes (word, username, vote, date, game_type) was only ever counted on
+the fly, and pruning disliked words was a hand-edited scripts/remove-words.js.
+This job keeps running tallies instead (schema: tools/sql/word-vote-tallies.sql,
+created if missing):
+
+  word_vote_days     per word, game type and day: up / down votes
+  word_vote_tallies  per word and game type: up / down votes, time-weighted sums
+
+Each run consumes only votes past the stored watermark. word_votes has no
+surrogate key, so the keyset is (date, game_type, word, username), limited to
+closed days (before today in Australia/Sydney). A vote cast for a day that
+has already been consumed (or an edited or deleted one) is picked up with
+--refresh-since. That recomputes the day buckets in a window and applies
+only the differences to the tallies. Changing --half-life-days reweights the
+tallies from the day buckets. Neither rereads all of word_votes.
+
+The queue is one pass over the tallies. Each word is scored by the Wilson
+lower bound of its down-vote share, with every vote decayed by its age
+(half-life --half-life-days) as of --as-of. A word with a high score is one
+that players dislike with some confidence. Words at or above --remove-above
+(with at least --min-votes raw votes) are queued for removal; words at or
+above --review-above are queued for review. Words no longer in --table are
+skipped.
+
+--remove-list writes the removal words one per line. That file feeds
+`wordlist_delta.py --remove` or `node scripts/remove-words.js --from`.
+
+Usage:
+  python tools/word_vote_queue.py --queue vote-queue.tsv
+  python tools/word_vote_queue.py --refresh-since 2025-12-01 --remove-list remove.txt
+  python tools/wordlist_delta.py data/wordlist-state.tsv --remove remove.txt --changes delta.tsv
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import os
+import time
+from collections import Counter
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+import psycopg
+
+from wordlist_table import DEFAULT_TABLE, read_table
+
+
+SCHEMA_SQL = Path(__file__).resolve().parent / "sql" / "word-vote-tallies.sql"
+WEIGHT_EPOCH = date(2025, 1, 1)
+QUEUE_HEADER = "RANK\tACTION\tWORD\tSCORE\tVOTES\tUP\tDOWN\tDECAYED_UP\tDECAYED_DOWN\tLAST_VOTE"
+
+VOTES_SINCE_SQL = """
+SELECT date, game_type, word, username, UPPER(word), vote
+FROM word_votes
+WHERE (date, game_type, word, username) > (%(date)s, %(game_type)s, %(word)s, %(username)s)
+  AND date < %(today)s
+ORDER BY date, game_type, word, username
+LIMIT %(limit)s
+"""
+
+DAYS_UPSERT_SQL = """
+INSERT INTO word_vote_days (word, game_type, day, up, down)
+SELECT * FROM unnest(%(words)s::text[], %(game_types)s::text[], %(days)s::date[], %(ups)s::int[], %(downs)s::int[])
+ON CONFLICT (word, game_type, day) DO UPDATE
+SET up = word_vote_days.up + EXCLUDED.up, down = word_vote_days.down + EXCLUDED.down
+"""
+
+TALLIES_UPSERT_SQL = """
+INSERT INTO word_vote_tallies (word, game_type, up, down, up_weight, down_weight, first_vote, last_vote)
+SELECT * FROM unnest(
+  %(words)s::text[], %(game_types)s::text[], %(ups)s::int[], %(downs)s::int[],
+  %(up_weights)s::float8[], %(down_weights)s::float8[], %(firsts)s::date[], %(lasts)s::date[]
+)
+ON CONFLICT (word, game_type) DO UPDATE
+SET up = word_vote_tallies.up + EXCLUDED.up,
+    down = word_vote_tallies.down + EXCLUDED.down,
+    up_weight = word_vote_tallies.up_weight + EXCLUDED.up_weight,
+    down_weight = word_vote_tallies.down_weight + EXCLUDED.down_weight,
+    first_vote = LEAST(word_vote_tallies.first_vote, EXCLUDED.first_vote),
+    last_vote = GREATEST(word_vote_tallies.last_vote, EXCLUDED.last_vote),
+    updated_at = NOW()
+"""
+
+# After negative deltas: drop emptied rows, then re-derive first/last vote days.
+TIDY_DAYS_SQL = "DELETE FROM word_vote_days WHERE up = 0 AND down = 0"
+TIDY_TALLIES_SQL = "DELETE FROM word_vote_tallies WHERE up = 0 AND down = 0"
+TALLY_SPAN_SQL = """
+UPDATE word_vote_tallies t
+SET first_vote = d.first_vote, last_vote = d.last_vote
+FROM (
+  SELECT word, game_type, MIN(day) AS first_vote, MAX(day) AS last_vote
+  FROM word_vote_days
+  WHERE (word, game_type) IN (SELECT * FROM unnest(%(words)s::text[], %(game_types)s::text[]))
+  GROUP BY word, game_type
+) d
+WHERE t.word = d.word AND t.game_type = d.game_type
+"""
+
+WINDOW_SOURCE_SQL = """
+SELECT UPPER(word), game_type, date,
+       COUNT(*) FILTER (WHERE vote = 'up'), COUNT(*) FILTER (WHERE vote = 'down')
+FROM word_votes
+WHERE date >= %(since)s AND date < %(today)s
+GROUP BY 1, 2, 3
+"""
+
+REWEIGHT_SQL = """
+UPDATE word_vote_tallies t
+SET up_weight = w.up_weight, down_weight = w.down_weight, updated_at = NOW()
+FROM (
+  SELECT word, game_type,
+         SUM(up * power(2.0, (day - %(epoch)s) / %(half_life)s)) AS up_weight,
+         SUM(down * power(2.0, (day - %(epoch)s) / %(half_life)s)) AS down_weight
+  FROM word_vote_days
+  GROUP BY word, game_type
+) w
+WHERE t.word = w.word AND t.game_type = w.game_type
+"""
+
+QUEUE_SQL = """
+SELECT word, SUM(up), SUM(down), SUM(up_weight), SUM(down_weight), MAX(last_vote)
+FROM word_vote_tallies
+WHERE %(game_type)s::text IS NULL OR game_type = %(game_type)s
+GROUP BY word
+"""
+
+
+@dataclass
+class RunStats:
+    rows: int = 0
+    batches: int = 0
+    keys: int = 0
+    seconds: float = 0.0
+
+    def line(self, name: str) -> str:
+        rate = self.rows / self.seconds if self.seconds > 0 else 0.0
+        return f"  {name:<8} rows={self.rows:<8} batches={self.batches:<4} keys={self.keys:<8} {self.seconds:7.2f}s  {rate:,.0f} rows/s"
+
+
+@dataclass(frozen=True)
+class QueueEntry:
+    action: str  # remove | review
+    word: str  # uppercase
+    score: float
+    up: int
+    down: int
+    decayed_up: float
+    decayed_down: float
+    last_vote: date
+
+
+def sydney_today() -> date:
+    return datetime.now(ZoneInfo("Australia/Sydney")).date()
+
+
+def day_weight(day: date, half_life: float) -> float:
+    return 2.0 ** ((day - WEIGHT_EPOCH).days / half_life)
+
+
+def wilson_lower_bound(positive: float, n: float, z: float) -> float:
+    """Lower bound of the Wilson score interval for positive / n (n may be fractional)."""
+    if n <= 0:
+        return 0.0
+    p = positive / n
+    z2 = z * z
+    centre = p + z2 / (2 * n)
+    margin = z * math.sqrt(p * (1 - p) / n + z2 / (4 * n * n))
+    return max(0.0, (centre - margin) / (1 + z2 / n))
+
+
+# --- tallies ------------------------------------------------------------------
+
+
+def apply_buckets(cur: psycopg.Cursor, buckets: dict[tuple[str, str, date], tuple[int, int]], half_life: float) -> int:
+    """Add (word, game_type, day) -> (up, down) deltas to both tables; returns tally keys touched."""
+    if not buckets:
+        return 0
+    keys = sorted(buckets)
+    cur.execute(
+        DAYS_UPSERT_SQL,
+        {
+            "words": [k[0] for k in keys],
+            "game_types": [k[1] for k in keys],
+            "days": [k[2] for k in keys],
+            "ups": [buckets[k][0] for k in keys],
+            "downs": [buckets[k][1] for k in keys],
+        },
+    )
+    tallies: dict[tuple[str, str], list] = {}
+    for (word, game_type, day), (up, down) in buckets.items():
+        weight = day_weight(day, half_life)
+        t = tallies.setdefault((word, game_type), [0, 0, 0.0, 0.0, day, day])
+        t[0] += up
+        t[1] += down
+        t[2] += up * weight
+        t[3] += down * weight
+        t[4] = min(t[4], day)
+        t[5] = max(t[5], day)
+    tkeys = sorted(tallies)
+    cur.execute(
+        TALLIES_UPSERT_SQL,
+        {
+            "words": [k[0] for k in tkeys],
+            "game_types": [k[1] for k in tkeys],
+            "ups": [tallies[k][0] for k in tkeys],
+            "downs": [tallies[k][1] for k in tkeys],
+            "up_weights": [tallies[k][2] for k in tkeys],
+            "down_weights": [tallies[k][3] for k in tkeys],
+            "firsts": [tallies[k][4] for k in tkeys],
+            "lasts": [tallies[k][5] for k in tkeys],
+        },
+    )
+    if any(up < 0 or down < 0 for up, down in buckets.values()):
+        cur.execute(TIDY_DAYS_SQL)
+        cur.execute(TIDY_TALLIES_SQL)
+        cur.execute(TALLY_SPAN_SQL, {"words": [k[0] for k in tkeys], "game_types": [k[1] for k in tkeys]})
+    return len(tallies)
+
+
+def load_watermark(cur: psycopg.Cursor, half_life: float) -> tuple[tuple, float]:
+    cur.execute(
+        "INSERT INTO word_vote_watermark (half_life_days) VALUES (%s) ON CONFLICT (id) DO NOTHING",
+        (half_life,),
+    )
+    cur.execute(
+        """SELECT last_date, last_game_type, last_word, last_username, half_life_days
+           FROM word_vote_watermark FOR UPDATE"""
+    )
+    last_date, game_type, word, username, stored = cur.fetchone()
+    return (last_date or date.min, game_type or "", word or "", username or ""), stored
+
+
+def save_watermark(cur: psycopg.Cursor, key: tuple, rows: int) -> None:
+    cur.execute(
+        """UPDATE word_vote_watermark
+           SET last_date = %s, last_game_type = %s, last_word = %s, last_username = %s,
+               rows_processed = rows_processed + %s, updated_at = NOW()""",
+        (*key, rows),
+    )
+
+
+def reweight(conn: psycopg.Connection, stored: float, half_life: float) -> None:
+    with conn.transaction(), conn.cursor() as cur:
+        cur.execute(REWEIGHT_SQL, {"epoch": WEIGHT_EPOCH, "half_life": half_life})
+        cur.execute("UPDATE word_vote_watermark SET half_life_days = %s", (half_life,))
+    print(f"Reweighted tallies from the day buckets: half-life {stored:g} -> {half_life:g} days")
+
+
+def consume(conn: psycopg.Connection, batch_size: int, half_life: float, today: date) -> RunStats:
+    stats = RunStats()
+    started = time.perf_counter()
+    with conn.transaction(), conn.cursor() as cur:
+        _, stored = load_watermark(cur, half_life)
+    if stored != half_life:
+        reweight(conn, stored, half_life)
+
+    while True:
+        with conn.transaction(), conn.cursor() as cur:
+            key, _ = load_watermark(cur, half_life)
+            cur.execute(
+                VOTES_SINCE_SQL,
+                {"date": key[0], "game_type": key[1], "word": key[2], "username": key[3], "today": today, "limit": batch_size},
+            )
+            rows = cur.fetchall()
+            if not rows:
+                break
+            ups: Counter = Counter()
+            downs: Counter = Counter()
+            for day, game_type, _, _, word, vote in rows:
+                (ups if vote == "up" else downs)[(word, game_type, day)] += 1
+            buckets = {k: (ups[k], downs[k]) for k in ups.keys() | downs.keys()}
+            stats.keys += apply_buckets(cur, buckets, half_life)
+            save_watermark(cur, rows[-1][:4], len(rows))
+        stats.rows += len(rows)
+        stats.batches += 1
+    stats.seconds = time.perf_counter() - started
+    return stats
+
+
+def refresh_window(conn: psycopg.Connection, since: date, half_life: float, today: date) -> RunStats:
+    """Recompute day buckets from `since` on and apply the differences to the tallies."""
+    stats = RunStats()
+    started = time.perf_counter()
+    with conn.transaction(), conn.cursor() as cur:
+        load_watermark(cur, half_life)  # serializes with other runs
+        cur.execute(WINDOW_SOURCE_SQL, {"since": since, "today": today})
+        source = {(w, g, d): (up, down) for w, g, d, up, down in cur.fetchall()}
+        cur.execute(
+            "SELECT word, game_type, day, up, down FROM word_vote_days WHERE day >= %s AND day < %s",
+            (since, today),
+        )
+        stored = {(w, g, d): (up, down) for w, g, d, up, down in cur.fetchall()}
+        deltas: dict[tuple[str, str, date], tuple[int, int]] = {}
+        for k in source.keys() | stored.keys():
+            new, old = source.get(k, (0, 0)), stored.get(k, (0, 0))
+            if new != old:
+                deltas[k] = (new[0] - old[0], new[1] - old[1])
+        stats.keys = apply_buckets(cur, deltas, half_life)
+        stats.rows = sum(up + down for up, down in source.values())
+        stats.batches = 1
+    stats.seconds = time.perf_counter() - started
+    return stats
+
+
+def verify(conn: psycopg.Connection, half_life: float) -> list[str]:
+    """Compare the tallies with an aggregate of every consumed vote."""
+    problems: list[str] = []
+    with conn.cursor() as cur:
+        key, _ = load_watermark(cur, half_life)
+        cur.execute(
+            """SELECT UPPER(word), game_type, COUNT(*) FILTER (WHERE vote = 'up'), COUNT(*) FILTER (WHERE vote = 'down'),
+                      SUM(CASE WHEN vote = 'up' THEN power(2.0, (date - %(epoch)s) / %(half_life)s) ELSE 0 END),
+                      SUM(CASE WHEN vote = 'down' THEN power(2.0, (date - %(epoch)s) / %(half_life)s) ELSE 0 END),
+                      MIN(date), MAX(date)
+               FROM word_votes
+               WHERE (date, game_type, word, username) <= (%(date)s, %(game_type)s, %(word)s, %(username)s)
+               GROUP BY 1, 2""",
+            {"epoch": WEIGHT_EPOCH, "half_life": half_life, "date": key[0], "game_type": key[1], "word": key[2], "username": key[3]},
+        )
+        expected = {(r[0], r[1]): r[2:] for r in cur.fetchall()}
+        cur.execute("SELECT word, game_type, up, down, up_weight, down_weight, first_vote, last_vote FROM word_vote_tallies")
+        got = {(r[0], r[1]): r[2:] for r in cur.fetchall()}
+    for k in sorted(expected.keys() | got.keys()):
+        e, g = expected.get(k), got.get(k)
+        if e is None or g is None:
+            problems.append(f"{k[0]} {k[1]}: {'missing' if g is None else 'unexpected'} tally")
+        elif (e[0], e[1], e[4], e[5]) != (g[0], g[1], g[4], g[5]) or not all(
+            math.isclose(a, b, rel_tol=1e-9, abs_tol=1e-9) for a, b in ((e[2], g[2]), (e[3], g[3]))
+        ):
+            problems.append(f"{k[0]} {k[1]}: expected {e} got {g}")
+    return problems
+
+
+# --- queue --------------------------------------------------------------------
+
+
+def build_queue(
+    conn: psycopg.Connection,
+    *,
+    as_of: date,
+    half_life: float,
+    game_type: str | None,
+    z: float,
+    min_votes: int,
+    remove_above: float,
+    review_above: float,
+    keep_words: set[str] | None,
+) -> tuple[list[QueueEntry], int]:
+    scale = 2.0 ** (-(as_of - WEIGHT_EPOCH).days / half_life)
+    queue: list[QueueEntry] = []
+    skipped = 0
+    with conn.cursor() as cur:
+        cur.execute(QUEUE_SQL, {"game_type": game_type})
+        for word, up, down, up_weight, down_weight, last_vote in cur:
+            decayed_up, decayed_down = up_weight * scale, down_weight * scale
+            score = wilson_lower_bound(decayed_down, decayed_up + decayed_down, z)
+            if score >= remove_above and up + down >= min_votes:
+                action = "remove"
+            elif score >= review_above:
+                action = "review"
+            else:
+                continue
+            if keep_words is not None and word not in keep_words:
+                skipped += 1
+                continue
+            queue.append(QueueEntry(action, word, score, int(up), int(down), decayed_up, decayed_down, last_vote))
+    queue.sort(key=lambda e: (-e.score, -e.decayed_down, e.word))
+    return queue, skipped
+
+
+def format_entry(rank: int, e: QueueEntry) -> str:
+    return "\t".join(
+        [
+            str(rank),
+            e.action,
+            e.word,
+            f"{e.score:.4f}",
+            str(e.up + e.down),
+            str(e.up),
+            str(e.down),
+            f"{e.decayed_up:.3f}",
+            f"{e.decayed_down:.3f}",
+            e.last_vote.isoformat(),
+        ]
+    )
+
+
+def parse_date(value: str, option: str) -> date:
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise SystemExit(f"Invalid {option} date: {value!r}")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Incrementally tally word_votes and emit a ranked removal / review queue.")
+    parser.add_argument("--dsn", default=os.environ.get("DATABASE_URL"), help="Postgres DSN (default: $DATABASE_URL)")
+    parser.add_argument("--batch-size", type=int, default=5000, help="Votes per transaction (default 5000)")
+    parser.add_argument("--half-life-days", type=float, default=90.0, help="Vote weight halves every N days (default 90)")
+    parser.add_argument("--refresh-since", default=None, help="Also recompute day buckets from this date (YYYY-MM-DD) on")
+    parser.add_argument("--as-of", default=None, help="Decay votes as of this date (default: today, Australia/Sydney)")
+    parser.add_argument("--game-type", choices=("daily", "golf"), default=None, help="Score votes from one game type only")
+    parser.add_argument("--z", type=float, default=1.96, help="Wilson interval z (default 1.96, 95%%)")
+    parser.add_argument("--min-votes", type=int, default=5, help="Raw votes needed before a word can be queued for removal (default 5)")
+    parser.add_argument("--remove-above", type=float, default=0.5, help="Queue for removal at this score or above (default 0.5)")
+    parser.add_argument("--review-above", type=float, default=0.25, help="Queue for review at this score or above (default 0.25)")
+    parser.add_argument("--table", type=Path, default=DEFAULT_TABLE, help="Skip words not in this wordlist table (default data/wordlist-table.txt)")
+    parser.add_argument("--queue", type=Path, default=None, help="Write the ranked queue as TSV")
+    parser.add_argument("--remove-list", type=Path, default=None, help="Write the removal words, one per line")
+    parser.add_argument("--top", type=int, default=20, help="Queue entries to print (default 20)")
+    parser.add_argument("--verify", action="store_true", help="Compare the tallies with an aggregate of all consumed votes")
+    args = parser.parse_args(argv)
+
+    if not args.dsn:
+        raise SystemExit("No database: pass --dsn or set DATABASE_URL")
+    if args.batch_size <= 0:
+        raise SystemExit("--batch-size must be > 0")
+    if args.half_life_days <= 0:
+        raise SystemExit("--half-life-days must be > 0")
+    if args.review_above > args.remove_above:
+        raise SystemExit("--review-above must not exceed --remove-above")
+    today = sydney_today()
+    since = parse_date(args.refresh_since, "--refresh-since") if args.refresh_since is not None else None
+    as_of = parse_date(args.as_of, "--as-of") if args.as_of is not None else today
+    keep_words = {r.word for r in read_table(args.table)} if args.table is not None else None
+
+    with psycopg.connect(args.dsn) as conn:
+        conn.autocommit = True
+        conn.execute(SCHEMA_SQL.read_text(encoding="utf-8"))
+
+        results = [("votes", consume(conn, args.batch_size, args.half_life_days, today))]
+        if since is not None:
+            results.append(("window", refresh_window(conn, since, args.half_life_days, today)))
+        print(f"Consumed votes before {today}:")
+        for name, s in results:
+            print(s.line(name))
+
+        if args.verify:
+            started = time.perf_counter()
+            problems = verify(conn, args.half_life_days)
+            print(f"Verify: {'OK' if not problems else f'{len(problems)} mismatch(es)'} ({time.perf_counter() - started:.2f}s)")
+            for p in problems[:20]:
+                print(f"  {p}")
+            if problems:
+                raise SystemExit(1)
+
+        started = time.perf_counter()
+        queue, skipped = build_queue(
+            conn,
+            as_of=as_of,
+            half_life=args.half_life_days,
+            game_type=args.game_type,
+            z=args.z,
+            min_votes=args.min_votes,
+            remove_above=args.remove_above,
+            review_above=args.review_above,
+            keep_words=keep_words,
+        )
+        elapsed = time.perf_counter() - started
+
+    removals = [e.word for e in queue if e.action == "remove"]
+    print(
+        f"Queue as of {as_of}: {len(removals)} remove, {len(queue) - len(removals)} review"
+        + (f", {skipped} not in {args.table.name}" if skipped else "")
+        + f" ({elapsed:.2f}s)"
+    )
+    if args.top > 0 and queue:
+        print(QUEUE_HEADER)
+        for rank, e in enumerate(queue[: args.top], start=1):
+            print(format_entry(rank, e))
+    if args.queue is not None:
+        lines = [QUEUE_HEADER] + [format_entry(rank, e) for rank, e in enumerate(queue, start=1)]
+        args.queue.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        print(f"Wrote: {args.queue}")
+    if args.remove_list is not None:
+        args.remove_list.write_text("".join(f"{w}\n" for w in removals), encoding="utf-8")
+        print(f"Wrote: {args.remove_list}")
+
+
+if __name__ == "__main__":
+    main()
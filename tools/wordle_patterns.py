@@ -0,0 +1,109 @@
+"""Wordle feedback patterns and per-guess partitions, vectorized with numpy.
+
+A pattern is the base-3 code of the five tiles, tile i weighted 3**i, with
+0 = absent, 1 = present elsewhere, 2 = correct. 242 is all-green. Duplicate
+letters follow the game's rule: greens are taken first, then yellows left to
+right while the target still has unmatched copies of that letter.
+
+For a guess, the answers that share a pattern form one partition class.
+The class containing the target is exactly the set of words still possible
+after playing that guess.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+
+import numpy as np
+
+from word_features import letter_matrix
+
+
+PATTERN_COUNT = 3**5
+_WEIGHTS = np.array([3**i for i in range(5)], dtype=np.int64)
+
+
+def feedback(guess: str, target: str) -> int:
+    """Scalar reference implementation of the pattern code."""
+    guess = guess.lower()
+    target = target.lower()
+    states = [0] * 5
+    unmatched: dict[str, int] = {}
+    for i in range(5):
+        if guess[i] == target[i]:
+            states[i] = 2
+        else:
+            unmatched[target[i]] = unmatched.get(target[i], 0) + 1
+    for i in range(5):
+        if states[i] == 0 and unmatched.get(guess[i], 0) > 0:
+            states[i] = 1
+            unmatched[guess[i]] -= 1
+    return sum(s * 3**i for i, s in enumerate(states))
+
+
+def pattern_matrix(guesses: list[str], answers: list[str], *, block: int = 128) -> np.ndarray:
+    """uint8 matrix P[g, a] of feedback codes for every guess/answer pair."""
+    g_letters = letter_matrix([w.lower() for w in guesses])
+    a_letters = letter_matrix([w.lower() for w in answers])
+    out = np.empty((len(guesses), len(answers)), dtype=np.uint8)
+
+    for start in range(0, len(guesses), block):
+        g = g_letters[start : start + block]  # (b, 5)
+        green = g[:, None, :] == a_letters[None, :, :]  # (b, n, 5)
+        open_answer = ~green
+        states = green.astype(np.uint8) * 2
+        for i in range(5):
+            # Tile i is yellow when the answer has more unmatched copies of the
+            # letter than earlier non-green tiles of the guess already claimed.
+            same = g[:, i][:, None, None] == a_letters[None, :, :]
+            available = (same & open_answer).sum(axis=2)
+            claimed = np.zeros(green.shape[:2], dtype=np.int64)
+            for j in range(i):
+                claimed += (g[:, j] == g[:, i])[:, None] & ~green[:, :, j]
+            states[:, :, i] += (~green[:, :, i] & (available > claimed)).astype(np.uint8)
+        out[start : start + block] = states.astype(np.int64) @ _WEIGHTS
+    return out
+
+
+def partition_sizes(patterns: np.ndarray) -> np.ndarray:
+    """counts[g, p] = answers that give pattern p for guess g."""
+    m = patterns.shape[0]
+    flat = patterns.astype(np.int64) + (np.arange(m, dtype=np.int64) * PATTERN_COUNT)[:, None]
+    return np.bincount(flat.ravel(), minlength=m * PATTERN_COUNT).reshape(m, PATTERN_COUNT)
+
+
+def partition_entropy(counts: np.ndarray) -> np.ndarray:
+    """Expected information (bits) of each guess over a uniform answer pool."""
+    total = counts.sum(axis=1, keepdims=True)
+    p = counts / np.maximum(total, 1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        terms = np.where(p > 0, -p * np.log2(p), 0.0)
+    return terms.sum(axis=1)
+
+
+def words_key(*lists: list[str]) -> str:
+    h = hashlib.sha256()
+    for words in lists:
+        h.update("\n".join(words).encode("ascii"))
+        h.update(b"\0")
+    return h.hexdigest()[:16]
+
+
+def pattern_cache_path(cache_dir: Path, guesses: list[str], answers: list[str]) -> Path:
+    return cache_dir / f"patterns-{words_key(guesses, answers)}.npy"
+
+
+def cached_pattern_matrix(guesses: list[str], answers: list[str], cache_dir: Path | None) -> tuple[np.ndarray, bool]:
+    """Pattern matrix, loaded (memory-mapped) from `cache_dir` when present."""
+    if cache_dir is None:
+        return pattern_matrix(guesses, answers), False
+    path = pattern_cache_path(cache_dir, guesses, answers)
+    if path.exists():
+        return np.load(path, mmap_mode="r"), True
+    patterns = pattern_matrix(guesses, answers)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp.npy")
+    np.save(tmp, patterns)
+    tmp.replace(path)
+    return patterns, False
@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""Fixed-width binary wordlist table with prebuilt sorted indexes.
+
+The TSV (WORD, DIFFICULTY, SCRABBLE_SCORE, PAR) has to be re-parsed and, for
+most questions, re-sorted by every tool. This packs it into a flat file.
+The reader memory-maps the file and reads columns in place. Indexes on
+difficulty, PAR and word are stored alongside, so top-k, range and per-PAR
+queries bisect an index without loading or sorting the table.
+
+File layout (little-endian, every section 8-byte aligned):
+  header         magic, schema version, row count, sha256 of everything after
+                 the header
+  words          row count x 5 ASCII bytes, uppercase, table (id) order
+  difficulty     row count x uint16, DIFFICULTY * 100 (the TSV keeps 2 decimals)
+  scrabble       row count x uint8
+  par            row count x uint8
+  by_difficulty  row count x uint32 row ids, by (difficulty, id)
+  by_par         row count x uint32 row ids, by (PAR, difficulty, id)
+  par_offsets    (PAR_SLOTS + 1) x uint32; rows with PAR p are
+                 by_par[par_offsets[p]:par_offsets[p + 1]]
+  by_word        row count x uint32 row ids, alphabetical
+
+Row order is preserved, because get-target-word indexes the wordlist by id.
+`unpack` writes back the same TSV that `pack` read (less any UTF-8 BOM).
+
+Usage:
+  python tools/wordlist_binary.py pack data/wordlist-table.txt data/wordlist-table.bin
+  python tools/wordlist_binary.py unpack data/wordlist-table.bin roundtrip.txt
+  python tools/wordlist_binary.py info data/wordlist-table.bin
+  python tools/wordlist_binary.py query data/wordlist-table.bin --hardest 100
+  python tools/wordlist_binary.py query data/wordlist-table.bin --par 3 --min 10 --max 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import math
+import mmap
+import struct
+import sys
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from wordlist_table import HEADER as TSV_HEADER
+from wordlist_table import TableRow, format_row, read_table, write_table
+
+
+MAGIC = b"GRWLTBL\0"
+SCHEMA_VERSION = 1
+HEADER = struct.Struct("<8sHxxI32s")
+WORD_LENGTH = 5
+PAR_SLOTS = 8  # PAR values 0..7 fit the offsets table; the game uses 3..5
+
+
+def _align(n: int) -> int:
+    return (n + 7) & ~7
+
+
+def _section_sizes(n: int) -> list[int]:
+    return [n * WORD_LENGTH, n * 2, n, n, n * 4, n * 4, (PAR_SLOTS + 1) * 4, n * 4]
+
+
+def _centi(row: TableRow) -> int:
+    centi = round(row.difficulty * 100)
+    if not 0 <= centi <= 0xFFFF or abs(centi / 100 - row.difficulty) > 1e-9:
+        raise SystemExit(f"{row.word}: difficulty {row.difficulty} does not fit the binary format (0..655.35, 2 decimals)")
+    return centi
+
+
+def pack_rows(rows: list[TableRow]) -> bytes:
+    n = len(rows)
+    words = []
+    for r in rows:
+        if len(r.word) != WORD_LENGTH or not r.word.isascii():
+            raise SystemExit(f"{r.word!r} is not a five-letter ASCII word")
+        if not 0 <= r.par < PAR_SLOTS or not 0 <= r.scrabble <= 0xFF:
+            raise SystemExit(f"{r.word}: PAR {r.par} or scrabble score {r.scrabble} out of range")
+        words.append(r.word.upper().encode("ascii"))
+    centi = [_centi(r) for r in rows]
+    pars = [r.par for r in rows]
+
+    by_difficulty = sorted(range(n), key=lambda i: (centi[i], i))
+    by_par = sorted(range(n), key=lambda i: (pars[i], centi[i], i))
+    par_offsets = [bisect_left(by_par, p, key=pars.__getitem__) for p in range(PAR_SLOTS)] + [n]
+    by_word = sorted(range(n), key=words.__getitem__)
+
+    sections = [
+        b"".join(words),
+        struct.pack(f"<{n}H", *centi),
+        bytes(r.scrabble for r in rows),
+        bytes(pars),
+        struct.pack(f"<{n}I", *by_difficulty),
+        struct.pack(f"<{n}I", *by_par),
+        struct.pack(f"<{PAR_SLOTS + 1}I", *par_offsets),
+        struct.pack(f"<{n}I", *by_word),
+    ]
+    body = b"".join(s.ljust(_align(len(s)), b"\0") for s in sections)
+    header = HEADER.pack(MAGIC, SCHEMA_VERSION, n, hashlib.sha256(body).digest())
+    return header.ljust(_align(HEADER.size), b"\0") + body
+
+
+def write_binary(path: Path, rows: list[TableRow]) -> bytes:
+    data = pack_rows(rows)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(data)
+    tmp.replace(path)
+    return data
+
+
+class BinaryTable:
+    """Read-only, memory-mapped view of a packed wordlist table.
+
+    Columns are exposed as memoryviews over the mapping (`difficulty_centi`,
+    `scrabble`, `par`); rows are decoded only when asked for.
+    """
+
+    def __init__(self, path: Path, *, check_hash: bool = False):
+        if sys.byteorder != "little":
+            raise SystemExit("The binary wordlist table is little-endian; this platform is not supported")
+        self.path = Path(path)
+        with self.path.open("rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, rows, digest = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            raise SystemExit(f"{self.path} is not a binary wordlist table")
+        if version != SCHEMA_VERSION:
+            raise SystemExit(f"{self.path} has schema version {version}, expected {SCHEMA_VERSION}; repack it")
+
+        sizes = _section_sizes(rows)
+        starts = [_align(HEADER.size)]
+        for size in sizes:
+            starts.append(starts[-1] + _align(size))
+        if len(self._mm) != starts[-1]:
+            raise SystemExit(f"{self.path} has the wrong size for {rows} rows")
+        if check_hash and hashlib.sha256(self._mm[starts[0] :]).digest() != digest:
+            raise SystemExit(f"{self.path} is corrupt (content hash mismatch)")
+
+        view = memoryview(self._mm)
+        self._views = [view[start : start + size] for start, size in zip(starts, sizes)]
+        self._words = self._views[0]
+        self.difficulty_centi = self._views[1].cast("H")
+        self.scrabble = self._views[2]
+        self.par = self._views[3]
+        self._by_difficulty = self._views[4].cast("I")
+        self._by_par = self._views[5].cast("I")
+        self._par_offsets = self._views[6].cast("I")
+        self._by_word = self._views[7].cast("I")
+        self._casts = [self.difficulty_centi, self._by_difficulty, self._by_par, self._par_offsets, self._by_word]
+
+        self.row_count = rows
+        self.digest = digest.hex()
+
+    @property
+    def version(self) -> str:
+        return self.digest[:12]
+
+    def close(self) -> None:
+        # Views must be released before the mmap can close.
+        for v in (*self._casts, *self._views):
+            v.release()
+        self._mm.close()
+
+    def __enter__(self) -> "BinaryTable":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.row_count
+
+    def word(self, i: int) -> str:
+        start = i * WORD_LENGTH
+        return bytes(self._words[start : start + WORD_LENGTH]).decode("ascii")
+
+    def difficulty(self, i: int) -> float:
+        return self.difficulty_centi[i] / 100
+
+    def row(self, i: int) -> TableRow:
+        return TableRow(word=self.word(i), difficulty=self.difficulty(i), scrabble=self.scrabble[i], par=self.par[i])
+
+    def __iter__(self) -> Iterator[TableRow]:
+        for i in range(self.row_count):
+            yield self.row(i)
+
+    def rows(self, ids: Iterable[int]) -> list[TableRow]:
+        return [self.row(i) for i in ids]
+
+    # --- index queries (row ids) ---
+
+    def find(self, word: str) -> int | None:
+        target = word.strip().upper()
+        i = bisect_left(self._by_word, target, key=self.word)
+        if i < self.row_count and self.word(self._by_word[i]) == target:
+            return self._by_word[i]
+        return None
+
+    def alphabetical(self, i: int) -> int:
+        """Row id of the i-th word in alphabetical order (start.js ordering)."""
+        return self._by_word[i]
+
+    def easiest(self, k: int) -> list[int]:
+        return list(self._by_difficulty[:k])
+
+    def hardest(self, k: int) -> list[int]:
+        # Highest difficulty first; ties keep the later row first, mirroring
+        # a stable descending sort of the ascending index.
+        k = min(k, self.row_count)
+        return list(reversed(self._by_difficulty[self.row_count - k :]))
+
+    def _centi_bounds(self, low: float | None, high: float | None) -> tuple[int, int]:
+        # Stored values are whole hundredths: round the bounds inwards, with a
+        # little slack so 0.29 * 100 = 28.999... still includes 0.29.
+        lo = 0 if low is None else max(0, math.ceil(low * 100 - 1e-9))
+        hi = 0xFFFF if high is None else min(0xFFFF, math.floor(high * 100 + 1e-9))
+        return lo, hi
+
+    def difficulty_range(self, low: float | None = None, high: float | None = None) -> list[int]:
+        """Row ids with low <= DIFFICULTY <= high, easiest first."""
+        lo, hi = self._centi_bounds(low, high)
+        key = self.difficulty_centi.__getitem__
+        start = bisect_left(self._by_difficulty, lo, key=key)
+        end = bisect_right(self._by_difficulty, hi, key=key)
+        return list(self._by_difficulty[start:end])
+
+    def par_rows(self, par: int, low: float | None = None, high: float | None = None) -> list[int]:
+        """Row ids with the given PAR (optionally within a difficulty range), easiest first."""
+        if not 0 <= par < PAR_SLOTS:
+            return []
+        first, last = self._par_offsets[par], self._par_offsets[par + 1]
+        lo, hi = self._centi_bounds(low, high)
+        key = self.difficulty_centi.__getitem__
+        start = bisect_left(self._by_par, lo, first, last, key=key)
+        end = bisect_right(self._by_par, hi, start, last, key=key)
+        return list(self._by_par[start:end])
+
+    def par_counts(self) -> dict[int, int]:
+        return {
+            p: self._par_offsets[p + 1] - self._par_offsets[p]
+            for p in range(PAR_SLOTS)
+            if self._par_offsets[p + 1] > self._par_offsets[p]
+        }
+
+
+def cmd_pack(args: argparse.Namespace) -> None:
+    rows = read_table(args.input)
+    if not rows:
+        raise SystemExit(f"No rows in {args.input}")
+    data = write_binary(args.output, rows)
+    with BinaryTable(args.output) as table:
+        print(f"Rows: {len(table)}  version: {table.version}  size: {len(data)} bytes")
+    print(f"Wrote: {args.output}")
+
+
+def cmd_unpack(args: argparse.Namespace) -> None:
+    with BinaryTable(args.input, check_hash=True) as table:
+        write_table(args.output, table)
+        print(f"Rows: {len(table)}")
+    print(f"Wrote: {args.output}")
+
+
+def cmd_info(args: argparse.Namespace) -> None:
+    with BinaryTable(args.input, check_hash=True) as table:
+        counts = table.par_counts()
+        easiest = table.row(table.easiest(1)[0]) if len(table) else None
+        hardest = table.row(table.hardest(1)[0]) if len(table) else None
+        print(f"Table: {table.path}")
+        print(f"Schema: {SCHEMA_VERSION}  rows: {len(table)}  version: {table.version} (hash OK)")
+        print("PAR distribution: " + ", ".join(f"{p}={c}" for p, c in sorted(counts.items())))
+        if easiest and hardest:
+            print(f"Difficulty: {easiest.difficulty} ({easiest.word}) .. {hardest.difficulty} ({hardest.word})")
+
+
+def cmd_query(args: argparse.Namespace) -> None:
+    with BinaryTable(args.input) as table:
+        if args.word:
+            ids = [i for i in (table.find(w) for w in args.word) if i is not None]
+        elif args.hardest is not None:
+            ids = table.hardest(args.hardest)
+        elif args.easiest is not None:
+            ids = table.easiest(args.easiest)
+        elif args.par is not None:
+            ids = table.par_rows(args.par, args.min, args.max)
+        else:
+            ids = table.difficulty_range(args.min, args.max)
+        if args.limit is not None:
+            ids = ids[: args.limit]
+        rows = table.rows(ids)
+
+    if args.output is None:
+        print(TSV_HEADER)
+        for r in rows:
+            print(format_row(r))
+        return
+    write_table(args.output, rows)
+    print(f"Rows: {len(rows)}")
+    print(f"Wrote: {args.output}")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Convert and query the binary wordlist-table format.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("pack", help="TSV -> binary")
+    p.add_argument("input", type=Path)
+    p.add_argument("output", type=Path)
+    p.set_defaults(func=cmd_pack)
+
+    p = sub.add_parser("unpack", help="binary -> TSV")
+    p.add_argument("input", type=Path)
+    p.add_argument("output", type=Path)
+    p.set_defaults(func=cmd_unpack)
+
+    p = sub.add_parser("info", help="Check the content hash and summarize a binary table")
+    p.add_argument("input", type=Path)
+    p.set_defaults(func=cmd_info)
+
+    p = sub.add_parser("query", help="Print rows selected through the prebuilt indexes as TSV")
+    p.add_argument("input", type=Path)
+    group = p.add_mutually_exclusive_group()
+    group.add_argument("--hardest", type=int, default=None, metavar="K", help="K highest-difficulty rows")
+    group.add_argument("--easiest", type=int, default=None, metavar="K", help="K lowest-difficulty rows")
+    group.add_argument("--par", type=int, default=None, help="Rows with this PAR (combine with --min/--max)")
+    group.add_argument("--word", action="append", default=[], help="Look up a word (repeatable)")
+    p.add_argument("--min", type=float, default=None, help="Minimum DIFFICULTY (inclusive)")
+    p.add_argument("--max", type=float, default=None, help="Maximum DIFFICULTY (inclusive)")
+    p.add_argument("--limit", type=int, default=None)
+    p.add_argument("--output", type=Path, default=None, help="Write a TSV file instead of printing")
+    p.set_defaults(func=cmd_query)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+"""Apply add/remove batches to the wordlist table without a full rebuild.
+
+Reads the state file written by `generate_wordlist_table.py --state` (Zipf,
+scrabble score and build parameters per word), keeps commonality and
+difficulty ranks in order-statistic structures (order_stats.SortedBlocks), and
+after each batch re-derives only the rows whose rank can have moved. The
+output lists just the rows whose formatted DIFFICULTY or PAR changed, plus the
+added and removed words.
+
+Only a balanced batch whose edits sit close together in commonality order is
+cheaper than a rebuild: it touches just the ranks between the edits and
+repairs PARs near the bucket boundaries. A batch that changes the word count
+or the scrabble min/max rescales every percentile, and balanced edits spread
+across the order shift most ranks, so past n/8 shifted rows apply() falls back
+to build_table() and diffs the result.
+
+Usage:
+  python tools/generate_wordlist_table.py words.txt data/wordlist-table.txt --state data/wordlist-state.tsv
+  python tools/wordlist_delta.py data/wordlist-state.tsv --add new.txt --remove-word ZEBRA --changes delta.tsv --verify
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from generate_wordlist_table import (
+    BuiltTable,
+    TableParams,
+    WordRow,
+    build_table,
+    commonality_key,
+    commonality_score,
+    format_float,
+    normalize,
+    par_counts,
+    par_for_index,
+    read_state,
+    scrabble_score,
+    write_state,
+)
+from order_stats import SortedBlocks
+
+
+CHANGES_HEADER = "STATUS\tWORD\tDIFFICULTY\tSCRABBLE_SCORE\tPAR"
+
+
+@dataclass
+class RowChange:
+    status: str  # add | remove | update
+    word: str  # lowercase
+    difficulty: float
+    scrabble: int
+    par: int
+    old_difficulty: float | None = None
+    old_par: int | None = None
+
+    def format(self) -> str:
+        return "\t".join([self.status, self.word.upper(), format_float(self.difficulty), str(self.scrabble), str(self.par)])
+
+
+class IncrementalTable:
+    def __init__(self, rows: list[WordRow], params: TableParams):
+        self.params = params
+        self.w_common, self.w_scrabble = params.normalized_weights()
+        built = build_table(rows, params)
+
+        self.rows: dict[str, WordRow] = {r.word: r for r in rows}
+        self.difficulty: dict[str, float] = dict(built.difficulty_by_word)
+        self.par: dict[str, int] = dict(built.par_by_word)
+        self.common: SortedBlocks[tuple[float, str]] = SortedBlocks(commonality_key(r) for r in rows)
+        self.by_diff: SortedBlocks[tuple[float, str]] = SortedBlocks((d, w) for w, d in self.difficulty.items())
+        self.scrabble_counts: dict[int, int] = {}
+        for r in rows:
+            self.scrabble_counts[r.scrabble] = self.scrabble_counts.get(r.scrabble, 0) + 1
+        self.scr_min, self.scr_max = built.scr_min, built.scr_max
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def _count_scrabble(self, score: int, delta: int) -> None:
+        left = self.scrabble_counts.get(score, 0) + delta
+        if left:
+            self.scrabble_counts[score] = left
+        else:
+            del self.scrabble_counts[score]
+
+    def _shifted_ranges(self, edits: list[tuple[tuple[float, str], int]]) -> list[tuple[int, int]]:
+        # A word's commonality rank moves by (#adds before it - #removes before it).
+        # Walk the sorted edit keys and collect the rank gaps where that net is non-zero.
+        ranges: list[tuple[int, int]] = []
+        net = 0
+        for (key, delta), nxt in zip(edits, edits[1:] + [None]):
+            net += delta
+            if net == 0:
+                continue
+            lo = self.common.rank(key)
+            hi = len(self.common) if nxt is None else self.common.rank(nxt[0])
+            if lo < hi:
+                ranges.append((lo, hi))
+        return ranges
+
+    def apply(self, adds: list[WordRow], removes: list[str]) -> list[RowChange]:
+        old_n = len(self.rows)
+        old_scr = (self.scr_min, self.scr_max)
+        old_difficulty: dict[str, float] = {}
+        old_par: dict[str, int] = {}
+        removed: list[tuple[WordRow, float, int]] = []
+        edits: list[tuple[tuple[float, str], int]] = []
+
+        # Removes first, so remove+add of the same word acts as an update.
+        for word in removes:
+            r = self.rows.pop(word)
+            d = self.difficulty.pop(word)
+            p = self.par.pop(word)
+            removed.append((r, d, p))
+            self.common.remove(commonality_key(r))
+            self.by_diff.remove((d, word))
+            self._count_scrabble(r.scrabble, -1)
+            edits.append((commonality_key(r), -1))
+
+        added: set[str] = set()
+        for r in adds:
+            self.rows[r.word] = r
+            self.common.add(commonality_key(r))
+            self._count_scrabble(r.scrabble, 1)
+            edits.append((commonality_key(r), 1))
+            added.add(r.word)
+
+        n = len(self.rows)
+        if n == 0:
+            raise SystemExit("Batch would remove every word")
+        self.scr_min = float(min(self.scrabble_counts))
+        self.scr_max = float(max(self.scrabble_counts))
+
+        # Rows to re-derive, as rank ranges of the commonality order. A changed
+        # count or scrabble range rescales every percentile, and edits spread
+        # across the order shift most ranks; past n/8 rows a rebuild is cheaper.
+        if n != old_n or (self.scr_min, self.scr_max) != old_scr:
+            return self._rebuild(removed, added)
+        edits.sort()
+        ranges = self._shifted_ranges(edits)
+        if sum(hi - lo for lo, hi in ranges) > n // 8:
+            return self._rebuild(removed, added)
+
+        scr_terms = {
+            score: self.w_scrabble * (normalize(float(score), min_value=self.scr_min, max_value=self.scr_max) * 100.0)
+            for score in self.scrabble_counts
+        }
+        positions: dict[str, int] = {}
+        for lo, hi in ranges:
+            for idx, (_, word) in enumerate(self.common.islice(lo, hi), lo):
+                positions[word] = idx
+        for word in added - positions.keys():
+            positions[word] = self.common.rank(commonality_key(self.rows[word]))
+
+        # Re-derive difficulties and move changed keys in the difficulty order.
+        moved = set(added)
+        for word, idx in positions.items():
+            d = self.w_common * commonality_score(idx, n) + scr_terms[self.rows[word].scrabble]
+            prev = self.difficulty.get(word)
+            if prev == d:
+                continue
+            if prev is not None:
+                old_difficulty[word] = prev
+                self.by_diff.remove((prev, word))
+            self.by_diff.add((d, word))
+            self.difficulty[word] = d
+            moved.add(word)
+
+        self._repair_par(n, moved, old_par)
+
+        # Emit in commonality order. `positions` already is, apart from adds and
+        # boundary PAR fixes that fall outside the shifted ranges.
+        ordered = [(idx, w) for w, idx in positions.items()]
+        ordered += [(self.common.rank(commonality_key(self.rows[w])), w) for w in old_par.keys() - positions.keys()]
+        ordered.sort()
+        return self._changes([w for _, w in ordered], removed, added, old_difficulty, old_par)
+
+    def _rebuild(self, removed: list[tuple[WordRow, float, int]], added: set[str]) -> list[RowChange]:
+        built = build_table(list(self.rows.values()), self.params)
+        old_difficulty = {w: d for w, d in self.difficulty.items() if built.difficulty_by_word[w] != d}
+        old_par = {w: p for w, p in self.par.items() if built.par_by_word[w] != p}
+        self.difficulty = dict(built.difficulty_by_word)
+        self.par = dict(built.par_by_word)
+        self.by_diff = SortedBlocks((d, w) for w, d in self.difficulty.items())
+        return self._changes([r.word for r in built.rows_by_common], removed, added, old_difficulty, old_par)
+
+    def _repair_par(self, n: int, moved: set[str], old_par: dict[str, int]) -> None:
+        # PAR: words whose difficulty moved get their bucket from their new rank.
+        # Unmoved words keep their relative order, so their stored PARs are a
+        # monotone step function; mismatches can only sit next to a bucket
+        # boundary. Scan outwards from each boundary until an unmoved word
+        # already has the right PAR.
+        easy_count, hard_count = par_counts(n, self.params)
+        candidates = set(moved)
+        for boundary in (easy_count, n - hard_count):
+            for idx in range(boundary - 1, -1, -1):
+                _, word = self.by_diff[idx]
+                if word not in moved and self.par[word] == par_for_index(idx, n, easy_count, hard_count):
+                    break
+                candidates.add(word)
+            for idx in range(boundary, n):
+                _, word = self.by_diff[idx]
+                if word not in moved and self.par[word] == par_for_index(idx, n, easy_count, hard_count):
+                    break
+                candidates.add(word)
+
+        for word in candidates:
+            idx = self.by_diff.rank((self.difficulty[word], word))
+            p = par_for_index(idx, n, easy_count, hard_count)
+            prev = self.par.get(word)
+            if prev is not None and prev != p:
+                old_par[word] = prev
+            self.par[word] = p
+
+    def _changes(
+        self,
+        ordered: list[str],
+        removed: list[tuple[WordRow, float, int]],
+        added: set[str],
+        old_difficulty: dict[str, float],
+        old_par: dict[str, int],
+    ) -> list[RowChange]:
+        removed_by_word = {r.word: (r, d, p) for r, d, p in removed}
+        changes: list[RowChange] = []
+        for word, (r, d, p) in removed_by_word.items():
+            if word not in added:
+                changes.append(RowChange("remove", word, d, r.scrabble, p))
+        rows, difficulty, par = self.rows, self.difficulty, self.par
+        for word in ordered:
+            d, p = difficulty[word], par[word]
+            if word in added:
+                if word not in removed_by_word:
+                    changes.append(RowChange("add", word, d, rows[word].scrabble, p))
+                    continue
+                # Removed and re-added in one batch: compare with the removed row.
+                _, prev_d, prev_p = removed_by_word[word]
+            else:
+                prev_d = old_difficulty.get(word, d)
+                prev_p = old_par.get(word, p)
+            # Same test as comparing format_float() output, without the rstrip calls.
+            if prev_p != p or (prev_d != d and f"{prev_d:.2f}" != f"{d:.2f}"):
+                changes.append(RowChange("update", word, d, rows[word].scrabble, p, old_difficulty=prev_d, old_par=prev_p))
+        return changes
+
+    def snapshot(self) -> BuiltTable:
+        rows = [self.rows[w] for _, w in self.common]
+        return BuiltTable(
+            rows_by_common=rows,
+            difficulty_by_word=dict(self.difficulty),
+            par_by_word=dict(self.par),
+            scr_min=self.scr_min,
+            scr_max=self.scr_max,
+        )
+
+
+def verify(before: BuiltTable, after: IncrementalTable, changes: list[RowChange], params: TableParams) -> list[str]:
+    """Compare the incremental result with a full rebuild; return a list of problems."""
+    problems: list[str] = []
+    rebuilt = build_table(list(after.rows.values()), params)
+    inc = after.snapshot()
+
+    if [r.word for r in rebuilt.rows_by_common] != [r.word for r in inc.rows_by_common]:
+        problems.append("commonality order differs")
+    for word, d in rebuilt.difficulty_by_word.items():
+        if inc.difficulty_by_word.get(word) != d:
+            problems.append(f"{word}: difficulty {inc.difficulty_by_word.get(word)!r} != {d!r}")
+        if inc.par_by_word.get(word) != rebuilt.par_by_word[word]:
+            problems.append(f"{word}: PAR {inc.par_by_word.get(word)} != {rebuilt.par_by_word[word]}")
+
+    # The emitted delta must be exactly the rows that differ between the two full builds.
+    expected: set[tuple[str, str]] = set()
+    for word in before.difficulty_by_word.keys() - rebuilt.difficulty_by_word.keys():
+        expected.add(("remove", word))
+    for word, d in rebuilt.difficulty_by_word.items():
+        if word not in before.difficulty_by_word:
+            expected.add(("add", word))
+        elif (
+            format_float(before.difficulty_by_word[word]) != format_float(d)
+            or before.par_by_word[word] != rebuilt.par_by_word[word]
+        ):
+            expected.add(("update", word))
+    emitted = {(c.status, c.word) for c in changes}
+    for status, word in sorted(expected - emitted):
+        problems.append(f"missing {status} row for {word}")
+    for status, word in sorted(emitted - expected):
+        problems.append(f"unexpected {status} row for {word}")
+    return problems
+
+
+def read_batch(paths: list[Path], words: list[str]) -> list[str]:
+    # Plain word lists or wordlist-table TSVs (first column, header skipped).
+    out: list[str] = []
+    for path in paths:
+        for raw in path.read_text(encoding="utf-8-sig").splitlines():
+            w = raw.split("\t", 1)[0].strip().lower()
+            if w and w != "word":
+                out.append(w)
+    out.extend(w.strip().lower() for w in words)
+    return out
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Apply add/remove batches to a wordlist-table state incrementally.")
+    parser.add_argument("state", type=Path, help="State file from generate_wordlist_table.py --state")
+    parser.add_argument("--add", type=Path, action="append", default=[], help="File of words to add (repeatable)")
+    parser.add_argument("--remove", type=Path, action="append", default=[], help="File of words to remove (repeatable)")
+    parser.add_argument("--add-word", action="append", default=[], help="Single word to add (repeatable)")
+    parser.add_argument("--remove-word", action="append", default=[], help="Single word to remove (repeatable)")
+    parser.add_argument("--changes", type=Path, default=None, help="Write changed rows as TSV (STATUS, WORD, DIFFICULTY, SCRABBLE_SCORE, PAR)")
+    parser.add_argument("--table", type=Path, default=None, help="Also write the full updated wordlist table")
+    parser.add_argument("--write-state", action="store_true", help="Save the updated state back to the state file")
+    parser.add_argument("--verify", action="store_true", help="Check the result against a full rebuild")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    rows, params = read_state(args.state)
+    if not rows:
+        raise SystemExit(f"{args.state} has no rows")
+    table = IncrementalTable(rows, params)
+    before = table.snapshot() if args.verify else None
+    loaded = time.perf_counter()
+
+    remove_words: list[str] = []
+    skipped_removes: list[str] = []
+    for w in dict.fromkeys(read_batch(args.remove, args.remove_word)):
+        (remove_words if w in table.rows else skipped_removes).append(w)
+
+    adds: list[WordRow] = []
+    skipped_adds: list[str] = []
+    pending = list(dict.fromkeys(read_batch(args.add, args.add_word)))
+    for w in pending:
+        if len(w) != 5 or not w.isascii() or not w.isalpha() or (w in table.rows and w not in remove_words):
+            skipped_adds.append(w)
+    pending = [w for w in pending if w not in skipped_adds]
+    if pending:
+        from wordfreq import zipf_frequency
+
+        adds = [WordRow(word=w, zipf=float(zipf_frequency(w, "en")), scrabble=scrabble_score(w)) for w in pending]
+
+    old_n = len(table)
+    apply_started = time.perf_counter()
+    changes = table.apply(adds, remove_words)
+    applied = time.perf_counter()
+
+    counts = {s: sum(1 for c in changes if c.status == s) for s in ("add", "remove", "update")}
+    par_moves = sum(1 for c in changes if c.status == "update" and c.old_par != c.par)
+    print(f"Words: {old_n} -> {len(table)}")
+    print(f"Batch: +{len(adds)} -{len(remove_words)} (ignored: {len(skipped_adds)} adds, {len(skipped_removes)} removes)")
+    print(f"Changed rows: {len(changes)} (add={counts['add']}, remove={counts['remove']}, update={counts['update']}, PAR moves={par_moves})")
+    print(f"Load: {(loaded - started) * 1000:.1f} ms  apply: {(applied - apply_started) * 1000:.1f} ms")
+    if skipped_adds:
+        print(f"Ignored adds (invalid or already present): {', '.join(w.upper() for w in skipped_adds[:20])}")
+    if skipped_removes:
+        print(f"Ignored removes (not present): {', '.join(w.upper() for w in skipped_removes[:20])}")
+
+    if args.verify:
+        started = time.perf_counter()
+        problems = verify(before, table, changes, params)
+        print(f"Verify against full rebuild: {'OK' if not problems else f'{len(problems)} problem(s)'} ({(time.perf_counter() - started) * 1000:.1f} ms)")
+        for p in problems[:20]:
+            print(f"  {p}")
+        if problems:
+            raise SystemExit(1)
+
+    if args.changes is not None:
+        args.changes.write_text("\n".join([CHANGES_HEADER] + [c.format() for c in changes]) + "\n", encoding="utf-8")
+        print(f"Wrote: {args.changes}")
+    if args.table is not None:
+        args.table.write_text("\n".join(table.snapshot().output_lines()) + "\n", encoding="utf-8")
+        print(f"Wrote: {args.table}")
+    if args.write_state:
+        write_state(args.state, list(table.rows.values()), params)
+        print(f"Wrote: {args.state}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Read and write the tab-delimited wordlist-table format.
+
+    WORD<TAB>DIFFICULTY<TAB>SCRABBLE_SCORE<TAB>PAR
+
+This is the format produced by generate_wordlist_table.py and consumed by the
+JS importers (tools/populate-wordlist-db.js, migrations/repopulate-wordlist.js).
+Row order is significant: get-target-word indexes the wordlist by insertion id.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+
+
+HEADER = "WORD\tDIFFICULTY\tSCRABBLE_SCORE\tPAR"
+
+DEFAULT_TABLE = Path(__file__).resolve().parent.parent / "data" / "wordlist-table.txt"
+
+
+@dataclass(frozen=True)
+class TableRow:
+    word: str  # uppercase
+    difficulty: float
+    scrabble: int
+    par: int
+
+
+def format_float(value: float) -> str:
+    # Matches existing file style like "8.4" rather than "8.40".
+    s = f"{value:.2f}"
+    s = s.rstrip("0").rstrip(".")
+    return s
+
+
+def parse_line(line: str) -> TableRow | None:
+    parts = line.rstrip("\r\n").split("\t")
+    if len(parts) < 4:
+        return None
+    word = parts[0].strip().upper()
+    if word == "WORD" or len(word) != 5 or not word.isalpha():
+        return None
+    return TableRow(word=word, difficulty=float(parts[1]), scrabble=int(parts[2]), par=int(parts[3]))
+
+
+def iter_table(path: Path):
+    # Several historical files in data/ carry a UTF-8 BOM, hence utf-8-sig.
+    with path.open("r", encoding="utf-8-sig") as f:
+        for line in f:
+            row = parse_line(line)
+            if row is not None:
+                yield row
+
+
+def read_table(path: Path) -> list[TableRow]:
+    return list(iter_table(path))
+
+
+def format_row(row: TableRow) -> str:
+    return "\t".join([row.word, format_float(row.difficulty), str(row.scrabble), str(row.par)])
+
+
+def write_table(path: Path, rows) -> None:
+    lines = [HEADER]
+    lines.extend(format_row(r) for r in rows)
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def date_seed(prefix: str, date: str) -> int:
+    # Same 31-multiplier hash as start.js ("START:") and get-target-word.js ("TARGET:").
+    seed = 0
+    for ch in prefix + date:
+        seed = (seed * 31 + ord(ch)) & 0xFFFFFFFF
+    return seed
+
+
+def target_word_for_date(words: list[str], date: str) -> str:
+    # get-target-word.js indexes the wordlist in id (file) order.
+    return words[date_seed("TARGET:", date) % len(words)]
+
+
+def start_word_for_date(words: list[str], date: str) -> str:
+    # start.js indexes the wordlist in alphabetical order.
+    ordered = sorted(words)
+    return ordered[date_seed("START:", date) % len(ordered)]